@@ -9,47 +9,112 @@ Library Usage:
 
 __version__ = "0.1.0"
 
-from .api.client import TFCClient
-from .api.projects import ProjectAPI
-from .api.runs import RunsAPI
-from .api.teams import TeamsAPI
-from .api.vcs import VCSAPI
-from .api.workspace_clone import CloneWorkspaceAPI
-from .api.workspaces import WorkspaceAPI
-from .core.backend import RemoteBackend
-from .core.context import resolve_organization, resolve_workspace
-from .core.credentials import TerraformCredentials
-from .core.exceptions import (
-    TerraformApplyError,
-    TerraformError,
-    TerraformVersionError,
-    TerrapyneError,
-    TFCAPIError,
-    TFCAuthenticationError,
-    TFCConflictError,
-    TFCNotFoundError,
-    TFCRateLimitError,
-    TFCServerError,
-    VCSTokenRequiredError,
-    WorkspaceAlreadyExistsError,
-    WorkspaceNotFoundError,
-)
-from .core.local_binary import Terraform
-from .core.plan_parser import TerraformPlainTextPlanParser as PlanParser
-from .models.plan import Plan
-from .models.project import Project
-from .models.run import Run
-from .models.team import Team
-from .models.team_access import TeamProjectAccess
-from .models.variable import WorkspaceVariable
-from .models.vcs import VCSConnection
-from .models.workspace import Workspace, WorkspaceVCS
+from typing import TYPE_CHECKING, Any
+
+# Public name -> (module, attribute); imported on first access to keep `import terrapyne` cheap
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "AsyncTFCClient": (".api.async_client", "AsyncTFCClient"),
+    "TFCClient": (".api.client", "TFCClient"),
+    "ProjectAPI": (".api.projects", "ProjectAPI"),
+    "RunsAPI": (".api.runs", "RunsAPI"),
+    "TeamsAPI": (".api.teams", "TeamsAPI"),
+    "VCSAPI": (".api.vcs", "VCSAPI"),
+    "CloneWorkspaceAPI": (".api.workspace_clone", "CloneWorkspaceAPI"),
+    "WorkspaceAPI": (".api.workspaces", "WorkspaceAPI"),
+    "RemoteBackend": (".core.backend", "RemoteBackend"),
+    "resolve_organization": (".core.context", "resolve_organization"),
+    "resolve_workspace": (".core.context", "resolve_workspace"),
+    "TerraformCredentials": (".core.credentials", "TerraformCredentials"),
+    "TerraformApplyError": (".core.exceptions", "TerraformApplyError"),
+    "TerraformError": (".core.exceptions", "TerraformError"),
+    "TerraformVersionError": (".core.exceptions", "TerraformVersionError"),
+    "TerrapyneError": (".core.exceptions", "TerrapyneError"),
+    "TFCAPIError": (".core.exceptions", "TFCAPIError"),
+    "TFCAuthenticationError": (".core.exceptions", "TFCAuthenticationError"),
+    "TFCConflictError": (".core.exceptions", "TFCConflictError"),
+    "TFCNotFoundError": (".core.exceptions", "TFCNotFoundError"),
+    "TFCRateLimitError": (".core.exceptions", "TFCRateLimitError"),
+    "TFCServerError": (".core.exceptions", "TFCServerError"),
+    "VCSTokenRequiredError": (".core.exceptions", "VCSTokenRequiredError"),
+    "WorkspaceAlreadyExistsError": (".core.exceptions", "WorkspaceAlreadyExistsError"),
+    "WorkspaceNotFoundError": (".core.exceptions", "WorkspaceNotFoundError"),
+    "Terraform": (".core.local_binary", "Terraform"),
+    "PlanStreamParser": (".core.plan_parser", "PlanStreamParser"),
+    "PlanParser": (".core.plan_parser", "TerraformPlainTextPlanParser"),
+    "Plan": (".models.plan", "Plan"),
+    "Project": (".models.project", "Project"),
+    "Run": (".models.run", "Run"),
+    "Team": (".models.team", "Team"),
+    "TeamProjectAccess": (".models.team_access", "TeamProjectAccess"),
+    "WorkspaceVariable": (".models.variable", "WorkspaceVariable"),
+    "VCSConnection": (".models.vcs", "VCSConnection"),
+    "Workspace": (".models.workspace", "Workspace"),
+    "WorkspaceVCS": (".models.workspace", "WorkspaceVCS"),
+}
+
+if TYPE_CHECKING:
+    from .api.async_client import AsyncTFCClient
+    from .api.client import TFCClient
+    from .api.projects import ProjectAPI
+    from .api.runs import RunsAPI
+    from .api.teams import TeamsAPI
+    from .api.vcs import VCSAPI
+    from .api.workspace_clone import CloneWorkspaceAPI
+    from .api.workspaces import WorkspaceAPI
+    from .core.backend import RemoteBackend
+    from .core.context import resolve_organization, resolve_workspace
+    from .core.credentials import TerraformCredentials
+    from .core.exceptions import (
+        TerraformApplyError,
+        TerraformError,
+        TerraformVersionError,
+        TerrapyneError,
+        TFCAPIError,
+        TFCAuthenticationError,
+        TFCConflictError,
+        TFCNotFoundError,
+        TFCRateLimitError,
+        TFCServerError,
+        VCSTokenRequiredError,
+        WorkspaceAlreadyExistsError,
+        WorkspaceNotFoundError,
+    )
+    from .core.local_binary import Terraform
+    from .core.plan_parser import PlanStreamParser
+    from .core.plan_parser import TerraformPlainTextPlanParser as PlanParser
+    from .models.plan import Plan
+    from .models.project import Project
+    from .models.run import Run
+    from .models.team import Team
+    from .models.team_access import TeamProjectAccess
+    from .models.variable import WorkspaceVariable
+    from .models.vcs import VCSConnection
+    from .models.workspace import Workspace, WorkspaceVCS
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _EXPORTS[name]
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "VCSAPI",
+    "AsyncTFCClient",
     "CloneWorkspaceAPI",
     "Plan",
     "PlanParser",
+    "PlanStreamParser",
     "Project",
     "ProjectAPI",
     "RemoteBackend",
@@ -1,6 +1,8 @@
 """Entry point for `python -m terrapyne`."""
 
-from .cli.main import app
+from .cli.main import app, run
+
+__all__ = ["app", "run"]
 
 if __name__ == "__main__":
-    app()
+    run()
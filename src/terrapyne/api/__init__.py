@@ -1,7 +1,29 @@
 """Terraform Cloud API client."""
 
-from .client import TFCClient
-from .workspaces import WorkspaceAPI
+from typing import TYPE_CHECKING, Any
 
-# Ensure WorkspaceAPI is attached to TFCClient
-__all__ = ["TFCClient", "WorkspaceAPI"]
+# Public name -> module; imported on first access (the async client pulls in asyncio)
+_EXPORTS = {
+    "AsyncTFCClient": ".async_client",
+    "TFCClient": ".client",
+    "WorkspaceAPI": ".workspaces",
+}
+
+if TYPE_CHECKING:
+    from .async_client import AsyncTFCClient
+    from .client import TFCClient
+    from .workspaces import WorkspaceAPI
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["AsyncTFCClient", "TFCClient", "WorkspaceAPI"]
@@ -0,0 +1,479 @@
+"""Asynchronous Terraform Cloud API client."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import httpx
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from terrapyne.api.cache import ResponseCache
+from terrapyne.api.client import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_TIMEOUT,
+    PASSTHROUGH_STATUSES,
+    _BaseTFCClient,
+    _page_count,
+)
+from terrapyne.api.singleflight import AsyncSingleFlight
+from terrapyne.api.tracing import Tracer
+from terrapyne.core.credentials import TerraformCredentials
+from terrapyne.core.exceptions import TFCServerError
+from terrapyne.models.utils import IncludedResources
+
+if TYPE_CHECKING:
+    from terrapyne.api.projects import AsyncProjectAPI
+    from terrapyne.api.runs import AsyncRunsAPI
+    from terrapyne.api.state_versions import AsyncStateVersionsAPI
+    from terrapyne.api.teams import AsyncTeamsAPI
+    from terrapyne.api.vcs import AsyncVCSAPI
+    from terrapyne.api.workspaces import AsyncWorkspaceAPI
+
+logger = logging.getLogger("terrapyne.api")
+
+
+class AsyncResponseIterator:
+    """Async iterator over every item of a paginated listing.
+
+    Mirrors ``terrapyne.api.client.ResponseIterator``: ``included`` always
+    holds the included resources of the page currently being yielded, and up
+    to ``max_inflight`` remaining pages are requested concurrently once the
+    page count is known.
+    """
+
+    def __init__(
+        self,
+        first_resp: dict[str, Any],
+        client: AsyncTFCClient,
+        path: str,
+        base_params: dict[str, Any],
+        max_inflight: int = 1,
+    ):
+        self.first_resp = first_resp
+        self.client = client
+        self.path = path
+        self.params = base_params
+        self.max_inflight = max_inflight
+        self.included = IncludedResources(first_resp.get("included", []))
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        for item in self.first_resp.get("data", []):
+            yield item
+
+        if not self.first_resp.get("links", {}).get("next"):
+            return
+
+        total_pages = _page_count(self.first_resp, self.params.get("page[size]"))
+        pages: AsyncIterator[dict[str, Any]]
+        if self.max_inflight > 1 and total_pages and total_pages > 1:
+            pages = self._iter_prefetched(total_pages)
+        else:
+            pages = self._iter_sequential()
+        async for item in pages:
+            yield item
+
+    async def _iter_sequential(self, page: int = 2) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            self.params["page[number]"] = page
+            response_data = await self.client.get(self.path, params=self.params)
+            self.included = IncludedResources(response_data.get("included", []))
+
+            data = response_data.get("data", [])
+            if not data:
+                break
+
+            for item in data:
+                yield item
+
+            links = response_data.get("links", {})
+            if not links.get("next"):
+                break
+
+            page += 1
+
+    async def _iter_prefetched(self, total_pages: int) -> AsyncIterator[dict[str, Any]]:
+        def fetch(page: int) -> asyncio.Task[dict[str, Any]]:
+            params = {**self.params, "page[number]": page}
+            return asyncio.ensure_future(self.client.get(self.path, params=params))
+
+        pages = iter(range(2, total_pages + 1))
+        window = deque(fetch(page) for page in islice(pages, self.max_inflight))
+        has_more = False
+        try:
+            while window:
+                response_data = await window.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    window.append(fetch(next_page))
+
+                self.included = IncludedResources(response_data.get("included", []))
+                data = response_data.get("data", [])
+                if not data:
+                    return
+
+                for item in data:
+                    yield item
+
+                has_more = bool(response_data.get("links", {}).get("next"))
+                if not has_more:
+                    return
+        finally:
+            for task in window:
+                task.cancel()
+
+        if has_more:
+            async for item in self._iter_sequential(total_pages + 1):
+                yield item
+
+
+class AsyncTFCClient(_BaseTFCClient):
+    """Terraform Cloud API client built on ``httpx.AsyncClient``.
+
+    Offers the same surface as ``TFCClient`` with awaitable request methods,
+    so many concurrent callers can share one event loop and connection pool.
+
+    Example:
+        async with AsyncTFCClient(organization="my-org") as client:
+            ws = await client.workspaces.get("my-app-dev")
+            runs, total = await client.runs.list(ws.id, limit=5)
+    """
+
+    def __init__(
+        self,
+        host: str = "app.terraform.io",
+        organization: str | None = None,
+        credentials: TerraformCredentials | None = None,
+        debug: bool = False,
+        cache_ttl: int = 0,
+        *,
+        max_inflight: int = 1,
+        state_store_mb: int = 0,
+        rate_limit: float | None = None,
+        http2: bool | None = None,
+        tracer: Tracer | None = None,
+        api_origin: str | None = None,
+    ):
+        """Initialize async TFC client.
+
+        Args:
+            host: TFC hostname (default: app.terraform.io)
+            organization: TFC organization name
+            credentials: Optional pre-loaded credentials (otherwise loaded from tfrc.json)
+            debug: Enable API call tracing
+            cache_ttl: Cache TTL in seconds (0 to disable)
+            max_inflight: Default number of pages paginate_with_meta fetches concurrently
+            state_store_mb: Size cap in MiB of the local store of downloaded state
+                versions (0 to disable)
+            rate_limit: Requests per second shared by every request of this client
+                (default: TERRAPYNE_RATE_LIMIT or 25; 0 to only honour 429s)
+            http2: Multiplex API requests over HTTP/2 (default: when the ``h2``
+                package is installed, e.g. via ``terrapyne[http2]``)
+            tracer: Records a span per request and per-endpoint latency histograms
+            api_origin: Scheme and host serving the API, e.g. a local stand-in
+                server (default: TERRAPYNE_API_ORIGIN, else ``https://{host}``)
+        """
+        super().__init__(
+            host,
+            organization,
+            credentials,
+            debug,
+            cache_ttl,
+            state_store_mb=state_store_mb,
+            rate_limit=rate_limit,
+            http2=http2,
+            tracer=tracer,
+            api_origin=api_origin,
+        )
+        self.max_inflight = max(1, max_inflight)
+        self._inflight = AsyncSingleFlight()
+        self.client = httpx.AsyncClient(**self._http_options())
+
+    async def __aenter__(self) -> AsyncTFCClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients."""
+        await self.client.aclose()
+        if "blob_client" in self.__dict__:
+            await self.blob_client.aclose()
+
+    @cached_property
+    def blob_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for signed URLs off the API host (created on first use)."""
+        return httpx.AsyncClient(**self._http_options(blob=True))
+
+    def _http_for(self, url: str) -> httpx.AsyncClient:
+        return self.blob_client if self._is_blob_url(url) else self.client
+
+    @cached_property
+    def workspaces(self) -> AsyncWorkspaceAPI:
+        """Get async workspace API instance."""
+        from terrapyne.api.workspaces import AsyncWorkspaceAPI
+
+        return AsyncWorkspaceAPI(self)
+
+    @cached_property
+    def runs(self) -> AsyncRunsAPI:
+        """Get async runs API instance."""
+        from terrapyne.api.runs import AsyncRunsAPI
+
+        return AsyncRunsAPI(self)
+
+    @cached_property
+    def projects(self) -> AsyncProjectAPI:
+        """Get async project API instance."""
+        from terrapyne.api.projects import AsyncProjectAPI
+
+        return AsyncProjectAPI(self)
+
+    @cached_property
+    def teams(self) -> AsyncTeamsAPI:
+        """Get async teams API instance."""
+        from terrapyne.api.teams import AsyncTeamsAPI
+
+        return AsyncTeamsAPI(self)
+
+    @cached_property
+    def state_versions(self) -> AsyncStateVersionsAPI:
+        """Get async state versions API instance."""
+        from terrapyne.api.state_versions import AsyncStateVersionsAPI
+
+        return AsyncStateVersionsAPI(self)
+
+    @cached_property
+    def vcs(self) -> AsyncVCSAPI:
+        """Get async VCS API instance."""
+        from terrapyne.api.vcs import AsyncVCSAPI
+
+        return AsyncVCSAPI(self)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Internal generic request handler with error handling."""
+        url = self._url(path)
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            start_time = self._log_request(method, url, params or json_data)
+            response = await self._http_for(url).request(
+                method,
+                url,
+                params=params or {},
+                json=json_data or {} if json_data is not None else None,
+                headers=headers,
+            )
+            self._log_response(method, url, response, start_time, retries=attempt)
+            if self._rate_limit_delay(response, attempt) is None:
+                break
+            attempt += 1
+        if not (headers and response.status_code in PASSTHROUGH_STATUSES):
+            self._handle_response_error(response)
+        return response
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """GET request with retry logic and optional caching.
+
+        Concurrent calls for the same URL and params share one request and
+        its decoded body.
+
+        Args:
+            path: API path (e.g., "/organizations/my-org/workspaces")
+            params: Query parameters
+
+        Returns:
+            JSON response dict
+
+        Raises:
+            TFCAPIError: On TFC API errors
+        """
+        url = self._url(path)
+        return await self._inflight.do(
+            ResponseCache.key(url, params), lambda: self._get(path, url, params)
+        )
+
+    async def _get(self, path: str, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        entry = self._cache_lookup(url, params)
+        if entry is not None and entry.fresh:
+            return entry.data
+
+        headers = self._conditional_headers(entry)
+        response = await self._request("GET", path, params=params, headers=headers)
+        return self._cache_response(url, params, entry, response)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    async def post(self, path: str, json_data: dict[str, Any] | None = None) -> dict[str, Any]:
+        """POST request with retry logic.
+
+        Args:
+            path: API path
+            json_data: JSON payload
+
+        Returns:
+            JSON response dict
+
+        Raises:
+            TFCAPIError: On TFC API errors
+        """
+        response = await self._request("POST", path, json_data=json_data)
+        return response.json()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    async def patch(self, path: str, json_data: dict[str, Any] | None = None) -> dict[str, Any]:
+        """PATCH request with retry logic.
+
+        Args:
+            path: API path
+            json_data: JSON payload
+
+        Returns:
+            JSON response dict
+
+        Raises:
+            TFCAPIError: On TFC API errors
+        """
+        response = await self._request("PATCH", path, json_data=json_data)
+        return response.json()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    async def delete(self, path: str, json_data: dict[str, Any] | None = None) -> None:
+        """DELETE request with retry logic.
+
+        Args:
+            path: API path
+            json_data: Optional JSON payload
+
+        Raises:
+            TFCAPIError: On TFC API errors
+        """
+        await self._request("DELETE", path, json_data=json_data)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    async def download(self, path: str, destination: BinaryIO) -> int:
+        """Stream a GET response body into a binary file object (see TFCClient.download).
+
+        Returns:
+            Number of bytes written
+        """
+        url = self._url(path)
+        await self.rate_limiter.acquire_async()
+        start_time = self._log_request("GET", url)
+        async with self._http_for(url).stream("GET", url, timeout=DOWNLOAD_TIMEOUT) as response:
+            self.rate_limiter.observe(response.headers)
+            if response.is_error:
+                await response.aread()
+                self._log_response("GET", url, response, start_time)
+                self._handle_response_error(response)
+            written = 0
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                destination.write(chunk)
+                written += len(chunk)
+        self._log_response("GET", url, response, start_time, size=written)
+        return written
+
+    async def paginate(
+        self, path: str, params: dict[str, Any] | None = None, page_size: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Paginate through API results.
+
+        Args:
+            path: API path
+            params: Query parameters
+            page_size: Items per page (max 100)
+
+        Yields:
+            Individual resource dicts
+        """
+        params = (params or {}).copy()
+        page = 1
+
+        while True:
+            params.update({"page[number]": page, "page[size]": min(page_size, 100)})
+            response_data = await self.get(path, params=params)
+
+            data = response_data.get("data", [])
+            if not data:
+                break
+
+            for item in data:
+                yield item
+
+            links = response_data.get("links", {})
+            if not links.get("next"):
+                break
+
+            page += 1
+
+    async def paginate_with_meta(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        max_inflight: int | None = None,
+    ) -> tuple[AsyncResponseIterator, int | None]:
+        """Paginate through API results with metadata.
+
+        Args:
+            path: API path
+            params: Query parameters
+            page_size: Items per page (max 100)
+            max_inflight: Pages to fetch concurrently once the page count is known
+                (defaults to the client's ``max_inflight``; 1 fetches sequentially)
+
+        Returns:
+            Tuple of (async iterator with .included property, total count)
+        """
+        params = (params or {}).copy()
+        params.update({"page[number]": 1, "page[size]": min(page_size, 100)})
+
+        first_response = await self.get(path, params=params)
+        total_count = first_response.get("meta", {}).get("pagination", {}).get("total-count")
+
+        iterator = AsyncResponseIterator(
+            first_response,
+            self,
+            path,
+            params,
+            max_inflight=max_inflight if max_inflight is not None else self.max_inflight,
+        )
+        return iterator, total_count
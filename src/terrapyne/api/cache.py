@@ -0,0 +1,280 @@
+"""Tiered response cache for GET requests.
+
+Responses are kept in a byte-bounded in-process LRU backed by a size-capped
+directory of JSON files. Freshness is decided per URL by TTL policies; stale
+entries that carry an ETag are revalidated with ``If-None-Match`` so an
+unchanged resource costs a 304 instead of a full body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("terrapyne.api")
+
+# Default TTL overrides (seconds) keyed on the API path, first match wins
+DEFAULT_TTL_POLICIES: tuple[tuple[str, int], ...] = (
+    # Team names and IDs practically never change
+    (r"^/teams/[^/]+$", 3600),
+    # Run/plan/apply status moves every few seconds
+    (r"^/(runs|plans|applies)/[^/]+$", 2),
+)
+
+DEFAULT_MEMORY_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+        }
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validator."""
+
+    data: Any
+    stored_at: float
+    size: int
+    etag: str | None = None
+    fresh: bool = field(default=True, compare=False)
+
+
+class TTLPolicy:
+    """Maps request URLs to a TTL in seconds."""
+
+    def __init__(
+        self,
+        base_url: str,
+        default_ttl: int,
+        rules: tuple[tuple[str, int], ...] = DEFAULT_TTL_POLICIES,
+    ):
+        self.base_url = base_url
+        self.default_ttl = default_ttl
+        self.rules = [(re.compile(pattern), ttl) for pattern, ttl in rules]
+
+    def ttl_for(self, url: str) -> int:
+        """TTL for a URL; off-host URLs (e.g. signed blob downloads) are never cached."""
+        if not url.startswith(self.base_url):
+            return 0
+        path = url[len(self.base_url) :]
+        for pattern, ttl in self.rules:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + disk) cache of GET response bodies.
+
+    Disk entries are ``<md5>.json`` files holding the raw response body, with
+    the ETag (if any) in a ``<md5>.etag`` sidecar; freshness comes from the
+    body file's mtime. Writes are atomic (temp file + rename) so concurrent
+    processes never observe partial entries.
+
+    Bodies served from the memory tier are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        policy: TTLPolicy,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.policy = policy
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_used = 0
+        self._disk_used: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None) -> str:
+        """Cache key for a GET request."""
+        key_content = f"GET:{url}:{json.dumps(params, sort_keys=True)}"
+        return hashlib.md5(key_content.encode()).hexdigest()
+
+    def lookup(self, url: str, params: dict[str, Any] | None) -> CacheEntry | None:
+        """Return the cached entry for a request, marking whether it is still fresh.
+
+        Stale entries are only returned when they carry an ETag that can be
+        revalidated; callers must check ``entry.fresh``.
+        """
+        ttl = self.policy.ttl_for(url)
+        if ttl <= 0:
+            return None
+
+        key = self.key(url, params)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        fresh = entry is not None and (now - entry.stored_at) < ttl
+        with self._lock:
+            if fresh:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+        if entry is None:
+            return None
+        entry.fresh = fresh
+        return entry if fresh or entry.etag else None
+
+    def store(
+        self, url: str, params: dict[str, Any] | None, data: Any, etag: str | None = None
+    ) -> None:
+        """Store a response body (no-op for URLs the policy does not cache)."""
+        if self.policy.ttl_for(url) <= 0:
+            return
+
+        body = json.dumps(data).encode()
+        key = self.key(url, params)
+        entry = CacheEntry(data=data, stored_at=time.time(), size=len(body), etag=etag)
+        self._remember(key, entry)
+        self._write_disk(key, body, etag)
+
+    def revalidated(self, url: str, params: dict[str, Any] | None, entry: CacheEntry) -> None:
+        """Record a 304 for a stale entry, restarting its TTL."""
+        with self._lock:
+            self.stats.revalidations += 1
+        entry.stored_at = time.time()
+        entry.fresh = True
+        key = self.key(url, params)
+        self._remember(key, entry)
+        try:
+            os.utime(self.cache_dir / f"{key}.json")
+        except OSError:
+            pass
+
+    # Memory tier
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_used -= previous.size
+            self._memory[key] = entry
+            self._memory_used += entry.size
+            while self._memory_used > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_used -= evicted.size
+                self.stats.evictions += 1
+
+    # Disk tier
+
+    def _read_disk(self, key: str) -> CacheEntry | None:
+        body_path = self.cache_dir / f"{key}.json"
+        try:
+            stat = body_path.stat()
+            with open(body_path, "rb") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        etag = None
+        try:
+            etag = (self.cache_dir / f"{key}.etag").read_text().strip() or None
+        except OSError:
+            pass
+
+        return CacheEntry(data=data, stored_at=stat.st_mtime, size=stat.st_size, etag=etag)
+
+    def _write_disk(self, key: str, body: bytes, etag: str | None) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if etag:
+                self._atomic_write(self.cache_dir / f"{key}.etag", etag.encode())
+            else:
+                (self.cache_dir / f"{key}.etag").unlink(missing_ok=True)
+            # Body last: its mtime marks the entry as stored
+            self._atomic_write(self.cache_dir / f"{key}.json", body)
+        except OSError as e:
+            logger.debug(f"Cache write failed: {e}")
+            return
+
+        with self._lock:
+            if self._disk_used is None:
+                self._disk_used = self._scan_disk_usage()
+            else:
+                self._disk_used += len(body)
+            over_budget = self._disk_used > self.disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _atomic_write(self, path: Path, content: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _scan_disk_usage(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*.json") if p.is_file())
+
+    def _evict_disk(self) -> None:
+        """Remove least recently stored entries until the tier is at 90% of its cap."""
+        try:
+            entries = sorted(
+                ((p.stat().st_mtime, p.stat().st_size, p) for p in self.cache_dir.glob("*.json")),
+                key=lambda item: item[0],
+            )
+        except OSError:
+            return
+
+        used = sum(size for _, size, _ in entries)
+        target = int(self.disk_bytes * 0.9)
+        evicted = 0
+        for _, size, path in entries:
+            if used <= target:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".etag").unlink(missing_ok=True)
+            used -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_used = used
+            self.stats.evictions += evicted
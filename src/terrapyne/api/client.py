@@ -2,19 +2,35 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
+import copy
+import importlib.util
 import logging
+import math
 import os
+import threading
 import time
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from terrapyne.api.cache import CacheEntry, CacheStats, ResponseCache, TTLPolicy
+from terrapyne.api.ratelimit import (
+    DEFAULT_RATE,
+    MAX_BACKOFF,
+    MAX_RATE_LIMIT_RETRIES,
+    RateLimitGovernor,
+    retry_after_seconds,
+)
+from terrapyne.api.singleflight import SingleFlight
+from terrapyne.api.state_store import StateStore
+from terrapyne.api.tracing import Span, Tracer, endpoint_template
 from terrapyne.core.credentials import TerraformCredentials
 from terrapyne.core.exceptions import (
     TFCAPIError,
@@ -24,8 +40,10 @@ from terrapyne.core.exceptions import (
     TFCRateLimitError,
     TFCServerError,
 )
+from terrapyne.models.utils import IncludedResources
 
 if TYPE_CHECKING:
+    from terrapyne.api.inventory import Inventory
     from terrapyne.api.projects import ProjectAPI
     from terrapyne.api.runs import RunsAPI
     from terrapyne.api.state_versions import StateVersionsAPI
@@ -35,10 +53,395 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("terrapyne.api")
 
+# Answers to conditional/range requests that carry meaning rather than an error:
+# 304 Not Modified (ETag revalidation) and 416 Range Not Satisfiable (no new log bytes)
+PASSTHROUGH_STATUSES = (304, 416)
+
+# Bytes written at a time by download()
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# API host pool: room for fan-out workers each prefetching pages, kept alive between bursts
+API_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+
+# Pool for signed blob URLs (state and log archives, usually on another host)
+BLOB_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0)
+
+# Metadata calls fail fast; downloads only time out when the stream stalls for minutes
+API_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DOWNLOAD_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+
+class _BaseTFCClient:
+    """Configuration, tracing and error mapping shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        host: str = "app.terraform.io",
+        organization: str | None = None,
+        credentials: TerraformCredentials | None = None,
+        debug: bool = False,
+        cache_ttl: int = 0,
+        *,
+        state_store_mb: int = 0,
+        rate_limit: float | None = None,
+        http2: bool | None = None,
+        tracer: Tracer | None = None,
+        api_origin: str | None = None,
+    ):
+        """Initialize shared client configuration (see TFCClient for arguments)."""
+        self.host = host
+        self.organization = organization
+        self.creds = credentials or TerraformCredentials.load(host=host)
+        api_origin = api_origin or os.getenv("TERRAPYNE_API_ORIGIN") or f"https://{host}"
+        self.api_origin = api_origin.rstrip("/")
+        self.base_url = f"{self.api_origin}/api/v2"
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.debug = debug or os.getenv("TERRAPYNE_DEBUG") == "1"
+        self.cache_ttl = cache_ttl or int(os.getenv("TERRAPYNE_CACHE_TTL", "0"))
+        self.cache: ResponseCache | None = None
+        if self.cache_ttl > 0:
+            self.cache = ResponseCache(self._cache_dir(), TTLPolicy(self.base_url, self.cache_ttl))
+        state_store_mb = state_store_mb or int(os.getenv("TERRAPYNE_STATE_STORE_MB", "0"))
+        self.state_store: StateStore | None = None
+        if state_store_mb > 0:
+            self.state_store = StateStore(self._state_store_dir(), state_store_mb * 1024 * 1024)
+        if rate_limit is None:
+            rate_limit = float(os.getenv("TERRAPYNE_RATE_LIMIT", DEFAULT_RATE))
+        self.rate_limiter = RateLimitGovernor(rate_limit)
+        self.tracer = tracer
+
+    def _url(self, path: str) -> str:
+        """Resolve an API path (or absolute URL) to a full URL."""
+        return path if path.startswith("http") else f"{self.base_url}{path}"
+
+    def _is_blob_url(self, url: str) -> bool:
+        """Whether a full URL points off the API host (a signed archive URL)."""
+        return not url.startswith(f"{self.api_origin}/")
+
+    def _http_options(self, *, blob: bool = False) -> dict[str, Any]:
+        """httpx client arguments for the API host or, with ``blob``, for signed URLs.
+
+        The API client multiplexes over HTTP/2 when enabled; the blob client
+        sends no credentials, since signed URLs carry their own authorization.
+        """
+        if blob:
+            return {"timeout": DOWNLOAD_TIMEOUT, "limits": BLOB_LIMITS, "follow_redirects": True}
+        return {
+            "headers": self.creds.get_headers(),
+            "timeout": API_TIMEOUT,
+            "limits": API_LIMITS,
+            "http2": self.http2,
+            "follow_redirects": True,
+        }
+
+    @staticmethod
+    def _cache_dir() -> Path:
+        """Directory of the on-disk cache tier ($TERRAPYNE_CACHE_DIR or ~/.terrapyne/cache)."""
+        override = os.getenv("TERRAPYNE_CACHE_DIR")
+        if override:
+            return Path(override).expanduser()
+        return Path("~/.terrapyne/cache").expanduser()
+
+    @staticmethod
+    def _inventory_path() -> Path:
+        """SQLite inventory database ($TERRAPYNE_INVENTORY or ~/.terrapyne/inventory.db)."""
+        override = os.getenv("TERRAPYNE_INVENTORY")
+        if override:
+            return Path(override).expanduser()
+        return Path("~/.terrapyne/inventory.db").expanduser()
+
+    @staticmethod
+    def _state_store_dir() -> Path:
+        """Directory of the local state store ($TERRAPYNE_STATE_STORE_DIR or ~/.terrapyne/state)."""
+        override = os.getenv("TERRAPYNE_STATE_STORE_DIR")
+        if override:
+            return Path(override).expanduser()
+        return Path("~/.terrapyne/state").expanduser()
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss/eviction/revalidation counters of the response cache."""
+        return self.cache.stats if self.cache else CacheStats()
+
+    def _cache_lookup(self, url: str, params: dict[str, Any] | None) -> CacheEntry | None:
+        """Return the cached entry for a GET (fresh, or stale but revalidatable)."""
+        if self.cache is None:
+            return None
+        entry = self.cache.lookup(url, params)
+        if entry is not None and entry.fresh:
+            if self.debug:
+                logger.info(f"Cache Hit: GET {url}")
+            self._trace("GET", url, time.time(), cache="hit")
+        return entry
+
+    @staticmethod
+    def _conditional_headers(entry: CacheEntry | None) -> dict[str, str] | None:
+        """If-None-Match headers for revalidating a stale entry."""
+        if entry is not None and entry.etag:
+            return {"If-None-Match": entry.etag}
+        return None
+
+    def _cache_response(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        entry: CacheEntry | None,
+        response: httpx.Response,
+    ) -> Any:
+        """Resolve a GET response against the cache and return its body."""
+        if self.cache is None:
+            return response.json()
+        if entry is not None and response.status_code == 304:
+            if self.debug:
+                logger.info(f"Cache Revalidated: GET {url}")
+            self.cache.revalidated(url, params, entry)
+            return entry.data
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        self.cache.store(url, params, data, etag=etag if isinstance(etag, str) else None)
+        return data
+
+    def _log_request(self, method: str, url: str, params: Any = None) -> float:
+        if self.debug:
+            logger.info(f"API Request: {method} {url}")
+            if params:
+                logger.info(f"  Params: {params}")
+        return time.time()
+
+    def _log_response(
+        self,
+        method: str,
+        url: str,
+        response: httpx.Response,
+        start_time: float,
+        *,
+        retries: int = 0,
+        size: int | None = None,
+    ) -> None:
+        duration = time.time() - start_time
+        if self.debug:
+            logger.info(f"API Response: {method} {url} -> {response.status_code} ({duration:.3f}s)")
+            if response.status_code >= 400:
+                logger.info(f"  Error Body: {response.text}")
+        if self.tracer is not None:
+            cache = None
+            if self.cache is not None and method == "GET":
+                cache = "revalidated" if response.status_code == 304 else "miss"
+            self._trace(
+                method,
+                url,
+                start_time,
+                status=response.status_code,
+                size=response.num_bytes_downloaded if size is None else size,
+                retries=retries,
+                cache=cache,
+            )
+
+    def _trace(
+        self,
+        method: str,
+        url: str,
+        start_time: float,
+        *,
+        status: int | None = None,
+        size: int = 0,
+        retries: int = 0,
+        cache: str | None = None,
+    ) -> None:
+        """Record a span for one call on the client's tracer (if any)."""
+        if self.tracer is None:
+            return
+        self.tracer.record(
+            Span(
+                method=method,
+                endpoint=endpoint_template(url, self.base_url),
+                start=start_time,
+                duration=time.time() - start_time,
+                status=status,
+                bytes=size,
+                retries=retries,
+                cache=cache,
+                thread=threading.get_ident(),
+            )
+        )
+
+    def _rate_limit_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Feed a response to the governor; for a retryable 429, pause and return the wait.
+
+        Returns None when the response should be handled as-is (not a 429,
+        or a 429 that has used up its retries and will be raised).
+        """
+        self.rate_limiter.observe(response.headers)
+        if response.status_code != 429 or attempt >= MAX_RATE_LIMIT_RETRIES:
+            return None
+        delay = retry_after_seconds(response.headers)
+        if delay is None:
+            delay = min(2.0**attempt, MAX_BACKOFF)
+        logger.info(f"Rate limited; retrying in {delay:.1f}s")
+        self.rate_limiter.pause(delay)
+        return delay
+
+    def _handle_response_error(self, response: httpx.Response) -> None:
+        """Handle HTTP response errors and raise domain-specific exceptions."""
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status_code = response.status_code
+            message = f"TFC API Error: {status_code} - {response.text}"
+
+            if status_code in (401, 403):
+                raise TFCAuthenticationError(
+                    message, status_code=status_code, response=response
+                ) from e
+            if status_code == 404:
+                raise TFCNotFoundError(message, status_code=status_code, response=response) from e
+            if status_code == 409:
+                raise TFCConflictError(message, status_code=status_code, response=response) from e
+            if status_code == 429:
+                raise TFCRateLimitError(message, status_code=status_code, response=response) from e
+            if status_code >= 500:
+                raise TFCServerError(message, status_code=status_code, response=response) from e
+
+            raise TFCAPIError(message, status_code=status_code, response=response) from e
+
+    def get_organization(self, org: str | None = None) -> str:
+        """Get organization name (from param, instance, or raise error).
+
+        Args:
+            org: Optional organization name
+
+        Returns:
+            Organization name
+
+        Raises:
+            ValueError: If no organization specified
+        """
+        organization = org or self.organization
+        if not organization:
+            raise ValueError(
+                "Organization not specified. "
+                "Pass --organization or set it in client initialization."
+            )
+        return organization
+
+
+def _page_count(first_resp: dict[str, Any], page_size: Any) -> int | None:
+    """Page count advertised by the first page of a listing, if any."""
+    pagination = first_resp.get("meta", {}).get("pagination", {})
+    total_pages = pagination.get("total-pages")
+    if isinstance(total_pages, int):
+        return total_pages
+    total_count = pagination.get("total-count")
+    if isinstance(total_count, int) and isinstance(page_size, int) and page_size > 0:
+        return math.ceil(total_count / page_size)
+    return None
+
+
+class ResponseIterator:
+    """Iterator over every item of a paginated listing.
+
+    ``included`` always holds the included resources of the page currently
+    being yielded, as ``IncludedResources`` so that the models built from the
+    page share one lookup index. Once the first page reveals the page count (from
+    ``meta.pagination.total-pages`` or ``total-count``), up to ``max_inflight``
+    of the remaining pages are fetched concurrently; items are still yielded
+    in page order.
+    """
+
+    def __init__(
+        self,
+        first_resp: dict[str, Any],
+        client: TFCClient,
+        path: str,
+        base_params: dict[str, Any],
+        max_inflight: int = 1,
+    ):
+        self.first_resp = first_resp
+        self.client = client
+        self.path = path
+        self.params = base_params
+        self.max_inflight = max_inflight
+        self.included = IncludedResources(first_resp.get("included", []))
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Yield items from first page
+        yield from self.first_resp.get("data", [])
+
+        # Continue with remaining pages if there are any
+        if not self.first_resp.get("links", {}).get("next"):
+            return
+
+        total_pages = _page_count(self.first_resp, self.params.get("page[size]"))
+        if self.max_inflight > 1 and total_pages and total_pages > 1:
+            yield from self._iter_prefetched(total_pages)
+        else:
+            yield from self._iter_sequential()
+
+    def _iter_sequential(self, page: int = 2) -> Iterator[dict[str, Any]]:
+        while True:
+            self.params["page[number]"] = page
+            response_data = self.client.get(self.path, params=self.params)
+            self.included = IncludedResources(response_data.get("included", []))
+
+            data = response_data.get("data", [])
+            if not data:
+                break
+
+            yield from data
+
+            links = response_data.get("links", {})
+            if not links.get("next"):
+                break
+
+            page += 1
+
+    def _iter_prefetched(self, total_pages: int) -> Iterator[dict[str, Any]]:
+        def fetch(page: int) -> dict[str, Any]:
+            return self.client.get(self.path, params={**self.params, "page[number]": page})
 
-class TFCClient:
+        pages = iter(range(2, total_pages + 1))
+        has_more = False
+        with ThreadPoolExecutor(max_workers=self.max_inflight) as executor:
+            window: deque[Future[dict[str, Any]]] = deque(
+                executor.submit(fetch, page) for page in islice(pages, self.max_inflight)
+            )
+            try:
+                while window:
+                    response_data = window.popleft().result()
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        window.append(executor.submit(fetch, next_page))
+
+                    self.included = IncludedResources(response_data.get("included", []))
+                    data = response_data.get("data", [])
+                    if not data:
+                        return
+
+                    yield from data
+
+                    # Items can be deleted between requests; stop where the server stops
+                    has_more = bool(response_data.get("links", {}).get("next"))
+                    if not has_more:
+                        return
+            finally:
+                for future in window:
+                    future.cancel()
+
+        # Items were added after the first page was read; finish page by page
+        if has_more:
+            yield from self._iter_sequential(total_pages + 1)
+
+
+class TFCClient(_BaseTFCClient):
     """Terraform Cloud API client with retry logic and pagination support."""
 
+    # API manager properties, bound to the client (and organization) that created them
+    _MANAGERS = ("workspaces", "runs", "projects", "teams", "state_versions", "vcs")
+
+    # Borrowed clients (see borrow) leave the shared connections open on close
+    _borrowed = False
+
     def __init__(
         self,
         host: str = "app.terraform.io",
@@ -46,6 +449,14 @@ class TFCClient:
         credentials: TerraformCredentials | None = None,
         debug: bool = False,
         cache_ttl: int = 0,
+        *,
+        max_inflight: int = 1,
+        state_store_mb: int = 0,
+        rate_limit: float | None = None,
+        http2: bool | None = None,
+        tracer: Tracer | None = None,
+        inventory_max_age: float | None = None,
+        api_origin: str | None = None,
     ):
         """Initialize TFC client.
 
@@ -55,18 +466,38 @@ class TFCClient:
             credentials: Optional pre-loaded credentials (otherwise loaded from tfrc.json)
             debug: Enable API call tracing
             cache_ttl: Cache TTL in seconds (0 to disable)
+            max_inflight: Default number of pages paginate_with_meta fetches concurrently
+            state_store_mb: Size cap in MiB of the local store of downloaded state
+                versions (0 to disable)
+            rate_limit: Requests per second shared by every request of this client
+                (default: TERRAPYNE_RATE_LIMIT or 25; 0 to only honour 429s)
+            http2: Multiplex API requests over HTTP/2 (default: when the ``h2``
+                package is installed, e.g. via ``terrapyne[http2]``)
+            tracer: Records a span per request and per-endpoint latency histograms
+            inventory_max_age: Answer list queries from the local inventory, synced
+                first when older than this many seconds (``math.inf`` to never sync;
+                default: TERRAPYNE_INVENTORY_MAX_AGE, else always ask the API)
+            api_origin: Scheme and host serving the API, e.g. a local stand-in
+                server (default: TERRAPYNE_API_ORIGIN, else ``https://{host}``)
         """
-        self.host = host
-        self.organization = organization
-        self.creds = credentials or TerraformCredentials.load(host=host)
-        self.base_url = f"https://{host}/api/v2"
-        self.debug = debug or os.getenv("TERRAPYNE_DEBUG") == "1"
-        self.cache_ttl = cache_ttl or int(os.getenv("TERRAPYNE_CACHE_TTL", "0"))
-        self.client = httpx.Client(
-            headers=self.creds.get_headers(),
-            timeout=30.0,
-            follow_redirects=True,
+        super().__init__(
+            host,
+            organization,
+            credentials,
+            debug,
+            cache_ttl,
+            state_store_mb=state_store_mb,
+            rate_limit=rate_limit,
+            http2=http2,
+            tracer=tracer,
+            api_origin=api_origin,
         )
+        self.max_inflight = max(1, max_inflight)
+        if inventory_max_age is None and os.getenv("TERRAPYNE_INVENTORY_MAX_AGE"):
+            inventory_max_age = float(os.environ["TERRAPYNE_INVENTORY_MAX_AGE"])
+        self.inventory_max_age = inventory_max_age
+        self._inflight = SingleFlight()
+        self.client = httpx.Client(**self._http_options())
 
     def __enter__(self) -> "TFCClient":
         return self
@@ -75,8 +506,63 @@ class TFCClient:
         self.close()
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP clients (unless they are borrowed)."""
+        if self._borrowed:
+            return
         self.client.close()
+        if "blob_client" in self.__dict__:
+            self.blob_client.close()
+        if "inventory" in self.__dict__:
+            self.inventory.close()
+
+    def borrow(
+        self,
+        organization: str | None = None,
+        *,
+        tracer: Tracer | None = None,
+        inventory_max_age: float | None = None,
+    ) -> TFCClient:
+        """A client for ``organization`` that shares this client's connections and caches.
+
+        Credentials, connection pools, response cache, state store, rate
+        limiter and in-flight GETs are shared; closing the borrowed client
+        leaves them open. ``tfc serve`` lends its warm client to every command
+        this way.
+
+        Args:
+            organization: Default organization of the borrowed client
+            tracer: Tracer of the borrowed client (this client's is not shared)
+            inventory_max_age: Inventory freshness bound of the borrowed client
+
+        Returns:
+            Borrowed client
+        """
+        # Create the lazily opened resources now so that the copy shares them
+        self.blob_client  # noqa: B018
+        self.inventory  # noqa: B018
+        borrowed = copy.copy(self)
+        for name in self._MANAGERS:
+            borrowed.__dict__.pop(name, None)
+        borrowed.organization = organization
+        borrowed.tracer = tracer
+        borrowed.inventory_max_age = inventory_max_age
+        borrowed._borrowed = True
+        return borrowed
+
+    @cached_property
+    def blob_client(self) -> httpx.Client:
+        """Pooled HTTP client for signed URLs off the API host (created on first use)."""
+        return httpx.Client(**self._http_options(blob=True))
+
+    @cached_property
+    def inventory(self) -> Inventory:
+        """Local SQLite inventory of this client's host (opened on first use)."""
+        from terrapyne.api.inventory import Inventory
+
+        return Inventory(self._inventory_path(), self.host)
+
+    def _http_for(self, url: str) -> httpx.Client:
+        return self.blob_client if self._is_blob_url(url) else self.client
 
     @cached_property
     def workspaces(self) -> "WorkspaceAPI":
@@ -120,74 +606,56 @@ class TFCClient:
 
         return VCSAPI(self)
 
-    def _log_request(self, method: str, url: str, params: Any = None) -> float:
-        if self.debug:
-            logger.info(f"API Request: {method} {url}")
-            if params:
-                logger.info(f"  Params: {params}")
-        return time.time()
-
-    def _log_response(
-        self, method: str, url: str, response: httpx.Response, start_time: float
-    ) -> None:
-        duration = time.time() - start_time
-        if self.debug:
-            logger.info(f"API Response: {method} {url} -> {response.status_code} ({duration:.3f}s)")
-            if response.status_code >= 400:
-                logger.info(f"  Error Body: {response.text}")
-
-    def _handle_response_error(self, response: httpx.Response) -> None:
-        """Handle HTTP response errors and raise domain-specific exceptions."""
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            status_code = response.status_code
-            message = f"TFC API Error: {status_code} - {response.text}"
-
-            if status_code in (401, 403):
-                raise TFCAuthenticationError(
-                    message, status_code=status_code, response=response
-                ) from e
-            if status_code == 404:
-                raise TFCNotFoundError(message, status_code=status_code, response=response) from e
-            if status_code == 409:
-                raise TFCConflictError(message, status_code=status_code, response=response) from e
-            if status_code == 429:
-                raise TFCRateLimitError(message, status_code=status_code, response=response) from e
-            if status_code >= 500:
-                raise TFCServerError(message, status_code=status_code, response=response) from e
-
-            raise TFCAPIError(message, status_code=status_code, response=response) from e
-
     def _request(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Internal generic request handler with error handling."""
-        url = path if path.startswith("http") else f"{self.base_url}{path}"
-        start_time = self._log_request(method, url, params or json_data)
-        response = self.client.request(
-            method,
-            url,
-            params=params or {},
-            json=json_data or {} if json_data is not None else None,
-        )
-        self._log_response(method, url, response, start_time)
-        self._handle_response_error(response)
+        """Internal generic request handler with error handling.
+
+        A 304 answer to a conditional request (``headers`` with
+        ``If-None-Match``) and a 416 answer to a ``Range`` request are
+        returned as-is rather than raised.
+
+        Every attempt is paced by the client's rate-limit governor, and a 429
+        is retried after its ``Retry-After`` (the request was never processed,
+        so this is safe for any method) before TFCRateLimitError is raised.
+        """
+        url = self._url(path)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            start_time = self._log_request(method, url, params or json_data)
+            response = self._http_for(url).request(
+                method,
+                url,
+                params=params or {},
+                json=json_data or {} if json_data is not None else None,
+                headers=headers,
+            )
+            self._log_response(method, url, response, start_time, retries=attempt)
+            if self._rate_limit_delay(response, attempt) is None:
+                break
+            attempt += 1
+        if not (headers and response.status_code in PASSTHROUGH_STATUSES):
+            self._handle_response_error(response)
         return response
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((TFCAPIError, TFCServerError)),
+        retry=retry_if_exception_type(TFCServerError),
         reraise=True,
     )
     def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """GET request with retry logic and optional caching.
 
+        Concurrent calls for the same URL and params share one request and
+        its decoded body.
+
         Args:
             path: API path (e.g., "/organizations/my-org/workspaces")
             params: Query parameters
@@ -198,34 +666,19 @@ class TFCClient:
         Raises:
             TFCAPIError: On TFC API errors
         """
-        # Cache check
-        url = path if path.startswith("http") else f"{self.base_url}{path}"
-        cache_path = None
-        if self.cache_ttl > 0:
-            cache_dir = Path("~/.terrapyne/cache").expanduser()
-            cache_dir.mkdir(parents=True, exist_ok=True)
-
-            key_content = f"GET:{url}:{json.dumps(params, sort_keys=True)}"
-            key = hashlib.md5(key_content.encode()).hexdigest()
-            cache_path = cache_dir / f"{key}.json"
-
-            if cache_path.exists():
-                mtime = cache_path.stat().st_mtime
-                if (time.time() - mtime) < self.cache_ttl:
-                    if self.debug:
-                        logger.info(f"Cache Hit: GET {url}")
-                    with open(cache_path) as f:
-                        return json.load(f)
-
-        response = self._request("GET", path, params=params)
-        data = response.json()
+        url = self._url(path)
+        return self._inflight.do(
+            ResponseCache.key(url, params), lambda: self._get(path, url, params)
+        )
 
-        # Store in cache
-        if cache_path:
-            with open(cache_path, "w") as f:
-                json.dump(data, f)
+    def _get(self, path: str, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        entry = self._cache_lookup(url, params)
+        if entry is not None and entry.fresh:
+            return entry.data
 
-        return data
+        headers = self._conditional_headers(entry)
+        response = self._request("GET", path, params=params, headers=headers)
+        return self._cache_response(url, params, entry, response)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -289,6 +742,44 @@ class TFCClient:
         """
         self._request("DELETE", path, json_data=json_data)
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(TFCServerError),
+        reraise=True,
+    )
+    def download(self, path: str, destination: BinaryIO) -> int:
+        """Stream a GET response body into a binary file object.
+
+        Unlike get(), the body is neither parsed nor cached and is written
+        in chunks, so memory use does not grow with the download size.
+
+        Args:
+            path: API path or absolute URL (e.g., a signed state download URL)
+            destination: Binary file object to write to
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            TFCAPIError: On TFC API errors (before anything is written)
+        """
+        url = self._url(path)
+        self.rate_limiter.acquire()
+        start_time = self._log_request("GET", url)
+        with self._http_for(url).stream("GET", url, timeout=DOWNLOAD_TIMEOUT) as response:
+            self.rate_limiter.observe(response.headers)
+            if response.is_error:
+                response.read()
+                self._log_response("GET", url, response, start_time)
+                self._handle_response_error(response)
+            written = 0
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                destination.write(chunk)
+                written += len(chunk)
+        self._log_response("GET", url, response, start_time, size=written)
+        return written
+
     def paginate(
         self, path: str, params: dict[str, Any] | None = None, page_size: int = 100
     ) -> Iterator[dict[str, Any]]:
@@ -324,20 +815,27 @@ class TFCClient:
             page += 1
 
     def paginate_with_meta(
-        self, path: str, params: dict[str, Any] | None = None, page_size: int = 100
-    ) -> tuple[Any, int | None]:
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        max_inflight: int | None = None,
+    ) -> tuple[ResponseIterator, int | None]:
         """Paginate through API results with metadata.
 
         Args:
             path: API path
             params: Query parameters
             page_size: Items per page (max 100)
+            max_inflight: Pages to fetch concurrently once the page count is known
+                (defaults to the client's ``max_inflight``; 1 fetches sequentially)
 
         Returns:
             Tuple of (iterator-like object with .included property, total count)
         """
+        page_size = min(page_size, 100)
         params = (params or {}).copy()
-        params.update({"page[number]": 1, "page[size]": min(page_size, 100)})
+        params.update({"page[number]": 1, "page[size]": page_size})
 
         # Get first page to extract total count
         first_response = self.get(path, params=params)
@@ -348,58 +846,11 @@ class TFCClient:
         pagination = meta.get("pagination", {})
         total_count = pagination.get("total-count")
 
-        # Generator to yield items from all pages
-        class ResponseIterator:
-            def __init__(self, first_resp: dict[str, Any], client: TFCClient, base_params: dict):
-                self.first_resp = first_resp
-                self.client = client
-                self.params = base_params
-                self.included = first_resp.get("included", [])
-
-            def __iter__(self) -> Iterator[dict[str, Any]]:
-                # Yield items from first page
-                data = self.first_resp.get("data", [])
-                yield from data
-
-                # Continue with remaining pages if there are any
-                links = self.first_resp.get("links", {})
-                if links.get("next"):
-                    page = 2
-                    while True:
-                        self.params["page[number]"] = page
-                        response_data = self.client.get(path, params=self.params)
-                        self.included = response_data.get("included", [])
-
-                        data = response_data.get("data", [])
-                        if not data:
-                            break
-
-                        yield from data
-
-                        links = response_data.get("links", {})
-                        if not links.get("next"):
-                            break
-
-                        page += 1
-
-        return ResponseIterator(first_response, self, params), total_count
-
-    def get_organization(self, org: str | None = None) -> str:
-        """Get organization name (from param, instance, or raise error).
-
-        Args:
-            org: Optional organization name
-
-        Returns:
-            Organization name
-
-        Raises:
-            ValueError: If no organization specified
-        """
-        organization = org or self.organization
-        if not organization:
-            raise ValueError(
-                "Organization not specified. "
-                "Pass --organization or set it in client initialization."
-            )
-        return organization
+        iterator = ResponseIterator(
+            first_response,
+            self,
+            path,
+            params,
+            max_inflight=max_inflight if max_inflight is not None else self.max_inflight,
+        )
+        return iterator, total_count
@@ -0,0 +1,66 @@
+"""Bounded-concurrency fan-out of independent API calls."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 8
+
+
+class FanOut:
+    """Run one callable over many inputs on a bounded thread pool.
+
+    Results come back in input order. Rate limiting is left to the client:
+    its shared governor paces every worker and retries 429s after
+    ``Retry-After``, so the fan-out does not add a retry layer of its own.
+
+    Example:
+        fan = FanOut(concurrency=16)
+        for ws, (runs, _) in zip(workspaces, fan.map(lambda w: api.list(w.id), workspaces)):
+            ...
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply ``func`` to every item concurrently, yielding results in input order.
+
+        The first exception raised by ``func`` is re-raised when its result
+        is reached.
+        """
+        items = list(items)
+        if self.concurrency == 1 or len(items) <= 1:
+            for item in items:
+                yield func(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(items))) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+def fan_out(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int = DEFAULT_CONCURRENCY
+) -> list[R]:
+    """Apply ``func`` to every item with at most ``concurrency`` calls in flight.
+
+    Args:
+        func: Callable taking one item
+        items: Inputs
+        concurrency: Maximum concurrent calls
+
+    Returns:
+        Results in input order
+    """
+    return list(FanOut(concurrency=concurrency).map(func, items))
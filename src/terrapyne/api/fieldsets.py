@@ -0,0 +1,47 @@
+"""JSON:API sparse fieldsets for list endpoints.
+
+Listing endpoints return every attribute of every resource by default, most
+of which a table never shows. A fieldset (``fields[workspaces]=name,locked``)
+asks the API for only the named attributes and relationships, which shrinks
+each page and the work of parsing it. Models built from sparse resources
+leave the omitted attributes at their defaults, so a profile must name
+everything its consumer reads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+# Resource type -> attribute/relationship names to request
+Fieldsets = Mapping[str, Sequence[str]]
+
+# `tfc workspace list` table: name (and the environment derived from it), version, branch, lock
+WORKSPACE_TABLE_FIELDS: Fieldsets = {
+    "workspaces": ("name", "terraform-version", "vcs-repo", "locked", "updated-at"),
+}
+
+# `tfc run list` table: resource counts come from the included plan
+RUN_TABLE_FIELDS: Fieldsets = {
+    "runs": ("status", "message", "created-at", "plan"),
+    "plans": ("resource-additions", "resource-changes", "resource-destructions"),
+}
+
+# Include for RUN_TABLE_FIELDS (the commit details of configuration versions are not shown)
+RUN_TABLE_INCLUDE = "plan"
+
+# `tfc project list` table, plus the counts ProjectAPI.count_workspaces can reuse
+PROJECT_TABLE_FIELDS: Fieldsets = {
+    "projects": ("name", "description", "created-at", "resource-count", "workspace-count"),
+}
+
+
+def fieldset_params(fields: Fieldsets | None) -> dict[str, str]:
+    """Query parameters requesting a sparse fieldset per resource type.
+
+    Args:
+        fields: Resource type to the attributes (and relationships) to return
+
+    Returns:
+        ``fields[<type>]`` parameters (empty when ``fields`` is None)
+    """
+    return {f"fields[{type_}]": ",".join(names) for type_, names in (fields or {}).items()}
@@ -0,0 +1,647 @@
+"""Local SQLite inventory of an organization.
+
+Org-wide commands otherwise walk the API from scratch on every call. An
+``Inventory`` keeps an organization's workspaces (with their latest runs),
+projects, teams and team access to projects in a SQLite database, as the
+JSON:API resources the API returned, so models are rebuilt from them exactly
+as from a live response.
+
+Syncs fetch as little as the API allows:
+
+- workspaces are listed most recently changed first (``latest-change-at``:
+  when the newest state version was created), and the walk stops once
+  ``INCREMENTAL_STOP_AFTER`` workspaces in a row are unchanged; when the
+  listing turns out not to be in that order, or its total count disagrees
+  with the inventory afterwards (a workspace was deleted), it is walked in full.
+  Changes that create no state version (settings, locks, renames) are not
+  seen until the next full walk;
+- latest runs are refreshed from the organization's run listing, newest
+  first, back to the previous sync (or the oldest unfinished latest run);
+- projects and teams, a few pages in most organizations, are listed in full,
+  and team access is read again for new and changed projects;
+- everything is walked in full at least every ``FULL_SYNC_INTERVAL``, which
+  also drops deleted resources and re-reads the team access of every project.
+
+The API facades answer list and search queries from the inventory when their
+client has an ``inventory_max_age`` (``--from-inventory`` or
+``--inventory-max-age``), syncing first when it is older than that.
+
+Example:
+    inventory = Inventory(Path("~/.terrapyne/inventory.db").expanduser())
+    inventory.sync(client, "my-org")
+    workspaces = inventory.workspaces("my-org", search="prod-*")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from terrapyne.api.fanout import FanOut
+from terrapyne.core.exceptions import TFCNotFoundError
+from terrapyne.models.project import Project
+from terrapyne.models.run import RunStatus
+from terrapyne.models.team import Team
+from terrapyne.models.team_access import TeamProjectAccess
+from terrapyne.models.utils import parse_iso_datetime
+from terrapyne.models.workspace import Workspace
+
+if TYPE_CHECKING:
+    from terrapyne.api.client import TFCClient
+
+logger = logging.getLogger("terrapyne.api")
+
+# Collections a sync covers, in dependency order (team access is read per project)
+COLLECTIONS = ("projects", "teams", "workspaces", "team-projects")
+
+# Walk every collection in full at least this often (seconds)
+FULL_SYNC_INTERVAL = 24 * 3600
+
+# Consecutive unchanged workspaces after which an incremental walk stops
+INCREMENTAL_STOP_AFTER = 20
+
+# How far back an incremental sync looks for runs (older unfinished runs wait for a full sync)
+RUN_LOOKBACK = timedelta(days=7)
+
+# Clock skew allowed between this machine and the API when comparing run times
+CLOCK_SKEW = timedelta(minutes=5)
+
+# Bump when the schema changes; an inventory with another version is rebuilt
+SCHEMA_VERSION = 2
+
+# ``sort_key`` is the attribute a collection is walked by (latest-change-at for workspaces,
+# created-at for runs, updated-at otherwise).
+# ``related_id`` is the latest run of a workspace, the team of a team-project and the workspace
+# of a run.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    host TEXT NOT NULL,
+    organization TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    project_id TEXT,
+    related_id TEXT,
+    sort_key TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (host, organization, type, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS resources_by_name ON resources (host, organization, type, name);
+CREATE INDEX IF NOT EXISTS resources_by_project
+    ON resources (host, organization, type, project_id);
+CREATE TABLE IF NOT EXISTS syncs (
+    host TEXT NOT NULL,
+    organization TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL,
+    PRIMARY KEY (host, organization, collection)
+);
+"""
+
+
+@dataclass
+class SyncStats:
+    """What syncing one collection fetched and changed."""
+
+    collection: str
+    fetched: int = 0
+    changed: int = 0
+    deleted: int = 0
+    full: bool = False
+
+
+@dataclass(frozen=True)
+class CollectionStatus:
+    """Size and age of one collection in the inventory."""
+
+    collection: str
+    count: int
+    synced_at: float | None
+    full_synced_at: float | None
+
+
+def _relationship_id(item: dict[str, Any], name: str) -> str | None:
+    data = (item.get("relationships", {}).get(name) or {}).get("data") or {}
+    return data.get("id")
+
+
+def _columns(type_: str, item: dict[str, Any]) -> tuple[str | None, ...]:
+    """(name, project_id, related_id, sort_key) of a resource."""
+    attrs = item.get("attributes", {})
+    if type_ == "workspaces":
+        return (
+            attrs.get("name"),
+            _relationship_id(item, "project"),
+            _relationship_id(item, "latest-run"),
+            attrs.get("latest-change-at"),
+        )
+    if type_ == "team-projects":
+        return None, _relationship_id(item, "project"), _relationship_id(item, "team"), None
+    if type_ == "runs":
+        return None, None, _relationship_id(item, "workspace"), attrs.get("created-at")
+    return attrs.get("name"), None, None, attrs.get("updated-at")
+
+
+def _like_pattern(search: str, wildcard: bool) -> str:
+    """SQL LIKE pattern (escaped with ``\\``) for a name search."""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped.replace("*", "%") if wildcard else f"%{escaped}%"
+
+
+def inventory_for(client: Any, organization: str | None, collection: str) -> Inventory | None:
+    """The inventory a facade should answer a list query from, or None to ask the API.
+
+    Only clients with an ``inventory_max_age`` use the inventory; one older
+    than that (or never synced) is synced first.
+
+    Args:
+        client: Client of the facade
+        organization: Organization name
+        collection: Collection the query reads (e.g. ``workspaces``)
+    """
+    max_age = getattr(client, "inventory_max_age", None)
+    if not isinstance(organization, str) or not isinstance(max_age, int | float):
+        return None
+    inventory: Inventory = client.inventory
+    age = inventory.age(organization, collection)
+    if age is None or age > max_age:
+        inventory.sync(client, organization, [collection])
+    return inventory
+
+
+def _is_unfinished(run: dict[str, Any]) -> bool:
+    try:
+        return not RunStatus(run.get("attributes", {}).get("status")).is_terminal
+    except ValueError:
+        return True
+
+
+class Inventory:
+    """SQLite store of the resources of one or more organizations on one host.
+
+    The database may be shared by concurrent processes (it uses SQLite's WAL
+    journal); each collection is synced in a single transaction, so readers
+    see it either before or after a sync, never halfway.
+    """
+
+    def __init__(self, path: Path, host: str = "app.terraform.io"):
+        """Initialize the inventory (the database is opened on first use).
+
+        Args:
+            path: SQLite database file (created ``0600`` in a ``0700`` directory)
+            host: TFC/TFE host whose resources this inventory holds
+        """
+        self.path = path
+        self.host = host
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Open connection to the database (created on first use)."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.path.touch(mode=0o600, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            logger.info(f"Rebuilding inventory {self.path} (schema {version} -> {SCHEMA_VERSION})")
+            conn.executescript("DROP TABLE IF EXISTS resources; DROP TABLE IF EXISTS syncs;")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def age(self, organization: str, collection: str) -> float | None:
+        """Seconds since ``collection`` was last synced, or None if it never was."""
+        with self._lock:
+            row = self.db.execute(
+                "SELECT synced_at FROM syncs"
+                " WHERE host = ? AND organization = ? AND collection = ?",
+                (self.host, organization, collection),
+            ).fetchone()
+        return None if row is None else max(0.0, time.time() - row[0])
+
+    def status(self, organization: str) -> list[CollectionStatus]:
+        """Size and last sync times of every collection of an organization."""
+        statuses = []
+        with self._lock:
+            for collection in COLLECTIONS:
+                count = self._count(organization, collection)
+                row = self.db.execute(
+                    "SELECT synced_at, full_synced_at FROM syncs"
+                    " WHERE host = ? AND organization = ? AND collection = ?",
+                    (self.host, organization, collection),
+                ).fetchone()
+                statuses.append(CollectionStatus(collection, count, *(row or (None, None))))
+        return statuses
+
+    def sync(
+        self,
+        client: TFCClient,
+        organization: str | None = None,
+        collections: Sequence[str] = COLLECTIONS,
+        *,
+        full: bool = False,
+    ) -> list[SyncStats]:
+        """Bring collections of an organization up to date with the API.
+
+        Args:
+            client: Client to read the API with
+            organization: Organization name (uses client default if not specified)
+            collections: Collections to sync (see ``COLLECTIONS``)
+            full: Walk every collection in full rather than incrementally
+
+        Returns:
+            Per-collection statistics, in sync order
+        """
+        org = client.get_organization(organization)
+        unknown = set(collections) - set(COLLECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown inventory collections: {', '.join(sorted(unknown))}")
+        if "team-projects" in collections and self.age(org, "projects") is None:
+            collections = ["projects", *collections]
+
+        stats = []
+        changed_projects: set[str] | None = None
+        for collection in (c for c in COLLECTIONS if c in collections):
+            last_full = self._full_synced_at(org, collection)
+            walk_full = full or last_full is None or time.time() - last_full > FULL_SYNC_INTERVAL
+            if collection == "workspaces":
+                result = self._sync_workspaces(client, org, full=walk_full)
+            elif collection == "team-projects":
+                result = self._sync_team_access(
+                    client, org, None if walk_full else changed_projects
+                )
+            else:
+                result, changed = self._sync_listing(client, org, collection)
+                if collection == "projects":
+                    changed_projects = changed
+            stats.append(result)
+            logger.debug(
+                f"Inventory sync of {org}/{collection}: {result.fetched} fetched, "
+                f"{result.changed} changed, {result.deleted} deleted"
+            )
+        return stats
+
+    def _sync_listing(
+        self, client: TFCClient, org: str, collection: str
+    ) -> tuple[SyncStats, set[str]]:
+        """Walk a whole listing, replacing the collection with what it returned.
+
+        Returns:
+            Statistics, and the IDs of the resources that are new or changed
+        """
+        items, _ = client.paginate_with_meta(f"/organizations/{org}/{collection}")
+        resources = [(collection, item) for item in items]
+        stats = SyncStats(collection, fetched=len(resources), full=True)
+        with self._lock, self.db:
+            changed = self._upsert(org, resources)
+            stats.deleted = self._delete_missing(org, collection, {i["id"] for _, i in resources})
+            self._record_sync(org, collection, full=True)
+        stats.changed = len(changed)
+        return stats, changed
+
+    def _sync_workspaces(self, client: TFCClient, org: str, *, full: bool) -> SyncStats:
+        """Walk workspaces most recently changed first, stopping early unless ``full``."""
+        known = self._sort_keys(org, "workspaces")
+        last_synced = time.time() - (self.age(org, "workspaces") or 0)
+        items, total = client.paginate_with_meta(
+            f"/organizations/{org}/workspaces",
+            params={"include": "latest_run", "sort": "-latest-change-at"},
+            max_inflight=None if full else 1,
+        )
+        stats = SyncStats("workspaces", full=full)
+        resources: list[tuple[str, dict[str, Any]]] = []
+        seen: set[str] = set()
+        included = None
+        unchanged = 0
+        in_order = True
+        previous: str | None = None
+        complete = True
+        for item in items:
+            if items.included is not included:
+                included = items.included
+                resources.extend(("runs", run) for run in included if run.get("type") == "runs")
+            resources.append(("workspaces", item))
+            seen.add(item["id"])
+            key = item.get("attributes", {}).get("latest-change-at")
+            if previous is not None and key is not None and key > previous:
+                in_order = False
+            previous = key or previous
+            unchanged = unchanged + 1 if key is not None and known.get(item["id"]) == key else 0
+            if not full and in_order and unchanged >= INCREMENTAL_STOP_AFTER:
+                complete = False
+                break
+        stats.fetched = len(seen)
+
+        with self._lock, self.db:
+            stats.changed = len(self._upsert(org, resources))
+            if complete:
+                stats.deleted = self._delete_missing(org, "workspaces", seen)
+            miscounted = not complete and total != self._count(org, "workspaces")
+            if not miscounted:
+                self._record_sync(org, "workspaces", full=complete)
+
+        if miscounted:
+            logger.debug(f"Inventory of {org} disagrees with the API's workspace count")
+            return self._sync_workspaces(client, org, full=True)
+        if not complete:
+            try:
+                stats.changed += len(self._refresh_latest_runs(client, org, last_synced))
+            except TFCNotFoundError:
+                # Older Terraform Enterprise releases cannot list an organization's runs
+                return self._sync_workspaces(client, org, full=True)
+        self._prune_runs(org)
+        return stats
+
+    def _refresh_latest_runs(self, client: TFCClient, org: str, since: float) -> set[str]:
+        """Point workspaces at runs started since ``since``; refresh unfinished latest runs.
+
+        Returns:
+            IDs of the workspaces and runs changed
+        """
+        now = datetime.now(UTC)
+        horizon = max(now - RUN_LOOKBACK, datetime.fromtimestamp(since, UTC) - CLOCK_SKEW)
+        for run in self._resources(org, "runs"):
+            started = parse_iso_datetime(run.get("attributes", {}).get("created-at"))
+            if started is not None and _is_unfinished(run):
+                horizon = max(min(horizon, started), now - RUN_LOOKBACK)
+
+        with self._lock:
+            latest_ids: dict[str, str | None] = dict(
+                self.db.execute(
+                    "SELECT id, related_id FROM resources"
+                    " WHERE host = ? AND organization = ? AND type = 'workspaces'",
+                    (self.host, org),
+                ).fetchall()
+            )
+        stored_runs = set(latest_ids.values())
+        items, _ = client.paginate_with_meta(f"/organizations/{org}/runs", max_inflight=1)
+        resources: list[tuple[str, dict[str, Any]]] = []
+        relinked: dict[str, str] = {}
+        for run in items:
+            started = parse_iso_datetime(run.get("attributes", {}).get("created-at"))
+            if started is not None and started < horizon:
+                break
+            workspace_id = _relationship_id(run, "workspace")
+            if workspace_id in latest_ids and workspace_id not in relinked:
+                relinked[workspace_id] = run["id"]
+                resources.append(("runs", run))
+            elif run["id"] in stored_runs:
+                resources.append(("runs", run))
+
+        for workspace_id, run_id in relinked.items():
+            if latest_ids[workspace_id] == run_id:
+                continue
+            workspace = self._resource(org, "workspaces", workspace_id)
+            if workspace is not None:
+                workspace.setdefault("relationships", {})["latest-run"] = {
+                    "data": {"id": run_id, "type": "runs"}
+                }
+                resources.append(("workspaces", workspace))
+        with self._lock, self.db:
+            return self._upsert(org, resources)
+
+    def _sync_team_access(
+        self, client: TFCClient, org: str, project_ids: set[str] | None
+    ) -> SyncStats:
+        """Read the team access of ``project_ids`` (every project when None)."""
+        full = project_ids is None
+        if project_ids is None:
+            project_ids = {p["id"] for p in self._resources(org, "projects")}
+
+        def fetch(project_id: str) -> list[dict[str, Any]]:
+            items, _ = client.paginate_with_meta(
+                "/team-projects", params={"filter[project][id]": project_id}
+            )
+            return list(items)
+
+        ids = sorted(project_ids)
+        resources = [
+            ("team-projects", item) for items in FanOut().map(fetch, ids) for item in items
+        ]
+        stats = SyncStats("team-projects", fetched=len(resources), full=full)
+        with self._lock, self.db:
+            stats.changed = len(self._upsert(org, resources))
+            stats.deleted = self._delete_missing(
+                org,
+                "team-projects",
+                {item["id"] for _, item in resources},
+                project_ids=None if full else project_ids,
+            )
+            self._record_sync(org, "team-projects", full=full)
+        return stats
+
+    def _upsert(self, org: str, resources: Iterable[tuple[str, dict[str, Any]]]) -> set[str]:
+        """Store resources that are new or differ from the stored copy; return their IDs."""
+        changed = set()
+        rows = []
+        for type_, item in resources:
+            data = json.dumps(item, separators=(",", ":"))
+            stored = self.db.execute(
+                "SELECT data FROM resources"
+                " WHERE host = ? AND organization = ? AND type = ? AND id = ?",
+                (self.host, org, type_, item["id"]),
+            ).fetchone()
+            if stored is not None and stored[0] == data:
+                continue
+            changed.add(item["id"])
+            rows.append((self.host, org, type_, item["id"], *_columns(type_, item), data))
+        self.db.executemany(
+            "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        return changed
+
+    def _delete_missing(
+        self, org: str, type_: str, keep: set[str], project_ids: set[str] | None = None
+    ) -> int:
+        """Delete stored resources (of ``project_ids`` only, if given) not in ``keep``."""
+        stored = {
+            resource_id
+            for resource_id, project_id in self.db.execute(
+                "SELECT id, project_id FROM resources"
+                " WHERE host = ? AND organization = ? AND type = ?",
+                (self.host, org, type_),
+            )
+            if project_ids is None or project_id in project_ids
+        }
+        gone = stored - keep
+        self.db.executemany(
+            "DELETE FROM resources WHERE host = ? AND organization = ? AND type = ? AND id = ?",
+            [(self.host, org, type_, resource_id) for resource_id in gone],
+        )
+        return len(gone)
+
+    def _prune_runs(self, org: str) -> None:
+        """Drop runs that are no longer the latest run of any workspace."""
+        with self._lock, self.db:
+            self.db.execute(
+                "DELETE FROM resources WHERE host = ? AND organization = ? AND type = 'runs'"
+                " AND id NOT IN (SELECT related_id FROM resources WHERE host = ?"
+                " AND organization = ? AND type = 'workspaces' AND related_id IS NOT NULL)",
+                (self.host, org, self.host, org),
+            )
+
+    def _record_sync(self, org: str, collection: str, *, full: bool) -> None:
+        now = time.time()
+        self.db.execute(
+            "INSERT INTO syncs VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (host, organization, collection) DO UPDATE SET"
+            " synced_at = excluded.synced_at,"
+            " full_synced_at = COALESCE(excluded.full_synced_at, syncs.full_synced_at)",
+            (self.host, org, collection, now, now if full else None),
+        )
+
+    def _full_synced_at(self, org: str, collection: str) -> float | None:
+        with self._lock:
+            row = self.db.execute(
+                "SELECT full_synced_at FROM syncs"
+                " WHERE host = ? AND organization = ? AND collection = ?",
+                (self.host, org, collection),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _count(self, org: str, type_: str) -> int:
+        with self._lock:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM resources WHERE host = ? AND organization = ? AND type = ?",
+                (self.host, org, type_),
+            ).fetchone()[0]
+
+    def _sort_keys(self, org: str, type_: str) -> dict[str, str | None]:
+        with self._lock:
+            return dict(
+                self.db.execute(
+                    "SELECT id, sort_key FROM resources"
+                    " WHERE host = ? AND organization = ? AND type = ?",
+                    (self.host, org, type_),
+                ).fetchall()
+            )
+
+    def _resource(self, org: str, type_: str, resource_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.db.execute(
+                "SELECT data FROM resources"
+                " WHERE host = ? AND organization = ? AND type = ? AND id = ?",
+                (self.host, org, type_, resource_id),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def _resources(
+        self, org: str, type_: str, where: str = "", params: Sequence[Any] = ()
+    ) -> Iterator[dict[str, Any]]:
+        """Stored resources of a type, ordered by name (``where`` adds SQL conditions)."""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT data FROM resources WHERE host = ? AND organization = ? AND type = ?"
+                f"{where} ORDER BY name COLLATE NOCASE, id",
+                (self.host, org, type_, *params),
+            ).fetchall()
+        return (json.loads(row[0]) for row in rows)
+
+    def workspaces(
+        self,
+        organization: str,
+        search: str | None = None,
+        project_id: str | None = None,
+        include: str | None = None,
+    ) -> list[Workspace]:
+        """Workspaces as ``WorkspaceAPI.list`` would return them.
+
+        Args:
+            organization: Organization name
+            search: Name search (``*`` wildcards match any characters; otherwise a
+                case-insensitive substring)
+            project_id: Only workspaces of this project
+            include: ``project`` and/or ``latest_run`` to fill in related models
+
+        Returns:
+            Workspaces ordered by name
+        """
+        where, params = "", []
+        if search:
+            where += " AND name LIKE ? ESCAPE '\\'"
+            params.append(_like_pattern(search, "*" in search))
+        if project_id:
+            where += " AND project_id = ?"
+            params.append(project_id)
+        items = list(self._resources(organization, "workspaces", where, params))
+
+        includes = {name.strip().replace("-", "_") for name in (include or "").split(",")}
+        included: list[dict[str, Any]] = []
+        if "project" in includes:
+            included.extend(self._resources(organization, "projects"))
+        if "latest_run" in includes:
+            included.extend(self._resources(organization, "runs"))
+        return [Workspace.from_api_response(item, included=included) for item in items]
+
+    def projects(self, organization: str, search: str | None = None) -> list[Project]:
+        """Projects as ``ProjectAPI.list`` would return them (wildcards search substrings)."""
+        where, params = "", []
+        if search and "*" in search:
+            where, params = (
+                " AND name LIKE ? ESCAPE '\\'",
+                [_like_pattern(search.strip("*"), False)],
+            )
+        elif search:
+            where, params = " AND name = ?", [search]
+        return [
+            Project.from_api_response(item)
+            for item in self._resources(organization, "projects", where, params)
+        ]
+
+    def teams(
+        self,
+        organization: str,
+        search: str | None = None,
+        names: Sequence[str] | None = None,
+    ) -> list[Team]:
+        """Teams as ``TeamsAPI.list_teams`` would return them."""
+        where, params = "", []
+        if search:
+            where += " AND name LIKE ? ESCAPE '\\'"
+            params.append(_like_pattern(search, False))
+        if names:
+            where += f" AND name IN ({', '.join('?' * len(names))})"
+            params.extend(names)
+        return [
+            Team.from_api_response(item)
+            for item in self._resources(organization, "teams", where, params)
+        ]
+
+    def team_access(self, organization: str, project_id: str) -> list[TeamProjectAccess]:
+        """Team access to a project, with the names of the teams filled in."""
+        names = {
+            team["id"]: team["attributes"].get("name")
+            for team in self._resources(organization, "teams")
+        }
+        access = []
+        for item in self._resources(
+            organization, "team-projects", " AND project_id = ?", [project_id]
+        ):
+            record = TeamProjectAccess.from_api_response(item)
+            record.team_name = names.get(record.team_id)
+            access.append(record)
+        return access
@@ -0,0 +1,272 @@
+"""Incremental tailing of plan and apply logs."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import codecs
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from terrapyne.api.runs import POLL_INTERVALS
+from terrapyne.core.exceptions import TFCAuthenticationError, TFCNotFoundError
+
+if TYPE_CHECKING:
+    from terrapyne.api.runs import AsyncRunsAPI, RunsAPI
+    from terrapyne.models.run import Run
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-")
+
+
+@dataclass
+class LogLine:
+    """One complete line of a run's plan or apply log."""
+
+    stage: str  # "plan" or "apply"
+    text: str
+
+
+class _LogCursor:
+    """Byte offset and partial-line buffer for one growing log.
+
+    Each read asks for ``Range: bytes=<offset>-``. A 206 carries only the new
+    bytes, a 416 means nothing new has been written, and a plain 200 (a server
+    that ignores ``Range``) is sliced locally so lines are still never repeated.
+    A 206 that starts past the offset is dropped, leaving the offset for the
+    next read to request again, so lines are never skipped either.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0
+        self._reset_text()
+
+    def _reset_text(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    def range_headers(self) -> dict[str, str]:
+        return {"Range": f"bytes={self.offset}-"}
+
+    def consume(self, status_code: int, body: bytes, content_range: str | None) -> list[str]:
+        """Advance past a response body and return the lines it completed."""
+        if status_code == 416:
+            return []
+
+        if status_code == 206:
+            match = _CONTENT_RANGE.match(content_range or "")
+            start = int(match.group(1)) if match else self.offset
+            if start > self.offset:
+                # Bytes before start are missing; ask for the same range again
+                return []
+            chunk = body[self.offset - start :]
+        else:
+            if len(body) < self.offset:
+                # Log was truncated or rotated; start over
+                self.offset = 0
+                self._reset_text()
+            chunk = body[self.offset :]
+
+        self.offset += len(chunk)
+        *lines, self._partial = (self._partial + self._decoder.decode(chunk)).split("\n")
+        return [line.removesuffix("\r") for line in lines]
+
+    def flush(self) -> list[str]:
+        """Return the trailing line of a finished log that had no newline."""
+        text = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        return [text] if text else []
+
+
+class LogTailer:
+    """Read a growing log in increments, fetching only bytes not seen before.
+
+    Example:
+        tailer = LogTailer(client, f"/plans/{plan_id}/logs")
+        for line in tailer.read():
+            print(line)
+    """
+
+    def __init__(self, client: Any, path: str):
+        self.client = client
+        self.path = path
+        self._cursor = _LogCursor()
+
+    @property
+    def offset(self) -> int:
+        """Number of log bytes consumed so far."""
+        return self._cursor.offset
+
+    def read(self) -> builtins.list[str]:
+        """Fetch new bytes and return the complete lines they finish.
+
+        A log that does not exist yet (404/403) reads as empty.
+        """
+        try:
+            response = self.client._request("GET", self.path, headers=self._cursor.range_headers())
+        except (TFCNotFoundError, TFCAuthenticationError):
+            return []
+        return self._cursor.consume(
+            response.status_code, response.content, response.headers.get("Content-Range")
+        )
+
+    def flush(self) -> builtins.list[str]:
+        """Return any final unterminated line (call once the log is complete)."""
+        return self._cursor.flush()
+
+
+class AsyncLogTailer:
+    """Async form of LogTailer for use with AsyncTFCClient."""
+
+    def __init__(self, client: Any, path: str):
+        self.client = client
+        self.path = path
+        self._cursor = _LogCursor()
+
+    @property
+    def offset(self) -> int:
+        """Number of log bytes consumed so far."""
+        return self._cursor.offset
+
+    async def read(self) -> builtins.list[str]:
+        """Fetch new bytes and return the complete lines they finish."""
+        try:
+            response = await self.client._request(
+                "GET", self.path, headers=self._cursor.range_headers()
+            )
+        except (TFCNotFoundError, TFCAuthenticationError):
+            return []
+        return self._cursor.consume(
+            response.status_code, response.content, response.headers.get("Content-Range")
+        )
+
+    def flush(self) -> builtins.list[str]:
+        """Return any final unterminated line (call once the log is complete)."""
+        return self._cursor.flush()
+
+
+class _Stages:
+    """Decide which log stages of a run are readable, keeping one tailer per stage."""
+
+    def __init__(self, factory: Callable[[str], Any]):
+        self.factory = factory
+        self.tailers: dict[str, Any] = {}
+
+    def active(self, run: Run) -> builtins.list[tuple[str, Any]]:
+        if run.plan_id and "plan" not in self.tailers:
+            self.tailers["plan"] = self.factory(f"/plans/{run.plan_id}/logs")
+        # Once the apply has started keep reading its log, even if it then errors
+        if (
+            run.apply_id
+            and "apply" not in self.tailers
+            and run.status.value in ("applying", "applied")
+        ):
+            self.tailers["apply"] = self.factory(f"/applies/{run.apply_id}/logs")
+        return builtins.list(self.tailers.items())
+
+
+class RunLogStream:
+    """Follow a run until it finishes, yielding its plan then apply log lines.
+
+    The run is polled with the usual backoff, which resets whenever new log
+    output arrives. Each stage keeps its own byte offset, so every poll only
+    transfers what was appended since the previous one. After iteration,
+    ``run`` holds the final (terminal) Run.
+
+    Example:
+        stream = client.runs.stream_logs(run_id)
+        for line in stream:
+            print(line.text)
+        print(stream.run.status.value)
+    """
+
+    def __init__(
+        self,
+        runs_api: RunsAPI,
+        run_id: str,
+        max_wait: float = 1800.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.runs_api = runs_api
+        self.run_id = run_id
+        self.max_wait = max_wait
+        self.clock = clock
+        self.sleep = sleep
+        self.run: Run | None = None
+
+    def __iter__(self) -> Iterator[LogLine]:
+        stages = _Stages(lambda path: LogTailer(self.runs_api.client, path))
+        start = self.clock()
+        interval_index = 0
+
+        while True:
+            run = self.run = self.runs_api.get(self.run_id)
+            received = False
+            for stage, tailer in stages.active(run):
+                lines = tailer.read()
+                if run.status.is_terminal:
+                    lines += tailer.flush()
+                for text in lines:
+                    received = True
+                    yield LogLine(stage, text)
+
+            if run.status.is_terminal:
+                return
+
+            if self.clock() - start >= self.max_wait:
+                raise TimeoutError(
+                    f"Run {self.run_id} did not complete within {self.max_wait}s "
+                    f"(current status: {run.status.value})"
+                )
+
+            if received:
+                interval_index = 0
+            self.sleep(POLL_INTERVALS[interval_index])
+            if not received and interval_index < len(POLL_INTERVALS) - 1:
+                interval_index += 1
+
+
+class AsyncRunLogStream:
+    """Async-iterator form of RunLogStream for use with AsyncRunsAPI."""
+
+    def __init__(self, runs_api: AsyncRunsAPI, run_id: str, max_wait: float = 1800.0):
+        self.runs_api = runs_api
+        self.run_id = run_id
+        self.max_wait = max_wait
+        self.run: Run | None = None
+
+    async def __aiter__(self) -> AsyncIterator[LogLine]:
+        loop = asyncio.get_running_loop()
+        stages = _Stages(lambda path: AsyncLogTailer(self.runs_api.client, path))
+        start = loop.time()
+        interval_index = 0
+
+        while True:
+            run = self.run = await self.runs_api.get(self.run_id)
+            received = False
+            for stage, tailer in stages.active(run):
+                lines = await tailer.read()
+                if run.status.is_terminal:
+                    lines += tailer.flush()
+                for text in lines:
+                    received = True
+                    yield LogLine(stage, text)
+
+            if run.status.is_terminal:
+                return
+
+            if loop.time() - start >= self.max_wait:
+                raise TimeoutError(
+                    f"Run {self.run_id} did not complete within {self.max_wait}s "
+                    f"(current status: {run.status.value})"
+                )
+
+            if received:
+                interval_index = 0
+            await asyncio.sleep(POLL_INTERVALS[interval_index])
+            if not received and interval_index < len(POLL_INTERVALS) - 1:
+                interval_index += 1
@@ -3,16 +3,55 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Iterator
-from typing import TYPE_CHECKING
+import math
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
 from terrapyne.api.client import TFCClient
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY, FanOut
+from terrapyne.api.fieldsets import Fieldsets, fieldset_params
+from terrapyne.api.inventory import inventory_for
 from terrapyne.models.project import Project
 
 if TYPE_CHECKING:
+    from terrapyne.api.async_client import AsyncTFCClient
     from terrapyne.models.team_access import TeamProjectAccess
 
 
+def _list_params(search: str | None, *, fields: Fieldsets | None = None) -> dict[str, str]:
+    """Build query parameters for a project listing."""
+    params = fieldset_params(fields)
+    if search:
+        if "*" in search:
+            # Wildcard → substring search (strip wildcards for API)
+            params["q"] = search.replace("*", "")
+        else:
+            # Exact name → use filter[names] for fast server-side match
+            params["filter[names]"] = search
+    return params
+
+
+# Page size of an org-wide workspace walk (the API maximum)
+WORKSPACE_PAGE_SIZE = 100
+
+
+def _count_params(project_id: str | None = None) -> dict[str, Any]:
+    """Parameters of a one-item workspace listing, read only for its total count."""
+    params: dict[str, Any] = {"page[size]": 1}
+    if project_id:
+        params["filter[project][id]"] = project_id
+    return params
+
+
+def _total_count(response: dict[str, Any]) -> int:
+    return response.get("meta", {}).get("pagination", {}).get("total-count") or 0
+
+
+def _prefer_walk(uncounted: int, org_workspaces: int) -> bool:
+    """Whether one walk over every workspace costs fewer requests than a count per project."""
+    return math.ceil(org_workspaces / WORKSPACE_PAGE_SIZE) < uncounted
+
+
 class ProjectAPI:
     """Project API operations."""
 
@@ -25,28 +64,30 @@ class ProjectAPI:
         self.client = client
 
     def list(
-        self, organization: str | None = None, search: str | None = None
+        self,
+        organization: str | None = None,
+        search: str | None = None,
+        fields: Fieldsets | None = None,
     ) -> tuple[Iterator[Project], int | None]:
         """List projects in an organization.
 
         Args:
             organization: Organization name (uses client default if not specified)
             search: Search pattern for project names (supports wildcards like *-MAN, 10234-*)
+            fields: Sparse fieldsets (e.g. ``PROJECT_TABLE_FIELDS``)
 
         Returns:
             Tuple of (iterator of Project instances, total count or None)
         """
         org = self.client.get_organization(organization)
+        inventory = inventory_for(self.client, org, "projects")
+        if inventory is not None:
+            projects = inventory.projects(org, search)
+            return iter(projects), len(projects)
+
         path = f"/organizations/{org}/projects"
 
-        params = {}
-        if search:
-            if "*" in search:
-                # Wildcard → substring search (strip wildcards for API)
-                params["q"] = search.replace("*", "")
-            else:
-                # Exact name → use filter[names] for fast server-side match
-                params["filter[names]"] = search
+        params = _list_params(search, fields=fields)
 
         items_iterator, total_count = self.client.paginate_with_meta(path, params=params)
 
@@ -123,6 +164,63 @@ class ProjectAPI:
 
         return workspace_counts
 
+    def count_workspaces(
+        self,
+        projects: Iterable[Project],
+        organization: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, int]:
+        """Count the workspaces of several projects with as few requests as possible.
+
+        Projects whose payload carries ``workspace-count`` cost nothing. For
+        the rest, the cheaper of two strategies is used: a one-item listing
+        per project (read for its total count, issued concurrently), or a
+        single walk over every workspace in the organization (one request per
+        100 workspaces), chosen by comparing the two request counts. A client
+        that answers from the inventory counts the inventory's workspaces.
+
+        Args:
+            projects: Projects to count
+            organization: Organization name (uses client default if not specified)
+            concurrency: Maximum concurrent per-project count requests
+
+        Returns:
+            Dict mapping project_id -> workspace count
+        """
+        counts: dict[str, int] = {}
+        uncounted = []
+        for project in projects:
+            if project.workspace_count is not None:
+                counts[project.id] = project.workspace_count
+            else:
+                uncounted.append(project.id)
+        if not uncounted:
+            return counts
+
+        org = self.client.get_organization(organization)
+        if inventory_for(self.client, org, "workspaces") is not None:
+            walked = self.get_workspace_counts(org)
+            counts.update({project_id: walked.get(project_id, 0) for project_id in uncounted})
+            return counts
+
+        path = f"/organizations/{org}/workspaces"
+
+        if len(uncounted) > 1:
+            org_workspaces = _total_count(self.client.get(path, params=_count_params()))
+            if _prefer_walk(len(uncounted), org_workspaces):
+                walked = self.get_workspace_counts(org)
+                counts.update({project_id: walked.get(project_id, 0) for project_id in uncounted})
+                return counts
+
+        totals = FanOut(concurrency=concurrency).map(
+            lambda project_id: _total_count(
+                self.client.get(path, params=_count_params(project_id))
+            ),
+            uncounted,
+        )
+        counts.update(zip(uncounted, totals, strict=True))
+        return counts
+
     def list_team_access(self, project_id: str) -> builtins.list[TeamProjectAccess]:
         """List team access for a project.
 
@@ -132,25 +230,161 @@ class ProjectAPI:
         Returns:
             List of TeamProjectAccess instances with team names populated
         """
-        from terrapyne.api.teams import TeamsAPI
+        from terrapyne.api.teams import TeamsAPI, team_names, team_names_from_included
         from terrapyne.models.team_access import TeamProjectAccess
 
+        # The listing is by project, so the inventory is read for the default organization
+        org = getattr(self.client, "organization", None)
+        inventory = inventory_for(self.client, org, "team-projects")
+        if inventory is not None and org:
+            return inventory.team_access(org, project_id)
+
         path = "/team-projects"
-        params = {"filter[project][id]": project_id}
+        params = {"filter[project][id]": project_id, "include": "team"}
+
+        # Team names arrive with the access records via include=team
+        team_access_list = []
+        items_iterator, _ = self.client.paginate_with_meta(path, params=params)
+        included = None
+        for item in items_iterator:
+            if items_iterator.included is not included:
+                included = items_iterator.included
+                team_names.update(self.client, team_names_from_included(included))
+            team_access_list.append(TeamProjectAccess.from_api_response(item))
+
+        # Any team the include did not cover is resolved in one batch
+        names = TeamsAPI(self.client).resolve_names(a.team_id for a in team_access_list)
+        for access in team_access_list:
+            access.team_name = names.get(access.team_id)
+
+        return team_access_list
+
+
+class AsyncProjectAPI:
+    """Async project API operations (mirrors ProjectAPI)."""
+
+    def __init__(self, client: AsyncTFCClient):
+        """Initialize async project API.
+
+        Args:
+            client: Async TFC API client
+        """
+        self.client = client
+
+    async def list(
+        self,
+        organization: str | None = None,
+        search: str | None = None,
+        fields: Fieldsets | None = None,
+    ) -> tuple[AsyncIterator[Project], int | None]:
+        """List projects in an organization.
+
+        Returns:
+            Tuple of (async iterator of Project instances, total count or None)
+        """
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/projects"
+
+        items_iterator, total_count = await self.client.paginate_with_meta(
+            path, params=_list_params(search, fields=fields)
+        )
+
+        async def project_iterator() -> AsyncIterator[Project]:
+            async for item in items_iterator:
+                yield Project.from_api_response(item)
+
+        return project_iterator(), total_count
+
+    async def get_by_name(self, name: str, organization: str | None = None) -> Project:
+        """Get project by name.
+
+        Raises:
+            ValueError: If project not found
+        """
+        org = self.client.get_organization(organization)
+
+        projects_iter, _ = await self.list(org, search=name)
+        async for project in projects_iter:
+            if project.name == name:
+                return project
+
+        raise ValueError(f"Project '{name}' not found in organization '{org}'")
+
+    async def get_by_id(self, project_id: str) -> Project:
+        """Get project by ID."""
+        response = await self.client.get(f"/projects/{project_id}")
+        return Project.from_api_response(response["data"])
+
+    async def get_workspace_counts(self, organization: str | None = None) -> dict[str, int]:
+        """Get actual workspace counts per project."""
+        from terrapyne.api.workspaces import AsyncWorkspaceAPI
+
+        org = self.client.get_organization(organization)
+        workspaces_iter, _ = await AsyncWorkspaceAPI(self.client).list(org)
+        workspace_counts: dict[str, int] = {}
+
+        async for ws in workspaces_iter:
+            if ws.project_id:
+                workspace_counts[ws.project_id] = workspace_counts.get(ws.project_id, 0) + 1
+
+        return workspace_counts
+
+    async def count_workspaces(
+        self,
+        projects: Iterable[Project],
+        organization: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, int]:
+        """Count the workspaces of several projects (see ProjectAPI.count_workspaces)."""
+        import asyncio
+
+        counts: dict[str, int] = {}
+        uncounted = []
+        for project in projects:
+            if project.workspace_count is not None:
+                counts[project.id] = project.workspace_count
+            else:
+                uncounted.append(project.id)
+        if not uncounted:
+            return counts
+
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/workspaces"
+
+        if len(uncounted) > 1:
+            org_workspaces = _total_count(await self.client.get(path, params=_count_params()))
+            if _prefer_walk(len(uncounted), org_workspaces):
+                walked = await self.get_workspace_counts(org)
+                counts.update({project_id: walked.get(project_id, 0) for project_id in uncounted})
+                return counts
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def count(project_id: str) -> int:
+            async with semaphore:
+                return _total_count(await self.client.get(path, params=_count_params(project_id)))
+
+        totals = await asyncio.gather(*(count(project_id) for project_id in uncounted))
+        counts.update(zip(uncounted, totals, strict=True))
+        return counts
+
+    async def list_team_access(self, project_id: str) -> builtins.list[TeamProjectAccess]:
+        """List team access for a project, with team names populated."""
+        from terrapyne.api.teams import AsyncTeamsAPI, team_names, team_names_from_included
+        from terrapyne.models.team_access import TeamProjectAccess
 
-        # Fetch team access records
+        params = {"filter[project][id]": project_id, "include": "team"}
+        items_iterator, _ = await self.client.paginate_with_meta("/team-projects", params=params)
         team_access_list = []
-        for item in self.client.paginate(path, params=params):
+        included = None
+        async for item in items_iterator:
+            if items_iterator.included is not included:
+                included = items_iterator.included
+                team_names.update(self.client, team_names_from_included(included))
             team_access_list.append(TeamProjectAccess.from_api_response(item))
 
-        # Fetch team names for each team ID
-        teams_api = TeamsAPI(self.client)
+        names = await AsyncTeamsAPI(self.client).resolve_names(a.team_id for a in team_access_list)
         for access in team_access_list:
-            try:
-                team = teams_api.get(access.team_id)
-                access.team_name = team.name
-            except Exception:
-                # If team lookup fails, keep team_name as None
-                pass
+            access.team_name = names.get(access.team_id)
 
         return team_access_list
@@ -0,0 +1,153 @@
+"""Client-side pacing of API requests below the TFC rate limit.
+
+TFC allows about 30 requests per second per token and answers anything
+above that with 429 Too Many Requests. Every request a client sends (from
+any thread, or any task of an async client) first takes a token from one
+shared bucket, so a burst of parallel work is smoothed out before it reaches
+the API instead of being throttled by it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger("terrapyne.api")
+
+# Requests per second: safely below TFC's 30 req/s per token
+DEFAULT_RATE = 25.0
+
+# Requests that may be sent back to back before pacing starts
+DEFAULT_BURST = 10
+
+# Fraction of a server-advertised X-RateLimit-Limit to actually use
+LIMIT_HEADROOM = 0.9
+
+# Times a 429 is retried after waiting out Retry-After before it is raised
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Backoff ceiling when a 429 carries no Retry-After
+MAX_BACKOFF = 30.0
+
+
+def _float_header(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if not isinstance(value, str | int | float):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Seconds a 429 asked the client to wait, or None if it did not say.
+
+    Reads ``Retry-After`` (delta-seconds or an HTTP date), falling back to
+    TFC's ``X-RateLimit-Reset`` (seconds until the limit resets).
+    """
+    value = headers.get("Retry-After")
+    if isinstance(value, str):
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    reset = _float_header(headers, "X-RateLimit-Reset")
+    return max(0.0, reset) if reset is not None else None
+
+
+class RateLimitGovernor:
+    """Thread-safe token bucket shared by every request of one client.
+
+    Each request reserves a token and sleeps until the reservation is due,
+    so concurrent callers are queued at ``rate`` requests per second rather
+    than racing. Response headers tune the bucket as the client runs:
+    ``X-RateLimit-Limit`` lowers the rate when the server allows less than
+    configured, ``X-RateLimit-Remaining`` caps the local bucket at what the
+    server says is left (other processes may share the token), and a
+    429's ``Retry-After`` stops all requests until it has passed. A rate of
+    0 disables pacing but still honours pauses.
+
+    Example:
+        governor = RateLimitGovernor(rate=25)
+        governor.acquire()
+        response = http.get(url)
+        governor.observe(response.headers)
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = max(self._updated, now)
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before sending the request."""
+        with self._lock:
+            now = self._clock()
+            if self.rate <= 0:
+                return max(0.0, self._paused_until - now)
+            self._refill(now)
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request back for ``seconds``."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adapt the bucket to the rate-limit headers of a response."""
+        limit = _float_header(headers, "X-RateLimit-Limit")
+        remaining = _float_header(headers, "X-RateLimit-Remaining")
+        if limit is None and remaining is None:
+            return
+        with self._lock:
+            if limit is not None and limit > 0:
+                rate = min(self.max_rate, limit * LIMIT_HEADROOM)
+                if rate != self.rate:
+                    logger.debug(f"Rate limit is {limit:g} req/s; pacing at {rate:g} req/s")
+                    self.rate = rate
+            if remaining is not None:
+                self._refill(self._clock())
+                self._tokens = min(self._tokens, remaining)
+        if remaining is not None and remaining <= 0:
+            reset = _float_header(headers, "X-RateLimit-Reset")
+            if reset:
+                self.pause(reset)
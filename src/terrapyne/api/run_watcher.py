@@ -0,0 +1,190 @@
+"""Multiplexed polling of many runs at once."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY, FanOut
+from terrapyne.api.runs import POLL_INTERVALS
+from terrapyne.models.run import Run, RunStatus
+
+if TYPE_CHECKING:
+    from terrapyne.api.runs import AsyncRunsAPI, RunsAPI
+
+
+@dataclass
+class RunEvent:
+    """A status change observed for one watched run."""
+
+    run: Run
+    previous_status: RunStatus | None
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the run has finished (it will not be polled again)."""
+        return self.run.status.is_terminal
+
+
+@dataclass
+class _Tracked:
+    run_id: str
+    status: RunStatus | None = None
+    interval_index: int = 0
+    next_check: float = 0.0
+
+
+class _Schedule:
+    """Per-run adaptive backoff shared by the sync and async watchers.
+
+    A run that changed status since its last check is polled again soon
+    (the backoff resets); an unchanged run backs off along ``intervals``;
+    a run waiting for manual approval jumps straight to the longest interval.
+    """
+
+    def __init__(self, run_ids: Iterable[str], intervals: builtins.list[float], now: float):
+        self.intervals = intervals
+        self.pending = {
+            run_id: _Tracked(run_id, next_check=now) for run_id in dict.fromkeys(run_ids)
+        }
+
+    def due(self, now: float) -> builtins.list[str]:
+        return [t.run_id for t in self.pending.values() if t.next_check <= now]
+
+    def next_wakeup(self) -> float:
+        return min(t.next_check for t in self.pending.values())
+
+    def observe(self, run: Run, run_id: str, now: float) -> RunEvent | None:
+        """Record a fresh status; return an event if it changed."""
+        tracked = self.pending[run_id]
+        previous = tracked.status
+        changed = run.status != previous
+
+        if run.status.is_terminal:
+            del self.pending[run_id]
+        else:
+            if changed:
+                tracked.interval_index = 0
+            elif tracked.interval_index < len(self.intervals) - 1:
+                tracked.interval_index += 1
+            if run.status.is_awaiting_approval:
+                tracked.interval_index = len(self.intervals) - 1
+            tracked.status = run.status
+            tracked.next_check = now + self.intervals[tracked.interval_index]
+
+        return RunEvent(run=run, previous_status=previous) if changed else None
+
+    def timeout_error(self, max_wait: float) -> TimeoutError:
+        waiting = ", ".join(
+            f"{t.run_id} ({t.status.value if t.status else 'unknown'})"
+            for t in self.pending.values()
+        )
+        return TimeoutError(f"Runs did not complete within {max_wait}s: {waiting}")
+
+
+class RunWatcher:
+    """Poll many runs from one loop, yielding events as their status changes.
+
+    Every tick, all runs whose backoff has expired are checked together
+    (concurrently, up to ``concurrency`` requests in flight); the loop then
+    sleeps until the next run is due. Iteration ends when every run has
+    reached a terminal state.
+
+    Example:
+        for event in client.runs.poll_many(run_ids):
+            print(event.run.id, event.run.status.value)
+    """
+
+    def __init__(
+        self,
+        runs_api: RunsAPI,
+        run_ids: Iterable[str],
+        max_wait: float = 1800.0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        intervals: builtins.list[float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.runs_api = runs_api
+        self.run_ids = builtins.list(run_ids)
+        self.max_wait = max_wait
+        self.fan = FanOut(concurrency=concurrency)
+        self.intervals = intervals or [float(i) for i in POLL_INTERVALS]
+        self.clock = clock
+        self.sleep = sleep
+
+    def __iter__(self) -> Iterator[RunEvent]:
+        start = self.clock()
+        schedule = _Schedule(self.run_ids, self.intervals, start)
+
+        while schedule.pending:
+            due = schedule.due(self.clock())
+            runs = self.fan.map(self.runs_api.get, due)
+            for run_id, run in zip(due, runs, strict=True):
+                event = schedule.observe(run, run_id, self.clock())
+                if event:
+                    yield event
+
+            if not schedule.pending:
+                return
+
+            now = self.clock()
+            if now - start >= self.max_wait:
+                raise schedule.timeout_error(self.max_wait)
+
+            delay = min(schedule.next_wakeup(), start + self.max_wait) - now
+            if delay > 0:
+                self.sleep(delay)
+
+
+class AsyncRunWatcher:
+    """Async-iterator form of RunWatcher for use with AsyncRunsAPI."""
+
+    def __init__(
+        self,
+        runs_api: AsyncRunsAPI,
+        run_ids: Iterable[str],
+        max_wait: float = 1800.0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        intervals: builtins.list[float] | None = None,
+    ):
+        self.runs_api = runs_api
+        self.run_ids = builtins.list(run_ids)
+        self.max_wait = max_wait
+        self.concurrency = max(1, concurrency)
+        self.intervals = intervals or [float(i) for i in POLL_INTERVALS]
+
+    async def __aiter__(self) -> AsyncIterator[RunEvent]:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        schedule = _Schedule(self.run_ids, self.intervals, start)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(run_id: str) -> Run:
+            async with semaphore:
+                return await self.runs_api.get(run_id)
+
+        while schedule.pending:
+            due = schedule.due(loop.time())
+            runs = await asyncio.gather(*(fetch(run_id) for run_id in due))
+            for run_id, run in zip(due, runs, strict=True):
+                event = schedule.observe(run, run_id, loop.time())
+                if event:
+                    yield event
+
+            if not schedule.pending:
+                return
+
+            now = loop.time()
+            if now - start >= self.max_wait:
+                raise schedule.timeout_error(self.max_wait)
+
+            delay = min(schedule.next_wakeup(), start + self.max_wait) - now
+            if delay > 0:
+                await asyncio.sleep(delay)
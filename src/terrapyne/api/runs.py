@@ -1,14 +1,135 @@
 """TFC Runs API."""
 
+import asyncio
 import builtins
 import time
-from collections.abc import Callable
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY
+from terrapyne.api.fieldsets import Fieldsets, fieldset_params
 from terrapyne.core.exceptions import TFCAuthenticationError, TFCNotFoundError
 from terrapyne.models.apply import Apply
 from terrapyne.models.plan import Plan
 from terrapyne.models.run import Run
+from terrapyne.models.utils import IncludedResources
+
+if TYPE_CHECKING:
+    from terrapyne.api.logs import AsyncRunLogStream, RunLogStream
+    from terrapyne.api.run_watcher import AsyncRunWatcher, RunWatcher
+
+# Exponential backoff intervals (seconds) used while polling a run
+POLL_INTERVALS = [2, 2, 3, 5, 5, 10, 10, 15, 30]
+
+
+def _list_params(
+    limit: int, status: str | None, include: str | None, *, fields: Fieldsets | None = None
+) -> dict[str, Any]:
+    """Build query parameters for a workspace run listing."""
+    params: dict[str, Any] = {
+        "page[size]": min(limit, 100),
+        **fieldset_params(fields),
+    }
+    if include:
+        params["include"] = include
+
+    if status:
+        params["filter[status]"] = status
+    return params
+
+
+def _runs_from_response(response: dict[str, Any], limit: int) -> tuple[list[Run], int]:
+    """Build Run models (up to limit) and the total count from a run listing page."""
+    runs = []
+    included = IncludedResources(response.get("included", []))
+    total_count = response.get("meta", {}).get("pagination", {}).get("total-count", 0)
+
+    for item in response.get("data", []):
+        runs.append(Run.from_api_response(item, included=included))
+        if len(runs) >= limit:
+            break
+
+    return runs, total_count
+
+
+def _organization_params(
+    status: str | None,
+    project_names: list[str] | None,
+    workspace_names: list[str] | None,
+    include: str | None,
+) -> dict[str, Any]:
+    """Build query parameters for the organization-wide run listing."""
+    params: dict[str, Any] = {}
+    if status:
+        params["filter[status]"] = status
+    if project_names:
+        params["filter[project_names]"] = ",".join(project_names)
+    if workspace_names:
+        params["filter[workspace_names]"] = ",".join(workspace_names)
+    if include:
+        params["include"] = include
+    return params
+
+
+def _latest_cost_estimate(response: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the first finished cost estimate from a run listing with cost estimates included."""
+    runs = response.get("data", [])
+    if not runs:
+        return None
+
+    cost_by_id = {
+        inc["id"]: inc["attributes"]
+        for inc in response.get("included", [])
+        if inc.get("type") == "cost-estimates"
+    }
+
+    for run in runs:
+        ce_rel = run.get("relationships", {}).get("cost-estimate", {}).get("data")
+        if not ce_rel:
+            continue
+        ce = cost_by_id.get(ce_rel["id"], {})
+        if ce.get("status") == "finished" and ce.get("proposed-monthly-cost"):
+            return ce
+
+    return None
+
+
+def _create_payload(
+    workspace_id: str,
+    *,
+    message: str | None,
+    auto_apply: bool,
+    is_destroy: bool,
+    target_addrs: list[str] | None,
+    replace_addrs: list[str] | None,
+    refresh_only: bool,
+    debug: bool,
+) -> dict[str, Any]:
+    """Build the JSON:API payload for creating a run."""
+    payload: dict[str, Any] = {
+        "data": {
+            "attributes": {
+                "auto-apply": auto_apply,
+                "is-destroy": is_destroy,
+                "refresh-only": refresh_only,
+            },
+            "relationships": {"workspace": {"data": {"type": "workspaces", "id": workspace_id}}},
+        }
+    }
+
+    if message:
+        payload["data"]["attributes"]["message"] = message
+
+    if target_addrs:
+        payload["data"]["attributes"]["target-addrs"] = target_addrs
+
+    if replace_addrs:
+        payload["data"]["attributes"]["replace-addrs"] = replace_addrs
+
+    if debug:
+        payload["data"]["attributes"]["debugging-mode"] = True
+
+    return payload
 
 
 class RunsAPI:
@@ -24,6 +145,7 @@ class RunsAPI:
         limit: int = 20,
         status: str | None = None,
         include: str | None = "configuration-version,plan",
+        fields: Fieldsets | None = None,
     ) -> tuple[builtins.list[Run], int]:
         """List runs for a workspace.
 
@@ -32,36 +154,52 @@ class RunsAPI:
             limit: Maximum number of runs to return
             status: Filter by status (can be comma-separated list)
             include: Resources to include
+            fields: Sparse fieldsets (e.g. ``RUN_TABLE_FIELDS`` with ``RUN_TABLE_INCLUDE``)
 
         Returns:
             Tuple of (list of Run instances, total count)
         """
-        params: dict[str, Any] = {
-            "page[size]": min(limit, 100),
-        }
-        if include:
-            params["include"] = include
-
-        if status:
-            params["filter[status]"] = status
+        params = _list_params(limit, status, include, fields=fields)
 
         path = f"/workspaces/{workspace_id}/runs"
         response = self.client.get(path, params=params)
+        return _runs_from_response(response, limit)
 
-        runs = []
-        data = response.get("data", [])
-        included = response.get("included", [])
-        total_count = response.get("meta", {}).get("pagination", {}).get("total-count", 0)
+    def list_for_organization(
+        self,
+        organization: str | None = None,
+        status: str | None = None,
+        project_names: builtins.list[str] | None = None,
+        workspace_names: builtins.list[str] | None = None,
+        include: str | None = None,
+    ) -> tuple[Iterator[Run], int | None]:
+        """List runs across an organization in one paginated query.
 
-        # Use an iterator if we need to fetch more pages (not implemented here for simplicity)
-        items_iterator = data
+        Runs are returned most recent first, so callers looking for recent
+        activity can stop iterating early. Older Terraform Enterprise releases
+        do not offer this endpoint and answer 404 (TFCNotFoundError).
 
-        for item in items_iterator:
-            runs.append(Run.from_api_response(item, included=included))
-            if len(runs) >= limit:
-                break
+        Args:
+            organization: Organization name (uses client default if not specified)
+            status: Filter by status (can be comma-separated list)
+            project_names: Only runs in workspaces of these projects
+            workspace_names: Only runs in these workspaces
+            include: Resources to include
 
-        return runs, total_count
+        Returns:
+            Tuple of (iterator of Run instances, total count or None)
+        """
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/runs"
+        params = _organization_params(status, project_names, workspace_names, include)
+
+        items_iterator, total_count = self.client.paginate_with_meta(path, params=params)
+
+        def run_iterator() -> Iterator[Run]:
+            for item in items_iterator:
+                yield Run.from_api_response(item, included=items_iterator.included)
+
+        return run_iterator(), total_count
 
     def get_active_runs(self, workspace_id: str) -> builtins.list[Run]:
         """Get all currently active (non-terminal) runs for a workspace."""
@@ -82,25 +220,7 @@ class RunsAPI:
             {"include": "cost_estimate", "page[size]": 10},
         )
 
-        runs = response.get("data", [])
-        if not runs:
-            return None
-
-        cost_by_id = {
-            inc["id"]: inc["attributes"]
-            for inc in response.get("included", [])
-            if inc.get("type") == "cost-estimates"
-        }
-
-        for run in runs:
-            ce_rel = run.get("relationships", {}).get("cost-estimate", {}).get("data")
-            if not ce_rel:
-                continue
-            ce = cost_by_id.get(ce_rel["id"], {})
-            if ce.get("status") == "finished" and ce.get("proposed-monthly-cost"):
-                return ce
-
-        return None
+        return _latest_cost_estimate(response)
 
     def get(self, run_id: str, include: str | None = None) -> Run:
         """Get run by ID.
@@ -150,30 +270,16 @@ class RunsAPI:
             TFCAPIError: If creation fails
         """
         path = "/runs"
-        payload: dict[str, Any] = {
-            "data": {
-                "attributes": {
-                    "auto-apply": auto_apply,
-                    "is-destroy": is_destroy,
-                    "refresh-only": refresh_only,
-                },
-                "relationships": {
-                    "workspace": {"data": {"type": "workspaces", "id": workspace_id}}
-                },
-            }
-        }
-
-        if message:
-            payload["data"]["attributes"]["message"] = message
-
-        if target_addrs:
-            payload["data"]["attributes"]["target-addrs"] = target_addrs
-
-        if replace_addrs:
-            payload["data"]["attributes"]["replace-addrs"] = replace_addrs
-
-        if debug:
-            payload["data"]["attributes"]["debugging-mode"] = True
+        payload = _create_payload(
+            workspace_id,
+            message=message,
+            auto_apply=auto_apply,
+            is_destroy=is_destroy,
+            target_addrs=target_addrs,
+            replace_addrs=replace_addrs,
+            refresh_only=refresh_only,
+            debug=debug,
+        )
 
         response = self.client.post(path, json_data=payload)
         return Run.from_api_response(response["data"])
@@ -300,14 +406,27 @@ class RunsAPI:
 
         return Apply.from_api_response(response["data"])
 
-    def stream_logs(self, url: str) -> builtins.list[str]:
-        """Fetch logs from a read URL.
+    def stream_logs(self, run_id: str, max_wait: float = 1800.0) -> "RunLogStream":
+        """Follow a run's plan and apply logs until the run finishes.
+
+        Each stage's log is tailed with HTTP ``Range`` requests from the last
+        byte read, so a long log is downloaded once over the life of the run
+        rather than once per poll.
+
+        Args:
+            run_id: Run ID to follow
+            max_wait: Maximum seconds to wait for the run to finish
+
+        Returns:
+            RunLogStream yielding a LogLine per complete log line; its ``run``
+            attribute holds the final Run once iteration ends
 
-        Note: TFC log URLs often point to S3.
-        This is a simple version that returns all lines.
-        A future version will support real-time streaming.
+        Raises:
+            TimeoutError: (while iterating) if the run is still active after max_wait
         """
-        return self.client._request("GET", url).text.splitlines()
+        from terrapyne.api.logs import RunLogStream
+
+        return RunLogStream(self, run_id, max_wait=max_wait)
 
     def poll_until_complete(
         self,
@@ -329,8 +448,7 @@ class RunsAPI:
             TimeoutError: If max_wait exceeded
             TFCAPIError: If API errors occur
         """
-        # Exponential backoff intervals (seconds)
-        intervals = [2, 2, 3, 5, 5, 10, 10, 15, 30]
+        intervals = POLL_INTERVALS
         interval_index = 0
 
         start_time = time.time()
@@ -357,3 +475,218 @@ class RunsAPI:
                 interval_index += 1
 
             time.sleep(wait_time)
+
+    def poll_many(
+        self,
+        run_ids: Iterable[str],
+        max_wait: float = 1800.0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "RunWatcher":
+        """Poll many runs from a single loop until all reach a terminal state.
+
+        Status checks for every run that is due are issued together (up to
+        ``concurrency`` at a time) and each run backs off independently, so
+        watching hundreds of runs needs neither a thread nor a sleep per run.
+
+        Args:
+            run_ids: Run IDs to watch
+            max_wait: Maximum seconds to wait for all runs
+            concurrency: Maximum status checks in flight
+
+        Returns:
+            RunWatcher yielding a RunEvent for each status change
+
+        Raises:
+            TimeoutError: (while iterating) if runs are still active after max_wait
+        """
+        from terrapyne.api.run_watcher import RunWatcher
+
+        return RunWatcher(self, run_ids, max_wait=max_wait, concurrency=concurrency)
+
+
+class AsyncRunsAPI:
+    """Async API for TFC runs (mirrors RunsAPI)."""
+
+    def __init__(self, client):
+        """Initialize async Runs API."""
+        self.client = client
+
+    async def list(
+        self,
+        workspace_id: str,
+        limit: int = 20,
+        status: str | None = None,
+        include: str | None = "configuration-version,plan",
+        fields: Fieldsets | None = None,
+    ) -> tuple[builtins.list[Run], int]:
+        """List runs for a workspace."""
+        params = _list_params(limit, status, include, fields=fields)
+        response = await self.client.get(f"/workspaces/{workspace_id}/runs", params=params)
+        return _runs_from_response(response, limit)
+
+    async def list_for_organization(
+        self,
+        organization: str | None = None,
+        status: str | None = None,
+        project_names: builtins.list[str] | None = None,
+        workspace_names: builtins.list[str] | None = None,
+        include: str | None = None,
+    ) -> tuple[AsyncIterator[Run], int | None]:
+        """List runs across an organization in one paginated query (most recent first)."""
+        org = self.client.get_organization(organization)
+        params = _organization_params(status, project_names, workspace_names, include)
+
+        items_iterator, total_count = await self.client.paginate_with_meta(
+            f"/organizations/{org}/runs", params=params
+        )
+
+        async def run_iterator() -> AsyncIterator[Run]:
+            async for item in items_iterator:
+                yield Run.from_api_response(item, included=items_iterator.included)
+
+        return run_iterator(), total_count
+
+    async def get_active_runs(self, workspace_id: str) -> builtins.list[Run]:
+        """Get all currently active (non-terminal) runs for a workspace."""
+        from terrapyne.models.run import RunStatus
+
+        active_statuses = ",".join(RunStatus.get_active_statuses())
+        runs, _ = await self.list(workspace_id, status=active_statuses, limit=100)
+        return runs
+
+    async def get_latest_cost_estimate(self, workspace_id: str) -> dict[str, Any] | None:
+        """Get the latest finished cost estimate for a workspace."""
+        response = await self.client.get(
+            f"/workspaces/{workspace_id}/runs",
+            {"include": "cost_estimate", "page[size]": 10},
+        )
+        return _latest_cost_estimate(response)
+
+    async def get(self, run_id: str, include: str | None = None) -> Run:
+        """Get run by ID."""
+        params = {}
+        if include:
+            params["include"] = include
+
+        response = await self.client.get(f"/runs/{run_id}", params=params)
+        return Run.from_api_response(response["data"], included=response.get("included"))
+
+    async def create(
+        self,
+        workspace_id: str,
+        message: str | None = None,
+        auto_apply: bool = False,
+        is_destroy: bool = False,
+        target_addrs: builtins.list[str] | None = None,
+        replace_addrs: builtins.list[str] | None = None,
+        refresh_only: bool = False,
+        debug: bool = False,
+    ) -> Run:
+        """Create a new run (plan)."""
+        payload = _create_payload(
+            workspace_id,
+            message=message,
+            auto_apply=auto_apply,
+            is_destroy=is_destroy,
+            target_addrs=target_addrs,
+            replace_addrs=replace_addrs,
+            refresh_only=refresh_only,
+            debug=debug,
+        )
+        response = await self.client.post("/runs", json_data=payload)
+        return Run.from_api_response(response["data"])
+
+    async def apply(self, run_id: str, comment: str | None = None) -> Run:
+        """Apply a run."""
+        payload = {"comment": comment} if comment else None
+        await self.client.post(f"/runs/{run_id}/actions/apply", json_data=payload)
+        return await self.get(run_id)
+
+    async def discard(self, run_id: str, comment: str | None = None) -> Run:
+        """Discard a run."""
+        payload = {"comment": comment} if comment else None
+        await self.client.post(f"/runs/{run_id}/actions/discard", json_data=payload)
+        return await self.get(run_id)
+
+    async def cancel(self, run_id: str, comment: str | None = None) -> Run:
+        """Cancel a run."""
+        payload = {"comment": comment} if comment else None
+        await self.client.post(f"/runs/{run_id}/actions/cancel", json_data=payload)
+        return await self.get(run_id)
+
+    async def get_plan(self, plan_id: str) -> Plan:
+        """Get plan details."""
+        response = await self.client.get(f"/plans/{plan_id}")
+        return Plan.from_api_response(response["data"])
+
+    async def get_plan_logs(self, plan_id: str) -> str:
+        """Get plan logs (empty string if not ready yet)."""
+        try:
+            return (await self.client._request("GET", f"/plans/{plan_id}/logs")).text
+        except (TFCNotFoundError, TFCAuthenticationError):
+            return ""
+
+    async def get_apply_logs(self, apply_id: str) -> str:
+        """Get apply logs (empty string if not ready yet)."""
+        try:
+            return (await self.client._request("GET", f"/applies/{apply_id}/logs")).text
+        except (TFCNotFoundError, TFCAuthenticationError):
+            return ""
+
+    async def get_apply(self, apply_id: str) -> Apply:
+        """Get apply details."""
+        response = await self.client.get(f"/applies/{apply_id}")
+        return Apply.from_api_response(response["data"])
+
+    def stream_logs(self, run_id: str, max_wait: float = 1800.0) -> "AsyncRunLogStream":
+        """Follow a run's plan and apply logs (``async for`` over the result)."""
+        from terrapyne.api.logs import AsyncRunLogStream
+
+        return AsyncRunLogStream(self, run_id, max_wait=max_wait)
+
+    async def poll_until_complete(
+        self,
+        run_id: str,
+        callback: Callable[[Run], None] | None = None,
+        max_wait: float = 1800.0,
+    ) -> Run:
+        """Poll run status until it reaches a terminal state.
+
+        Same contract as RunsAPI.poll_until_complete, but waits with
+        ``asyncio.sleep`` so other tasks keep running between polls.
+        """
+        interval_index = 0
+        start_time = time.time()
+
+        while True:
+            run = await self.get(run_id)
+
+            if callback:
+                callback(run)
+
+            if run.status.is_terminal:
+                return run
+
+            elapsed = time.time() - start_time
+            if elapsed >= max_wait:
+                raise TimeoutError(
+                    f"Run {run_id} did not complete within {max_wait}s "
+                    f"(current status: {run.status.value})"
+                )
+
+            wait_time = POLL_INTERVALS[interval_index]
+            if interval_index < len(POLL_INTERVALS) - 1:
+                interval_index += 1
+
+            await asyncio.sleep(wait_time)
+
+    def poll_many(
+        self,
+        run_ids: Iterable[str],
+        max_wait: float = 1800.0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "AsyncRunWatcher":
+        """Poll many runs from one task; iterate with ``async for``."""
+        from terrapyne.api.run_watcher import AsyncRunWatcher
+
+        return AsyncRunWatcher(self, run_ids, max_wait=max_wait, concurrency=concurrency)
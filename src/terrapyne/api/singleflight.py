@@ -0,0 +1,95 @@
+"""Coalescing of identical concurrent calls.
+
+When many threads (or tasks) ask for the same resource at once, only the
+first one calls the API; the others wait for its result instead of sending
+their own identical request. Nothing is remembered once the call finishes,
+so this complements rather than replaces the response cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """One in-flight call and the callers waiting on it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one execution of a call among concurrent callers with the same key.
+
+    Followers receive the very object the leader's call returned (as they
+    would from the response cache) or the exception it raised.
+
+    Example:
+        flight = SingleFlight()
+        data = flight.do(("GET", url), lambda: fetch(url))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call with ``key`` is already in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines of one event loop.
+
+    The shared call runs as a task, so a caller being cancelled does not
+    cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func()`` unless a call with ``key`` is already in flight, then share it."""
+        task = self._tasks.get(key)
+        if task is None:
+
+            async def run() -> T:
+                return await func()
+
+            task = self._tasks[key] = asyncio.ensure_future(run())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
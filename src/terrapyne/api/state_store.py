@@ -0,0 +1,179 @@
+"""Local content-addressed store of downloaded state versions.
+
+A state version is immutable once created, so its JSON only ever needs to be
+downloaded once. The store keeps each state gzip-compressed under a name
+derived from its terraform ``lineage`` and ``serial`` (falling back to a hash
+of the content), with a small reference file per state version ID pointing at
+it; state versions that share a lineage and serial share one object.
+
+The directory may be shared by concurrent processes: objects and references
+are written to temp files and renamed into place, so a reader only ever sees
+complete entries, and an entry evicted by one process stays readable by any
+process that already opened it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from terrapyne.core.state_diff import read_state_lineage
+
+logger = logging.getLogger("terrapyne.api")
+
+DEFAULT_STATE_STORE_BYTES = 1024 * 1024 * 1024
+
+# gzip level for stored states: state JSON shrinks ~10x even at low levels
+COMPRESS_LEVEL = 6
+
+# Temp files older than this are leftovers of crashed writers
+STALE_TEMP_SECONDS = 24 * 3600
+
+_OBJECT_SUFFIX = ".tfstate.gz"
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class StateStore:
+    """Size-bounded disk store of state version JSON.
+
+    Layout under ``root``::
+
+        objects/<lineage>-<serial>.tfstate.gz   gzip-compressed state JSON
+        refs/<state-version-id>                 name of the object it resolves to
+
+    Objects are evicted least recently used first (reads refresh an object's
+    mtime) once their total compressed size exceeds ``max_bytes``; references
+    left pointing at an evicted object read as misses. Directories are created
+    ``0700`` and files ``0600``, since state can hold secrets.
+
+    Example:
+        store = StateStore(Path("~/.terrapyne/state").expanduser())
+        with store.writer("sv-abc123") as f:
+            client.download(url, f)
+        with store.open("sv-abc123") as f:
+            state = json.load(f)
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_STATE_STORE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.objects_dir = root / "objects"
+        self.refs_dir = root / "refs"
+
+    def _ensure_dirs(self) -> None:
+        for directory in (self.root, self.objects_dir, self.refs_dir):
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _ref_path(self, state_version_id: str) -> Path:
+        if not _SAFE_NAME.match(state_version_id):
+            raise ValueError(f"Invalid state version ID: {state_version_id!r}")
+        return self.refs_dir / state_version_id
+
+    def _object_path(self, state_version_id: str) -> Path | None:
+        try:
+            name = self._ref_path(state_version_id).read_text().strip()
+        except OSError:
+            return None
+        path = self.objects_dir / name
+        return path if _SAFE_NAME.match(name) and path.is_file() else None
+
+    def __contains__(self, state_version_id: str) -> bool:
+        return self._object_path(state_version_id) is not None
+
+    def open(self, state_version_id: str) -> BinaryIO | None:
+        """Open a stored state version's (decompressed) JSON, or None if not stored."""
+        path = self._object_path(state_version_id)
+        if path is None:
+            return None
+        try:
+            stored = gzip.open(path, "rb")
+        except OSError:
+            # Evicted by another process between resolving and opening
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return stored  # type: ignore[return-value]
+
+    @contextlib.contextmanager
+    def writer(self, state_version_id: str) -> Iterator[BinaryIO]:
+        """Write a state version's JSON into the store.
+
+        Yields a binary file object that compresses what is written to it.
+        The entry becomes visible only once the block exits without error;
+        on error nothing is stored.
+        """
+        ref = self._ref_path(state_version_id)
+        self._ensure_dirs()
+        fd, tmp_name = tempfile.mkstemp(dir=self.objects_dir, prefix=".tmp-")
+        tmp = Path(tmp_name)
+        try:
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=COMPRESS_LEVEL, mtime=0) as gz,
+            ):
+                yield gz  # type: ignore[misc]
+            name = self._object_name(tmp)
+            os.replace(tmp, self.objects_dir / name)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._atomic_write(ref, name.encode())
+        self._evict()
+
+    def _object_name(self, tmp: Path) -> str:
+        """Content address of a written object: lineage and serial, else a content hash."""
+        try:
+            with gzip.open(tmp, "rt", encoding="utf-8") as f:
+                lineage, serial = read_state_lineage(f)
+        except (OSError, ValueError):
+            lineage, serial = None, None
+        if lineage and serial is not None and _SAFE_NAME.match(lineage):
+            return f"{lineage}-{serial}{_OBJECT_SUFFIX}"
+        with open(tmp, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return f"sha256-{digest}{_OBJECT_SUFFIX}"
+
+    def _atomic_write(self, path: Path, content: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _evict(self) -> None:
+        """Remove least recently used objects until the store is at 90% of its cap."""
+        now = time.time()
+        entries = []
+        try:
+            for path in self.objects_dir.iterdir():
+                stat = path.stat()
+                if path.name.endswith(_OBJECT_SUFFIX):
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                elif now - stat.st_mtime > STALE_TEMP_SECONDS:
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"State store scan failed: {e}")
+            return
+
+        used = sum(size for _, size, _ in entries)
+        if used <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in sorted(entries, key=lambda item: item[0]):
+            if used <= target:
+                break
+            path.unlink(missing_ok=True)
+            used -= size
+            logger.debug(f"Evicted {path.name} from the state store")
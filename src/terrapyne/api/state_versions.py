@@ -3,12 +3,81 @@
 from __future__ import annotations
 
 import builtins
+import io
+import json
+import os
+import tempfile
+from collections.abc import Iterator
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, BinaryIO
 
+from terrapyne.api.client import DOWNLOAD_CHUNK_SIZE
+from terrapyne.api.state_store import StateStore
+from terrapyne.core.state_diff import StateResourceInstance, iter_state_resources
 from terrapyne.models.state_version import StateVersion, StateVersionOutput
 
 
+def _workspace_filter(organization: str, workspace_name: str) -> dict[str, Any]:
+    """Build the org+name filter the /state-versions listing requires."""
+    return {
+        "filter[organization][name]": organization,
+        "filter[workspace][name]": workspace_name,
+    }
+
+
+def _output_from_item(item: dict[str, Any]) -> StateVersionOutput:
+    """Build a StateVersionOutput from a state-version-outputs resource."""
+    attrs = item.get("attributes", {})
+    return StateVersionOutput(
+        name=attrs.get("name", ""),
+        value=attrs.get("value"),
+        type=attrs.get("type"),
+        sensitive=attrs.get("sensitive", False),
+    )
+
+
+def _created_before(sv: StateVersion, before: datetime) -> bool:
+    """Whether a state version was created before a (UTC-aware) datetime."""
+    if not sv.created_at:
+        return False
+    # Ensure created_at is timezone-aware (UTC)
+    created = sv.created_at
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=UTC)
+    return created < before
+
+
+def _download_target(path: str | os.PathLike[str] | None) -> Path:
+    """Destination of a state download: the given path, or a new private temp file."""
+    if path is not None:
+        return Path(path)
+    fd, name = tempfile.mkstemp(prefix="terrapyne-state-", suffix=".tfstate")
+    os.close(fd)
+    return Path(name)
+
+
+def _require_download_url(sv: StateVersion) -> str:
+    if not sv.download_url:
+        raise ValueError(f"State version {sv.id} has no download URL")
+    return sv.download_url
+
+
+def _state_store(client: Any) -> StateStore | None:
+    """The client's local state store, if one is configured."""
+    store = getattr(client, "state_store", None)
+    return store if isinstance(store, StateStore) else None
+
+
+def _copy(source: BinaryIO, destination: BinaryIO) -> int:
+    """Copy one binary file object into another, returning the bytes copied."""
+    written = 0
+    while chunk := source.read(DOWNLOAD_CHUNK_SIZE):
+        destination.write(chunk)
+        written += len(chunk)
+    return written
+
+
 class StateVersionsAPI:
     """State Versions API operations."""
 
@@ -45,8 +114,7 @@ class StateVersionsAPI:
             organization = self.client.get_organization()
 
         if organization and workspace_name:
-            params["filter[organization][name]"] = organization
-            params["filter[workspace][name]"] = workspace_name
+            params.update(_workspace_filter(organization, workspace_name))
         else:
             raise ValueError("Either workspace_id or organization+workspace_name required")
 
@@ -72,34 +140,135 @@ class StateVersionsAPI:
         response = self.client.get(path)
         return StateVersion.from_api_response(response["data"])
 
+    def _open_stored(
+        self, state_version_id: str, download_url: str | None = None
+    ) -> BinaryIO | None:
+        """Open a state version from the local store, downloading it there on a miss.
+
+        Returns None when the client has no state store (or another process
+        evicted the entry before it could be reopened).
+        """
+        store = _state_store(self.client)
+        if store is None:
+            return None
+        if state_version_id not in store:
+            url = download_url or _require_download_url(self.get(state_version_id))
+            with store.writer(state_version_id) as f:
+                self.stream_from_url(url, f)
+        return store.open(state_version_id)
+
     def download(self, state_version_id: str) -> dict[str, Any]:
         """Download raw state JSON for a state version.
 
-        Follows the signed hosted-state-download-url.
+        Follows the signed hosted-state-download-url, or reads the local
+        state store when the client has one.
         """
-        sv = self.get(state_version_id)
-        if not sv.download_url:
-            raise ValueError(f"State version {state_version_id} has no download URL")
-        return self.client.get(sv.download_url)
+        stored = self._open_stored(state_version_id)
+        if stored is not None:
+            with stored:
+                return json.load(stored)
+        return self.client.get(_require_download_url(self.get(state_version_id)))
 
     def download_from_url(self, download_url: str) -> dict[str, Any]:
         """Download raw state JSON from a signed URL directly."""
         return self.client.get(download_url)
 
+    def stream_from_url(self, download_url: str, destination: BinaryIO) -> int:
+        """Stream raw state JSON from a signed URL into a binary file object.
+
+        The state is written as it arrives rather than parsed into memory.
+
+        Returns:
+            Number of bytes written
+        """
+        return self.client.download(download_url, destination)
+
+    def stream(
+        self, state_version_id: str, destination: BinaryIO, download_url: str | None = None
+    ) -> int:
+        """Stream a state version's JSON into a binary file object.
+
+        Served from the local state store when the client has one (filling it
+        on a miss), otherwise streamed from the signed download URL.
+
+        Args:
+            state_version_id: State version ID
+            destination: Binary file object to write to
+            download_url: The version's signed URL, if already known (saves a lookup)
+
+        Returns:
+            Number of bytes written
+        """
+        stored = self._open_stored(state_version_id, download_url)
+        if stored is not None:
+            with stored:
+                return _copy(stored, destination)
+        url = download_url or _require_download_url(self.get(state_version_id))
+        return self.stream_from_url(url, destination)
+
+    def download_to_file(
+        self, state_version_id: str, path: str | os.PathLike[str] | None = None
+    ) -> Path:
+        """Stream a state version's JSON to a file without loading it into memory.
+
+        Args:
+            state_version_id: State version ID
+            path: Destination file (default: a new private temporary file,
+                which the caller is responsible for removing)
+
+        Returns:
+            Path of the written state file
+        """
+        target = _download_target(path)
+        try:
+            with open(target, "wb") as f:
+                self.stream(state_version_id, f)
+        except BaseException:
+            target.unlink(missing_ok=True)
+            raise
+        return target
+
+    def iter_resources(
+        self,
+        state_version_id: str,
+        types: set[str] | None = None,
+        mode: str | None = "managed",
+        module_pattern: str | None = None,
+    ) -> Iterator[StateResourceInstance]:
+        """Iterate a state version's resource instances with bounded memory.
+
+        The state is parsed incrementally by iter_state_resources (same
+        filters as parse_state_resources), read straight from the local state
+        store when the client has one, otherwise from a temporary file that is
+        removed once iteration ends.
+
+        Args:
+            state_version_id: State version ID
+            types: Filter to these resource types (None = all)
+            mode: Filter by mode ('managed', 'data', or None for all)
+            module_pattern: Filter to resources in modules matching this substring
+
+        Yields:
+            StateResourceInstance for each matching instance
+        """
+        stored = self._open_stored(state_version_id)
+        if stored is not None:
+            with stored, io.TextIOWrapper(stored, encoding="utf-8") as text:
+                yield from iter_state_resources(text, types, mode, module_pattern)
+            return
+
+        path = self.download_to_file(state_version_id)
+        try:
+            yield from iter_state_resources(path, types, mode, module_pattern)
+        finally:
+            path.unlink(missing_ok=True)
+
     def list_outputs(self, state_version_id: str) -> builtins.list[StateVersionOutput]:
         """List outputs for a state version without downloading full state."""
         path = f"/state-versions/{state_version_id}/outputs"
         outputs = []
         for item in self.client.paginate(path):
-            attrs = item.get("attributes", {})
-            outputs.append(
-                StateVersionOutput(
-                    name=attrs.get("name", ""),
-                    value=attrs.get("value"),
-                    type=attrs.get("type"),
-                    sensitive=attrs.get("sensitive", False),
-                )
-            )
+            outputs.append(_output_from_item(item))
         return outputs
 
     def find_version_before(self, workspace_id: str, before: datetime) -> StateVersion | None:
@@ -121,20 +290,133 @@ class StateVersionsAPI:
 
         ws = WorkspaceAPI(self.client).get_by_id(workspace_id)
         organization = self.client.get_organization()
-        params: dict[str, Any] = {
-            "filter[organization][name]": organization,
-            "filter[workspace][name]": ws.name,
-        }
+        params = _workspace_filter(organization, ws.name)
 
         for item in self.client.paginate(path, params=params):
             sv = StateVersion.from_api_response(item)
-            if not sv.created_at:
-                continue
-            # Ensure created_at is timezone-aware (UTC)
-            created = sv.created_at
-            if created.tzinfo is None:
-                created = created.replace(tzinfo=UTC)
-            if created < before:
+            if _created_before(sv, before):
+                return sv
+
+        return None
+
+
+class AsyncStateVersionsAPI:
+    """Async state versions API operations (mirrors StateVersionsAPI)."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def list(
+        self,
+        workspace_id: str | None = None,
+        organization: str | None = None,
+        workspace_name: str | None = None,
+        limit: int = 20,
+    ) -> tuple[builtins.list[StateVersion], int | None]:
+        """List state versions for a workspace (most recent first)."""
+        if not (organization and workspace_name) and workspace_id:
+            from terrapyne.api.workspaces import AsyncWorkspaceAPI
+
+            ws = await AsyncWorkspaceAPI(self.client).get_by_id(workspace_id)
+            workspace_name = ws.name
+            organization = self.client.get_organization()
+
+        if not (organization and workspace_name):
+            raise ValueError("Either workspace_id or organization+workspace_name required")
+
+        items_iter, total_count = await self.client.paginate_with_meta(
+            "/state-versions", params=_workspace_filter(organization, workspace_name)
+        )
+
+        versions = []
+        async for item in items_iter:
+            versions.append(StateVersion.from_api_response(item))
+            if len(versions) >= limit:
+                break
+
+        return versions, total_count
+
+    async def get(self, state_version_id: str) -> StateVersion:
+        """Get a state version by ID."""
+        response = await self.client.get(f"/state-versions/{state_version_id}")
+        return StateVersion.from_api_response(response["data"])
+
+    async def get_current(self, workspace_id: str) -> StateVersion:
+        """Get the current (latest) state version for a workspace."""
+        response = await self.client.get(f"/workspaces/{workspace_id}/current-state-version")
+        return StateVersion.from_api_response(response["data"])
+
+    async def _open_stored(
+        self, state_version_id: str, download_url: str | None = None
+    ) -> BinaryIO | None:
+        """Open a state version from the local store, downloading it there on a miss."""
+        store = _state_store(self.client)
+        if store is None:
+            return None
+        if state_version_id not in store:
+            url = download_url or _require_download_url(await self.get(state_version_id))
+            with store.writer(state_version_id) as f:
+                await self.stream_from_url(url, f)
+        return store.open(state_version_id)
+
+    async def download(self, state_version_id: str) -> dict[str, Any]:
+        """Download raw state JSON for a state version (via the local store, if any)."""
+        stored = await self._open_stored(state_version_id)
+        if stored is not None:
+            with stored:
+                return json.load(stored)
+        return await self.client.get(_require_download_url(await self.get(state_version_id)))
+
+    async def download_from_url(self, download_url: str) -> dict[str, Any]:
+        """Download raw state JSON from a signed URL directly."""
+        return await self.client.get(download_url)
+
+    async def stream_from_url(self, download_url: str, destination: BinaryIO) -> int:
+        """Stream raw state JSON from a signed URL into a binary file object."""
+        return await self.client.download(download_url, destination)
+
+    async def stream(
+        self, state_version_id: str, destination: BinaryIO, download_url: str | None = None
+    ) -> int:
+        """Stream a state version's JSON into a binary file object (via the local store, if any)."""
+        stored = await self._open_stored(state_version_id, download_url)
+        if stored is not None:
+            with stored:
+                return _copy(stored, destination)
+        url = download_url or _require_download_url(await self.get(state_version_id))
+        return await self.stream_from_url(url, destination)
+
+    async def download_to_file(
+        self, state_version_id: str, path: str | os.PathLike[str] | None = None
+    ) -> Path:
+        """Stream a state version's JSON to a file (default: a new private temp file)."""
+        target = _download_target(path)
+        try:
+            with open(target, "wb") as f:
+                await self.stream(state_version_id, f)
+        except BaseException:
+            target.unlink(missing_ok=True)
+            raise
+        return target
+
+    async def list_outputs(self, state_version_id: str) -> builtins.list[StateVersionOutput]:
+        """List outputs for a state version without downloading full state."""
+        path = f"/state-versions/{state_version_id}/outputs"
+        return [_output_from_item(item) async for item in self.client.paginate(path)]
+
+    async def find_version_before(self, workspace_id: str, before: datetime) -> StateVersion | None:
+        """Find the last state version created before a given datetime."""
+        from terrapyne.api.workspaces import AsyncWorkspaceAPI
+
+        if before.tzinfo is None:
+            before = before.replace(tzinfo=UTC)
+
+        ws = await AsyncWorkspaceAPI(self.client).get_by_id(workspace_id)
+        params = _workspace_filter(self.client.get_organization(), ws.name)
+
+        async for item in self.client.paginate("/state-versions", params=params):
+            sv = StateVersion.from_api_response(item)
+            if _created_before(sv, before):
                 return sv
 
         return None
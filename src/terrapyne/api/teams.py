@@ -2,15 +2,148 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import builtins
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from terrapyne.api.client import TFCClient
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY, FanOut
+from terrapyne.api.inventory import inventory_for
 from terrapyne.models.team import Team
 
 if TYPE_CHECKING:
+    from terrapyne.api.async_client import AsyncTFCClient
     from terrapyne.models.team_access import TeamProjectAccess, TeamProjectAccessComparison
 
+VALID_ACCESS_LEVELS = {"admin", "maintain", "write", "read"}
+
+# Seconds a cached team name is trusted; matches the response cache TTL for /teams/<id>
+TEAM_NAME_TTL = 3600
+
+
+class TeamNameCache:
+    """Thread-safe team ID to name map shared by every client in the process.
+
+    Entries are keyed by the client's host as well as the ID, so clients
+    talking to different TFC/TFE instances never see each other's teams.
+    Names are learned from every team the API returns (``get``,
+    ``list_teams``, ``include=team``). Each entry expires ``ttl`` seconds
+    after it was last learned, so a renamed team is picked up again even in a
+    long-lived process such as ``tfc serve``.
+    """
+
+    def __init__(
+        self,
+        ttl: float = TEAM_NAME_TTL,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._names: dict[tuple[str, str], tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, client: Any, team_id: str) -> str | None:
+        """Cached name of a team, or None if unknown or expired."""
+        key = (_host(client), team_id)
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is None:
+                return None
+            name, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._names[key]
+                return None
+            return name
+
+    def update(self, client: Any, names: dict[str, str]) -> None:
+        """Record team names by ID."""
+        host = _host(client)
+        expires_at = self._clock() + self.ttl
+        with self._lock:
+            self._names.update(
+                {(host, team_id): (name, expires_at) for team_id, name in names.items()}
+            )
+
+    def clear(self) -> None:
+        """Forget every cached name."""
+        with self._lock:
+            self._names.clear()
+
+
+def _host(client: Any) -> str:
+    return getattr(client, "host", "")
+
+
+# Shared by every client in the process; names are looked up far more often than they change,
+# so entries live for TEAM_NAME_TTL seconds
+team_names = TeamNameCache()
+
+
+def team_names_from_included(included: Iterable[dict[str, Any]]) -> dict[str, str]:
+    """Team names by ID from a response's ``included`` resources."""
+    return {
+        item["id"]: item["attributes"]["name"]
+        for item in included
+        if item.get("type") == "teams" and item.get("attributes", {}).get("name")
+    }
+
+
+def _list_params(search: str | None, names: list[str] | None) -> dict[str, Any]:
+    """Build query parameters for a team listing."""
+    params: dict[str, Any] = {}
+    if search:
+        # q= is case-insensitive substring search; vastly more efficient than
+        # paginating all teams client-side in large orgs
+        params["q"] = search
+    if names:
+        # filter[names] accepts comma-separated exact names; returns any matching
+        params["filter[names]"] = ",".join(names)
+    return params
+
+
+def _team_payload(name: str | None, description: str | None) -> dict[str, Any]:
+    """Build the JSON:API payload for creating or updating a team."""
+    attributes: dict[str, Any] = {}
+    if name is not None:
+        attributes["name"] = name
+    if description is not None:
+        attributes["description"] = description
+
+    return {
+        "data": {
+            "type": "teams",
+            "attributes": attributes,
+        }
+    }
+
+
+def _membership_payload(user_id: str) -> dict[str, Any]:
+    """Build the relationship payload for adding or removing a team member."""
+    return {
+        "data": [
+            {
+                "type": "users",
+                "id": user_id,
+            }
+        ]
+    }
+
+
+def _project_access_payload(access: str) -> dict[str, Any]:
+    """Validate an access level and build the team-projects PATCH payload."""
+    if access not in VALID_ACCESS_LEVELS:
+        raise ValueError(f"Invalid access level '{access}'. Must be one of: {VALID_ACCESS_LEVELS}")
+
+    return {
+        "data": {
+            "type": "team-projects",
+            "attributes": {"access": access},
+        }
+    }
+
 
 class TeamsAPI:
     """Teams API operations."""
@@ -54,22 +187,23 @@ class TeamsAPI:
             teams, total = api.list_teams(names=["platform-developer", "platform-viewer"])
         """
         org = self.client.get_organization(organization)
+        inventory = inventory_for(self.client, org, "teams")
+        if inventory is not None:
+            teams = inventory.teams(org, search, names)
+            team_names.update(self.client, {team.id: team.name for team in teams})
+            return iter(teams), len(teams)
+
         path = f"/organizations/{org}/teams"
 
-        params: dict[str, Any] = {}
-        if search:
-            # q= is case-insensitive substring search; vastly more efficient than
-            # paginating all teams client-side in large orgs
-            params["q"] = search
-        if names:
-            # filter[names] accepts comma-separated exact names; returns any matching
-            params["filter[names]"] = ",".join(names)
+        params = _list_params(search, names)
 
         items_iterator, total_count = self.client.paginate_with_meta(path, params=params)
 
         def team_iterator() -> Iterator[Team]:
             for item in items_iterator:
-                yield Team.from_api_response(item)
+                team = Team.from_api_response(item)
+                team_names.update(self.client, {team.id: team.name})
+                yield team
 
         return team_iterator(), total_count
 
@@ -87,7 +221,41 @@ class TeamsAPI:
         """
         path = f"/teams/{team_id}"
         response = self.client.get(path)
-        return Team.from_api_response(response["data"])
+        team = Team.from_api_response(response["data"])
+        team_names.update(self.client, {team.id: team.name})
+        return team
+
+    def resolve_names(self, team_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve team IDs to names, fetching only those not cached yet.
+
+        Unknown teams are fetched concurrently; a team that cannot be read
+        (deleted, or hidden from this token) is left out of the result.
+
+        Args:
+            team_ids: Team IDs (duplicates are looked up once)
+
+        Returns:
+            Dict of team ID to name for every team that could be resolved
+        """
+        names: dict[str, str] = {}
+        missing = []
+        for team_id in dict.fromkeys(team_ids):
+            name = team_names.get(self.client, team_id)
+            if name is None:
+                missing.append(team_id)
+            else:
+                names[team_id] = name
+
+        def fetch(team_id: str) -> Team | None:
+            try:
+                return self.get(team_id)
+            except Exception:
+                return None
+
+        for team in FanOut().map(fetch, missing):
+            if team is not None:
+                names[team.id] = team.name
+        return names
 
     def create(
         self,
@@ -111,18 +279,7 @@ class TeamsAPI:
         org = self.client.get_organization(organization)
         path = f"/organizations/{org}/teams"
 
-        attributes: dict[str, Any] = {}
-        if name:
-            attributes["name"] = name
-        if description is not None:
-            attributes["description"] = description
-
-        payload = {
-            "data": {
-                "type": "teams",
-                "attributes": attributes,
-            }
-        }
+        payload = _team_payload(name or None, description)
 
         response = self.client.post(path, json_data=payload)
         return Team.from_api_response(response["data"])
@@ -148,18 +305,7 @@ class TeamsAPI:
         """
         path = f"/teams/{team_id}"
 
-        attributes: dict[str, Any] = {}
-        if name is not None:
-            attributes["name"] = name
-        if description is not None:
-            attributes["description"] = description
-
-        payload = {
-            "data": {
-                "type": "teams",
-                "attributes": attributes,
-            }
-        }
+        payload = _team_payload(name, description)
 
         response = self.client.patch(path, json_data=payload)
         return Team.from_api_response(response["data"])
@@ -207,14 +353,7 @@ class TeamsAPI:
         """
         path = f"/teams/{team_id}/relationships/users"
 
-        payload = {
-            "data": [
-                {
-                    "type": "users",
-                    "id": user_id,
-                }
-            ]
-        }
+        payload = _membership_payload(user_id)
 
         self.client.post(path, json_data=payload)
 
@@ -230,14 +369,7 @@ class TeamsAPI:
         """
         path = f"/teams/{team_id}/relationships/users"
 
-        payload = {
-            "data": [
-                {
-                    "type": "users",
-                    "id": user_id,
-                }
-            ]
-        }
+        payload = _membership_payload(user_id)
 
         # Use DELETE with JSON body
         self.client.delete(path, json_data=payload)
@@ -295,20 +427,12 @@ class TeamsAPI:
         """
         from terrapyne.models.team_access import TeamProjectAccess
 
-        valid_levels = {"admin", "maintain", "write", "read"}
-        if access not in valid_levels:
-            raise ValueError(f"Invalid access level '{access}'. Must be one of: {valid_levels}")
+        payload = _project_access_payload(access)
 
         # Find existing record ID
         existing = self.get_project_access(project_id, team_id)
 
         path = f"/team-projects/{existing.id}"
-        payload = {
-            "data": {
-                "type": "team-projects",
-                "attributes": {"access": access},
-            }
-        }
 
         response = self.client.patch(path, json_data=payload)
         return TeamProjectAccess.from_api_response(response["data"])
@@ -340,3 +464,170 @@ class TeamsAPI:
         access_b = self.get_project_access(project_id_b, team_id_b)
 
         return TeamProjectAccessComparison.compare(access_a, access_b)
+
+
+class AsyncTeamsAPI:
+    """Async teams API operations (mirrors TeamsAPI)."""
+
+    def __init__(self, client: AsyncTFCClient):
+        """Initialize async teams API.
+
+        Args:
+            client: Async TFC API client
+        """
+        self.client = client
+
+    async def list_teams(
+        self,
+        organization: str | None = None,
+        search: str | None = None,
+        names: builtins.list[str] | None = None,
+    ) -> tuple[AsyncIterator[Team], int | None]:
+        """List teams in an organization using server-side filtering."""
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/teams"
+
+        items_iterator, total_count = await self.client.paginate_with_meta(
+            path, params=_list_params(search, names)
+        )
+
+        async def team_iterator() -> AsyncIterator[Team]:
+            async for item in items_iterator:
+                team = Team.from_api_response(item)
+                team_names.update(self.client, {team.id: team.name})
+                yield team
+
+        return team_iterator(), total_count
+
+    async def get(self, team_id: str) -> Team:
+        """Get team details by ID."""
+        response = await self.client.get(f"/teams/{team_id}")
+        team = Team.from_api_response(response["data"])
+        team_names.update(self.client, {team.id: team.name})
+        return team
+
+    async def resolve_names(self, team_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve team IDs to names, fetching those not cached yet concurrently."""
+        import asyncio
+
+        ids = builtins.list(dict.fromkeys(team_ids))
+        missing = [team_id for team_id in ids if team_names.get(self.client, team_id) is None]
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+        async def fetch(team_id: str) -> Team:
+            async with semaphore:
+                return await self.get(team_id)
+
+        await asyncio.gather(*(fetch(team_id) for team_id in missing), return_exceptions=True)
+        return {
+            team_id: name
+            for team_id in ids
+            if (name := team_names.get(self.client, team_id)) is not None
+        }
+
+    async def create(
+        self,
+        organization: str | None = None,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> Team:
+        """Create a new team."""
+        org = self.client.get_organization(organization)
+        response = await self.client.post(
+            f"/organizations/{org}/teams", json_data=_team_payload(name or None, description)
+        )
+        return Team.from_api_response(response["data"])
+
+    async def update(
+        self,
+        team_id: str,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> Team:
+        """Update a team."""
+        response = await self.client.patch(
+            f"/teams/{team_id}", json_data=_team_payload(name, description)
+        )
+        return Team.from_api_response(response["data"])
+
+    async def delete(self, team_id: str) -> None:
+        """Delete a team."""
+        await self.client.delete(f"/teams/{team_id}")
+
+    async def list_members(self, team_id: str) -> tuple[builtins.list[dict[str, Any]], int | None]:
+        """List members in a team."""
+        path = f"/teams/{team_id}/relationships/users"
+
+        items_iterator, total_count = await self.client.paginate_with_meta(path)
+        members = [item async for item in items_iterator]
+
+        return members, total_count
+
+    async def add_member(self, team_id: str, user_id: str) -> None:
+        """Add a user to a team."""
+        await self.client.post(
+            f"/teams/{team_id}/relationships/users", json_data=_membership_payload(user_id)
+        )
+
+    async def remove_member(self, team_id: str, user_id: str) -> None:
+        """Remove a user from a team."""
+        await self.client.delete(
+            f"/teams/{team_id}/relationships/users", json_data=_membership_payload(user_id)
+        )
+
+    async def get_project_access(self, project_id: str, team_id: str) -> TeamProjectAccess:
+        """Get a team's access record for a specific project.
+
+        Raises:
+            ValueError: If no access record found for this team/project combination
+        """
+        from terrapyne.models.team_access import TeamProjectAccess
+
+        params = {"filter[project][id]": project_id}
+
+        async for item in self.client.paginate("/team-projects", params=params):
+            access = TeamProjectAccess.from_api_response(item)
+            if access.team_id == team_id:
+                return access
+
+        raise ValueError(
+            f"No project access record found for team '{team_id}' in project '{project_id}'"
+        )
+
+    async def set_project_access(
+        self,
+        project_id: str,
+        team_id: str,
+        access: str,
+    ) -> TeamProjectAccess:
+        """Update a team's access level on a project.
+
+        Raises:
+            ValueError: If access level invalid or no existing record found
+        """
+        from terrapyne.models.team_access import TeamProjectAccess
+
+        payload = _project_access_payload(access)
+        existing = await self.get_project_access(project_id, team_id)
+
+        response = await self.client.patch(f"/team-projects/{existing.id}", json_data=payload)
+        return TeamProjectAccess.from_api_response(response["data"])
+
+    async def compare_project_access(
+        self,
+        project_id_a: str,
+        team_id_a: str,
+        project_id_b: str,
+        team_id_b: str,
+    ) -> TeamProjectAccessComparison:
+        """Compare project access permissions between two teams."""
+        import asyncio
+
+        from terrapyne.models.team_access import TeamProjectAccessComparison
+
+        access_a, access_b = await asyncio.gather(
+            self.get_project_access(project_id_a, team_id_a),
+            self.get_project_access(project_id_b, team_id_b),
+        )
+
+        return TeamProjectAccessComparison.compare(access_a, access_b)
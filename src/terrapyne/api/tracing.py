@@ -0,0 +1,203 @@
+"""Structured tracing of API calls.
+
+A ``Tracer`` attached to a client records one ``Span`` per HTTP request
+(and per response served from the cache) and keeps a latency histogram per
+endpoint, where an endpoint is the method plus the path with its IDs and
+names templated out (``GET /workspaces/{id}/runs``). Traces can be written
+as NDJSON (one span per line, then one line per histogram) or in the Chrome
+trace-event format read by ``chrome://tracing`` and Perfetto.
+
+Example:
+    tracer = Tracer()
+    client = TFCClient(tracer=tracer)
+    client.workspaces.get("my-app")
+    for endpoint, histogram in tracer.histograms().items():
+        print(endpoint, histogram.count, histogram.percentile(95))
+    tracer.write(Path("trace.json"), "chrome")
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is unbounded)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Spans kept in memory; older ones are dropped (histograms keep counting)
+DEFAULT_MAX_SPANS = 100_000
+
+# Formats Tracer.write (and `--trace-format`) accept
+TRACE_FORMATS = ("ndjson", "chrome")
+
+# TFC resource ID prefixes (ws-…, run-…, prj-…); such path segments become {id}
+_RESOURCE_ID = re.compile(
+    r"^(apply|at|cv|nc|org|ot|plan|pol|polset|prj|run|sv|ta|team|tprj|tws|user|var|varset|ws)"
+    r"-[A-Za-z0-9]+$"
+)
+
+# Path segments that name a resource rather than identify it: the segment after the key
+_NAME_AFTER = {"organizations": "{organization}", "workspaces": "{workspace}"}
+
+
+def endpoint_template(url: str, base_url: str) -> str:
+    """Path of a request URL with IDs and names replaced by placeholders.
+
+    Args:
+        url: Full request URL
+        base_url: API base URL (e.g. ``https://app.terraform.io/api/v2``)
+
+    Returns:
+        e.g. ``/organizations/{organization}/workspaces/{workspace}``, or
+        ``<host>/*`` for URLs off the API (signed archive URLs)
+    """
+    if not url.startswith(f"{base_url}/"):
+        return f"{urlsplit(url).hostname}/*"
+    segments = urlsplit(url).path[len(urlsplit(base_url).path) :].strip("/").split("/")
+    templated = []
+    for i, segment in enumerate(segments):
+        if _RESOURCE_ID.match(segment):
+            templated.append("{id}")
+        elif i and segments[i - 1] in _NAME_AFTER:
+            templated.append(_NAME_AFTER[segments[i - 1]])
+        else:
+            templated.append(segment)
+    return "/" + "/".join(templated)
+
+
+@dataclass(frozen=True)
+class Span:
+    """One traced API call."""
+
+    method: str
+    endpoint: str
+    start: float  # epoch seconds
+    duration: float  # seconds
+    status: int | None = None  # None for responses served from the cache
+    bytes: int = 0
+    retries: int = 0  # 429s waited out before this response
+    cache: str | None = None  # "hit", "revalidated", "miss", or None when not cached
+    thread: int = 0
+
+    @property
+    def name(self) -> str:
+        """Histogram key: method and templated path."""
+        return f"{self.method} {self.endpoint}"
+
+
+@dataclass
+class LatencyHistogram:
+    """Bucketed latencies of one endpoint."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total: float = 0.0  # seconds
+    max: float = 0.0  # seconds
+
+    def add(self, seconds: float) -> None:
+        """Record one latency."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound in seconds of the bucket holding the ``pct``-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * pct / 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[i] / 1000 if i < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary of the histogram (times in milliseconds)."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "max_ms": round(self.max * 1000, 3),
+            "buckets_ms": dict(
+                zip([*map(str, LATENCY_BUCKETS_MS), "inf"], self.counts, strict=True)
+            ),
+        }
+
+
+class Tracer:
+    """Thread-safe collector of spans and per-endpoint latency histograms."""
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS):
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        """Add a span and count its latency."""
+        with self._lock:
+            self.spans.append(span)
+            histogram = self._histograms.setdefault(span.name, LatencyHistogram())
+            histogram.add(span.duration)
+
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Latency histograms keyed by endpoint, slowest total time first."""
+        with self._lock:
+            items = sorted(self._histograms.items(), key=lambda item: -item[1].total)
+        return dict(items)
+
+    def write(self, path: Path, trace_format: str = "ndjson") -> None:
+        """Write the recorded spans and histograms to ``path``.
+
+        Args:
+            path: Output file
+            trace_format: ``ndjson`` or ``chrome`` (trace-event JSON)
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format {trace_format!r} (use one of {TRACE_FORMATS})")
+        with self._lock:
+            spans = list(self.spans)
+        histograms = {name: h.as_dict() for name, h in self.histograms().items()}
+        with open(path, "w") as f:
+            if trace_format == "ndjson":
+                for span in spans:
+                    f.write(json.dumps({"type": "span", "name": span.name, **asdict(span)}) + "\n")
+                for name, summary in histograms.items():
+                    f.write(json.dumps({"type": "histogram", "name": name, **summary}) + "\n")
+            else:
+                json.dump(_chrome_trace(spans, histograms), f)
+
+
+def _chrome_trace(spans: list[Span], histograms: dict[str, Any]) -> dict[str, Any]:
+    """Spans as complete ("X") trace events, microsecond timestamps."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": span.name,
+            "cat": "cache" if span.cache == "hit" else "http",
+            "ph": "X",
+            "ts": round(span.start * 1_000_000),
+            "dur": round(span.duration * 1_000_000),
+            "pid": pid,
+            "tid": span.thread,
+            "args": {
+                "status": span.status,
+                "bytes": span.bytes,
+                "retries": span.retries,
+                "cache": span.cache,
+            },
+        }
+        for span in spans
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"histograms": histograms}}
@@ -4,12 +4,93 @@ from __future__ import annotations
 
 import builtins
 from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from terrapyne.api.client import TFCClient
-from terrapyne.api.workspaces import WorkspaceAPI
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY, FanOut
+from terrapyne.api.workspaces import AsyncWorkspaceAPI, WorkspaceAPI
 from terrapyne.models.vcs import VCSConnection
 from terrapyne.models.workspace import Workspace
 
+if TYPE_CHECKING:
+    from terrapyne.api.async_client import AsyncTFCClient
+
+
+def _vcs_from_workspace(response: dict[str, Any]) -> VCSConnection | None:
+    """Extract the VCS connection from a workspace response, if any."""
+    vcs_data = response["data"].get("attributes", {}).get("vcs-repo")
+
+    if not vcs_data:
+        return None
+
+    return VCSConnection.from_api_response(vcs_data)
+
+
+def _vcs_from_listing(workspace: Workspace) -> VCSConnection | None:
+    """Build the VCS connection from a listed workspace's ``vcs-repo`` attributes."""
+    vcs = workspace.vcs_repo
+    if vcs is None or not vcs.identifier:
+        return None
+    return VCSConnection.model_construct(
+        identifier=vcs.identifier,
+        branch=vcs.branch,
+        oauth_token_id=vcs.oauth_token_id,
+        repository_http_url=vcs.repository_http_url,
+        service_provider=vcs.service_provider,
+        working_directory=vcs.working_directory,
+    )
+
+
+def _needs_lookup(workspace: Workspace) -> bool:
+    """Whether a listed workspace's VCS data is too sparse to group (no service provider)."""
+    return workspace.vcs_repo is not None and workspace.vcs_repo.service_provider is None
+
+
+def _branch_update_payload(
+    current_vcs: VCSConnection, branch: str, oauth_token_id: str
+) -> dict[str, Any]:
+    """Build a workspace PATCH payload that changes the branch and preserves other VCS settings."""
+    vcs_payload: dict[str, str | bool] = {
+        "identifier": current_vcs.identifier,
+        "oauth-token-id": oauth_token_id,
+        "branch": branch,
+        "ingress-submodules": current_vcs.ingress_submodules,
+    }
+
+    # Add optional fields if they exist
+    if current_vcs.working_directory:
+        vcs_payload["working-directory"] = current_vcs.working_directory
+
+    return {
+        "data": {
+            "type": "workspaces",
+            "attributes": {
+                "vcs-repo": vcs_payload,
+            },
+        }
+    }
+
+
+def _group_github_repositories(
+    connections: Iterable[tuple[Workspace, VCSConnection | None]],
+) -> list[dict]:
+    """Group workspaces by the GitHub repository they are connected to."""
+    repos: dict[str, dict] = defaultdict(lambda: {"workspaces": []})
+
+    for workspace, vcs in connections:
+        if vcs and vcs.service_provider == "github":
+            identifier = vcs.identifier
+            if identifier not in repos:
+                repos[identifier] = {
+                    "identifier": identifier,
+                    "url": vcs.github_url,
+                    "workspaces": [],
+                }
+            repos[identifier]["workspaces"].append(workspace.name)
+
+    return sorted(repos.values(), key=lambda x: x["identifier"])
+
 
 class VCSAPI:
     """VCS API operations."""
@@ -35,13 +116,7 @@ class VCSAPI:
             TFCAPIError: If workspace not found
         """
         response = self.client.get(f"/workspaces/{workspace_id}")
-        workspace_data = response["data"]
-        vcs_data = workspace_data.get("attributes", {}).get("vcs-repo")
-
-        if not vcs_data:
-            return None
-
-        return VCSConnection.from_api_response(vcs_data)
+        return _vcs_from_workspace(response)
 
     def update_workspace_branch(
         self,
@@ -71,25 +146,7 @@ class VCSAPI:
             raise ValueError(f"Workspace {workspace_id} has no VCS connection")
 
         # Build update payload preserving existing settings
-        vcs_payload: dict[str, str | bool] = {
-            "identifier": current_vcs.identifier,
-            "oauth-token-id": oauth_token_id,
-            "branch": branch,
-            "ingress-submodules": current_vcs.ingress_submodules,
-        }
-
-        # Add optional fields if they exist
-        if current_vcs.working_directory:
-            vcs_payload["working-directory"] = current_vcs.working_directory
-
-        payload = {
-            "data": {
-                "type": "workspaces",
-                "attributes": {
-                    "vcs-repo": vcs_payload,
-                },
-            }
-        }
+        payload = _branch_update_payload(current_vcs, branch, oauth_token_id)
 
         response = self.client.patch(f"/workspaces/{workspace_id}", json_data=payload)
         return Workspace.from_api_response(response["data"])
@@ -113,11 +170,19 @@ class VCSAPI:
         # In a real scenario we might want to iterate through oauth-tokens
         return []
 
-    def list_repositories(self, organization: str) -> list[dict]:
+    def list_repositories(
+        self, organization: str, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[dict]:
         """Discover GitHub repositories connected to TFC workspaces.
 
+        VCS settings are read from the workspace listing itself, so an
+        organization costs one request per page of workspaces. Only workspaces
+        whose listed ``vcs-repo`` lacks a service provider are fetched again,
+        concurrently.
+
         Args:
             organization: Organization name
+            concurrency: Maximum concurrent lookups for sparse listings
 
         Returns:
             List of dicts with:
@@ -128,23 +193,88 @@ class VCSAPI:
         Raises:
             TFCAPIError: If API request fails
         """
-        workspaces_api = WorkspaceAPI(self.client)
-        workspaces_iter, _ = workspaces_api.list(organization)
-        workspaces = list(workspaces_iter)
+        workspaces_iter, _ = WorkspaceAPI(self.client).list(organization)
+
+        connections: list[tuple[Workspace, VCSConnection | None]] = []
+        sparse: list[int] = []
+        for workspace in workspaces_iter:
+            if _needs_lookup(workspace):
+                sparse.append(len(connections))
+            connections.append((workspace, _vcs_from_listing(workspace)))
+
+        lookups = FanOut(concurrency=concurrency).map(
+            self.get_workspace_vcs, [connections[i][0].id for i in sparse]
+        )
+        for i, vcs in zip(sparse, lookups, strict=True):
+            connections[i] = (connections[i][0], vcs)
 
         # Group workspaces by repository
-        repos: dict[str, dict] = defaultdict(lambda: {"workspaces": []})
-
-        for workspace in workspaces:
-            vcs = self.get_workspace_vcs(workspace.id)
-            if vcs and vcs.service_provider == "github":
-                identifier = vcs.identifier
-                if identifier not in repos:
-                    repos[identifier] = {
-                        "identifier": identifier,
-                        "url": vcs.github_url,
-                        "workspaces": [],
-                    }
-                repos[identifier]["workspaces"].append(workspace.name)
-
-        return sorted(repos.values(), key=lambda x: x["identifier"])
+        return _group_github_repositories(connections)
+
+
+class AsyncVCSAPI:
+    """Async VCS API operations (mirrors VCSAPI)."""
+
+    def __init__(self, client: AsyncTFCClient):
+        """Initialize async VCS API.
+
+        Args:
+            client: Async TFC API client
+        """
+        self.client = client
+
+    async def get_workspace_vcs(self, workspace_id: str) -> VCSConnection | None:
+        """Get VCS connection for workspace (None if not VCS-backed)."""
+        response = await self.client.get(f"/workspaces/{workspace_id}")
+        return _vcs_from_workspace(response)
+
+    async def update_workspace_branch(
+        self,
+        workspace_id: str,
+        branch: str,
+        oauth_token_id: str,
+    ) -> Workspace:
+        """Update VCS branch for workspace, preserving all other VCS settings.
+
+        Raises:
+            ValueError: If workspace has no VCS connection
+        """
+        current_vcs = await self.get_workspace_vcs(workspace_id)
+        if not current_vcs:
+            raise ValueError(f"Workspace {workspace_id} has no VCS connection")
+
+        payload = _branch_update_payload(current_vcs, branch, oauth_token_id)
+        response = await self.client.patch(f"/workspaces/{workspace_id}", json_data=payload)
+        return Workspace.from_api_response(response["data"])
+
+    async def list_connections(self, organization: str) -> builtins.list[VCSConnection]:
+        """List VCS connections (oauth-tokens) for an organization."""
+        await self.client.get(f"/organizations/{organization}/oauth-clients")
+        return []
+
+    async def list_repositories(
+        self, organization: str, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> builtins.list[dict]:
+        """Discover GitHub repositories connected to TFC workspaces.
+
+        VCS settings come from the workspace listing; only workspaces whose
+        listed ``vcs-repo`` lacks a service provider are fetched again, at
+        most ``concurrency`` at a time.
+        """
+        import asyncio
+
+        workspaces_iter, _ = await AsyncWorkspaceAPI(self.client).list(organization)
+        workspaces = [workspace async for workspace in workspaces_iter]
+
+        connections = [_vcs_from_listing(workspace) for workspace in workspaces]
+        sparse = [i for i, workspace in enumerate(workspaces) if _needs_lookup(workspace)]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def lookup(workspace_id: str) -> VCSConnection | None:
+            async with semaphore:
+                return await self.get_workspace_vcs(workspace_id)
+
+        lookups = await asyncio.gather(*(lookup(workspaces[i].id) for i in sparse))
+        for i, vcs in zip(sparse, lookups, strict=True):
+            connections[i] = vcs
+        return _group_github_repositories(zip(workspaces, connections, strict=True))
@@ -2,13 +2,102 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
 
 from terrapyne.api.client import TFCClient
+from terrapyne.api.fieldsets import Fieldsets, fieldset_params
+from terrapyne.api.inventory import inventory_for
 from terrapyne.models.variable import WorkspaceVariable
 from terrapyne.models.workspace import Workspace
 
+if TYPE_CHECKING:
+    from terrapyne.api.async_client import AsyncTFCClient
+
+
+def _list_params(
+    search: str | None,
+    project_id: str | None,
+    include: str | None,
+    *,
+    fields: Fieldsets | None = None,
+) -> dict[str, Any]:
+    """Build query parameters for a workspace listing."""
+    params: dict[str, Any] = fieldset_params(fields)
+    if include:
+        params["include"] = include
+    if search:
+        if "*" in search:
+            params["search[wildcard-name]"] = search
+        else:
+            params["search[name]"] = search
+    if project_id:
+        params["filter[project][id]"] = project_id
+    return params
+
+
+def _create_variable_payload(
+    workspace_id: str,
+    key: str,
+    value: str,
+    *,
+    category: str,
+    hcl: bool,
+    sensitive: bool,
+    description: str | None,
+) -> dict[str, Any]:
+    """Build the JSON:API payload for creating a workspace variable."""
+    attributes: dict[str, Any] = {
+        "key": key,
+        "value": value,
+        "category": category,
+        "hcl": hcl,
+        "sensitive": sensitive,
+    }
+    if description is not None:
+        attributes["description"] = description
+
+    return {
+        "data": {
+            "type": "vars",
+            "attributes": attributes,
+            "relationships": {"workspace": {"data": {"type": "workspaces", "id": workspace_id}}},
+        }
+    }
+
+
+def _update_variable_payload(
+    key: str | None,
+    value: str | None,
+    hcl: bool | None,
+    sensitive: bool | None,
+    description: str | None,
+) -> dict[str, Any]:
+    """Build the JSON:API payload for updating a variable (only provided values)."""
+    attributes: dict[str, Any] = {}
+    if key is not None:
+        attributes["key"] = key
+    if value is not None:
+        attributes["value"] = value
+    if hcl is not None:
+        attributes["hcl"] = hcl
+    if sensitive is not None:
+        attributes["sensitive"] = sensitive
+    if description is not None:
+        attributes["description"] = description
+
+    return {
+        "data": {
+            "type": "vars",
+            "attributes": attributes,
+        }
+    }
+
+
+def _sort_variables(variables: list[WorkspaceVariable]) -> list[WorkspaceVariable]:
+    """Sort variables: terraform vars first, then env vars, alphabetically within each."""
+    return sorted(variables, key=lambda v: (0 if v.is_terraform_var else 1, v.key.lower()))
+
 
 class WorkspaceAPI:
     """Workspace API operations."""
@@ -27,6 +116,7 @@ class WorkspaceAPI:
         search: str | None = None,
         project_id: str | None = None,
         include: str | None = None,
+        fields: Fieldsets | None = None,
     ) -> tuple[Iterator[Workspace], int | None]:
         """List workspaces in an organization.
 
@@ -35,23 +125,21 @@ class WorkspaceAPI:
             search: Search pattern for workspace names
             project_id: Filter by project ID
             include: Resources to include
+            fields: Sparse fieldsets (e.g. ``WORKSPACE_TABLE_FIELDS``); attributes
+                left out keep their model defaults
 
         Returns:
             Tuple of (iterator of Workspace instances, total count or None)
         """
         org = self.client.get_organization(organization)
+        inventory = inventory_for(self.client, org, "workspaces")
+        if inventory is not None:
+            workspaces = inventory.workspaces(org, search, project_id, include)
+            return iter(workspaces), len(workspaces)
+
         path = f"/organizations/{org}/workspaces"
 
-        params: dict[str, Any] = {}
-        if include:
-            params["include"] = include
-        if search:
-            if "*" in search:
-                params["search[wildcard-name]"] = search
-            else:
-                params["search[name]"] = search
-        if project_id:
-            params["filter[project][id]"] = project_id
+        params = _list_params(search, project_id, include, fields=fields)
 
         items_iterator, total_count = self.client.paginate_with_meta(path, params=params)
 
@@ -130,8 +218,7 @@ class WorkspaceAPI:
         for item in self.client.paginate(path):
             variables.append(WorkspaceVariable.from_api_response(item))
 
-        # Sort variables: terraform vars first, then env vars, alphabetically within each
-        return sorted(variables, key=lambda v: (0 if v.is_terraform_var else 1, v.key.lower()))
+        return _sort_variables(variables)
 
     def create_variable(
         self,
@@ -161,26 +248,15 @@ class WorkspaceAPI:
             TFCAPIError: If API request fails
         """
         path = "/vars"
-
-        attributes: dict[str, Any] = {
-            "key": key,
-            "value": value,
-            "category": category,
-            "hcl": hcl,
-            "sensitive": sensitive,
-        }
-        if description is not None:
-            attributes["description"] = description
-
-        payload = {
-            "data": {
-                "type": "vars",
-                "attributes": attributes,
-                "relationships": {
-                    "workspace": {"data": {"type": "workspaces", "id": workspace_id}}
-                },
-            }
-        }
+        payload = _create_variable_payload(
+            workspace_id,
+            key,
+            value,
+            category=category,
+            hcl=hcl,
+            sensitive=sensitive,
+            description=description,
+        )
 
         response = self.client.post(path, json_data=payload)
         return WorkspaceVariable.from_api_response(response["data"])
@@ -211,26 +287,7 @@ class WorkspaceAPI:
             TFCAPIError: If API request fails
         """
         path = f"/vars/{variable_id}"
-
-        # Build attributes dict with only provided values
-        attributes: dict[str, Any] = {}
-        if key is not None:
-            attributes["key"] = key
-        if value is not None:
-            attributes["value"] = value
-        if hcl is not None:
-            attributes["hcl"] = hcl
-        if sensitive is not None:
-            attributes["sensitive"] = sensitive
-        if description is not None:
-            attributes["description"] = description
-
-        payload = {
-            "data": {
-                "type": "vars",
-                "attributes": attributes,
-            }
-        }
+        payload = _update_variable_payload(key, value, hcl, sensitive, description)
 
         response = self.client.patch(path, json_data=payload)
         return WorkspaceVariable.from_api_response(response["data"])
@@ -247,3 +304,119 @@ class WorkspaceAPI:
         """
         path = f"/vars/{variable_id}"
         self.client.delete(path)
+
+
+class AsyncWorkspaceAPI:
+    """Async workspace API operations (mirrors WorkspaceAPI)."""
+
+    def __init__(self, client: AsyncTFCClient):
+        """Initialize async workspace API.
+
+        Args:
+            client: Async TFC API client
+        """
+        self.client = client
+
+    async def list(
+        self,
+        organization: str | None = None,
+        search: str | None = None,
+        project_id: str | None = None,
+        include: str | None = None,
+        fields: Fieldsets | None = None,
+    ) -> tuple[AsyncIterator[Workspace], int | None]:
+        """List workspaces in an organization.
+
+        Returns:
+            Tuple of (async iterator of Workspace instances, total count or None)
+        """
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/workspaces"
+        params = _list_params(search, project_id, include, fields=fields)
+
+        items_iterator, total_count = await self.client.paginate_with_meta(path, params=params)
+
+        async def workspace_iterator() -> AsyncIterator[Workspace]:
+            async for item in items_iterator:
+                yield Workspace.from_api_response(item, included=items_iterator.included)
+
+        return workspace_iterator(), total_count
+
+    async def get(
+        self,
+        workspace_name: str,
+        organization: str | None = None,
+        include: str | None = "project",
+    ) -> Workspace:
+        """Get workspace by name."""
+        org = self.client.get_organization(organization)
+        path = f"/organizations/{org}/workspaces/{workspace_name}"
+
+        params = {}
+        if include:
+            params["include"] = include
+
+        response = await self.client.get(path, params=params)
+        return Workspace.from_api_response(response["data"], response.get("included", []))
+
+    async def get_by_id(self, workspace_id: str, include: str | None = "project") -> Workspace:
+        """Get workspace by ID."""
+        path = f"/workspaces/{workspace_id}"
+
+        params = {}
+        if include:
+            params["include"] = include
+
+        response = await self.client.get(path, params=params)
+        return Workspace.from_api_response(response["data"], response.get("included", []))
+
+    async def get_variables(self, workspace_id: str) -> list[WorkspaceVariable]:  # type: ignore[valid-type]
+        """Get variables for a workspace."""
+        path = f"/workspaces/{workspace_id}/vars"
+
+        variables = []
+        async for item in self.client.paginate(path):
+            variables.append(WorkspaceVariable.from_api_response(item))
+
+        return _sort_variables(variables)
+
+    async def create_variable(
+        self,
+        workspace_id: str,
+        key: str,
+        value: str,
+        category: str = "terraform",
+        hcl: bool = False,
+        sensitive: bool = False,
+        description: str | None = None,
+    ) -> WorkspaceVariable:
+        """Create a new variable in a workspace."""
+        payload = _create_variable_payload(
+            workspace_id,
+            key,
+            value,
+            category=category,
+            hcl=hcl,
+            sensitive=sensitive,
+            description=description,
+        )
+        response = await self.client.post("/vars", json_data=payload)
+        return WorkspaceVariable.from_api_response(response["data"])
+
+    async def update_variable(
+        self,
+        variable_id: str,
+        key: str | None = None,
+        value: str | None = None,
+        hcl: bool | None = None,
+        sensitive: bool | None = None,
+        description: str | None = None,
+    ) -> WorkspaceVariable:
+        """Update an existing variable."""
+        payload = _update_variable_payload(key, value, hcl, sensitive, description)
+        response = await self.client.patch(f"/vars/{variable_id}", json_data=payload)
+        return WorkspaceVariable.from_api_response(response["data"])
+
+    async def delete_variable(self, workspace_id: str, variable_id: str) -> None:
+        """Delete a workspace variable."""
+        await self.client.delete(f"/vars/{variable_id}")
@@ -0,0 +1,436 @@
+"""Warm daemon for repeated `tfc` invocations.
+
+`tfc serve` keeps one process alive with a warm ``TFCClient``: credentials
+loaded once, connection pools (and their TLS sessions) open, and the response
+cache and state store in memory. It listens on a Unix domain socket; while it
+runs, `tfc` sends each command there instead of running it itself.
+
+A forwarded command runs in the daemon as if it ran in the calling process:
+the caller's arguments, working directory and environment are applied, and
+its stdin, stdout and stderr file descriptors are passed over the socket
+(``SCM_RIGHTS``), so output streams straight to the caller's terminal or pipe
+and prompts read the caller's input. Each command runs on its own thread;
+commands from different directories or environments do not run side by side
+(see ``CommandServer``).
+
+This module only imports the standard library at the top, so checking for a
+daemon costs `tfc` nothing measurable when none is running.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+if TYPE_CHECKING:
+    from terrapyne.api.client import TFCClient
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the daemon socket (default ~/.terrapyne/tfc.sock)
+SOCKET_ENV = "TERRAPYNE_SOCKET"
+
+# Set to 0 to run every command in-process even when a daemon is listening
+DAEMON_ENV = "TERRAPYNE_DAEMON"
+
+# Pending connections queued before the daemon accepts them
+LISTEN_BACKLOG = 64
+
+# Seconds between checks for a stop request or idleness while no connection arrives
+ACCEPT_POLL_SECONDS = 0.2
+
+# Environment variables that select credentials; a daemon only serves callers that agree on them
+_CREDENTIAL_ENV = ("TFC_TOKEN", "TFRC")
+
+# Global `tfc` options that take a value, so the command can be found without importing the CLI
+_GLOBAL_VALUE_OPTIONS = frozenset(
+    {"--cache-ttl", "--state-store-mb", "--inventory-max-age", "--trace-file", "--trace-format"}
+)
+
+
+def default_socket_path() -> Path:
+    """Socket of the daemon ($TERRAPYNE_SOCKET or ~/.terrapyne/tfc.sock)."""
+    override = os.getenv(SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path("~/.terrapyne/tfc.sock").expanduser()
+
+
+def credentials_key(env: Mapping[str, str]) -> str:
+    """Digest of the credential-selecting variables of an environment (never the token itself)."""
+    material = "\0".join(env.get(name, "") for name in _CREDENTIAL_ENV)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+# Global options that configure the client itself, which a daemon's warm client cannot honour
+_CLIENT_OPTIONS = frozenset({"--cache-ttl", "--state-store-mb"})
+
+
+def _command_position(argv: list[str]) -> int:
+    """Index of the command in ``argv``, skipping global options and their values.
+
+    Returns ``len(argv)`` when no command is given.
+    """
+    position = 0
+    while position < len(argv):
+        arg = argv[position]
+        if arg == "--":
+            return position + 1
+        if not arg.startswith("-"):
+            return position
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            position += 1  # the option's value, given as a separate argument
+        position += 1
+    return position
+
+
+def forward(argv: list[str], socket_path: Path | None = None) -> int | None:
+    """Run a command in the daemon, if one is listening and can serve it.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+        socket_path: Daemon socket (default: ``default_socket_path()``)
+
+    Returns:
+        The command's exit code, or None when it should run in-process (no
+        daemon, daemon disabled, `tfc serve` itself, ``--cache-ttl`` or
+        ``--state-store-mb`` given, or different credentials)
+    """
+    position = _command_position(argv)
+    command = argv[position] if position < len(argv) else None
+    options = {arg.split("=", 1)[0] for arg in argv[:position]}
+    if os.getenv(DAEMON_ENV) == "0" or command == "serve" or options & _CLIENT_OPTIONS:
+        return None
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+    try:
+        fds = [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "credentials": credentials_key(os.environ),
+        }
+        sys.stdout.flush()
+        sys.stderr.flush()
+        socket.send_fds(sock, [b"\0"], fds)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        line = sock.makefile("rb").readline()
+
+    if not line:
+        print(f"tfc: lost the connection to the daemon at {path}", file=sys.stderr)
+        return 1
+    response = json.loads(line)
+    if "fallback" in response:
+        logger.debug(f"Daemon declined the command: {response['fallback']}")
+        return None
+    return int(response["exit_code"])
+
+
+def stop(socket_path: Path | None = None) -> bool:
+    """Ask the daemon to exit once its running commands finish.
+
+    Returns:
+        Whether a daemon was listening
+    """
+    path = socket_path or default_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            socket.send_fds(sock, [b"\0"], [])
+            sock.sendall(json.dumps({"stop": True}).encode() + b"\n")
+            sock.makefile("rb").readline()
+    except OSError:
+        return False
+    return True
+
+
+class CommandServer:
+    """Runs forwarded `tfc` commands against one warm client.
+
+    Each connection is handled on its own thread, so a long command such as
+    `tfc run follow` does not hold up the others. The working directory and
+    environment are process-wide, however: commands run concurrently only
+    when they share the caller's directory, environment and global options,
+    and while any are running a command from another context is declined
+    (the caller then runs it in-process) rather than made to wait.
+
+    Example:
+        server = CommandServer(default_socket_path(), TFCClient(cache_ttl=60))
+        server.serve_forever()
+    """
+
+    def __init__(self, socket_path: Path, client: TFCClient, idle_timeout: float = 0):
+        """Initialize the server.
+
+        Args:
+            socket_path: Unix socket to listen on (created owner-only)
+            client: Warm client lent to every command
+            idle_timeout: Exit after this many seconds without a command (0 to never)
+        """
+        self.socket_path = socket_path
+        self.client = client
+        self.idle_timeout = idle_timeout
+        self.credentials = credentials_key(os.environ)
+        self.served = 0
+        self._stopping = False
+        self._lock = threading.Lock()
+        self._connections = 0
+        self._last_active = time.monotonic()
+        # Commands running in the current context, the context, and what it replaced
+        self._running = 0
+        self._context: tuple[Any, ...] | None = None
+        self._saved: tuple[str, dict[str, str], list[logging.Handler]] | None = None
+
+    def serve_forever(self) -> None:
+        """Listen until stopped (or idle for ``idle_timeout``), then remove the socket.
+
+        A stop request lets the running commands finish first.
+        """
+        from terrapyne.cli import utils
+
+        listener = self._listen()
+        previous = utils.set_warm_client(self.client)
+        workers: list[threading.Thread] = []
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = listener.accept()
+                except TimeoutError:
+                    if self._idle():
+                        break
+                    continue
+                with self._lock:
+                    self._connections += 1
+                worker = threading.Thread(target=self._serve_connection, args=(conn,), daemon=True)
+                worker.start()
+                workers = [w for w in workers if w.is_alive()] + [worker]
+            for worker in workers:
+                worker.join()
+        finally:
+            utils.set_warm_client(previous)
+            listener.close()
+            self.socket_path.unlink(missing_ok=True)
+            _ThreadLocalStream.uninstall()
+
+    def _idle(self) -> bool:
+        """Whether no connection has been open for ``idle_timeout`` seconds."""
+        with self._lock:
+            idle_for = time.monotonic() - self._last_active
+            return self._connections == 0 and 0 < self.idle_timeout <= idle_for
+
+    def _listen(self) -> socket.socket:
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(str(self.socket_path))
+                except OSError:
+                    self.socket_path.unlink()  # left behind by a daemon that died
+                else:
+                    raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        listener.listen(LISTEN_BACKLOG)
+        # Wake up regularly to notice stop requests and idleness
+        listener.settimeout(ACCEPT_POLL_SECONDS)
+        return listener
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        try:
+            with conn:
+                self._handle(conn)
+        except OSError as e:
+            # A caller that hung up (or a liveness probe) must not take the daemon down
+            logger.debug(f"Dropped connection: {e}")
+        finally:
+            with self._lock:
+                self._connections -= 1
+                self._last_active = time.monotonic()
+
+    def _handle(self, conn: socket.socket) -> None:
+        conn.settimeout(None)
+        _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+        try:
+            request = json.loads(conn.makefile("rb").readline() or b"{}")
+            if request.get("stop"):
+                self._stopping = True
+                response: dict[str, Any] = {"exit_code": 0}
+            elif len(fds) != 3:
+                response = {"fallback": "stdio was not passed"}
+            elif request.get("credentials") != self.credentials:
+                response = {"fallback": "started with different credentials"}
+            elif (reason := self._enter(request)) is not None:
+                response = {"fallback": reason}
+            else:
+                passed, fds = fds, []  # closed by _run
+                try:
+                    response = {"exit_code": self._run(request, passed)}
+                finally:
+                    self._exit()
+                with self._lock:
+                    self.served += 1
+        finally:
+            for fd in fds:
+                os.close(fd)
+        conn.sendall(json.dumps(response).encode() + b"\n")
+
+    def _enter(self, request: dict[str, Any]) -> str | None:
+        """Apply the caller's directory and environment, unless commands run in another context.
+
+        Returns:
+            Why the command cannot run in the daemon now, or None if it can
+        """
+        argv = request["argv"]
+        context = (
+            request["cwd"],
+            tuple(sorted(request["env"].items())),
+            tuple(argv[: _command_position(argv)]),
+        )
+        with self._lock:
+            if self._running and context != self._context:
+                return "busy with commands from another directory or environment"
+            if not self._running:
+                saved = (
+                    os.getcwd(),
+                    dict(os.environ),
+                    list(logging.getLogger("terrapyne").handlers),
+                )
+                try:
+                    os.chdir(request["cwd"])
+                except OSError as e:
+                    return f"cannot enter the caller's directory: {e}"
+                os.environ.clear()
+                os.environ.update(request["env"])
+                self._context, self._saved = context, saved
+            self._running += 1
+            return None
+
+    def _exit(self) -> None:
+        """Restore the daemon's directory, environment and logging once the last command ends."""
+        with self._lock:
+            self._running -= 1
+            if self._running or self._saved is None:
+                return
+            cwd, env, handlers = self._saved
+            logging.getLogger("terrapyne").handlers[:] = handlers
+            os.environ.clear()
+            os.environ.update(env)
+            os.chdir(cwd)
+            self._context = self._saved = None
+
+    def _run(self, request: dict[str, Any], fds: list[int]) -> int:
+        """Run one command with the caller's stdio on this thread."""
+        from terrapyne.cli.main import app
+
+        stdin = open(fds[0], encoding="utf-8", errors="replace", closefd=True)
+        stdout = open(fds[1], "w", encoding="utf-8", closefd=True, buffering=1)
+        stderr = open(fds[2], "w", encoding="utf-8", closefd=True, buffering=1)
+        try:
+            with _ThreadLocalStream.bind(stdin, stdout, stderr):
+                return _exit_code(app, request["argv"])
+        finally:
+            for stream in (stdout, stderr, stdin):
+                with contextlib.suppress(OSError):
+                    stream.close()
+
+
+class _ThreadLocalStream:
+    """Stand-in for ``sys.stdin``/``stdout``/``stderr`` that uses the current thread's stream.
+
+    Commands running concurrently in the daemon each see their caller's
+    stdio, while every other thread keeps the stream that was replaced.
+    """
+
+    _NAMES = ("stdin", "stdout", "stderr")
+    _install_lock = threading.Lock()
+
+    def __init__(self, default: TextIO):
+        self._default = default
+        self._local = threading.local()
+
+    def _stream(self) -> TextIO:
+        return getattr(self._local, "stream", None) or self._default
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream(), name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stream())
+
+    @classmethod
+    def _installed(cls) -> list[_ThreadLocalStream]:
+        """The stand-ins in ``sys``, installing any that were replaced (e.g. by a redirect)."""
+        with cls._install_lock:
+            proxies = []
+            for name in cls._NAMES:
+                current = getattr(sys, name)
+                if not isinstance(current, cls):
+                    current = cls(current)
+                    setattr(sys, name, current)
+                proxies.append(current)
+            return proxies
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Put back the streams the stand-ins replaced."""
+        with cls._install_lock:
+            for name in cls._NAMES:
+                current = getattr(sys, name)
+                if isinstance(current, cls):
+                    setattr(sys, name, current._default)
+
+    @classmethod
+    @contextlib.contextmanager
+    def bind(cls, *streams: TextIO) -> Iterator[None]:
+        """Use ``streams`` as this thread's stdin, stdout and stderr."""
+        proxies = cls._installed()
+        for proxy, stream in zip(proxies, streams, strict=True):
+            proxy._local.stream = stream
+        try:
+            yield
+        finally:
+            for proxy in proxies:
+                proxy._local.stream = None
+
+
+def _exit_code(app: Any, argv: list[str]) -> int:
+    """Run the Typer app on ``argv`` and return its exit code, as the interpreter would."""
+    try:
+        app(args=argv, prog_name="tfc")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
@@ -0,0 +1,119 @@
+"""Inventory CLI commands."""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from terrapyne.cli.utils import console, emit_json, get_client, handle_cli_errors, validate_context
+
+app = typer.Typer(help="Local inventory of an organization for fast org-wide queries")
+
+
+@app.callback(invoke_without_command=True)
+def _show_help(ctx: typer.Context):
+    if ctx.invoked_subcommand is None:
+        console.print(ctx.get_help())
+
+
+def _ago(timestamp: float | None) -> str:
+    if timestamp is None:
+        return "never"
+    seconds = int(time.time() - timestamp)
+    if seconds < 120:
+        return f"{seconds}s ago"
+    if seconds < 7200:
+        return f"{seconds // 60}m ago"
+    return f"{seconds // 3600}h ago"
+
+
+@app.command("sync")
+@handle_cli_errors
+def inventory_sync(
+    ctx: typer.Context,
+    organization: str | None = typer.Option(
+        None,
+        "--organization",
+        "-o",
+        help="TFC organization (auto-detected from context if available)",
+    ),
+    full: bool = typer.Option(
+        False, "--full", help="Walk every collection in full instead of incrementally"
+    ),
+    only: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--only",
+            help="Sync only this collection: projects, teams, workspaces, team-projects "
+            "(repeatable)",
+        ),
+    ] = None,
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json"),
+) -> None:
+    """Sync workspaces, latest runs, projects, teams and team access into the inventory.
+
+    Later commands read the inventory instead of the API when given
+    --from-inventory or --inventory-max-age.
+
+    Examples:
+        tfc inventory sync -o my-org
+        tfc --from-inventory workspace list -o my-org --search 'prod-*'
+    """
+    from terrapyne.api.inventory import COLLECTIONS
+
+    org, _ = validate_context(organization)
+
+    with get_client(ctx, organization=org) as client:
+        stats = client.inventory.sync(client, org, only or COLLECTIONS, full=full)
+
+    if output_format == "json":
+        emit_json([vars(s) for s in stats])
+        return
+
+    table = Table(title=f"Inventory sync of {org}", show_header=True, header_style="bold magenta")
+    table.add_column("Collection", style="cyan", no_wrap=True)
+    table.add_column("Walk")
+    table.add_column("Fetched", justify="right")
+    table.add_column("Changed", justify="right")
+    table.add_column("Deleted", justify="right")
+    for s in stats:
+        walk = "full" if s.full else "incremental"
+        table.add_row(s.collection, walk, str(s.fetched), str(s.changed), str(s.deleted))
+    console.print(table)
+
+
+@app.command("status")
+@handle_cli_errors
+def inventory_status(
+    ctx: typer.Context,
+    organization: str | None = typer.Option(
+        None,
+        "--organization",
+        "-o",
+        help="TFC organization (auto-detected from context if available)",
+    ),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json"),
+) -> None:
+    """Show what the inventory holds for an organization and when it was synced."""
+    org, _ = validate_context(organization)
+
+    with get_client(ctx, organization=org) as client:
+        statuses = client.inventory.status(org)
+        path = client.inventory.path
+
+    if output_format == "json":
+        emit_json([vars(s) for s in statuses])
+        return
+
+    table = Table(title=f"Inventory of {org}", show_header=True, header_style="bold magenta")
+    table.add_column("Collection", style="cyan", no_wrap=True)
+    table.add_column("Resources", justify="right")
+    table.add_column("Synced")
+    table.add_column("Full sync")
+    for s in statuses:
+        table.add_row(s.collection, str(s.count), _ago(s.synced_at), _ago(s.full_synced_at))
+    console.print(table)
+    console.print(f"\n[dim]{path}[/dim]")
@@ -0,0 +1,62 @@
+"""Command groups imported on first use.
+
+Each `tfc` command group lives in its own module, which pulls in the API
+client, models and renderers. Registering the groups by module path lets
+`tfc --help` list them from their help text alone, and a command only
+imports the group it belongs to.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group whose subgroups are imported when they are first looked up.
+
+    Subclasses list the subgroups in ``lazy_groups`` as name -> (module
+    path, short help); the module must define a ``typer.Typer`` named ``app``.
+    While the group's own help is rendered, subgroups that have not been
+    imported yet are listed from their short help instead.
+
+    Example:
+        class Cli(LazyTyperGroup):
+            lazy_groups = {"state": ("terrapyne.cli.state_cmd", "State version commands")}
+
+        app = typer.Typer(cls=Cli)
+    """
+
+    lazy_groups: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._listing = False
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """Eager commands first, then the lazy groups in registration order."""
+        eager = [name for name in super().list_commands(ctx) if name not in self.lazy_groups]
+        return [*eager, *self.lazy_groups]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Return a command, importing its module if it is a lazy group."""
+        if cmd_name in self.commands or cmd_name not in self.lazy_groups:
+            return super().get_command(ctx, cmd_name)
+        module, short_help = self.lazy_groups[cmd_name]
+        if self._listing:
+            return TyperGroup(name=cmd_name, help=short_help)
+        command = typer.main.get_command(import_module(module).app)
+        command.name = cmd_name
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        """Render help without importing the groups it lists."""
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
@@ -2,54 +2,52 @@
 
 from __future__ import annotations
 
+import math
 import sys
 from pathlib import Path
+from typing import ClassVar
 
 import typer
 
-from terrapyne.cli import (
-    debug_cmd,
-    project_cmd,
-    run_cmd,
-    state_cmd,
-    team_cmd,
-    vcs_cmd,
-    workspace_cmd,
-)
-from terrapyne.cli.utils import console, set_quiet_mode
+from terrapyne.cli.lazy import LazyTyperGroup
+
+
+class TfcGroup(LazyTyperGroup):
+    """The `tfc` command; each command group is imported only when it runs."""
+
+    lazy_groups: ClassVar[dict[str, tuple[str, str]]] = {
+        "workspace": ("terrapyne.cli.workspace_cmd", "Workspace management commands"),
+        "run": ("terrapyne.cli.run_cmd", "Run management commands"),
+        "team": ("terrapyne.cli.team_cmd", "Team management commands"),
+        "vcs": ("terrapyne.cli.vcs_cmd", "VCS configuration and repository discovery"),
+        "debug": ("terrapyne.cli.debug_cmd", "Troubleshooting and debugging commands"),
+        "project": ("terrapyne.cli.project_cmd", "Project discovery and management commands"),
+        "state": ("terrapyne.cli.state_cmd", "State version commands"),
+        "inventory": (
+            "terrapyne.cli.inventory_cmd",
+            "Local inventory of an organization for fast org-wide queries",
+        ),
+        "serve": (
+            "terrapyne.cli.serve_cmd",
+            "Run a warm daemon that later tfc commands are forwarded to",
+        ),
+    }
+
 
 # Use the invocation name (e.g., "tfc" or "terrapyne") instead of hardcoded name
 _prog = Path(sys.argv[0]).name
 app = typer.Typer(
     name=_prog,
     help="Terraform Cloud CLI orchestrator for DevOps engineers",
+    cls=TfcGroup,
 )
 
-# Add workspace commands
-app.add_typer(workspace_cmd.app, name="workspace")
-
-# Add run commands
-app.add_typer(run_cmd.app, name="run")
-
-# Add team commands
-app.add_typer(team_cmd.app, name="team")
-
-# Add VCS commands
-app.add_typer(vcs_cmd.app, name="vcs")
-
-# Add debug commands
-app.add_typer(debug_cmd.app, name="debug")
-
-# Add project commands
-app.add_typer(project_cmd.app, name="project")
-
-# Add state commands
-app.add_typer(state_cmd.app, name="state")
-
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
+        from terrapyne.rendering.logging import console
+
         console.print("terrapyne version 0.1.0")
         raise typer.Exit()
 
@@ -80,9 +78,35 @@ def main(
         "--cache-ttl",
         help="Cache API responses for N seconds (0 to disable)",
     ),
+    state_store_mb: int = typer.Option(
+        0,
+        "--state-store-mb",
+        help="Keep downloaded state versions in a local store of up to N MiB (0 to disable)",
+    ),
+    from_inventory: bool = typer.Option(
+        False,
+        "--from-inventory",
+        help="Answer list queries from the local inventory (see `tfc inventory sync`)",
+    ),
+    inventory_max_age: int | None = typer.Option(
+        None,
+        "--inventory-max-age",
+        help="Answer list queries from the local inventory, syncing it if older than N seconds",
+    ),
+    trace_file: str | None = typer.Option(
+        None,
+        "--trace-file",
+        help="Write a span per API call and per-endpoint latency histograms to this file",
+    ),
+    trace_format: str = typer.Option(
+        "ndjson",
+        "--trace-format",
+        help="Trace file format: ndjson, chrome (trace-event JSON for chrome://tracing)",
+    ),
 ) -> None:
     """Terraform Cloud CLI orchestrator for DevOps engineers."""
-    from terrapyne.cli.utils import setup_logging
+    from terrapyne.cli.utils import set_quiet_mode, setup_logging
+    from terrapyne.rendering.logging import console
 
     set_quiet_mode(quiet)
     setup_logging(debug)
@@ -92,6 +116,32 @@ def main(
         ctx.obj = {}
 
     ctx.obj["cache_ttl"] = cache_ttl
+    ctx.obj["state_store_mb"] = state_store_mb
+    if inventory_max_age is not None:
+        ctx.obj["inventory_max_age"] = float(inventory_max_age)
+    elif from_inventory:
+        ctx.obj["inventory_max_age"] = math.inf
+
+    if trace_file is not None:
+        from terrapyne.api.tracing import TRACE_FORMATS, Tracer
+
+        if trace_format not in TRACE_FORMATS:
+            raise typer.BadParameter(
+                f"must be one of {', '.join(TRACE_FORMATS)}", param_hint="--trace-format"
+            )
+        tracer = Tracer()
+        ctx.obj["tracer"] = tracer
+        ctx.call_on_close(lambda: tracer.write(Path(trace_file), trace_format))
 
     if ctx.invoked_subcommand is None and not quiet:
         console.print(ctx.get_help())
+
+
+def run() -> None:
+    """Console-script entry point: forward to a running `tfc serve` daemon, else run here."""
+    from terrapyne.cli.daemon import forward
+
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    app()
@@ -7,6 +7,7 @@ import sys
 
 import typer
 
+from terrapyne.api.fieldsets import PROJECT_TABLE_FIELDS
 from terrapyne.cli.utils import (
     console,
     get_client,
@@ -46,7 +47,8 @@ def project_list(
     org, _ = validate_context(organization)
 
     with get_client(ctx, organization=org) as client:
-        projects_iter, total_count = client.projects.list(org)
+        fields = PROJECT_TABLE_FIELDS if output_format == "table" else None
+        projects_iter, total_count = client.projects.list(org, fields=fields)
         projects = list(projects_iter)[:limit]
 
         if not projects:
@@ -64,12 +66,7 @@ def project_list(
             emit_json([p.model_dump() for p in projects])
             return
 
-        # Fetch workspace counts for each project
-        # In a real scenario with many projects, we might want to optimize this
-        workspace_counts: dict[str, int] = {}
-        for project in projects:
-            _, count = client.workspaces.list(org, project_id=project.id)
-            workspace_counts[project.id] = count or 0
+        workspace_counts = client.projects.count_workspaces(projects, org)
 
         render_projects(
             projects,
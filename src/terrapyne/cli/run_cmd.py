@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import datetime
 import sys
+from collections.abc import Iterator
 from contextlib import suppress
 from pathlib import Path
 from typing import Annotated, Any
 
 import typer
 
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY, FanOut
+from terrapyne.api.fieldsets import RUN_TABLE_FIELDS, RUN_TABLE_INCLUDE
 from terrapyne.cli.utils import (
     console,
     emit_json,
@@ -18,11 +21,15 @@ from terrapyne.cli.utils import (
     resolve_project_context,
     validate_context,
 )
+from terrapyne.core.exceptions import TFCNotFoundError
 from terrapyne.models.run import Run
 from terrapyne.rendering.rich_tables import render_run_detail, render_runs
 
 app = typer.Typer(help="Run management commands")
 
+# Characters read at a time by parse-plan
+PLAN_READ_CHUNK_SIZE = 64 * 1024
+
 
 @app.callback(invoke_without_command=True)
 def _show_help(ctx: typer.Context):
@@ -70,7 +77,16 @@ def run_list(
         ws = client.workspaces.get(workspace_name or "", organization=org)  # type: ignore[arg-type]
 
         # Fetch runs
-        runs, total = client.runs.list(workspace_id=ws.id, limit=limit, status=status)
+        if output_format == "table":
+            runs, total = client.runs.list(
+                workspace_id=ws.id,
+                limit=limit,
+                status=status,
+                include=RUN_TABLE_INCLUDE,
+                fields=RUN_TABLE_FIELDS,
+            )
+        else:
+            runs, total = client.runs.list(workspace_id=ws.id, limit=limit, status=status)
 
         if not runs:
             status_msg = f" with status '{status}'" if status else ""
@@ -358,8 +374,26 @@ def run_errors(
         int,
         typer.Option("--limit", "-n", help="Max errors to show per workspace"),
     ] = 3,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", help="Workspaces queried in parallel"),
+    ] = DEFAULT_CONCURRENCY,
+    strategy: Annotated[
+        str,
+        typer.Option(
+            "--strategy",
+            help="workspace: one query per workspace; org: one org-wide runs listing; "
+            "auto: org-wide listing, falling back to per-workspace queries",
+        ),
+    ] = "workspace",
 ):
     """Identify recent execution errors across a project."""
+    if strategy not in ("workspace", "org", "auto"):
+        console.print(
+            f"[red]Error:[/red] Invalid strategy '{strategy}'. Use workspace, org or auto."
+        )
+        raise typer.Exit(1)
+
     org, _ = validate_context(organization)
 
     with get_client(ctx, organization=org) as client:
@@ -373,13 +407,35 @@ def run_errors(
         workspaces = list(workspaces_iter)
 
         since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=days)
+
+        errors_by_workspace: dict[str, list[Run]] | None = None
+        if strategy in ("org", "auto"):
+            try:
+                errors_by_workspace = _org_errored_runs(client, org, project.name, since, limit)
+            except TFCNotFoundError:
+                if strategy == "org":
+                    raise
+                console.print(
+                    "[dim]Organization runs listing unavailable; querying workspaces[/dim]"
+                )
+
+        if errors_by_workspace is None:
+
+            def errored_runs(ws: Any) -> list[Run]:
+                runs, _ = client.runs.list(ws.id, status="errored", limit=limit)
+                return runs
+
+            fan = FanOut(concurrency=concurrency)
+            errors_by_workspace = {
+                ws.id: runs
+                for ws, runs in zip(workspaces, fan.map(errored_runs, workspaces), strict=True)
+            }
+
         error_found = False
 
         for ws in workspaces:
-            # Fetch errored runs
-            runs, _ = client.runs.list(ws.id, status="errored", limit=limit)
-
             # Filter by date
+            runs = errors_by_workspace.get(ws.id, [])
             recent_errors = [r for r in runs if r.created_at and r.created_at > since]
 
             if recent_errors:
@@ -399,6 +455,29 @@ def run_errors(
             )
 
 
+def _org_errored_runs(
+    client: Any, org: str, project_name: str, since: datetime.datetime, limit: int
+) -> dict[str, list[Run]]:
+    """Collect errored runs newer than ``since`` from the org-wide runs listing.
+
+    Runs arrive most recent first, so iteration stops at the first run older
+    than the window. At most ``limit`` runs are kept per workspace.
+    """
+    runs_iter, _ = client.runs.list_for_organization(
+        org, status="errored", project_names=[project_name]
+    )
+    by_workspace: dict[str, list[Run]] = {}
+    for run in runs_iter:
+        if run.created_at and run.created_at <= since:
+            break
+        if not run.workspace_id:
+            continue
+        workspace_runs = by_workspace.setdefault(run.workspace_id, [])
+        if len(workspace_runs) < limit:
+            workspace_runs.append(run)
+    return by_workspace
+
+
 @app.command("trigger")
 @handle_cli_errors
 def run_trigger(
@@ -569,7 +648,10 @@ def run_trigger(
 @handle_cli_errors
 def run_watch(
     ctx: typer.Context,
-    run_id: Annotated[str, typer.Argument(help="Run ID")],
+    run_ids: Annotated[
+        list[str] | None,
+        typer.Argument(help="Run ID(s) to watch"),
+    ] = None,
     organization: Annotated[
         str | None,
         typer.Option(
@@ -582,29 +664,95 @@ def run_watch(
         int,
         typer.Option("--max-wait", help="Max seconds to wait"),
     ] = 1800,
+    watch_all: Annotated[
+        bool,
+        typer.Option("--all", help="Watch every active run in the organization"),
+    ] = False,
+    project: Annotated[
+        str | None,
+        typer.Option("--project", "-p", help="With --all, only runs in this project"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", help="Status checks in flight when watching many"),
+    ] = DEFAULT_CONCURRENCY,
 ):
-    """Watch progress of an existing run."""
+    """Watch progress of an existing run (or many runs at once)."""
+    run_ids = run_ids or []
+    if not run_ids and not watch_all:
+        console.print("[red]Error:[/red] Provide a run ID or use --all")
+        raise typer.Exit(1)
+
     org, _ = validate_context(organization)
 
     with get_client(ctx, organization=org) as client:
-        console.print(f"[dim]Watching run:[/dim] {run_id}")
-        try:
-            final_run = client.runs.poll_until_complete(run_id, max_wait=float(max_wait))
-            print()
+        if len(run_ids) == 1 and not watch_all:
+            _watch_single(client, run_ids[0], max_wait)
+            return
 
-            plan = None
-            if final_run.plan_id:
-                with suppress(Exception):
-                    plan = client.runs.get_plan(final_run.plan_id)
+        if watch_all:
+            from terrapyne.models.run import RunStatus
 
-            render_run_detail(final_run, plan=plan)
+            runs_iter, _ = client.runs.list_for_organization(
+                org,
+                status=",".join(RunStatus.get_active_statuses()),
+                project_names=[project] if project else None,
+            )
+            run_ids = list(dict.fromkeys([*run_ids, *(run.id for run in runs_iter)]))
+            if not run_ids:
+                console.print("[green]✓ No active runs to watch.[/green]")
+                return
 
-            if not final_run.status.is_successful:
-                raise typer.Exit(1)
+        _watch_many(client, run_ids, max_wait, concurrency)
 
-        except TimeoutError as e:
-            console.print(f"\n[yellow]Warning:[/yellow] {e}")
-            raise typer.Exit(1) from None
+
+def _watch_single(client: Any, run_id: str, max_wait: int) -> None:
+    """Poll one run to completion and render its details."""
+    console.print(f"[dim]Watching run:[/dim] {run_id}")
+    try:
+        final_run = client.runs.poll_until_complete(run_id, max_wait=float(max_wait))
+        print()
+
+        plan = None
+        if final_run.plan_id:
+            with suppress(Exception):
+                plan = client.runs.get_plan(final_run.plan_id)
+
+        render_run_detail(final_run, plan=plan)
+
+        if not final_run.status.is_successful:
+            raise typer.Exit(1)
+
+    except TimeoutError as e:
+        console.print(f"\n[yellow]Warning:[/yellow] {e}")
+        raise typer.Exit(1) from None
+
+
+def _watch_many(client: Any, run_ids: list[str], max_wait: int, concurrency: int) -> None:
+    """Poll many runs from one loop, printing each status change as it happens."""
+    console.print(f"[dim]Watching {len(run_ids)} runs[/dim]")
+    finished: list[Run] = []
+    try:
+        for event in client.runs.poll_many(
+            run_ids, max_wait=float(max_wait), concurrency=concurrency
+        ):
+            run = event.run
+            previous = event.previous_status.value if event.previous_status else "…"
+            console.print(
+                f"{run.status.emoji} [cyan]{run.id}[/cyan] {previous} → {run.status.value}"
+            )
+            if event.is_terminal:
+                finished.append(run)
+    except TimeoutError as e:
+        console.print(f"\n[yellow]Warning:[/yellow] {e}")
+        raise typer.Exit(1) from None
+
+    failed = [run for run in finished if not run.status.is_successful]
+    console.print(
+        f"\n[bold]{len(finished) - len(failed)} succeeded, {len(failed)} did not succeed[/bold]"
+    )
+    if failed:
+        raise typer.Exit(1)
 
 
 @app.command("follow")
@@ -631,83 +779,37 @@ def run_follow(
     with get_client(ctx, organization=org) as client:
         console.print(f"\n[dim]Following run {run_id}...[/dim]\n")
 
-        last_plan_pos = 0
-        last_apply_pos = 0
+        stage_headers = {"plan": "[dim]📋 Plan:[/dim]", "apply": "\n[dim]⚙️  Apply:[/dim]"}
         current_stage = None
 
-        def stream_logs(run: Run) -> None:
-            nonlocal last_plan_pos, last_apply_pos, current_stage
-
-            # 1. Plan Stage
-            if run.plan_id:
-                if current_stage is None:
-                    current_stage = "plan"
-                    console.print("[dim]📋 Plan:[/dim]")
-                try:
-                    plan_log = client.runs.get_plan_logs(run.plan_id)
-                    last_plan_pos = _print_log_delta(plan_log, last_plan_pos)
-                except Exception:
-                    pass
-
-            # 2. Apply Stage
-            if run.apply_id and run.status.value in ["applying", "applied"]:
-                if current_stage != "apply":
-                    current_stage = "apply"
-                    console.print("\n[dim]⚙️  Apply:[/dim]")
-                try:
-                    apply_log = client.runs.get_apply_logs(run.apply_id)
-                    last_apply_pos = _print_log_delta(apply_log, last_apply_pos)
-                except Exception:
-                    pass
-
-            # Feedback if run fails before generating logs
-            if run.status.is_error and last_plan_pos == 0 and last_apply_pos == 0:
-                if current_stage != "error":
-                    current_stage = "error"
-                    console.print(
-                        f"\n[red]Run failed before generating logs: {run.status.value}[/red]"
-                    )
-
         try:
-            final_run = client.runs.poll_until_complete(
-                run_id, callback=stream_logs, max_wait=float(max_wait)
-            )
-
-            # Print final newline and status
-            print()
-            if final_run.status.is_successful:
-                console.print(f"[green]✓[/green] Run {run_id} completed successfully")
-            else:
-                console.print(
-                    f"[red]✗[/red] Run {run_id} failed with status: {final_run.status.value}"
-                )
-                raise typer.Exit(1)
-
+            stream = client.runs.stream_logs(run_id, max_wait=float(max_wait))
+            for line in stream:
+                if line.stage != current_stage:
+                    current_stage = line.stage
+                    console.print(stage_headers[line.stage])
+                # Rich handles or strips ANSI escape codes depending on the terminal
+                console.print(line.text, markup=False)
         except TimeoutError as e:
             console.print(f"\n[yellow]Warning:[/yellow] {e}")
             raise typer.Exit(1) from None
 
+        final_run = stream.run
+        if final_run is None:
+            raise typer.Exit(1)
 
-def _print_log_delta(full_log: str, last_pos: int) -> int:
-    """Print new log content since last position.
-
-    Args:
-        full_log: Complete log content
-        last_pos: Last position read
-
-    Returns:
-        New position (length of full_log)
-    """
-    if len(full_log) < last_pos:
-        # Logs were truncated or rotated; reset position
-        last_pos = 0
+        # Feedback if run fails before generating logs
+        if final_run.status.is_error and current_stage is None:
+            console.print(
+                f"\n[red]Run failed before generating logs: {final_run.status.value}[/red]"
+            )
 
-    new_content = full_log[last_pos:]
-    if new_content:
-        # Use rich console to automatically handle or strip ANSI escape codes
-        # depending on terminal capabilities
-        console.print(new_content, end="", markup=False)
-    return len(full_log)
+        print()
+        if final_run.status.is_successful:
+            console.print(f"[green]✓[/green] Run {run_id} completed successfully")
+        else:
+            console.print(f"[red]✗[/red] Run {run_id} failed with status: {final_run.status.value}")
+            raise typer.Exit(1)
 
 
 @app.command("discard")
@@ -751,6 +853,13 @@ def run_parse_plan(
         Path | None, typer.Option("--output", "-o", help="Save parsed plan to file")
     ] = None,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show detailed output")] = False,
+    engine: Annotated[
+        str,
+        typer.Option(
+            "--engine",
+            help="Parser engine: state_machine, scanner (faster on very large plans)",
+        ),
+    ] = "state_machine",
 ):
     """Parse plain text terraform plan output.
 
@@ -769,21 +878,29 @@ def run_parse_plan(
 
         # Save to file
         terrapyne run parse-plan plan.txt --output parsed.json
+
+        # Parse a very large plan with the single-pass scanner
+        terrapyne run parse-plan plan.txt --engine scanner
     """
-    # Read plan from stdin or file
-    if plan_file is None or str(plan_file) == "-":
-        plan_text = sys.stdin.read()
-    elif not plan_file.exists():
+    if plan_file is not None and str(plan_file) != "-" and not plan_file.exists():
         console.print(f"[red]❌ Plan file not found:[/red] {plan_file}")
         raise typer.Exit(1)
-    else:
-        with open(plan_file) as f:
-            plan_text = f.read()
 
     # Parse it
-    from terrapyne.core.plan_parser import TerraformPlainTextPlanParser
-
-    result = TerraformPlainTextPlanParser(plan_text).parse()
+    from terrapyne.core.plan_parser import PlanStreamParser, TerraformPlainTextPlanParser
+
+    chunks = _read_plan_chunks(plan_file)
+    if engine == "state_machine":
+        # Parse while reading so the whole log is never held in memory
+        stream = PlanStreamParser()
+        resource_changes = []
+        for chunk in chunks:
+            resource_changes += stream.feed(chunk)
+        plan_ir = stream.finish()
+        plan_ir.resource_changes = resource_changes + plan_ir.resource_changes
+        result = plan_ir.to_plan_inspector_format()
+    else:
+        result = TerraformPlainTextPlanParser("".join(chunks), engine=engine).parse()
 
     # Format output
     if output_format == "json":
@@ -805,6 +922,15 @@ def run_parse_plan(
         console.print(output_text)
 
 
+def _read_plan_chunks(plan_file: Path | None) -> Iterator[str]:
+    """Read plan output in chunks from a file, or from stdin for None or "-"."""
+    if plan_file is None or str(plan_file) == "-":
+        yield from iter(lambda: sys.stdin.read(PLAN_READ_CHUNK_SIZE), "")
+        return
+    with open(plan_file) as f:
+        yield from iter(lambda: f.read(PLAN_READ_CHUNK_SIZE), "")
+
+
 def _format_plan_output_human(result: dict[str, Any], verbose: bool = False) -> str:
     """Format parsed plan for human-readable output."""
     lines = []
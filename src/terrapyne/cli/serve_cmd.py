@@ -0,0 +1,62 @@
+"""`tfc serve`: keep a warm client running for later `tfc` invocations."""
+
+from __future__ import annotations
+
+import typer
+
+from terrapyne.cli import daemon
+from terrapyne.cli.utils import PAGE_PREFETCH, console
+
+app = typer.Typer(help="Run a warm daemon that later tfc commands are forwarded to")
+
+
+@app.command("serve")
+def serve(
+    socket_path: str | None = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on (default: $TERRAPYNE_SOCKET or ~/.terrapyne/tfc.sock)",
+    ),
+    cache_ttl: int = typer.Option(
+        60, "--cache-ttl", help="Cache API responses for N seconds across commands (0 to disable)"
+    ),
+    state_store_mb: int = typer.Option(
+        0, "--state-store-mb", help="Keep downloaded state versions in a store of up to N MiB"
+    ),
+    idle_timeout: float = typer.Option(
+        0, "--idle-timeout", help="Exit after N seconds without a command (0 to never exit)"
+    ),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon instead"),
+) -> None:
+    """Serve tfc commands from one warm process over a Unix socket.
+
+    While it runs, tfc forwards every command to it (set TERRAPYNE_DAEMON=0 to
+    opt out), saving interpreter startup, credential loading and TLS handshakes.
+    """
+    from pathlib import Path
+
+    from terrapyne.api.client import TFCClient
+
+    path = Path(socket_path).expanduser() if socket_path else daemon.default_socket_path()
+    if stop:
+        if not daemon.stop(path):
+            console.print(f"[yellow]No daemon is listening on {path}[/yellow]")
+            raise typer.Exit(1)
+        console.print(f"Stopped the daemon on {path}")
+        return
+
+    client = TFCClient(
+        cache_ttl=cache_ttl, max_inflight=PAGE_PREFETCH, state_store_mb=state_store_mb
+    )
+    server = daemon.CommandServer(path, client, idle_timeout=idle_timeout)
+    console.print(f"Serving tfc commands on {path} (Ctrl-C or `tfc serve --stop` to exit)")
+    try:
+        server.serve_forever()
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+    console.print(f"Served {server.served} commands")
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import json
+import sys
 from datetime import UTC, datetime
 from typing import Any
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
-from terrapyne.cli.utils import console, get_client, validate_context
+from terrapyne.cli.utils import console, emit_json, get_client, validate_context
 from terrapyne.core.state_diff import (
     DEFAULT_FIELDS,
+    AttributeChange,
+    StateDiff,
+    diff_state_resources,
+    parse_state_resources,
+    resolve_field,
 )
 
 app = typer.Typer(help="State version commands")
@@ -57,6 +64,22 @@ def _require_download_url(ctx: typer.Context, sv: Any) -> str:
     return sv.download_url
 
 
+def _resolve_state_version(client: Any, target: str | None, ws_name: str | None, org: str) -> Any:
+    """Resolve a state version ID, or a workspace's current state version."""
+    if target and target.startswith("sv-"):
+        return client.state_versions.get(target)
+    # Resolve workspace from target arg, -w flag, or context
+    resolve_ws = target or ws_name
+    if not resolve_ws:
+        Console(stderr=True).print("[red]Error: Provide a workspace name or state version ID[/red]")
+        raise typer.Exit(1)
+    if resolve_ws.startswith("ws-"):
+        ws = client.workspaces.get_by_id(resolve_ws)
+    else:
+        ws = client.workspaces.get(resolve_ws, org)
+    return client.state_versions.get_current(ws.id)
+
+
 @app.command("list")
 def state_list(
     ctx: typer.Context,
@@ -112,21 +135,7 @@ def state_show(
     org, ws_name = validate_context(organization, workspace)
 
     with get_client(ctx, organization=org) as client:
-        if target and target.startswith("sv-"):
-            sv = client.state_versions.get(target)
-        else:
-            # Resolve workspace from target arg, -w flag, or context
-            resolve_ws = target or ws_name
-            if not resolve_ws:
-                Console(stderr=True).print(
-                    "[red]Error: Provide a workspace name or state version ID[/red]"
-                )
-                raise typer.Exit(1)
-            if resolve_ws.startswith("ws-"):
-                ws = client.workspaces.get_by_id(resolve_ws)
-            else:
-                ws = client.workspaces.get(resolve_ws, org)
-            sv = client.state_versions.get_current(ws.id)
+        sv = _resolve_state_version(client, target, ws_name, org)
 
     console.print(f"[bold]State Version:[/bold] {sv.id}")
     console.print(f"  Serial:     {sv.serial}")
@@ -150,7 +159,7 @@ def state_pull(
 
     with get_client(ctx, organization=org) as client:
         if state_version_id:
-            state = client.state_versions.download(state_version_id)
+            sv = client.state_versions.get(state_version_id)
         else:
             if not ws_name:
                 Console(stderr=True).print(
@@ -159,10 +168,207 @@ def state_pull(
                 raise typer.Exit(1)
             ws = client.workspaces.get(ws_name, org)
             sv = client.state_versions.get_current(ws.id)
-            state = client.state_versions.download_from_url(_require_download_url(ctx, sv))
 
-    # Raw JSON to stdout — not through rich, so it's pipeable
-    print(json.dumps(state, indent=2))
+        # Raw JSON to stdout — not through rich, so it's pipeable — streamed as it
+        # downloads rather than held in memory
+        download_url = _require_download_url(ctx, sv)
+        sys.stdout.flush()
+        client.state_versions.stream(sv.id, sys.stdout.buffer, download_url=download_url)
+        sys.stdout.buffer.flush()
+
+
+@app.command("resources")
+def state_resources(
+    ctx: typer.Context,
+    target: str | None = typer.Argument(
+        None, help="State version ID (sv-*), workspace name, or workspace ID (ws-*)"
+    ),
+    workspace: str | None = typer.Option(None, "-w", "--workspace"),
+    organization: str | None = typer.Option(None, "-o", "--organization"),
+    types: str | None = typer.Option(
+        None, "--type", "-t", help="Comma-separated resource types to include"
+    ),
+    mode: str = typer.Option("managed", "--mode", help="Resource mode: managed, data, all"),
+    module: str | None = typer.Option(
+        None, "--module", help="Only resources in modules whose address contains this"
+    ),
+    fields: str | None = typer.Option(
+        None, "--fields", help=f"Comma-separated fields (default: {','.join(DEFAULT_FIELDS)})"
+    ),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json"),
+) -> None:
+    """List resource instances in a state version (default: the workspace's latest).
+
+    The state is streamed and filtered as it is read, so large states are
+    never loaded into memory whole.
+    """
+    org, ws_name = validate_context(organization, workspace)
+    field_names = _parse_fields(fields)
+
+    with get_client(ctx, organization=org) as client:
+        sv = _resolve_state_version(client, target, ws_name, org)
+        rows = [
+            {f: resolve_field(instance, f) for f in field_names}
+            for instance in client.state_versions.iter_resources(
+                sv.id,
+                types=_parse_types(types),
+                mode=None if mode == "all" else mode,
+                module_pattern=module,
+            )
+        ]
+
+    if output_format == "json":
+        print(json.dumps(rows, indent=2))
+        return
+
+    table = Table(title=f"Resources in {sv.id}")
+    for f in field_names:
+        table.add_column(f)
+    for row in rows:
+        table.add_row(*(row[f] for f in field_names))
+    console.print(table)
+    console.print(f"[dim]{len(rows)} resource instances[/dim]")
+
+
+# Longest rendering of an attribute value in the human output of `state diff`
+DIFF_VALUE_WIDTH = 60
+
+# Lines of the human output of `state diff` printed at a time
+DIFF_PRINT_BATCH = 1000
+
+# State versions searched for the one before the version being diffed
+PREVIOUS_VERSION_SEARCH_LIMIT = 100
+
+
+def _previous_state_version(client: Any, workspace_id: str, sv: Any) -> Any:
+    """The latest state version of a workspace with a lower serial than ``sv``, or None."""
+    versions, _ = client.state_versions.list(workspace_id, limit=PREVIOUS_VERSION_SEARCH_LIMIT)
+    return next((v for v in versions if v.serial < sv.serial), None)
+
+
+def _diff_value(value: Any) -> str:
+    text = json.dumps(value)
+    if len(text) > DIFF_VALUE_WIDTH:
+        text = f"{text[: DIFF_VALUE_WIDTH - 1]}…"
+    return escape(text)
+
+
+def _diff_attribute_line(change: AttributeChange) -> str:
+    path = escape(change.path)
+    if change.action == "added":
+        return f"    [green]+ {path}[/green] = {_diff_value(change.after)}"
+    if change.action == "removed":
+        return f"    [red]- {path}[/red] = {_diff_value(change.before)}"
+    return (
+        f"    [yellow]~ {path}[/yellow]: {_diff_value(change.before)} → {_diff_value(change.after)}"
+    )
+
+
+def _print_state_diff(diff: StateDiff, old_sv: Any, new_sv: Any) -> None:
+    console.print(
+        f"[bold]State diff[/bold] {old_sv.id} (serial {old_sv.serial}) → "
+        f"{new_sv.id} (serial {new_sv.serial})\n"
+    )
+    lines = [f"[green]+ {escape(i.address)}[/green]" for i in diff.added]
+    lines.extend(f"[red]- {escape(i.address)}[/red]" for i in diff.removed)
+    for change in diff.changed:
+        lines.append(f"[yellow]~ {escape(change.address)}[/yellow]")
+        lines.extend(_diff_attribute_line(a) for a in change.attributes)
+    # Rich renders a batch of lines several times faster than one line per print
+    for start in range(0, len(lines), DIFF_PRINT_BATCH):
+        batch = lines[start : start + DIFF_PRINT_BATCH]
+        console.print("\n".join(batch), highlight=False, soft_wrap=True)
+
+    if not diff.has_changes:
+        console.print("No differences.")
+    console.print(
+        f"\n[dim]{len(diff.added)} added, {len(diff.removed)} removed, "
+        f"{len(diff.changed)} changed, {diff.unchanged} unchanged[/dim]"
+    )
+
+
+@app.command("diff")
+def state_diff(
+    ctx: typer.Context,
+    target: str | None = typer.Argument(None, help="Workspace name or workspace ID (ws-*)"),
+    *,
+    from_version: str | None = typer.Option(
+        None, "--from", help="State version ID (sv-*) to diff from (default: the one before --to)"
+    ),
+    to_version: str | None = typer.Option(
+        None, "--to", help="State version ID (sv-*) to diff to (default: the workspace's latest)"
+    ),
+    since: str | None = typer.Option(
+        None, "--since", help="Diff from the last state version created before this date"
+    ),
+    workspace: str | None = typer.Option(None, "-w", "--workspace"),
+    organization: str | None = typer.Option(None, "-o", "--organization"),
+    types: str | None = typer.Option(
+        None, "--type", "-t", help="Comma-separated resource types to include"
+    ),
+    mode: str = typer.Option("managed", "--mode", help="Resource mode: managed, data, all"),
+    module: str | None = typer.Option(
+        None, "--module", help="Only resources in modules whose address contains this"
+    ),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json"),
+) -> None:
+    """Show the resources and attributes that changed between two state versions.
+
+    Defaults to the workspace's latest state version against the one before
+    it. Instances are matched by address, and only those whose attributes
+    differ are compared attribute by attribute.
+    """
+    org, ws_name = validate_context(organization, workspace)
+    resolve_ws = target or ws_name
+    filters: dict[str, Any] = {
+        "types": _parse_types(types),
+        "mode": None if mode == "all" else mode,
+        "module_pattern": module,
+    }
+
+    with get_client(ctx, organization=org) as client:
+        ws: Any = None
+        if not (from_version and to_version):
+            if not resolve_ws:
+                Console(stderr=True).print(
+                    "[red]Error: Provide a workspace, or both --from and --to[/red]"
+                )
+                raise typer.Exit(1)
+            if resolve_ws.startswith("ws-"):
+                ws = client.workspaces.get_by_id(resolve_ws)
+            else:
+                ws = client.workspaces.get(resolve_ws, org)
+
+        if to_version:
+            new_sv = client.state_versions.get(to_version)
+        else:
+            new_sv = client.state_versions.get_current(ws.id)
+
+        old_sv: Any
+        if from_version:
+            old_sv = client.state_versions.get(from_version)
+        elif since:
+            old_sv = client.state_versions.find_version_before(ws.id, _parse_since(since))
+        else:
+            old_sv = _previous_state_version(client, ws.id, new_sv)
+        if old_sv is None:
+            Console(stderr=True).print(
+                f"[red]Error: No state version to diff {new_sv.id} against[/red]"
+            )
+            raise typer.Exit(1)
+
+        # The diff holds both snapshots' attributes in memory either way, so each
+        # state is decoded whole, which is faster than streaming it
+        diff = diff_state_resources(
+            parse_state_resources(client.state_versions.download(old_sv.id), **filters),
+            parse_state_resources(client.state_versions.download(new_sv.id), **filters),
+        )
+
+    if output_format == "json":
+        emit_json({"from": old_sv.id, "to": new_sv.id, **diff.to_dict()})
+        return
+
+    _print_state_diff(diff, old_sv, new_sv)
 
 
 @app.command("outputs")
@@ -19,15 +19,48 @@ if TYPE_CHECKING:
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+# Pages fetched concurrently by paginated listings (e.g. `tfc workspace list`)
+PAGE_PREFETCH = 8
+
+# Client kept warm by `tfc serve`, lent to every command it runs (see set_warm_client)
+_warm_client: TFCClient | None = None
+
+
+def set_warm_client(client: TFCClient | None) -> TFCClient | None:
+    """Make get_client lend ``client`` instead of creating a new client per command.
+
+    Returns:
+        The previous warm client
+    """
+    global _warm_client
+    previous, _warm_client = _warm_client, client
+    return previous
+
+
 def get_client(ctx: typer.Context | None, organization: str | None = None) -> TFCClient:
     """Get TFC client initialized with context options."""
     from terrapyne.api.client import TFCClient
 
     cache_ttl = 0
+    state_store_mb = 0
+    tracer = None
+    inventory_max_age = None
     if ctx and hasattr(ctx, "obj") and isinstance(ctx.obj, dict):
         cache_ttl = ctx.obj.get("cache_ttl", 0)
-
-    return TFCClient(organization=organization, cache_ttl=cache_ttl)
+        state_store_mb = ctx.obj.get("state_store_mb", 0)
+        tracer = ctx.obj.get("tracer")
+        inventory_max_age = ctx.obj.get("inventory_max_age")
+
+    if _warm_client is not None:
+        return _warm_client.borrow(organization, tracer=tracer, inventory_max_age=inventory_max_age)
+    return TFCClient(
+        organization=organization,
+        cache_ttl=cache_ttl,
+        max_inflight=PAGE_PREFETCH,
+        state_store_mb=state_store_mb,
+        tracer=tracer,
+        inventory_max_age=inventory_max_age,
+    )
 
 
 # Consolidated console instances for CLI output
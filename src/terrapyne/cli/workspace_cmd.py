@@ -4,6 +4,7 @@ from typing import Annotated, cast
 
 import typer
 
+from terrapyne.api.fieldsets import WORKSPACE_TABLE_FIELDS
 from terrapyne.cli.utils import (
     console,
     emit_json,
@@ -60,7 +61,11 @@ def workspace_list(
         # Use wildcard search if requested
         search_pattern = f"*{search}*" if search and wildcard else search
 
-        workspaces_iter, total_count = client.workspaces.list(org, search=search_pattern)
+        # A table shows a handful of attributes; JSON output dumps whole models
+        fields = WORKSPACE_TABLE_FIELDS if output_format == "table" else None
+        workspaces_iter, total_count = client.workspaces.list(
+            org, search=search_pattern, fields=fields
+        )
         workspaces = list(workspaces_iter)
 
         if output_format == "json":
@@ -142,7 +142,9 @@ class Terraform:
     def destroy(self, args: NullableList = None) -> tuple[str, str, int]:
         return self.exec(cmd=["destroy", *(args or [])])
 
-    def parse_plain_text_plan(self, plan_text: str) -> dict[str, Any]:
+    def parse_plain_text_plan(
+        self, plan_text: str, engine: str = "state_machine"
+    ) -> dict[str, Any]:
         """Parse plain text terraform plan output.
 
         Use when terraform plan -json is not available (e.g., TFC remote backend).
@@ -150,13 +152,14 @@ class Terraform:
 
         Args:
             plan_text: Plain text terraform plan output (may contain ANSI codes)
+            engine: Parser engine, "state_machine" or "scanner" (for very large plans)
 
         Returns:
             Dictionary with resource changes, plan summary, and diagnostics.
         """
         from terrapyne.core.plan_parser import TerraformPlainTextPlanParser
 
-        parser = TerraformPlainTextPlanParser(plan_text)
+        parser = TerraformPlainTextPlanParser(plan_text, engine=engine)
         return parser.parse()
 
     def fmt(self) -> tuple[str, str, int]:
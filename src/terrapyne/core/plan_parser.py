@@ -533,47 +533,12 @@ class InAttributesStateHandler(StateHandler):
         # Parse attributes using existing method
         attributes, attr_next_idx = self.parser._parse_attributes(lines, idx)
 
-        # Process attributes into before/after
-        actions = context.get("actions", [])
-        before_attrs = {}
-        after_attrs = {}
-
-        for key, value in attributes.items():
-            if isinstance(value, dict) and "before" in value and "after" in value:
-                # Attribute change
-                if value["before"] is not None:
-                    before_attrs[key] = value["before"]
-                if value["after"] is not None:
-                    after_attrs[key] = value["after"]
-            else:
-                # Simple attribute (no change)
-                if "create" not in actions and "import" not in actions:
-                    # For updates/deletes, existing attributes go in before
-                    before_attrs[key] = value
-                if "delete" not in actions:
-                    # For creates/updates, attributes go in after
-                    after_attrs[key] = value
-
-        # Build ResourceChange IR object
-        address = context.get("address")
-        resource_type = context.get("resource_type")
-        resource_name = context.get("resource_name")
-
-        # Ensure required fields are strings (mypy type safety)
-        if not address or not resource_type or not resource_name:
-            # If critical fields are missing, return None (shouldn't happen in practice)
-            return ParserState.DONE, attr_next_idx, None
-
-        change = Change(
-            actions=actions,
-            before=before_attrs
-            if before_attrs
-            else (None if "create" in actions or "import" in actions else {}),
-            after=after_attrs if after_attrs else (None if "delete" in actions else {}),
-        )
-
-        resource = ResourceChange(
-            address=str(address), type=str(resource_type), name=str(resource_name), change=change
+        resource = self.parser._build_resource_change(
+            context.get("address"),
+            context.get("resource_type"),
+            context.get("resource_name"),
+            context.get("actions", []),
+            attributes,
         )
 
         # Transition to DONE, then back to SEARCHING
@@ -635,6 +600,403 @@ class ParserStateMachine:
 
         return resources
 
+    def parse_resources_before(
+        self, lines: list[str], idx: int, limit: int
+    ) -> tuple[list[ResourceChange], int]:
+        """Parse the resources that start before ``limit``, resuming the search at ``idx``.
+
+        Used for incremental parsing, where lines from ``limit`` on may belong to a
+        resource block that is still being written. Resources are parsed exactly as
+        parse_resources would parse them.
+
+        Args:
+            lines: Lines buffered so far
+            idx: Index to resume searching from
+            limit: Index of the first resource start that must not be parsed yet
+
+        Returns:
+            Tuple of (ResourceChange IR objects, index to resume searching from)
+        """
+        resources: list[ResourceChange] = []
+        searching = self.handlers[ParserState.SEARCHING]
+
+        while idx < len(lines):
+            self.reset()
+            state, next_idx, _ = searching.handle(lines, idx, self.context)
+            if state == ParserState.DONE:
+                return resources, next_idx
+            if self.context["resource_start_idx"] >= limit:
+                return resources, self.context["resource_start_idx"]
+
+            idx = next_idx
+            while state not in (ParserState.SEARCHING, ParserState.DONE):
+                if idx >= len(lines):
+                    return resources, idx
+                state, idx, resource = self.handlers[state].handle(lines, idx, self.context)
+                if resource:
+                    resources.append(resource)
+
+        return resources, idx
+
+
+class PlanScanner:
+    """Single-pass scanner engine for plain text plans.
+
+    Produces the same PlanIR as the state machine engine, but splits the
+    (ANSI-stripped) text into lines once and walks them forward: leading JSON
+    messages, diagnostics, the start marker and the plan summary are found in
+    one scan, then resources are tokenized from the parseable section with
+    precompiled patterns and inline attribute dispatch. Lines are only matched
+    against a pattern when their first character could start that construct.
+    """
+
+    ATTRIBUTE_PATTERN = re.compile(r"^\s*([+\-~]?\s*)?([a-zA-Z_][a-zA-Z0-9_.%]*)\s*[:=]\s*(.+)$")
+    RESOURCE_DECLARATION_PATTERN = re.compile(r'(?:resource|data)\s+"([^"]+)"\s+"([^"]+)"')
+
+    # Cheap pre-check for "<symbol> ... resource|data ..." lines; it matches a superset
+    # of what ACTION_SYMBOL_PATTERN + _is_declaration accept, which then confirm
+    DECLARATION_PREFILTER = re.compile(r"(?:[+\-~]|<=)\S?\s+.*?(?:resource|data)", re.IGNORECASE)
+
+    # First characters that can start an action symbol line (+ - ~ <=)
+    SYMBOL_STARTS = frozenset("+-~<")
+
+    # RESOURCE_COMMENT_PATTERN split into its alternatives, each gated on a substring
+    # it requires, so most lines are rejected without running the lazy address match.
+    # Tried in the same order, so the first alternative to match still wins.
+    COMMENT_ALTERNATIVES: ClassVar[tuple[tuple[str, re.Pattern[str], str | None], ...]] = (
+        (
+            "is tainted, so must be replaced",
+            re.compile(r"^\s*#\s+(.+?)\s+is tainted, so must be replaced"),
+            "replaced",
+        ),
+        ("(tainted)", re.compile(r"^\s*#\s+(.+?)\s+\(tainted\)\s+must be replaced"), "replaced"),
+        ("must be replaced", re.compile(r"^\s*#\s+(.+?)\s+must be replaced"), "replaced"),
+        (
+            "will be ",
+            re.compile(
+                r"^\s*#\s+(.+?)\s+will be (created|destroyed|updated in-place|imported|replaced)"
+            ),
+            None,
+        ),
+    )
+
+    def __init__(self, parser_instance: Any) -> None:
+        """Initialize scanner with parser instance for access to patterns and helpers."""
+        self.parser = parser_instance
+        self._array_parser = ArrayAttributeParser()
+        self._map_parser = MapAttributeParser()
+        self._last_comment_line: str | None = None
+        self._last_comment: tuple[str, str] | None = None
+
+    def scan(self, lines: list[str]) -> PlanIR:
+        """Scan ANSI-stripped plan lines into a PlanIR.
+
+        Args:
+            lines: Plan text split into lines
+
+        Returns:
+            PlanIR object containing parsed plan data
+        """
+        parser = self.parser
+        n = len(lines)
+
+        # Skip JSON version messages from TFC (leading lines starting with { or [)
+        plain_start = 0
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if stripped and stripped[0] not in "{[":
+                plain_start = i
+                break
+
+        diagnostics: list[dict[str, Any]] = []
+        diagnostics_resume = plain_start
+        marker_line: int | None = None
+        summary_match: re.Match[str] | None = None
+        section_end: tuple[int, int] | None = None
+        operation_failed = False
+        no_changes = False
+
+        for i in range(plain_start, n):
+            line = lines[i]
+
+            if i >= diagnostics_resume and line.startswith(("╷", "┌")):
+                diagnostic, end_idx = parser._parse_error_box(lines, i)
+                if diagnostic:
+                    diagnostics.append(diagnostic)
+                    diagnostics_resume = end_idx
+
+            if "Plan:" in line:
+                match = parser.PLAN_SUMMARY_PATTERN.search(line)
+                if match:
+                    if summary_match is None:
+                        summary_match = match
+                    if marker_line is not None and section_end is None:
+                        section_end = (i, match.start())
+
+            if marker_line is None and parser.START_MARKER in line:
+                marker_line = i
+
+            if not operation_failed and parser.OPERATION_FAILED_PATTERN.search(line):
+                operation_failed = True
+
+            if not no_changes and ("No changes" in line or "Infrastructure is up-to-date" in line):
+                no_changes = True
+
+        resource_changes: list[ResourceChange] = []
+        if marker_line is not None:
+            if section_end is None:
+                section = lines[marker_line + 1 :]
+            else:
+                end_line, end_col = section_end
+                section = lines[marker_line + 1 : end_line]
+                if end_col:
+                    section.append(lines[end_line][:end_col])
+            resource_changes = self._scan_resources(section)
+
+        plan_summary = parser._summary_from_match(summary_match) if summary_match else None
+
+        return PlanIR(
+            resource_changes=resource_changes,
+            format_version="1.0",
+            plan_summary=plan_summary,
+            diagnostics=diagnostics,
+            plan_status=parser._plan_status(
+                operation_failed=operation_failed,
+                has_start_marker=marker_line is not None,
+                has_summary=summary_match is not None,
+                no_changes=no_changes,
+                has_resources=bool(resource_changes),
+                diagnostics=diagnostics,
+            ),
+        )
+
+    def _scan_resources(self, lines: list[str]) -> list[ResourceChange]:
+        """Tokenize resource blocks from the parseable section."""
+        parser = self.parser
+        symbol_pattern = parser.ACTION_SYMBOL_PATTERN
+        symbol_starts = self.SYMBOL_STARTS
+        resources: list[ResourceChange] = []
+        n = len(lines)
+        i = 0
+
+        while i < n:
+            stripped = lines[i].strip()
+            if not stripped:
+                i += 1
+                continue
+
+            head = stripped[0]
+            if head == "#":
+                comment = self._resource_comment(stripped)
+                if comment:
+                    address, action_text = comment
+                    actions = parser._action_text_to_actions(action_text)
+                    resource_type, resource_name = parser._extract_resource_type_name(address)
+
+                    # Skip the action symbol line that typically follows
+                    attr_start = i + 1
+                    if attr_start < n:
+                        next_line = lines[attr_start].strip()
+                        if next_line and next_line[0] in symbol_starts:
+                            symbol_match = symbol_pattern.match(next_line)
+                            if symbol_match and self._is_declaration(symbol_match.group(2)):
+                                attr_start = i + 2
+                    if attr_start >= n:
+                        break
+                    i = self._scan_resource(
+                        lines, attr_start, address, resource_type, resource_name, actions, resources
+                    )
+                    continue
+
+            elif head in symbol_starts:
+                symbol_match = symbol_pattern.match(stripped)
+                if symbol_match:
+                    rest = symbol_match.group(2).strip()
+                    actions = parser._symbol_to_actions(symbol_match.group(1))
+                    if self._is_declaration(rest):
+                        declaration = self.RESOURCE_DECLARATION_PATTERN.match(rest)
+                        if declaration:
+                            resource_type, resource_name = declaration.groups()
+                            if i + 1 >= n:
+                                break
+                            i = self._scan_resource(
+                                lines,
+                                i + 1,
+                                f"{resource_type}.{resource_name}",
+                                resource_type,
+                                resource_name,
+                                actions,
+                                resources,
+                            )
+                            continue
+                    else:
+                        words = rest.split()
+                        if words and "." in rest and "=" not in rest and ":" not in words[0]:
+                            # Short format: "~ aws_instance.web"
+                            address = words[0]
+                            resource_type, resource_name = parser._extract_resource_type_name(
+                                address
+                            )
+                            if i + 1 >= n:
+                                break
+                            i = self._scan_resource(
+                                lines,
+                                i + 1,
+                                address,
+                                resource_type,
+                                resource_name,
+                                actions,
+                                resources,
+                            )
+                            continue
+
+            i += 1
+
+        return resources
+
+    def _scan_resource(
+        self,
+        lines: list[str],
+        start: int,
+        address: str,
+        resource_type: str,
+        resource_name: str,
+        actions: list[str],
+        resources: list[ResourceChange],
+    ) -> int:
+        """Scan one resource's attributes, append its ResourceChange and return the next index."""
+        attributes, next_idx = self._scan_attributes(lines, start)
+        resource = self.parser._build_resource_change(
+            address, resource_type, resource_name, actions, attributes
+        )
+        if resource:
+            resources.append(resource)
+        return next_idx
+
+    def _scan_attributes(self, lines: list[str], start: int) -> tuple[dict[str, Any], int]:
+        """Scan attribute lines until the next resource or a dedent (see _parse_attributes)."""
+        symbol_pattern = self.parser.ACTION_SYMBOL_PATTERN
+        attribute_pattern = self.ATTRIBUTE_PATTERN
+        declaration_prefilter = self.DECLARATION_PREFILTER
+        symbol_starts = self.SYMBOL_STARTS
+        resource_comment = self._resource_comment
+        attribute_value = self._attribute_value
+        attributes: dict[str, Any] = {}
+        indent_level: int | None = None
+        n = len(lines)
+        i = start
+
+        while i < n:
+            line = lines[i]
+            lstripped = line.lstrip()
+            stripped = lstripped.rstrip()
+
+            if not stripped:
+                if i + 1 < n:
+                    next_stripped = lines[i + 1].strip()
+                    if next_stripped.startswith("#") and resource_comment(next_stripped):
+                        i += 1
+                        break
+                i += 1
+                continue
+
+            head = stripped[0]
+            if head == "#" and resource_comment(stripped):
+                break
+            if head in symbol_starts and declaration_prefilter.match(stripped):
+                symbol_match = symbol_pattern.match(stripped)
+                if symbol_match and self._is_declaration(symbol_match.group(2)):
+                    break
+
+            current_indent = len(line) - len(lstripped)
+            if indent_level is None:
+                indent_level = current_indent
+            if current_indent < indent_level - 2:
+                break
+
+            # Leading whitespace is irrelevant to the pattern; skipping it is cheaper
+            attr_match = attribute_pattern.match(lstripped)
+            if attr_match:
+                key, value_str = attr_match.group(2, 3)
+                value, next_idx = attribute_value(value_str.strip(), line, stripped, lines, i)
+                attributes[key] = value
+                if "." in key:
+                    base_key = key.split(".", 1)[0]
+                    if base_key not in attributes:
+                        attributes[base_key] = value
+                if next_idx > i:
+                    i = next_idx
+                    continue
+
+            i += 1
+
+        return attributes, i
+
+    def _attribute_value(
+        self, value_str: str, line: str, stripped: str, lines: list[str], idx: int
+    ) -> tuple[Any, int]:
+        """Parse one attribute value, with the same precedence as AttributeParserDispatcher."""
+        # Computed, sensitive, or known-after-apply values
+        if "<computed>" in line or "(sensitive value)" in line or "(known after apply)" in line:
+            for marker in ComputedAttributeParser.COMPUTED_MARKERS:
+                if marker in value_str:
+                    return self._value_or_change(marker), idx
+            return self._value_or_change(value_str), idx
+
+        # The dispatcher's value part (text after "=" then ":") always ends with the
+        # line's last character, so checking that is equivalent and avoids two splits
+        if stripped[-1] == "[":
+            return self._array_parser.parse("", value_str, lines, idx)
+        if stripped[-1] == "{":
+            map_text, next_idx = self._map_parser.parse("", value_str, lines, idx)
+            return self._value_or_change(map_text), next_idx
+        return self._value_or_change(value_str), idx
+
+    def _value_or_change(self, value_str: str) -> Any:
+        """Parse a value, or a ``{"before", "after"}`` pair for ``old -> new`` notation."""
+        if " -> " in value_str:
+            before_str, after_str = value_str.split(" -> ", 1)
+            return {"before": self._value(before_str), "after": self._value(after_str)}
+        return self._value(value_str)
+
+    def _value(self, value_str: str) -> Any:
+        """_parse_value with a fast path for plain quoted strings (the common case)."""
+        value_str = value_str.strip()
+        if (
+            len(value_str) >= 2
+            and value_str[0] == '"'
+            and value_str[-1] == '"'
+            and "\\" not in value_str
+            and " #" not in value_str
+            and " (" not in value_str
+        ):
+            return value_str[1:-1]
+        return self.parser._parse_value(value_str)
+
+    @staticmethod
+    def _is_declaration(rest: str) -> bool:
+        """Whether the text after an action symbol declares a resource or data source."""
+        lowered = rest.lower()
+        return "resource" in lowered or "data" in lowered
+
+    def _resource_comment(self, stripped: str) -> tuple[str, str] | None:
+        """Address and action text of a resource comment line, as RESOURCE_COMMENT_PATTERN.
+
+        Results are memoized for the line last looked up, since the attribute scan
+        peeks at the comment that the resource scan then consumes.
+        """
+        if stripped == self._last_comment_line:
+            return self._last_comment
+        result = None
+        for required, pattern, action_text in self.COMMENT_ALTERNATIVES:
+            if required in stripped:
+                match = pattern.match(stripped)
+                if match:
+                    result = (match.group(1), action_text or match.group(2) or "update")
+                    break
+        self._last_comment_line, self._last_comment = stripped, result
+        return result
+
 
 class TerraformPlainTextPlanParser:
     """
@@ -722,13 +1084,26 @@ class TerraformPlainTextPlanParser:
     # Operation failed pattern
     OPERATION_FAILED_PATTERN = re.compile(r"Operation failed:.*\(exit\s+(\d+)\)", re.IGNORECASE)
 
-    def __init__(self, plan_text: str):
+    # Resource parsing engines: the original state machine, and the single-pass
+    # scanner for very large plans (same output, linear time with small constants)
+    ENGINES: ClassVar[tuple[str, ...]] = ("state_machine", "scanner")
+
+    def __init__(self, plan_text: str, engine: str = "state_machine"):
         """Initialize parser with plain text plan output.
 
         Args:
             plan_text: Plain text terraform plan output (may contain ANSI codes)
+            engine: "state_machine" (default) or "scanner"
+
+        Raises:
+            ValueError: If engine is not one of ENGINES
         """
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown plan parser engine '{engine}'. Expected one of: {', '.join(self.ENGINES)}"
+            )
         self.plan_text = plan_text
+        self.engine = engine
         self._resource_changes: list[dict[str, Any]] | None = None
         self._plan_summary: dict[str, int] | None = None
         self._diagnostics: list[dict[str, Any]] | None = None
@@ -736,6 +1111,7 @@ class TerraformPlainTextPlanParser:
         self._attr_dispatcher = AttributeParserDispatcher(self._parse_value)
         # Initialize state machine for resource parsing
         self._state_machine = ParserStateMachine(self)
+        self._scanner = PlanScanner(self)
 
     @staticmethod
     def strip_ansi_codes(text: str) -> str:
@@ -796,28 +1172,17 @@ class TerraformPlainTextPlanParser:
         # Strip ANSI codes from entire plan text
         cleaned_text = self.strip_ansi_codes(self.plan_text)
 
+        if self.engine == "scanner":
+            lines = cleaned_text.splitlines()
+            if self._is_structured_json_lines(lines):
+                return self._structured_log_ir(self._parse_plan_summary_from_json_log(cleaned_text))
+            return self._scanner.scan(lines)
+
         # Detect TFC 1.12+ structured JSON log format early — every non-empty,
         # non-header line starts with '{'.  These logs have no plain-text plan
         # section so resource-level parsing is not possible.
         if self._is_structured_json_log(cleaned_text):
-            plan_summary = self._parse_plan_summary_from_json_log(cleaned_text)
-            diagnostic = {
-                "severity": "warning",
-                "summary": "Structured JSON log format detected",
-                "detail": (
-                    "This input is a TFC structured JSON log (Terraform 1.12+). "
-                    "Resource-level parsing is not available for this format — "
-                    "only the plan summary counts are extracted. "
-                    "Use terraform plan -json (outside TFC) for full resource details."
-                ),
-            }
-            return PlanIR(
-                resource_changes=[],
-                format_version="1.0",
-                plan_summary=plan_summary,
-                diagnostics=[diagnostic],
-                plan_status="structured_log",
-            )
+            return self._structured_log_ir(self._parse_plan_summary_from_json_log(cleaned_text))
 
         # Extract plain text portion (skip JSON version messages from TFC)
         plain_text = self._extract_plain_text(cleaned_text)
@@ -850,6 +1215,26 @@ class TerraformPlainTextPlanParser:
             plan_status=plan_status,
         )
 
+    def _structured_log_ir(self, plan_summary: dict[str, int] | None) -> PlanIR:
+        """Build the summary-only PlanIR for a TFC structured JSON log."""
+        diagnostic = {
+            "severity": "warning",
+            "summary": "Structured JSON log format detected",
+            "detail": (
+                "This input is a TFC structured JSON log (Terraform 1.12+). "
+                "Resource-level parsing is not available for this format — "
+                "only the plan summary counts are extracted. "
+                "Use terraform plan -json (outside TFC) for full resource details."
+            ),
+        }
+        return PlanIR(
+            resource_changes=[],
+            format_version="1.0",
+            plan_summary=plan_summary,
+            diagnostics=[diagnostic],
+            plan_status="structured_log",
+        )
+
     def _extract_plain_text(self, text: str) -> str:
         """Extract plain text portion from mixed content (JSON + plain text).
 
@@ -950,6 +1335,62 @@ class TerraformPlainTextPlanParser:
             return {"address": address, "action": action}
         return None
 
+    def _build_resource_change(
+        self,
+        address: str | None,
+        resource_type: str | None,
+        resource_name: str | None,
+        actions: list[str],
+        attributes: dict[str, Any],
+    ) -> ResourceChange | None:
+        """Split parsed attributes into before/after and build the ResourceChange.
+
+        Args:
+            address: Resource address
+            resource_type: Resource type
+            resource_name: Resource name
+            actions: Actions list (e.g. ["create"])
+            attributes: Attributes from _parse_attributes
+
+        Returns:
+            ResourceChange IR object, or None if address/type/name are missing
+        """
+        before_attrs = {}
+        after_attrs = {}
+
+        for key, value in attributes.items():
+            if isinstance(value, dict) and "before" in value and "after" in value:
+                # Attribute change
+                if value["before"] is not None:
+                    before_attrs[key] = value["before"]
+                if value["after"] is not None:
+                    after_attrs[key] = value["after"]
+            else:
+                # Simple attribute (no change)
+                if "create" not in actions and "import" not in actions:
+                    # For updates/deletes, existing attributes go in before
+                    before_attrs[key] = value
+                if "delete" not in actions:
+                    # For creates/updates, attributes go in after
+                    after_attrs[key] = value
+
+        # Ensure required fields are strings (mypy type safety)
+        if not address or not resource_type or not resource_name:
+            # If critical fields are missing, return None (shouldn't happen in practice)
+            return None
+
+        change = Change(
+            actions=actions,
+            before=before_attrs
+            if before_attrs
+            else (None if "create" in actions or "import" in actions else {}),
+            after=after_attrs if after_attrs else (None if "delete" in actions else {}),
+        )
+
+        return ResourceChange(
+            address=str(address), type=str(resource_type), name=str(resource_name), change=change
+        )
+
     def _parse_value(self, value_str: str) -> Any:
         """Parse a single value string into Python value.
 
@@ -1174,21 +1615,25 @@ class TerraformPlainTextPlanParser:
         """
         match = self.PLAN_SUMMARY_PATTERN.search(text)
         if match:
-            # Groups: (import_first, add, change, destroy, import_last)
-            import_count = 0
-            if match.group(1):  # Import at start
-                import_count = int(match.group(1))
-            elif match.group(5):  # Import at end
-                import_count = int(match.group(5))
-
-            return {
-                "add": int(match.group(2)),
-                "change": int(match.group(3)),
-                "destroy": int(match.group(4)),
-                "import": import_count,
-            }
+            return self._summary_from_match(match)
         return None
 
+    def _summary_from_match(self, match: re.Match[str]) -> dict[str, int]:
+        """Convert a PLAN_SUMMARY_PATTERN match into summary counts."""
+        # Groups: (import_first, add, change, destroy, import_last)
+        import_count = 0
+        if match.group(1):  # Import at start
+            import_count = int(match.group(1))
+        elif match.group(5):  # Import at end
+            import_count = int(match.group(5))
+
+        return {
+            "add": int(match.group(2)),
+            "change": int(match.group(3)),
+            "destroy": int(match.group(4)),
+            "import": import_count,
+        }
+
     def _parse_diagnostics(self, text: str) -> list[dict[str, Any]]:
         """Parse diagnostics (errors, warnings) from plan text.
 
@@ -1386,33 +1831,53 @@ class TerraformPlainTextPlanParser:
         Returns:
             Plan status: "success", "failed", or "incomplete"
         """
+        return self._plan_status(
+            operation_failed=bool(self.OPERATION_FAILED_PATTERN.search(text)),
+            has_start_marker=self.START_MARKER in text,
+            has_summary=bool(self.PLAN_SUMMARY_PATTERN.search(text)),
+            no_changes="No changes" in text or "Infrastructure is up-to-date" in text,
+            has_resources=bool(resource_changes),
+            diagnostics=diagnostics,
+        )
+
+    def _plan_status(
+        self,
+        *,
+        operation_failed: bool,
+        has_start_marker: bool,
+        has_summary: bool,
+        no_changes: bool,
+        has_resources: bool,
+        diagnostics: list[dict[str, Any]],
+    ) -> str:
+        """Decide the plan status from facts gathered about the plan text."""
         # Check for operation failed message
-        if self.OPERATION_FAILED_PATTERN.search(text):
+        if operation_failed:
             return "failed"
 
         # Check for errors in diagnostics
         error_diagnostics = [d for d in diagnostics if d.get("severity") == "error"]
         if error_diagnostics:
             # If we have errors but no parseable section, plan failed before completion
-            if self.START_MARKER not in text:
+            if not has_start_marker:
                 return "failed"
             # If we have errors but also have resources, plan is incomplete
-            if resource_changes:
+            if has_resources:
                 return "incomplete"
             return "failed"
 
         # Check for parseable section
-        if self.START_MARKER in text:
+        if has_start_marker:
             # Check for plan summary
-            if self.PLAN_SUMMARY_PATTERN.search(text):
+            if has_summary:
                 return "success"
             # Has parseable section but no summary - might be incomplete
-            if resource_changes:
+            if has_resources:
                 return "incomplete"
             return "success"
 
         # No parseable section and no errors - might be "no changes" or empty
-        if "No changes" in text or "Infrastructure is up-to-date" in text:
+        if no_changes:
             return "success"
 
         # Default to incomplete if we can't determine
@@ -1425,11 +1890,11 @@ class TerraformPlainTextPlanParser:
         with '@level', '@message', and 'type' keys.  Plain-text plan output
         always contains lines that do NOT start with '{'.
         """
-        import json
+        return self._is_structured_json_lines(text.splitlines())
 
-        non_empty = [l for l in text.splitlines() if l.strip()]
-        if not non_empty:
-            return False
+    def _is_structured_json_lines(self, lines: list[str]) -> bool:
+        """Line-based form of _is_structured_json_log."""
+        non_empty = (l for l in lines if l.strip())
         json_lines = 0
         for line in non_empty:
             stripped = line.strip()
@@ -1459,23 +1924,337 @@ class TerraformPlainTextPlanParser:
                 obj = json.loads(stripped)
             except (json.JSONDecodeError, ValueError):
                 continue
-            # Prefer the structured change_summary type
-            if obj.get("type") == "change_summary" and "changes" in obj:
-                ch = obj["changes"]
-                return {
-                    "add": ch.get("add", 0),
-                    "change": ch.get("change", 0),
-                    "destroy": ch.get("remove", 0),
-                    "import": ch.get("import", 0),
-                }
-            # Fallback: parse Plan: N to add... from @message
-            msg = obj.get("@message", "")
-            match = self.PLAN_SUMMARY_PATTERN.search(msg)
-            if match:
-                return {
-                    "add": int(match.group(2) or 0),
-                    "change": int(match.group(3) or 0),
-                    "destroy": int(match.group(4) or 0),
-                    "import": int(match.group(1) or match.group(5) or 0),
-                }
+            summary = self._json_log_summary(obj)
+            if summary:
+                return summary
+        return None
+
+    def _json_log_summary(self, obj: dict[str, Any]) -> dict[str, int] | None:
+        """Plan summary counts from one structured JSON log message, if it has them."""
+        # Prefer the structured change_summary type
+        if obj.get("type") == "change_summary" and "changes" in obj:
+            ch = obj["changes"]
+            return {
+                "add": ch.get("add", 0),
+                "change": ch.get("change", 0),
+                "destroy": ch.get("remove", 0),
+                "import": ch.get("import", 0),
+            }
+        # Fallback: parse Plan: N to add... from @message
+        msg = obj.get("@message", "")
+        match = self.PLAN_SUMMARY_PATTERN.search(msg)
+        if match:
+            return {
+                "add": int(match.group(2) or 0),
+                "change": int(match.group(3) or 0),
+                "destroy": int(match.group(4) or 0),
+                "import": int(match.group(1) or match.group(5) or 0),
+            }
         return None
+
+
+class PlanStreamParser:
+    """Incremental plain text plan parser for logs that arrive in chunks.
+
+    Feed the log as it is produced; each call returns the resources whose
+    blocks closed in that chunk. A block closes when the next resource header,
+    the plan summary or the end of input is reached, so only the block still
+    being written is buffered and memory is bounded by the largest single
+    resource block rather than the whole log. Resource blocks are parsed by
+    the same ParserStateMachine as TerraformPlainTextPlanParser, and the
+    combined output matches it however the log is split into chunks: a line
+    that looks like a resource header only closes the block before it when no
+    array, map, block or heredoc is open, so a header inside a multi-line
+    value (say, ``+ Resource = ...`` in a ``jsonencode`` policy) or a value
+    left open across a real header keeps the whole block buffered.
+
+    Example:
+        stream = PlanStreamParser()
+        for chunk in chunks:
+            for resource in stream.feed(chunk):
+                print(resource.address)
+        plan = stream.finish()
+        print(plan.plan_summary, plan.plan_status)
+    """
+
+    # Characters str.splitlines() treats as line boundaries
+    LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+    # Quoted strings, whose brackets do not open or close anything
+    QUOTED_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+    # A heredoc opening at the end of a line, capturing its terminator
+    HEREDOC_PATTERN = re.compile(r"<<-?([A-Za-z_][A-Za-z0-9_]*)$")
+
+    def __init__(self) -> None:
+        """Initialize an empty stream."""
+        self._parser = TerraformPlainTextPlanParser("")
+        self._machine = ParserStateMachine(self._parser)
+        self._pending = ""
+        self._has_text = False
+        self._finished = False
+        # Leading JSON/blank lines, held until the first plain text line (then None)
+        self._leading: list[str] | None = []
+        self._maybe_structured = True
+        self._json_messages = 0
+        self._json_summary: dict[str, int] | None = None
+        # Facts gathered from the plain text
+        self._marker_seen = False
+        self._in_section = False
+        self._summary: dict[str, int] | None = None
+        self._operation_failed = False
+        self._no_changes = False
+        self._diagnostics: list[dict[str, Any]] = []
+        self._error_box: list[str] | None = None
+        self._has_resources = False
+        # Unparsed lines of the resource section, where to resume searching in
+        # them, and the last line that closes the block before it
+        self._section: list[str] = []
+        self._resume = 0
+        self._boundary: int | None = None
+        self._after_comment = False
+        # Brackets open at the end of the buffered section, and the terminator
+        # of the heredoc it ends inside (if any)
+        self._depth = 0
+        self._heredoc: str | None = None
+
+    def feed(self, chunk: str) -> list[ResourceChange]:
+        """Consume the next chunk of plan output.
+
+        Args:
+            chunk: Any slice of the log; lines may be split across chunks
+
+        Returns:
+            ResourceChange IR objects for the resource blocks this chunk closed
+
+        Raises:
+            ValueError: If called after finish()
+        """
+        if self._finished:
+            raise ValueError("Cannot feed a PlanStreamParser after finish()")
+        if not chunk:
+            return []
+        if not self._has_text and not chunk.isspace():
+            self._has_text = True
+
+        text = self._pending + chunk
+        lines = text.splitlines()
+        if text[-1] == "\r":
+            # May be the first half of a \r\n split across chunks
+            self._pending = lines.pop() + "\r"
+        elif text[-1] in self.LINE_BREAKS:
+            self._pending = ""
+        else:
+            self._pending = lines.pop()
+
+        resources: list[ResourceChange] = []
+        for line in lines:
+            resources += self._line(line)
+        if self._in_section:
+            resources += self._parse_section(final=False)
+        return resources
+
+    def finish(self) -> PlanIR:
+        """Mark the end of input and return everything not yet reported.
+
+        Returns:
+            PlanIR with the plan summary, diagnostics and status; its
+            resource_changes holds only the blocks closed at end of input
+            (those already returned by feed() are not repeated)
+
+        Raises:
+            ValueError: If called twice
+        """
+        if self._finished:
+            raise ValueError("PlanStreamParser.finish() was already called")
+        self._finished = True
+
+        resources: list[ResourceChange] = []
+        if self._pending:
+            resources += self._line(self._pending.removesuffix("\r"))
+            self._pending = ""
+
+        if not self._has_text:
+            return PlanIR()
+
+        if self._leading is not None:
+            # No plain text line: either a structured JSON log, or text to parse as is
+            if self._maybe_structured and self._json_messages:
+                return self._parser._structured_log_ir(self._json_summary)
+            leading, self._leading = self._leading, None
+            for line in leading:
+                resources += self._plain_line(line)
+
+        while self._error_box is not None:
+            self._close_error_box()
+        if self._in_section:
+            resources += self._parse_section(final=True)
+            self._in_section = False
+
+        return PlanIR(
+            resource_changes=resources,
+            format_version="1.0",
+            plan_summary=self._summary,
+            diagnostics=self._diagnostics,
+            plan_status=self._parser._plan_status(
+                operation_failed=self._operation_failed,
+                has_start_marker=self._marker_seen,
+                has_summary=self._summary is not None,
+                no_changes=self._no_changes,
+                has_resources=self._has_resources,
+                diagnostics=self._diagnostics,
+            ),
+        )
+
+    def _line(self, line: str) -> list[ResourceChange]:
+        """Route one complete line of the raw log."""
+        line = self._parser.strip_ansi_codes(line)
+        if self._maybe_structured:
+            self._observe_json(line)
+        if self._leading is not None:
+            # Skip JSON version messages from TFC (leading lines starting with { or [)
+            stripped = line.strip()
+            if not stripped or stripped[0] in "{[":
+                self._leading.append(line)
+                return []
+            self._leading = None
+        return self._plain_line(line)
+
+    def _observe_json(self, line: str) -> None:
+        """Track whether the log so far is a TFC structured JSON log."""
+        stripped = line.strip()
+        if not stripped:
+            return
+        if not stripped.startswith("{"):
+            self._maybe_structured = False
+            return
+        try:
+            obj = json.loads(stripped)
+        except (json.JSONDecodeError, ValueError):
+            self._maybe_structured = False
+            return
+        if "@level" in obj or "@message" in obj or "type" in obj:
+            self._json_messages += 1
+        if self._json_summary is None:
+            self._json_summary = self._parser._json_log_summary(obj)
+
+    def _plain_line(self, line: str) -> list[ResourceChange]:
+        """Gather plan facts from one line of plain text output."""
+        parser = self._parser
+        resources: list[ResourceChange] = []
+
+        self._diagnostic_line(line)
+
+        match = parser.PLAN_SUMMARY_PATTERN.search(line) if "Plan:" in line else None
+        if match and self._summary is None:
+            self._summary = parser._summary_from_match(match)
+
+        if self._in_section:
+            if match:
+                # The first summary after the start marker ends the resource section
+                if match.start():
+                    self._append(line[: match.start()])
+                resources = self._parse_section(final=True)
+                self._in_section = False
+            else:
+                self._append(line)
+        elif not self._marker_seen and parser.START_MARKER in line:
+            self._marker_seen = self._in_section = True
+
+        if not self._operation_failed and parser.OPERATION_FAILED_PATTERN.search(line):
+            self._operation_failed = True
+        if not self._no_changes and (
+            "No changes" in line or "Infrastructure is up-to-date" in line
+        ):
+            self._no_changes = True
+
+        return resources
+
+    def _diagnostic_line(self, line: str) -> None:
+        """Collect error box lines, parsing each box once it is closed."""
+        if self._error_box is not None:
+            self._error_box.append(line)
+            if line.startswith(("╵", "└")):
+                self._close_error_box()
+        elif line.startswith(("╷", "┌")):
+            self._error_box = [line]
+
+    def _close_error_box(self) -> None:
+        box = self._error_box or []
+        self._error_box = None
+        diagnostic, _ = self._parser._parse_error_box(box, 0)
+        if diagnostic:
+            self._diagnostics.append(diagnostic)
+        else:
+            # Not an error box after all; look for one starting inside it
+            for line in box[1:]:
+                self._diagnostic_line(line)
+
+    def _append(self, line: str) -> None:
+        """Buffer a resource section line, noting lines that close the block before them."""
+        parser = self._parser
+        idx = len(self._section)
+        self._section.append(line)
+
+        stripped = line.strip()
+        if self._heredoc is not None:
+            if stripped == self._heredoc:
+                self._heredoc = None
+            return
+        after_comment, self._after_comment = self._after_comment, False
+        if not stripped:
+            return
+        at_top_level = self._depth == 0
+        self._track_nesting(stripped)
+        if stripped[0] == "#":
+            if at_top_level and parser.RESOURCE_COMMENT_PATTERN.match(stripped):
+                self._boundary = idx
+                self._after_comment = True
+            return
+        symbol_match = parser.ACTION_SYMBOL_PATTERN.match(stripped)
+        if symbol_match and at_top_level:
+            rest = symbol_match.group(2).lower()
+            # A declaration right after its comment belongs to that comment's header
+            if ("resource" in rest or "data" in rest) and not after_comment:
+                self._boundary = idx
+
+    def _track_nesting(self, stripped: str) -> None:
+        """Update the open bracket count and heredoc state past one non-blank line."""
+        unquoted = self.QUOTED_PATTERN.sub("", stripped) if '"' in stripped else stripped
+        opened = unquoted.count("[") + unquoted.count("{") + unquoted.count("(")
+        closed = unquoted.count("]") + unquoted.count("}") + unquoted.count(")")
+        self._depth = max(self._depth + opened - closed, 0)
+        if "<<" in unquoted:
+            heredoc = self.HEREDOC_PATTERN.search(unquoted)
+            if heredoc:
+                self._heredoc = heredoc.group(1)
+
+    def _parse_section(self, *, final: bool) -> list[ResourceChange]:
+        """Parse the buffered resource blocks that can no longer grow."""
+        if final:
+            limit = len(self._section) + 1
+        else:
+            limit = self._boundary if self._boundary is not None else 0
+
+        resources, self._resume = self._machine.parse_resources_before(
+            self._section, self._resume, limit
+        )
+        if resources:
+            self._has_resources = True
+
+        if final:
+            self._section = []
+            self._resume = 0
+            self._boundary = None
+            self._after_comment = False
+            self._depth = 0
+            self._heredoc = None
+        elif self._resume:
+            # Drop parsed lines so only the open block stays buffered
+            del self._section[: self._resume]
+            if self._boundary is not None:
+                self._boundary -= self._resume
+                if self._boundary < 0:
+                    self._boundary = None
+            self._resume = 0
+        return resources
@@ -5,11 +5,13 @@ from __future__ import annotations
 import difflib
 import json
 import os
+import re
 import shlex
 import subprocess
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TextIO
 
 
 @dataclass
@@ -44,10 +46,36 @@ class StateResourceInstance:
         return obj
 
 
+def _resource_selected(
+    resource: dict[str, Any],
+    types: set[str] | None,
+    mode: str | None,
+    module_pattern: str | None,
+) -> bool:
+    """Whether a state resource passes the type/mode/module filters."""
+    if mode and resource.get("mode") != mode:
+        return False
+    if types and resource.get("type", "") not in types:
+        return False
+    rmodule = resource.get("module")
+    return not (module_pattern and (not rmodule or module_pattern not in rmodule))
+
+
+def _instance(resource: dict[str, Any], inst: dict[str, Any]) -> StateResourceInstance:
+    """Build a StateResourceInstance from a state resource and one of its instances."""
+    return StateResourceInstance(
+        resource_type=resource.get("type", ""),
+        resource_name=resource.get("name", ""),
+        module=resource.get("module"),
+        index_key=inst.get("index_key"),
+        attributes=inst.get("attributes", {}),
+    )
+
+
 def parse_state_resources(
     state_json: dict[str, Any],
     types: set[str] | None = None,
-    mode: str = "managed",
+    mode: str | None = "managed",
     module_pattern: str | None = None,
 ) -> list[StateResourceInstance]:
     """Extract resource instances from a terraform state JSON.
@@ -63,27 +91,222 @@ def parse_state_resources(
     """
     instances = []
     for resource in state_json.get("resources", []):
-        if mode and resource.get("mode") != mode:
+        if not _resource_selected(resource, types, mode, module_pattern):
             continue
-        rtype = resource.get("type", "")
-        if types and rtype not in types:
+        for inst in resource.get("instances", []):
+            instances.append(_instance(resource, inst))
+    return instances
+
+
+# Characters read from a state file at a time by iter_state_resources
+STATE_READ_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamReader:
+    """Pull parser walking a JSON document read from a text file in chunks.
+
+    Containers are entered one token at a time, while leaf values (and values
+    being skipped) are decoded whole with ``json.JSONDecoder.raw_decode``, so
+    memory is bounded by the largest single value decoded, not the document.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = STATE_READ_CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read_more(self, size: int) -> bool:
+        if self.eof:
+            return False
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer only holds what is still unparsed
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        if self.pos < len(self.buf) and self.buf[self.pos] not in " \t\n\r":
+            return self.buf[self.pos]
+        while True:
+            match = _WHITESPACE.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._read_more(self.chunk_size):
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise ValueError(f"Invalid state JSON: expected one of {chars!r}, found {found}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value continues past the buffer; read ever larger chunks until it fits
+                if not self._read_more(size):
+                    raise
+                size *= 2
+                continue
+            if end == len(self.buf) and self._read_more(size):
+                continue  # A number may continue in the next chunk
+            self.pos = end
+            return value
+
+    def keys(self) -> Iterator[str]:
+        """Enter an object and yield its keys; the caller consumes each value."""
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid state JSON: object key is not a string")
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def elements(self) -> Iterator[None]:
+        """Enter an array and yield once per element; the caller consumes each one."""
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if self._expect(",]") == "]":
+                return
+
+
+def iter_state_resources(
+    source: str | os.PathLike[str] | TextIO,
+    types: set[str] | None = None,
+    mode: str | None = "managed",
+    module_pattern: str | None = None,
+) -> Iterator[StateResourceInstance]:
+    """Stream resource instances out of a terraform state file.
+
+    The incremental form of parse_state_resources (same filters, same order):
+    the state is read in chunks and at most one resource's instances are
+    decoded at a time, so memory stays bounded however large the state is.
+    Instances of filtered out resources are skipped without being kept.
+
+    Instances of a module resource are streamed one at a time when its other
+    keys precede ``instances``, as terraform writes them (module, mode, type,
+    name, provider, instances). A root module resource has no ``module`` key,
+    so one could still follow its instances: those are buffered until the
+    resource object ends, as is a resource serialized in any other order.
+
+    Args:
+        source: Path of a state file, or a text file object
+        types: Filter to these resource types (None = all)
+        mode: Filter by mode ('managed', 'data', or None for all)
+        module_pattern: Filter to resources in modules matching this substring
+
+    Yields:
+        StateResourceInstance for each matching instance
+
+    Raises:
+        ValueError: If the state is not valid JSON
+    """
+    if isinstance(source, str | os.PathLike):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_state_resources(f, types, mode, module_pattern)
+        return
+
+    reader = _JSONStreamReader(source)
+    for key in reader.keys():
+        if key != "resources" or reader.peek() != "[":
+            reader.value()
             continue
-        rmodule = resource.get("module")
-        if module_pattern and (not rmodule or module_pattern not in rmodule):
+        for _ in reader.elements():
+            if reader.peek() != "{":
+                reader.value()
+                continue
+            yield from _stream_resource(reader, types, mode, module_pattern)
+
+
+def read_state_lineage(source: TextIO) -> tuple[str | None, int | None]:
+    """Read a state file's ``lineage`` and ``serial`` without parsing the rest.
+
+    Terraform writes both before ``outputs`` and ``resources``, so only the
+    head of the file is read. Keys after ``resources`` are not searched.
+
+    Returns:
+        Tuple of (lineage, serial); either is None if not found
+
+    Raises:
+        ValueError: If the head of the state is not valid JSON
+    """
+    lineage: str | None = None
+    serial: int | None = None
+    reader = _JSONStreamReader(source, chunk_size=8192)
+    for key in reader.keys():
+        if key == "resources":
+            break
+        value = reader.value()
+        if key == "lineage" and isinstance(value, str):
+            lineage = value
+        elif key == "serial" and isinstance(value, int):
+            serial = value
+        if lineage is not None and serial is not None:
+            break
+    return lineage, serial
+
+
+def _stream_resource(
+    reader: _JSONStreamReader,
+    types: set[str] | None,
+    mode: str | None,
+    module_pattern: str | None,
+) -> Iterator[StateResourceInstance]:
+    """Yield the selected instances of the resource object the reader is at."""
+    resource: dict[str, Any] = {}
+    buffered: list[dict[str, Any]] = []
+    for key in reader.keys():
+        if key != "instances":
+            resource[key] = reader.value()
             continue
+        identified = all(k in resource for k in ("mode", "type", "name"))
+        if reader.peek() != "[":
+            buffered = reader.value() or []
+        elif identified and not _resource_selected(resource, types, mode, None):
+            # Filtered out by type or mode, whatever module may follow
+            for _ in reader.elements():
+                reader.value()
+        elif identified and "module" in resource:
+            selected = _resource_selected(resource, types, mode, module_pattern)
+            for _ in reader.elements():
+                inst = reader.value()
+                if selected:
+                    yield _instance(resource, inst)
+        else:
+            # A module key may still follow and change the address and module filter
+            buffered = reader.value() or []
 
-        rname = resource.get("name", "")
-        for inst in resource.get("instances", []):
-            instances.append(
-                StateResourceInstance(
-                    resource_type=rtype,
-                    resource_name=rname,
-                    module=rmodule,
-                    index_key=inst.get("index_key"),
-                    attributes=inst.get("attributes", {}),
-                )
-            )
-    return instances
+    if buffered and _resource_selected(resource, types, mode, module_pattern):
+        for inst in buffered:
+            yield _instance(resource, inst)
 
 
 DEFAULT_FIELDS = ["type", "name", "id", "arn", "region"]
@@ -130,37 +353,163 @@ def extract_rows(
     return [{f: resolve_field(inst, f) for f in fields} for inst in instances]
 
 
+@dataclass
+class AttributeChange:
+    """One attribute that differs between two instances at the same address.
+
+    ``path`` addresses the attribute like ``tags.Name`` or ``ingress[0].cidr_blocks[1]``
+    (keys that are not identifiers are quoted: ``tags["kubernetes.io/role"]``).
+    ``action`` is "added", "removed" or "changed"; ``before`` is None when the
+    attribute was added and ``after`` is None when it was removed.
+    """
+
+    path: str
+    action: str
+    before: Any = None
+    after: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "path": self.path,
+            "action": self.action,
+            "before": self.before,
+            "after": self.after,
+        }
+
+
+@dataclass
+class InstanceChange:
+    """A resource instance in both snapshots whose attributes differ."""
+
+    before: StateResourceInstance
+    after: StateResourceInstance
+    attributes: list[AttributeChange] = field(default_factory=list)
+
+    @property
+    def address(self) -> str:
+        return self.after.address
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "address": self.address,
+            "type": self.after.resource_type,
+            "attributes": [a.to_dict() for a in self.attributes],
+        }
+
+
 @dataclass
 class StateDiff:
     """Result of diffing two state snapshots."""
 
     added: list[StateResourceInstance] = field(default_factory=list)
     removed: list[StateResourceInstance] = field(default_factory=list)
+    changed: list[InstanceChange] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary format (the JSON output of `tfc state diff`)."""
+        return {
+            "summary": {
+                "added": len(self.added),
+                "removed": len(self.removed),
+                "changed": len(self.changed),
+                "unchanged": self.unchanged,
+            },
+            "added": [{"address": i.address, "type": i.resource_type} for i in self.added],
+            "removed": [{"address": i.address, "type": i.resource_type} for i in self.removed],
+            "changed": [c.to_dict() for c in self.changed],
+        }
+
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+
+
+def _attribute_path(parent: str, key: str | int) -> str:
+    """Extend an attribute path by a map key or list index."""
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    if not _IDENTIFIER.fullmatch(key):
+        return f"{parent}[{json.dumps(key)}]"
+    return f"{parent}.{key}" if parent else key
+
+
+def _attribute_changes(before: Any, after: Any, path: str, changes: list[AttributeChange]) -> None:
+    """Append the leaf-level differences between two unequal attribute values.
+
+    Maps are compared key by key, in the order of their keys, and lists
+    position by position (elements past the end of the shorter list are added
+    or removed); anything else that differs, including a change of type, is
+    one changed attribute. Paths are only built for values that differ.
+    """
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key, value in before.items():
+            if key not in after:
+                changes.append(AttributeChange(_attribute_path(path, key), "removed", before=value))
+            elif value != after[key]:
+                _attribute_changes(value, after[key], _attribute_path(path, key), changes)
+        for key, value in after.items():
+            if key not in before:
+                changes.append(AttributeChange(_attribute_path(path, key), "added", after=value))
+    elif isinstance(before, list) and isinstance(after, list):
+        for index, value in enumerate(before):
+            if index >= len(after):
+                changes.append(AttributeChange(f"{path}[{index}]", "removed", before=value))
+            elif value != after[index]:
+                _attribute_changes(value, after[index], f"{path}[{index}]", changes)
+        for index in range(len(before), len(after)):
+            changes.append(AttributeChange(f"{path}[{index}]", "added", after=after[index]))
+    else:
+        changes.append(AttributeChange(path, "changed", before, after))
 
 
 def diff_state_resources(
-    old_instances: list[StateResourceInstance],
-    new_instances: list[StateResourceInstance],
+    old_instances: Iterable[StateResourceInstance],
+    new_instances: Iterable[StateResourceInstance],
 ) -> StateDiff:
-    """Compute resource delta between two state snapshots.
+    """Compute the resource and attribute delta between two state snapshots.
 
-    Uses resource address as the identity key.
+    Instances are keyed by resource address. An instance at an address in
+    both snapshots is unchanged when its attributes compare equal, which
+    dict equality settles without walking them; only instances that differ
+    are walked to find which attributes changed. The old snapshot is held in
+    memory, the new one is consumed as it is iterated, so either side can be
+    streamed from iter_state_resources.
+
+    Args:
+        old_instances: Instances of the earlier snapshot
+        new_instances: Instances of the later snapshot
+
+    Returns:
+        StateDiff with added, removed and changed instances sorted by address
     """
     old_by_addr = {i.address: i for i in old_instances}
-    new_by_addr = {i.address: i for i in new_instances}
-
-    old_addrs = set(old_by_addr.keys())
-    new_addrs = set(new_by_addr.keys())
+    added: list[tuple[str, StateResourceInstance]] = []
+    changed: list[tuple[str, InstanceChange]] = []
+    unchanged = 0
+
+    for new in new_instances:
+        address = new.address
+        old = old_by_addr.pop(address, None)
+        if old is None:
+            added.append((address, new))
+        elif old.attributes == new.attributes:
+            unchanged += 1
+        else:
+            change = InstanceChange(old, new)
+            _attribute_changes(old.attributes, new.attributes, "", change.attributes)
+            changed.append((address, change))
 
     return StateDiff(
-        added=sorted(
-            [new_by_addr[a] for a in new_addrs - old_addrs],
-            key=lambda i: i.address,
-        ),
-        removed=sorted(
-            [old_by_addr[a] for a in old_addrs - new_addrs],
-            key=lambda i: i.address,
-        ),
+        added=[i for _, i in sorted(added, key=lambda pair: pair[0])],
+        removed=[old_by_addr[a] for a in sorted(old_by_addr)],
+        changed=[c for _, c in sorted(changed, key=lambda pair: pair[0])],
+        unchanged=unchanged,
     )
 
 
@@ -170,7 +519,11 @@ def format_diff_unified(
     fields: list[str],
     diff_cmd: str | None = None,
 ) -> str:
-    """Produce a unified diff of two state snapshots.
+    """Produce a unified text diff of selected fields of two state snapshots.
+
+    Both snapshots are rendered to JSON text and compared line by line, which
+    suits a handful of fields on small states; diff_state_resources compares
+    large states structurally.
 
     If diff_cmd is provided, writes temp files and shells out to that program.
     Otherwise uses difflib with ANSI colouring when stdout is a TTY.
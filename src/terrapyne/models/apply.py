@@ -21,11 +21,13 @@ class Apply(BaseModel):
     def from_api_response(cls, data: dict[str, Any]) -> "Apply":
         """Create apply from TFC API response."""
         attrs = data.get("attributes", {})
-        return cls.model_construct(
-            id=data["id"],
-            status=attrs.get("status", "unknown"),
-            log_read_url=attrs.get("log-read-url"),
-            resource_additions=attrs.get("resource-additions"),
-            resource_changes=attrs.get("resource-changes"),
-            resource_destructions=attrs.get("resource-destructions"),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "status": attrs.get("status") or "unknown",
+                "log_read_url": attrs.get("log-read-url"),
+                "resource_additions": attrs.get("resource-additions"),
+                "resource_changes": attrs.get("resource-changes"),
+                "resource_destructions": attrs.get("resource-destructions"),
+            }
         )
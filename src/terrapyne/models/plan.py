@@ -32,14 +32,16 @@ class Plan(BaseModel):
         """
         attrs = data.get("attributes", {})
 
-        return cls.model_construct(
-            id=data["id"],
-            status=attrs.get("status", "unknown"),
-            log_read_url=attrs.get("log-read-url"),
-            has_changes=attrs.get("has-changes", False),
-            resource_additions=attrs.get("resource-additions", 0),
-            resource_changes=attrs.get("resource-changes", 0),
-            resource_destructions=attrs.get("resource-destructions", 0),
-            resource_imports=attrs.get("resource-imports", 0),
-            action_invocations=attrs.get("action-invocations", 0),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "status": attrs.get("status") or "unknown",
+                "log_read_url": attrs.get("log-read-url"),
+                "has_changes": attrs.get("has-changes") or False,
+                "resource_additions": attrs.get("resource-additions") or 0,
+                "resource_changes": attrs.get("resource-changes") or 0,
+                "resource_destructions": attrs.get("resource-destructions") or 0,
+                "resource_imports": attrs.get("resource-imports") or 0,
+                "action_invocations": attrs.get("action-invocations") or 0,
+            }
         )
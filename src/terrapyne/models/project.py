@@ -18,6 +18,8 @@ class Project(BaseModel):
     description: str | None = None
     created_at: datetime | None = Field(None, alias="created-at")
     resource_count: int = Field(0, alias="resource-count")
+    # Only present on TFC/TFE versions that report it in the project payload
+    workspace_count: int | None = Field(None, alias="workspace-count")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -33,10 +35,13 @@ class Project(BaseModel):
         """
         attrs = data.get("attributes", {})
 
-        return cls.model_construct(
-            id=data["id"],
-            name=attrs.get("name", ""),
-            description=attrs.get("description"),
-            created_at=parse_iso_datetime(attrs.get("created-at")),
-            resource_count=attrs.get("resource-count", 0),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "name": attrs.get("name") or "",
+                "description": attrs.get("description"),
+                "created_at": parse_iso_datetime(attrs.get("created-at")),
+                "resource_count": attrs.get("resource-count") or 0,
+                "workspace_count": attrs.get("workspace-count"),
+            }
         )
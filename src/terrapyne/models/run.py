@@ -7,7 +7,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from terrapyne.models.utils import parse_iso_datetime
+from terrapyne.models.utils import IncludedResources, parse_iso_datetime
 
 
 class RunStatus(StrEnum):
@@ -175,13 +175,16 @@ class Run(BaseModel):
 
     @classmethod
     def from_api_response(
-        cls, data: dict[str, Any], included: list[dict[str, Any]] | None = None
+        cls,
+        data: dict[str, Any],
+        included: builtins.list[dict[str, Any]] | IncludedResources | None = None,
     ) -> "Run":
         """Create run from TFC API response.
 
         Args:
             data: API response data dict
             included: Optional list of included resources from the API response
+                (pass an ``IncludedResources`` to share its index across a page)
 
         Returns:
             Run instance
@@ -221,47 +224,46 @@ class Run(BaseModel):
         changes = attrs.get("resource-changes")
         destructions = attrs.get("resource-destructions")
 
-        if included:
-            for item in included:
-                # Commit info
-                if (
-                    item.get("type") == "configuration-versions"
-                    and item.get("id") == configuration_version_id
-                ):
-                    cv_attrs = item.get("attributes", {})
-                    if "ingress-attributes" in cv_attrs:
-                        ingress = cv_attrs["ingress-attributes"]
-                        commit_sha = ingress.get("commit-sha")
-                        commit_message = ingress.get("commit-message")
-                        commit_author = ingress.get("commit-author")
-
-                # Resource counts from plan (overrides run attributes if present)
-                if item.get("type") == "plans" and item.get("id") == plan_id:
-                    p_attrs = item.get("attributes", {})
-                    if p_attrs.get("resource-additions") is not None:
-                        additions = p_attrs.get("resource-additions")
-                    if p_attrs.get("resource-changes") is not None:
-                        changes = p_attrs.get("resource-changes")
-                    if p_attrs.get("resource-destructions") is not None:
-                        destructions = p_attrs.get("resource-destructions")
-
-        return cls.model_construct(
-            id=data["id"],
-            status=RunStatus(attrs["status"]),
-            message=attrs.get("message"),
-            created_at=parse_iso_datetime(attrs.get("created-at")),
-            auto_apply=attrs.get("auto-apply", False),
-            is_destroy=attrs.get("is-destroy", False),
-            workspace_id=workspace_id,
-            plan_id=plan_id,
-            apply_id=apply_id,
-            configuration_version_id=configuration_version_id,
-            commit_sha=commit_sha,
-            commit_message=commit_message,
-            commit_author=commit_author,
-            additions=additions,
-            changes=changes,
-            destructions=destructions,
+        index = IncludedResources.of(included)
+        configuration_version = index.find("configuration-versions", configuration_version_id)
+        if configuration_version is not None:
+            cv_attrs = configuration_version.get("attributes", {})
+            if "ingress-attributes" in cv_attrs:
+                ingress = cv_attrs["ingress-attributes"]
+                commit_sha = ingress.get("commit-sha")
+                commit_message = ingress.get("commit-message")
+                commit_author = ingress.get("commit-author")
+
+        # Resource counts from plan (overrides run attributes if present)
+        plan = index.find("plans", plan_id)
+        if plan is not None:
+            p_attrs = plan.get("attributes", {})
+            if p_attrs.get("resource-additions") is not None:
+                additions = p_attrs.get("resource-additions")
+            if p_attrs.get("resource-changes") is not None:
+                changes = p_attrs.get("resource-changes")
+            if p_attrs.get("resource-destructions") is not None:
+                destructions = p_attrs.get("resource-destructions")
+
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "status": RunStatus(attrs["status"]),
+                "message": attrs.get("message"),
+                "created_at": parse_iso_datetime(attrs.get("created-at")),
+                "auto_apply": attrs.get("auto-apply") or False,
+                "is_destroy": attrs.get("is-destroy") or False,
+                "workspace_id": workspace_id,
+                "plan_id": plan_id,
+                "apply_id": apply_id,
+                "configuration_version_id": configuration_version_id,
+                "commit_sha": commit_sha,
+                "commit_message": commit_message,
+                "commit_author": commit_author,
+                "additions": additions,
+                "changes": changes,
+                "destructions": destructions,
+            }
         )
 
     @property
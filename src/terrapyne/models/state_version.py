@@ -42,14 +42,16 @@ class StateVersion(BaseModel):
         if relationships.get("run", {}).get("data"):
             run_id = relationships["run"]["data"].get("id")
 
-        return cls.model_construct(
-            id=data["id"],
-            serial=attrs.get("serial", 0),
-            created_at=parse_iso_datetime(attrs.get("created-at")),
-            status=attrs.get("status"),
-            download_url=attrs.get("hosted-state-download-url"),
-            resource_count=attrs.get("resource-count", 0),
-            providers_count=attrs.get("providers-count", 0),
-            resources_processed=attrs.get("resources-processed", False),
-            run_id=run_id,
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "serial": attrs.get("serial") or 0,
+                "created_at": parse_iso_datetime(attrs.get("created-at")),
+                "status": attrs.get("status"),
+                "download_url": attrs.get("hosted-state-download-url"),
+                "resource_count": attrs.get("resource-count") or 0,
+                "providers_count": attrs.get("providers-count") or 0,
+                "resources_processed": attrs.get("resources-processed") or False,
+                "run_id": run_id,
+            }
         )
@@ -43,11 +43,13 @@ class Team(BaseModel):
         if attrs.get("updated-at"):
             updated_at = parse_iso_datetime(attrs["updated-at"])
 
-        return cls.model_construct(
-            id=data["id"],
-            name=attrs.get("name", ""),
-            description=attrs.get("description"),
-            created_at=created_at,
-            updated_at=updated_at,
-            members_count=attrs.get("users-count"),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "name": attrs.get("name") or "",
+                "description": attrs.get("description"),
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "members_count": attrs.get("users-count"),
+            }
         )
@@ -72,15 +72,19 @@ class TeamProjectAccess(BaseModel):
         project_access_data = attrs.get("project-access")
         workspace_access_data = attrs.get("workspace-access")
 
-        return cls.model_construct(
-            id=data["id"],
-            access=attrs.get("access", "read"),
-            team_id=team_id,
-            project_id=project_id,
-            project_access=ProjectAccess(**project_access_data) if project_access_data else None,
-            workspace_access=(
-                WorkspaceAccess(**workspace_access_data) if workspace_access_data else None
-            ),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "access": attrs.get("access") or "read",
+                "team_id": team_id,
+                "project_id": project_id,
+                "project_access": ProjectAccess(**project_access_data)
+                if project_access_data
+                else None,
+                "workspace_access": (
+                    WorkspaceAccess(**workspace_access_data) if workspace_access_data else None
+                ),
+            }
         )
 
 
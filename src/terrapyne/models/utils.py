@@ -1,6 +1,9 @@
 """Model utilities and helpers."""
 
+from __future__ import annotations
+
 from datetime import datetime
+from typing import Any
 
 
 def parse_iso_datetime(value: str | None) -> datetime | None:
@@ -27,3 +30,30 @@ def parse_iso_datetime(value: str | None) -> datetime | None:
         return None
     # Replace 'Z' with '+00:00' for proper timezone parsing
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class IncludedResources(list[dict[str, Any]]):
+    """A response's ``included`` array with lookup by type and ID.
+
+    The index is built on the first lookup and then shared by every item of
+    the page, instead of each item scanning the array for its related
+    resources. Treat it as read-only once looked up.
+    """
+
+    _index: dict[tuple[Any, Any], dict[str, Any]] | None = None
+
+    @classmethod
+    def of(cls, included: list[dict[str, Any]] | IncludedResources | None) -> IncludedResources:
+        """Wrap an ``included`` array, reusing it (and its index) if already wrapped."""
+        if isinstance(included, cls):
+            return included
+        return cls(included or ())
+
+    def find(self, type_: str, id_: str | None) -> dict[str, Any] | None:
+        """The included resource of the given type and ID, if any."""
+        if id_ is None:
+            return None
+        if self._index is None:
+            # Reversed so that the first of any duplicates wins, as a scan would
+            self._index = {(item.get("type"), item.get("id")): item for item in reversed(self)}
+        return self._index.get((type_, id_))
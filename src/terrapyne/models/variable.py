@@ -30,14 +30,16 @@ class WorkspaceVariable(BaseModel):
         """
         attrs = data.get("attributes", {})
 
-        return cls.model_construct(
-            id=data["id"],
-            key=attrs.get("key", ""),
-            value=attrs.get("value"),
-            description=attrs.get("description"),
-            category=attrs.get("category", "terraform"),
-            hcl=attrs.get("hcl", False),
-            sensitive=attrs.get("sensitive", False),
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "key": attrs.get("key") or "",
+                "value": attrs.get("value"),
+                "description": attrs.get("description"),
+                "category": attrs.get("category") or "terraform",
+                "hcl": attrs.get("hcl") or False,
+                "sensitive": attrs.get("sensitive") or False,
+            }
         )
 
     @property
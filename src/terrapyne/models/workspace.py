@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from terrapyne.models.utils import parse_iso_datetime
+from terrapyne.models.utils import IncludedResources, parse_iso_datetime
 
 if TYPE_CHECKING:
     from terrapyne.models.run import Run
@@ -21,6 +21,7 @@ class WorkspaceVCS(BaseModel):
     repository_http_url: str | None = Field(None, alias="repository-http-url")
     oauth_token_id: str | None = Field(None, alias="oauth-token-id")
     working_directory: str | None = Field(None, alias="working-directory")
+    service_provider: str | None = Field(None, alias="service-provider")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -58,13 +59,16 @@ class Workspace(BaseModel):
 
     @classmethod
     def from_api_response(
-        cls, data: dict[str, Any], included: list[dict[str, Any]] | None = None
+        cls,
+        data: dict[str, Any],
+        included: list[dict[str, Any]] | IncludedResources | None = None,
     ) -> "Workspace":
         """Create workspace from TFC API response.
 
         Args:
             data: API response data dict (should contain 'id', 'type', 'attributes', 'relationships')
             included: Optional list of included resources from the API response
+                (pass an ``IncludedResources`` to share its index across a page)
 
         Returns:
             Workspace instance
@@ -84,44 +88,41 @@ class Workspace(BaseModel):
         if relationships.get("project", {}).get("data"):
             project_id = relationships["project"]["data"].get("id")
 
-        # Try to find project name in included data
-        if included and project_id:
-            for item in included:
-                if item.get("type") == "projects" and item.get("id") == project_id:
-                    project_name = item.get("attributes", {}).get("name")
-                    break
+        # Look up project name and latest run in the included resources
+        index = IncludedResources.of(included)
+        project = index.find("projects", project_id)
+        if project is not None:
+            project_name = project.get("attributes", {}).get("name")
 
-        # Extract latest run if present in relationships and included
         latest_run = None
-        if relationships.get("latest-run", {}).get("data"):
-            run_id = relationships["latest-run"]["data"].get("id")
-            if included:
-                for item in included:
-                    if item.get("type") == "runs" and item.get("id") == run_id:
-                        from terrapyne.models.run import Run
+        run_id = (relationships.get("latest-run", {}).get("data") or {}).get("id")
+        run = index.find("runs", run_id)
+        if run is not None:
+            from terrapyne.models.run import Run
 
-                        latest_run = Run.from_api_response(item, included=included)
-                        break
+            latest_run = Run.from_api_response(run, included=index)
 
         # Detect environment from workspace name
-        environment = cls._detect_environment(attrs.get("name", ""))
-
-        return cls.model_construct(
-            id=data["id"],
-            name=attrs.get("name", ""),
-            created_at=parse_iso_datetime(attrs.get("created-at")),
-            updated_at=parse_iso_datetime(attrs.get("updated-at")),
-            terraform_version=attrs.get("terraform-version"),
-            working_directory=attrs.get("working-directory"),
-            auto_apply=attrs.get("auto-apply"),
-            execution_mode=attrs.get("execution-mode"),
-            locked=attrs.get("locked", False),
-            vcs_repo=vcs_repo,
-            project_id=project_id,
-            project_name=project_name,
-            tag_names=attrs.get("tag-names", []),
-            latest_run=latest_run,
-            environment=environment,
+        environment = cls._detect_environment(attrs.get("name") or "")
+
+        return cls.model_validate(
+            {
+                "id": data["id"],
+                "name": attrs.get("name") or "",
+                "created_at": parse_iso_datetime(attrs.get("created-at")),
+                "updated_at": parse_iso_datetime(attrs.get("updated-at")),
+                "terraform_version": attrs.get("terraform-version"),
+                "working_directory": attrs.get("working-directory"),
+                "auto_apply": attrs.get("auto-apply"),
+                "execution_mode": attrs.get("execution-mode"),
+                "locked": attrs.get("locked") or False,
+                "vcs_repo": vcs_repo,
+                "project_id": project_id,
+                "project_name": project_name,
+                "tag_names": attrs.get("tag-names") or [],
+                "latest_run": latest_run,
+                "environment": environment,
+            }
         )
 
     @staticmethod
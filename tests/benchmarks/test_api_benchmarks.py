@@ -0,0 +1,170 @@
+"""End-to-end API benchmarks against the local TFC API stand-in.
+
+Each benchmark serves a synthetic organization with injected latency from
+``tests/fixtures/tfc_server.py``, runs an SDK call or a `tfc` command against
+it, and prints wall time and request counts. Assertions compare variants
+measured in the same run (never absolute times), so that load on the machine
+does not fail them. Run with:
+
+    make test-bench
+"""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from terrapyne.cli.main import app
+from tests.fixtures.tfc_server import SyntheticOrganization, TFCStandIn
+
+pytestmark = pytest.mark.slow
+
+# Per-request latency of the stand-in: a quick round trip to a nearby TFC
+LATENCY = 0.01
+
+
+def _best_of(fn: Callable[[], Any], rounds: int = 3) -> tuple[Any, float]:
+    """Result of ``fn`` and its fastest wall time over ``rounds`` runs."""
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _tfc(server: TFCStandIn, monkeypatch: pytest.MonkeyPatch, *argv: str) -> Callable[[], str]:
+    """A `tfc` invocation against the stand-in, as a callable returning its output."""
+    for name, value in server.env().items():
+        monkeypatch.setenv(name, value)
+
+    def invoke() -> str:
+        result = CliRunner().invoke(app, list(argv))
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    return invoke
+
+
+def _api_requests(server: TFCStandIn) -> int:
+    return sum(n for path, n in server.requests.items() if path.startswith("GET /api/v2/"))
+
+
+def test_paginate_with_meta_benchmark():
+    """Prefetching pages concurrently walks a 5,000-workspace listing faster than page by page."""
+    with TFCStandIn(SyntheticOrganization(workspaces=5_000), latency=LATENCY) as server:
+        with server.client() as client:
+
+            def walk(max_inflight: int) -> int:
+                items, _ = client.paginate_with_meta(
+                    "/organizations/bench-org/workspaces",
+                    params={"include": "latest_run"},
+                    max_inflight=max_inflight,
+                )
+                return sum(1 for _ in items)
+
+            sequential_count, sequential = _best_of(lambda: walk(1))
+            prefetched_count, prefetched = _best_of(lambda: walk(8))
+
+    print(
+        f"\n{sequential_count} workspaces in 50 pages: sequential {sequential:.2f}s, "
+        f"8 in flight {prefetched:.2f}s"
+    )
+    assert sequential_count == prefetched_count == 5_000
+    assert prefetched < sequential
+
+
+def test_run_errors_benchmark(monkeypatch):
+    """`tfc run errors` over a 400-workspace project: per-workspace queries vs one org listing."""
+    organization = SyntheticOrganization(workspaces=4_000, projects=10, runs_per_workspace=10)
+    with TFCStandIn(organization, latency=LATENCY) as server:
+        timings = {}
+        requests = {}
+        for strategy in ("workspace", "org"):
+            invoke = _tfc(
+                server,
+                monkeypatch,
+                *("run", "errors", "project-004", "-o", "bench-org", "--strategy", strategy),
+            )
+            server.reset_counts()
+            invoke()
+            requests[strategy] = _api_requests(server)
+            _, timings[strategy] = _best_of(invoke)
+
+    print(
+        f"\nrun errors: per workspace {timings['workspace']:.2f}s "
+        f"({requests['workspace']} requests), org listing {timings['org']:.2f}s "
+        f"({requests['org']} requests)"
+    )
+    assert requests["org"] < requests["workspace"]
+
+
+def test_project_show_benchmark(monkeypatch):
+    """`tfc project show` of a 500-workspace project costs a handful of requests."""
+    organization = SyntheticOrganization(workspaces=5_000, projects=10)
+    with TFCStandIn(organization, latency=LATENCY) as server:
+        invoke = _tfc(
+            server, monkeypatch, "project", "show", "project-007", "-o", "bench-org", "-f", "json"
+        )
+        server.reset_counts()
+        output = invoke()
+        requests = _api_requests(server)
+        _, seconds = _best_of(invoke)
+
+    print(f"\nproject show of 500 workspaces: {seconds:.2f}s, {requests} requests")
+    assert '"workspace_count": 500' in output
+    # One project lookup and five 100-workspace pages
+    assert requests == 6
+
+
+def test_state_download_benchmark(tmp_path: Path, monkeypatch):
+    """Streaming a 20,000-resource state, then reading it again from the local state store."""
+    monkeypatch.setenv("TERRAPYNE_STATE_STORE_DIR", str(tmp_path / "store"))
+    organization = SyntheticOrganization(workspaces=1, state_resources=20_000)
+    with TFCStandIn(organization, latency=LATENCY) as server:
+        with server.client(state_store_mb=256) as client:
+            version = client.state_versions.get_current("ws-00000000")
+
+            start = time.perf_counter()
+            target = client.state_versions.download_to_file(version.id, tmp_path / "state.json")
+            download = time.perf_counter() - start
+            downloads = server.requests[f"GET /_archivist/state/{version.id}"]
+
+            _, stored = _best_of(
+                lambda: client.state_versions.download_to_file(version.id, tmp_path / "again.json")
+            )
+
+    size_mb = target.stat().st_size / 1024 / 1024
+    print(
+        f"\n{size_mb:.1f} MiB state: download {download:.2f}s ({size_mb / download:.0f} MiB/s), "
+        f"from the state store {stored:.3f}s"
+    )
+    assert downloads == 1
+    assert server.requests[f"GET /_archivist/state/{version.id}"] == 1
+    assert (tmp_path / "again.json").read_bytes() == target.read_bytes()
+
+
+def test_rate_limit_benchmark():
+    """The client-side governor keeps a concurrent walk under the API's rate limit."""
+    organization = SyntheticOrganization(workspaces=600, projects=1)
+    with TFCStandIn(organization, rate_limit=40) as server:
+        results = {}
+        for label, rate_limit in (("unpaced", 0), ("governed", 35)):
+            server.reset_counts()
+            server.throttle.tokens = server.throttle.burst
+            with server.client(max_inflight=8, rate_limit=rate_limit) as client:
+                start = time.perf_counter()
+                items, _ = client.paginate_with_meta(
+                    "/organizations/bench-org/workspaces", page_size=5
+                )
+                count = sum(1 for _ in items)
+                results[label] = (count, time.perf_counter() - start, server.throttled)
+
+    for label, (count, seconds, throttled) in results.items():
+        print(f"\n{label}: {count} workspaces in {seconds:.2f}s, {throttled} requests throttled")
+    assert results["unpaced"][0] == results["governed"][0] == 600
+    assert results["governed"][2] <= results["unpaced"][2]
@@ -0,0 +1,185 @@
+"""Plan parser benchmarks on generated plans of 10 to 100,000 resources.
+
+Each benchmark times one entry point of ``TerraformPlainTextPlanParser`` on a
+plan from ``tests/fixtures/plan_corpus.py`` (coloured, with error boxes),
+measures its peak memory with ``tracemalloc`` in a separate run (tracing slows
+the code it measures), prints both, and fails when either exceeds its
+per-resource threshold. Time thresholds are three times the median time per
+resource measured on an idle machine. A fixed reference
+workload is timed around every measurement, and the time thresholds grow by
+as much as it runs slower than ``REFERENCE_SECONDS``, so that a loaded or
+slower machine does not fail them; ``TERRAPYNE_BENCH_SLACK`` (e.g. ``2``)
+scales them further. Run with:
+
+    make test-bench
+"""
+
+import functools
+import os
+import re
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from terrapyne.core.plan_parser import TerraformPlainTextPlanParser
+from tests.fixtures.plan_corpus import SyntheticPlan, synthetic_plan
+
+pytestmark = pytest.mark.slow
+
+# Plan sizes in resource changes
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+
+# Regression thresholds per resource change: (microseconds, KiB of peak memory). The times are
+# 3x the medians over 1,000 to 100,000 resources on an idle machine (8, 108, 66 and 109 µs)
+THRESHOLDS: dict[str, tuple[float, float]] = {
+    "strip_ansi_codes": (25, 5),
+    "parse_to_ir": (325, 10),
+    "parse_to_ir[scanner]": (200, 8),
+    "parse": (325, 12),
+}
+
+# Plans smaller than this are held to the budget of this many resources (fixed costs dominate)
+MIN_BUDGETED_RESOURCES = 1_000
+
+# Multiplier of the time thresholds for slower machines
+SLACK = float(os.getenv("TERRAPYNE_BENCH_SLACK", "1"))
+
+# Seconds _reference_workload took on the idle machine THRESHOLDS were measured on
+REFERENCE_SECONDS = 0.016
+
+_REFERENCE_PATTERN = re.compile(r"^\s*# (\S+) will be (\w+)")
+
+
+def _reference_workload() -> int:
+    """Fixed work in the parser's style (a line regex and string splits), to gauge the machine."""
+    parts = 0
+    for i in range(20_000):
+        match = _REFERENCE_PATTERN.match(f"  # aws_s3_bucket.r{i} will be created")
+        if match:
+            parts += len(match.group(1).split("."))
+    return parts
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+@functools.cache
+def _plan(resources: int) -> SyntheticPlan:
+    return synthetic_plan(resources, ansi=True, errors=3)
+
+
+def _measure(fn: Callable[[], Any], rounds: int) -> tuple[Any, float, float, int]:
+    """Time and trace ``fn``.
+
+    Returns:
+        Its result, its best wall time over ``rounds`` runs, how many times
+        slower than ``REFERENCE_SECONDS`` the reference workload ran around
+        those runs (at least 1), and its peak traced bytes
+    """
+    best = float("inf")
+    result = None
+    references = [_timed(_reference_workload)[1]]
+    for _ in range(rounds):
+        result, seconds = _timed(fn)
+        best = min(best, seconds)
+        references.append(_timed(_reference_workload)[1])
+    load = max(1.0, statistics.median(references) / REFERENCE_SECONDS)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, best, load, peak
+
+
+def _check(name: str, plan: SyntheticPlan, seconds: float, load: float, peak: int) -> None:
+    """Print a measurement and hold it to the thresholds of ``name``, scaled by ``load``."""
+    per_resource_us, per_resource_kib = THRESHOLDS[name]
+    budgeted = max(plan.resources, MIN_BUDGETED_RESOURCES)
+    time_budget = per_resource_us * budgeted / 1_000_000 * load * SLACK
+    memory_budget = per_resource_kib * budgeted * 1024
+    print(
+        f"\n{name} of {plan.resources} resources ({plan.size_mb:.1f} MiB): "
+        f"{seconds * 1000:.1f} ms ({seconds * 1_000_000 / plan.resources:.0f} µs/resource, "
+        f"budget {time_budget * 1000:.0f} ms at load x{load:.1f}), peak {peak / 1024 / 1024:.1f} MiB "
+        f"(budget {memory_budget / 1024 / 1024:.1f} MiB)"
+    )
+    assert seconds <= time_budget, f"{name} got slower: {seconds:.3f}s > {time_budget:.3f}s"
+    assert peak <= memory_budget, f"{name} uses more memory: {peak} > {memory_budget} bytes"
+
+
+def _rounds(resources: int) -> int:
+    return 3 if resources <= 10_000 else 1
+
+
+@pytest.mark.parametrize("resources", SIZES)
+def test_strip_ansi_codes_benchmark(resources):
+    plan = _plan(resources)
+
+    stripped, seconds, load, peak = _measure(
+        lambda: TerraformPlainTextPlanParser.strip_ansi_codes(plan.text), _rounds(resources)
+    )
+
+    assert "\x1b[" not in stripped
+    _check("strip_ansi_codes", plan, seconds, load, peak)
+
+
+@pytest.mark.parametrize("resources", SIZES)
+@pytest.mark.parametrize("engine", TerraformPlainTextPlanParser.ENGINES)
+def test_parse_to_ir_benchmark(resources, engine):
+    plan = _plan(resources)
+
+    plan_ir, seconds, load, peak = _measure(
+        lambda: TerraformPlainTextPlanParser(plan.text, engine=engine).parse_to_ir(),
+        _rounds(resources),
+    )
+
+    assert len(plan_ir.resource_changes) == plan.resources
+    assert len(plan_ir.diagnostics) == plan.errors
+    _check(
+        "parse_to_ir" if engine == "state_machine" else f"parse_to_ir[{engine}]",
+        plan,
+        seconds,
+        load,
+        peak,
+    )
+
+
+@pytest.mark.parametrize("resources", SIZES)
+def test_parse_benchmark(resources):
+    plan = _plan(resources)
+
+    parsed, seconds, load, peak = _measure(
+        lambda: TerraformPlainTextPlanParser(plan.text).parse(), _rounds(resources)
+    )
+
+    assert len(parsed["resource_changes"]) == plan.resources
+    assert parsed["plan_summary"]["add"] == plan.to_add
+    _check("parse", plan, seconds, load, peak)
+
+
+def test_parse_time_scales_linearly():
+    """Time per resource at 10,000 resources stays within 3x of that at 1,000."""
+    per_resource = {}
+    for resources in (1_000, 10_000):
+        plan = _plan(resources)
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            TerraformPlainTextPlanParser(plan.text).parse_to_ir()
+            best = min(best, time.perf_counter() - start)
+        per_resource[resources] = best / resources
+
+    print(
+        "\nparse_to_ir per resource: "
+        + ", ".join(f"{n}: {seconds * 1_000_000:.0f} µs" for n, seconds in per_resource.items())
+    )
+    assert per_resource[10_000] < 3 * per_resource[1_000]
@@ -0,0 +1,94 @@
+"""State diff benchmarks on synthetic states of 1,000 to 100,000 instances.
+
+Each benchmark diffs two snapshots built from ``synthetic_state`` in
+``tests/fixtures/tfc_server.py``, prints the time taken, and fails when it
+exceeds a per-instance threshold (scaled by ``TERRAPYNE_BENCH_SLACK``). Run with:
+
+    make test-bench
+"""
+
+import os
+import time
+
+import pytest
+
+from terrapyne.core.state_diff import (
+    StateResourceInstance,
+    diff_state_resources,
+    format_diff_unified,
+    parse_state_resources,
+)
+from tests.fixtures.tfc_server import synthetic_state
+
+pytestmark = pytest.mark.slow
+
+# State sizes in resource instances
+SIZES = (1_000, 10_000, 100_000)
+
+# Regression thresholds in microseconds per instance, by share of instances changed
+THRESHOLDS = {"1% changed": 10, "all changed": 80}
+
+# Multiplier of the time thresholds for slower machines
+SLACK = float(os.getenv("TERRAPYNE_BENCH_SLACK", "1"))
+
+
+def _snapshots(
+    instances: int, changed_every: int
+) -> tuple[list[StateResourceInstance], list[StateResourceInstance]]:
+    """An old snapshot and a new one with every ``changed_every``-th instance changed.
+
+    One instance in a thousand is also removed and replaced by one at a new address.
+    """
+    old = parse_state_resources(synthetic_state(1, instances))
+    changed = parse_state_resources(synthetic_state(2, instances))
+    new = []
+    for i, (before, after) in enumerate(zip(old, changed, strict=True)):
+        instance = after if i % changed_every == 0 else before
+        if i % 1000 == 999:
+            instance = StateResourceInstance(
+                instance.resource_type, f"{instance.resource_name}_new", None, None, {}
+            )
+        new.append(instance)
+    return old, new
+
+
+def _best_time(old: list[StateResourceInstance], new: list[StateResourceInstance]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        diff_state_resources(old, new)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("instances", SIZES)
+@pytest.mark.parametrize(("label", "changed_every"), [("1% changed", 100), ("all changed", 1)])
+def test_diff_state_resources_benchmark(instances, label, changed_every):
+    old, new = _snapshots(instances, changed_every)
+
+    diff = diff_state_resources(old, new)
+    seconds = _best_time(old, new)
+
+    budget = THRESHOLDS[label] * instances / 1_000_000 * SLACK
+    print(
+        f"\ndiff of {instances} instances ({label}): {seconds * 1000:.1f} ms "
+        f"({seconds * 1_000_000 / instances:.1f} µs/instance, budget {budget * 1000:.0f} ms), "
+        f"{len(diff.changed)} changed, {len(diff.added)} added, {len(diff.removed)} removed"
+    )
+    replaced = instances // 1000
+    assert len(diff.removed) == len(diff.added) == replaced
+    assert len(diff.changed) + diff.unchanged + replaced == instances
+    assert seconds <= budget, f"diff got slower: {seconds:.3f}s > {budget:.3f}s"
+
+
+def test_structural_diff_outpaces_the_text_diff():
+    """format_diff_unified is quadratic in the rows it renders; the structural diff is not."""
+    old, new = _snapshots(1_000, 1)
+
+    start = time.perf_counter()
+    format_diff_unified(old, new, ["address", "id", "tags.Serial"])
+    text = time.perf_counter() - start
+    structural = _best_time(old, new)
+
+    print(f"\n1000 instances: unified text diff {text:.3f}s, structural diff {structural:.3f}s")
+    assert structural < text
@@ -10,6 +10,7 @@ This module provides:
 - API response fixtures for mocking
 """
 
+import importlib
 import re
 import subprocess
 import sys
@@ -37,6 +38,13 @@ from tests.fixtures.factories import (
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# `tfc` imports its command groups on first use; import them all up front so that the console
+# each binds at import is the default one, not whichever test's console happens to be current
+from terrapyne.cli.main import TfcGroup
+
+for _module, _help in TfcGroup.lazy_groups.values():
+    importlib.import_module(_module)
+
 
 @pytest.fixture()
 def tf_required_version():
@@ -190,3 +198,13 @@ def setup_console():
     new_console = Console(force_terminal=True, width=100)
     set_console(new_console)
     return new_console
+
+
+@pytest.fixture(autouse=True)
+def clear_team_names():
+    """Keep the process-wide team name cache from leaking between tests."""
+    from terrapyne.api.teams import team_names
+
+    team_names.clear()
+    yield
+    team_names.clear()
@@ -20,3 +20,21 @@ Feature: Multi-Workspace Execution Diagnostics
     Given no environments in project "platform" have failed in the last "7" days
     When I analyze execution failures for the last "7" days
     Then I should be notified that no project errors were found
+
+  Scenario: Scanning a project through the organization-wide runs listing
+    Given the project "platform" has recently encountered execution errors:
+      | environment   | execution-id | error-description           |
+      | app-prod      | run-aaa111   | Error: insufficient perms   |
+      | db-prod       | run-bbb222   | Error: resource timeout     |
+    When I analyze recent project-wide execution failures with the "org" strategy
+    Then I should see a report of all failed executions
+    And no per-workspace run queries should have been made
+
+  Scenario: Falling back to per-workspace queries when the organization listing is unavailable
+    Given the project "platform" has recently encountered execution errors:
+      | environment   | execution-id | error-description           |
+      | app-prod      | run-aaa111   | Error: insufficient perms   |
+      | db-prod       | run-bbb222   | Error: resource timeout     |
+    And the organization-wide runs listing is unavailable
+    When I analyze recent project-wide execution failures with the "auto" strategy
+    Then I should see a report of all failed executions
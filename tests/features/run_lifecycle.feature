@@ -57,3 +57,4 @@ Feature: Infrastructure Change Lifecycle
     Then the plan logs should be streamed progressively
     And the apply logs should be streamed progressively
     And no duplicate log lines should be printed
+    And each poll should only download new log output
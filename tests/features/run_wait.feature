@@ -32,3 +32,9 @@ Feature: Run Queue and Wait Management
     When I trigger a new plan for "my-app-dev" with --wait
     Then the command should exit with code 0
     And the output should indicate it is paused for approval
+
+  Scenario: Watching every active run during a rollout
+    Given the organization has active runs "run-a" and "run-b"
+    When I watch all active runs
+    Then each run's status changes should be reported
+    And the command should exit with code 1
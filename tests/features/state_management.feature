@@ -14,6 +14,14 @@ Feature: State Version Management
     Then the output should be valid JSON
     And it should contain "aws_instance.web"
 
+  Scenario: List resources in the current state
+    Given the workspace has a current state version with ID "sv-123"
+    And the state file contains "aws_instance.web"
+    When I list the resources in the current state
+    Then the output should be valid JSON
+    And it should contain "aws_instance.web"
+    And it should contain "i-123"
+
   Scenario: List state versions with relative time
     Given the workspace has state versions:
       | ID     | Created             | Serial |
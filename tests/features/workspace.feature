@@ -8,6 +8,7 @@ Feature: Workspace Operations
     When I list all workspaces
     Then I should see workspace list
     And the list should show workspace count
+    And only the table fields should be requested
 
   Scenario: List workspaces with search filter
     Given I have organization "test-org" with workspaces
@@ -0,0 +1,256 @@
+"""Synthetic plain-text Terraform plans of any size, for parser tests and benchmarks.
+
+``synthetic_plan(n)`` renders a plan of ``n`` resource changes the way
+``terraform plan`` prints them on TFC: module and indexed addresses, nested
+blocks, heredocs, ``jsonencode`` arrays of maps, map diffs, forced
+replacements, destroys and data source reads, optionally wrapped in ANSI
+colour codes and followed by error boxes. The resource kinds cycle in a fixed
+order, so a plan of a given size is always the same text and its expected
+counts are known without parsing it.
+
+Example:
+    plan = synthetic_plan(10_000, ansi=True, errors=3)
+    ir = TerraformPlainTextPlanParser(plan.text).parse_to_ir()
+    assert len(ir.resource_changes) == plan.resources
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# ANSI codes terraform colours its plan output with
+_BOLD, _RESET = "\x1b[1m", "\x1b[0m"
+_COLOURS = {"+": "\x1b[32m", "-": "\x1b[31m", "~": "\x1b[33m", "-/+": "\x1b[33m", "<=": "\x1b[36m"}
+
+_HEADER = """Terraform v1.7.0
+on linux_amd64
+Initializing plugins and modules...
+
+Terraform used the selected providers to generate the following execution
+plan. Resource actions are indicated with the following symbols:
+  + create
+  ~ update in-place
+  - destroy
+-/+ destroy and then create replacement
+ <= read (data resources)
+
+Terraform will perform the following actions:
+"""
+
+
+@dataclass(frozen=True)
+class SyntheticPlan:
+    """A generated plan and the counts a parser should find in it."""
+
+    text: str
+    resources: int  # resource changes, data source reads included
+    to_add: int
+    to_change: int
+    to_destroy: int
+    errors: int
+
+    @property
+    def size_mb(self) -> float:
+        return len(self.text.encode()) / 1024 / 1024
+
+
+def _address(i: int, kind: str, name: str) -> str:
+    """Module, keyed and indexed addresses in turn."""
+    match i % 3:
+        case 0:
+            return f'module.svc["svc-{i:06d}"].{kind}.{name}'
+        case 1:
+            return f"{kind}.{name}[{i % 16}]"
+    return f"{kind}.{name}_{i:06d}"
+
+
+def _create(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "aws_instance", "web")
+    return f"{address} will be created", [
+        '+ resource "aws_instance" "web" {',
+        f'    + ami                    = "ami-{i:08x}"',
+        "    + arn                    = (known after apply)",
+        "    + id                     = (known after apply)",
+        '    + instance_type          = "t3.micro"',
+        f'    + security_groups        = ["sg-{i:06d}", "sg-shared"]',
+        "    + tags                   = {",
+        f'        + "Name" = "web-{i:06d}"',
+        '        + "Team" = "platform"',
+        "      }",
+        "    + user_data              = <<-EOT",
+        "            #!/bin/bash",
+        f"            echo 'instance {i}' > /etc/motd",
+        "        EOT",
+        "",
+        "    + root_block_device {",
+        "        + encrypted   = true",
+        "        + volume_size = 20",
+        '        + volume_type = "gp3"',
+        "      }",
+        "  }",
+    ]
+
+
+def _update(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "aws_s3_bucket", "data")
+    return f"{address} will be updated in-place", [
+        '~ resource "aws_s3_bucket" "data" {',
+        f'      id                     = "bucket-{i:06d}"',
+        "    ~ tags                   = {",
+        '          "Name"        = "data"',
+        '        ~ "Version"     = "1" -> "2"',
+        '        + "Environment" = "production"',
+        '        - "Legacy"      = "true" -> null',
+        "      }",
+        "    ~ tags_all               = {",
+        '        ~ "Version"     = "1" -> "2"',
+        "          # (1 unchanged element hidden)",
+        "      }",
+        "      # (8 unchanged attributes hidden)",
+        "",
+        "      # (2 unchanged blocks hidden)",
+        "  }",
+    ]
+
+
+def _replace(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "aws_db_instance", "db")
+    return f"{address} must be replaced", [
+        '-/+ resource "aws_db_instance" "db" {',
+        '      ~ engine_version        = "13.7" -> "14.10" # forces replacement',
+        f'      ~ id                    = "db-{i:06d}" -> (known after apply)',
+        '        instance_class        = "db.t3.medium"',
+        '      ~ parameter_group_name  = "default.postgres13" -> "default.postgres14"',
+        "      ~ vpc_security_group_ids = [",
+        f'          - "sg-{i:06d}",',
+        '          + "sg-shared",',
+        "        ]",
+        "        # (12 unchanged attributes hidden)",
+        "    }",
+    ]
+
+
+def _destroy(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "aws_iam_role", "legacy")
+    return f"{address} will be destroyed", [
+        '- resource "aws_iam_role" "legacy" {',
+        f'    - arn                  = "arn:aws:iam::123456789012:role/legacy-{i:06d}" -> null',
+        f'    - name                 = "legacy-{i:06d}" -> null',
+        "    - max_session_duration = 3600 -> null",
+        "    - tags                 = {",
+        '        - "Owner" = "retired"',
+        "      } -> null",
+        "  }",
+    ]
+
+
+def _read(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "data.aws_iam_policy_document", "assume")
+    return f"{address} will be read during apply", [
+        '<= data "aws_iam_policy_document" "assume" {',
+        "    + id   = (known after apply)",
+        "    + json = (known after apply)",
+        "",
+        "    + statement {",
+        '        + actions = ["sts:AssumeRole"]',
+        '        + effect  = "Allow"',
+        "      }",
+        "  }",
+    ]
+
+
+def _policy(i: int) -> tuple[str, list[str]]:
+    address = _address(i, "aws_iam_policy", "access")
+    return f"{address} will be created", [
+        '+ resource "aws_iam_policy" "access" {',
+        f'    + name   = "access-{i:06d}"',
+        "    + policy = jsonencode(",
+        "        {",
+        "          + Statement = [",
+        "              + {",
+        '                  + Action   = ["s3:GetObject", "s3:PutObject"]',
+        '                  + Effect   = "Allow"',
+        f'                  + Resource = "arn:aws:s3:::bucket-{i:06d}/*"',
+        "                },",
+        "            ]",
+        '          + Version   = "2012-10-17"',
+        "        }",
+        "    )",
+        "  }",
+    ]
+
+
+# Resource kinds in the order they cycle, with their (add, change, destroy) contributions
+_KINDS: tuple[tuple[Callable[[int], tuple[str, list[str]]], tuple[int, int, int]], ...] = (
+    (_create, (1, 0, 0)),
+    (_update, (0, 1, 0)),
+    (_replace, (1, 0, 1)),
+    (_policy, (1, 0, 0)),
+    (_destroy, (0, 0, 1)),
+    (_read, (0, 0, 0)),
+)
+
+
+def _colour(line: str) -> str:
+    """Colour a line's action symbol the way terraform does."""
+    stripped = line.lstrip()
+    for symbol in ("-/+", "<=", "+", "-", "~"):
+        if stripped.startswith(f"{symbol} "):
+            indent = line[: len(line) - len(stripped)]
+            rest = stripped[len(symbol) :]
+            return f"{indent}{_COLOURS[symbol]}{symbol}{_RESET}{rest}"
+    return line
+
+
+def _error_box(i: int) -> list[str]:
+    return [
+        "╷",
+        f"│ Error: creating EC2 Instance (web-{i:06d}): UnauthorizedOperation",
+        "│",
+        f'│   with module.svc["svc-{i:06d}"].aws_instance.web,',
+        '│   on main.tf line 12, in resource "aws_instance" "web":',
+        '│   12: resource "aws_instance" "web" {',
+        "│",
+        "│ You are not authorized to perform this operation.",
+        "╵",
+    ]
+
+
+def synthetic_plan(resources: int, *, ansi: bool = False, errors: int = 0) -> SyntheticPlan:
+    """Render a plan of ``resources`` resource changes.
+
+    Args:
+        resources: Number of resource changes (creates, updates, replacements,
+            destroys and data source reads in a fixed cycle)
+        ansi: Colour the plan with ANSI escape codes, as TFC logs are
+        errors: Error boxes to print after the plan summary
+
+    Returns:
+        The plan text with the counts a parser should report for it
+    """
+    lines = _HEADER.splitlines()
+    to_add = to_change = to_destroy = 0
+    for i in range(resources):
+        render, (add, change, destroy) = _KINDS[i % len(_KINDS)]
+        comment, body = render(i)
+        to_add, to_change, to_destroy = to_add + add, to_change + change, to_destroy + destroy
+        lines.append("")
+        lines.append(f"{_BOLD}  # {comment}{_RESET}" if ansi else f"  # {comment}")
+        for line in body:
+            indented = f"  {line}" if line else ""
+            lines.append(_colour(indented) if ansi else indented)
+    lines.append("")
+    summary = f"Plan: {to_add} to add, {to_change} to change, {to_destroy} to destroy."
+    lines.append(f"{_BOLD}Plan:{_RESET} {summary[6:]}" if ansi else summary)
+    for i in range(errors):
+        lines.append("")
+        lines.extend(_error_box(i))
+    return SyntheticPlan(
+        text="\n".join(lines) + "\n",
+        resources=resources,
+        to_add=to_add,
+        to_change=to_change,
+        to_destroy=to_destroy,
+        errors=errors,
+    )
@@ -0,0 +1,695 @@
+"""Local stand-in for the TFC API, for load and performance tests.
+
+``TFCStandIn`` serves a synthetic organization over real HTTP from a thread
+of the test process, so a client exercises its whole stack (connection pools,
+pagination and prefetch, includes, rate-limit handling, redirects to signed
+archive URLs) without a live TFC. It implements the read side of the JSON:API
+the SDK uses:
+
+- listings paginated with ``page[number]``/``page[size]``, with TFC's
+  ``meta.pagination`` block and ``links``
+- ``include`` of related resources (``latest_run``, ``project``, ``team``, ...)
+- the filters and searches the SDK sends (``search[name]``,
+  ``search[wildcard-name]``, ``filter[project][id]``, ``filter[status]``,
+  ``filter[project_names]``, ``q``, ``filter[names]`` and friends)
+- the workspace listing sorts TFC supports (``name``,
+  ``current-run.created-at``, ``latest-change-at``), answering 400 to others
+- 429 Too Many Requests above a configurable request rate, with TFC's
+  ``X-RateLimit-*`` headers
+- a fixed latency injected before every response
+
+State versions and logs are served from a second origin (``localhost`` rather
+than ``127.0.0.1``), the way TFC hands out signed archive URLs on another host.
+
+Example:
+    with TFCStandIn(SyntheticOrganization(workspaces=2_000), latency=0.005) as server:
+        client = server.client(max_inflight=8)
+        workspaces, _ = client.workspaces.list()
+"""
+
+from __future__ import annotations
+
+import datetime
+import fnmatch
+import json
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from terrapyne.api.client import TFCClient
+from terrapyne.core.credentials import TerraformCredentials
+from tests.fixtures.factories import (
+    project_response,
+    run_response,
+    team_project_access_response,
+    team_response,
+    workspace_response,
+)
+
+# Page size of a listing without page[size], and the largest one the API accepts
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Token every stand-in client sends (any bearer token is accepted)
+STAND_IN_TOKEN = "stand-in-token"
+
+# Path prefix of the signed archive URLs (state files and logs)
+ARCHIVIST = "/_archivist"
+
+# To-one relationships by which resources are indexed under their parent
+_PARENTS = ("workspace", "project")
+
+# Statuses of the runs that did not error, oldest to newest
+_RUN_STATUSES = ("applied", "planned_and_finished", "applied", "discarded")
+
+
+def _timestamp(moment: datetime.datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def synthetic_state(serial: int, resources: int, lineage: str = "stand-in") -> dict[str, Any]:
+    """A Terraform state (format 4) with ``resources`` managed resources.
+
+    Args:
+        serial: State serial; attribute values change with it, as after an apply
+        resources: Number of resources (each with one instance)
+        lineage: State lineage
+
+    Returns:
+        State as it is downloaded from the hosted-state-download-url
+    """
+    return {
+        "version": 4,
+        "terraform_version": "1.7.0",
+        "serial": serial,
+        "lineage": lineage,
+        "outputs": {"resource_count": {"value": resources, "type": "number"}},
+        "resources": [
+            {
+                "mode": "managed",
+                "type": "aws_s3_bucket" if i % 2 else "aws_instance",
+                "name": f"r{i}",
+                "provider": 'provider["registry.terraform.io/hashicorp/aws"]',
+                "instances": [
+                    {
+                        "schema_version": 0,
+                        "attributes": {
+                            "id": f"id-{i}",
+                            "arn": f"arn:aws:s3:::bucket-{i}",
+                            "tags": {"Name": f"r{i}", "Serial": str(serial)},
+                            "size": i % 64,
+                        },
+                    }
+                ],
+            }
+            for i in range(resources)
+        ],
+    }
+
+
+@dataclass
+class SyntheticOrganization:
+    """A generated organization of configurable size.
+
+    Every workspace belongs to a project (round robin), has
+    ``runs_per_workspace`` runs (one in every ``errored_every`` errored) and
+    ``state_versions_per_workspace`` state versions; every project grants
+    access to ``teams_per_project`` teams.
+    """
+
+    name: str = "bench-org"
+    projects: int = 10
+    workspaces: int = 500
+    runs_per_workspace: int = 5
+    state_versions_per_workspace: int = 2
+    teams: int = 20
+    teams_per_project: int = 3
+    errored_every: int = 7
+    state_resources: int = 50
+    log_lines: int = 200
+    now: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+
+    def __post_init__(self) -> None:
+        self.resources: dict[tuple[str, str], dict[str, Any]] = {}
+        self.by_type: dict[str, list[dict[str, Any]]] = {}
+        self.by_parent: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        self._generate()
+        self.workspace_names = {w["attributes"]["name"]: w for w in self.of_type("workspaces")}
+        # The organization runs listing is newest first
+        self.runs_newest_first = sorted(
+            self.of_type("runs"), key=lambda r: r["attributes"]["created-at"], reverse=True
+        )
+
+    def add(self, resource: dict[str, Any]) -> dict[str, Any]:
+        """Register a resource (by type and ID) and return it."""
+        self.resources[resource["type"], resource["id"]] = resource
+        self.by_type.setdefault(resource["type"], []).append(resource)
+        for parent in _PARENTS:
+            data = resource.get("relationships", {}).get(parent, {}).get("data")
+            if data:
+                self.by_parent.setdefault((resource["type"], data["id"]), []).append(resource)
+        return resource
+
+    def _generate(self) -> None:
+        for p in range(self.projects):
+            project = project_response(
+                id=f"prj-{p:06d}", name=f"project-{p:03d}", organization_id=self.name
+            )["data"]
+            project["attributes"]["workspace-count"] = len(range(p, self.workspaces, self.projects))
+            self.add(project)
+        for t in range(self.teams):
+            self.add(team_response(id=f"team-{t:05d}", name=f"team-{t:03d}")["data"])
+        for p in range(self.projects):
+            for k in range(min(self.teams_per_project, self.teams)):
+                team_id = f"team-{(p + k) % self.teams:05d}"
+                access = team_project_access_response(
+                    id=f"tprj-{p:06d}{k:02d}", team_id=team_id, project_id=f"prj-{p:06d}"
+                )["data"]
+                access["relationships"]["team"].pop("links")
+                self.add(access)
+        for w in range(self.workspaces):
+            self._generate_workspace(w)
+
+    def _generate_workspace(self, w: int) -> None:
+        workspace_id = f"ws-{w:08d}"
+        # Workspaces are spread over the last week; runs over the hours before each update
+        updated = self.now - datetime.timedelta(seconds=w * 600_000 // max(self.workspaces, 1))
+        runs = []
+        for r in range(self.runs_per_workspace):
+            run_id = f"run-{w:08d}{r:03d}"
+            created = updated - datetime.timedelta(minutes=30 * (self.runs_per_workspace - r))
+            ordinal = w * self.runs_per_workspace + r
+            errored = self.errored_every > 0 and ordinal % self.errored_every == 0
+            run = run_response(
+                id=run_id,
+                status="errored" if errored else _RUN_STATUSES[ordinal % len(_RUN_STATUSES)],
+                message=f"Triggered run {r} of workspace {w}",
+                workspace_id=workspace_id,
+                **{"created-at": _timestamp(created), "updated-at": _timestamp(created)},
+            )["data"]
+            run["relationships"]["plan"] = {"data": {"id": f"plan-{w:08d}{r:03d}", "type": "plans"}}
+            run["relationships"]["apply"] = {
+                "data": {"id": f"apply-{w:08d}{r:03d}", "type": "applies"}
+            }
+            runs.append(self.add(run))
+            self.add(
+                {
+                    "id": f"plan-{w:08d}{r:03d}",
+                    "type": "plans",
+                    "attributes": {
+                        "status": "errored" if errored else "finished",
+                        "has-changes": True,
+                        "resource-additions": 3,
+                        "resource-changes": 2,
+                        "resource-destructions": 0,
+                        "log-read-url": f"{ARCHIVIST}/logs/plan-{w:08d}{r:03d}",
+                    },
+                }
+            )
+            self.add(
+                {
+                    "id": f"apply-{w:08d}{r:03d}",
+                    "type": "applies",
+                    "attributes": {
+                        "status": "finished",
+                        "log-read-url": f"{ARCHIVIST}/logs/apply-{w:08d}{r:03d}",
+                    },
+                }
+            )
+        state_versions = []
+        for s in range(self.state_versions_per_workspace):
+            state_version_id = f"sv-{w:08d}{s:03d}"
+            state_versions.append(
+                self.add(
+                    {
+                        "id": state_version_id,
+                        "type": "state-versions",
+                        "attributes": {
+                            "serial": s + 1,
+                            "created-at": _timestamp(updated - datetime.timedelta(hours=s)),
+                            "status": "finalized",
+                            "resource-count": self.state_resources,
+                            "hosted-state-download-url": f"{ARCHIVIST}/state/{state_version_id}",
+                        },
+                        "relationships": {
+                            "workspace": {"data": {"id": workspace_id, "type": "workspaces"}},
+                            "run": {"data": None},
+                        },
+                    }
+                )
+            )
+        workspace = workspace_response(
+            id=workspace_id,
+            name=f"app-{w:06d}",
+            project_id=f"prj-{w % max(self.projects, 1):06d}",
+            **{"updated-at": _timestamp(updated)},
+        )["data"]
+        # When the newest state version was created, else when the workspace was
+        attributes = workspace["attributes"]
+        attributes["latest-change-at"] = (
+            _timestamp(updated) if state_versions else attributes["created-at"]
+        )
+        if runs:
+            workspace["relationships"]["latest-run"] = {
+                "data": {"id": runs[-1]["id"], "type": "runs"}
+            }
+        if state_versions:
+            workspace["relationships"]["current-state-version"] = {
+                "data": {"id": state_versions[-1]["id"], "type": "state-versions"}
+            }
+        self.add(workspace)
+
+    def of_type(self, type_: str) -> list[dict[str, Any]]:
+        """Resources of one JSON:API type, in generation order."""
+        return self.by_type.get(type_, [])
+
+    def children(self, type_: str, parent_id: str) -> list[dict[str, Any]]:
+        """Resources of one type belonging to a workspace or project, in generation order."""
+        return self.by_parent.get((type_, parent_id), [])
+
+    def get(self, type_: str, id_: str) -> dict[str, Any] | None:
+        """A resource by type and ID."""
+        return self.resources.get((type_, id_))
+
+    def related(self, resource: dict[str, Any], relationship: str) -> dict[str, Any] | None:
+        """The resource a to-one relationship points at."""
+        data = resource.get("relationships", {}).get(relationship, {}).get("data")
+        return self.get(data["type"], data["id"]) if data else None
+
+    def workspace_by_name(self, name: str) -> dict[str, Any] | None:
+        """A workspace by name."""
+        return self.workspace_names.get(name)
+
+
+class RequestThrottle:
+    """Token bucket answering 429 above ``rate`` requests per second (0 for no limit)."""
+
+    def __init__(self, rate: float, burst: int = 30):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> tuple[bool, float]:
+        """Take a token: (allowed, seconds until the bucket is full again, like TFC's reset)."""
+        if self.rate <= 0:
+            return True, 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True, 0.0
+            return False, (self.burst - self.tokens) / self.rate
+
+
+class TFCStandIn:
+    """HTTP server answering TFC API requests from a ``SyntheticOrganization``.
+
+    ``requests`` counts the requests served per method and path (IDs and names
+    included), ``throttled`` the requests answered 429.
+    """
+
+    def __init__(
+        self,
+        organization: SyntheticOrganization | None = None,
+        *,
+        latency: float = 0.0,
+        rate_limit: float = 0.0,
+    ):
+        """Initialize the stand-in (it listens once started).
+
+        Args:
+            organization: Organization to serve (default: ``SyntheticOrganization()``)
+            latency: Seconds every response is delayed by
+            rate_limit: Requests per second above which requests are answered 429
+                (0 for no limit)
+        """
+        self.org = organization or SyntheticOrganization()
+        self.latency = latency
+        self.throttle = RequestThrottle(rate_limit)
+        self.requests: Counter[str] = Counter()
+        self.throttled = 0
+        self._state_bodies: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("The stand-in server is not running")
+        return self._server.server_address[1]
+
+    @property
+    def origin(self) -> str:
+        """Origin of the API (pass as ``api_origin``)."""
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def blob_origin(self) -> str:
+        """Origin of the signed archive URLs (another host name for the same server)."""
+        return f"http://localhost:{self.port}"
+
+    def start(self) -> TFCStandIn:
+        """Listen on a free local port and serve from a background thread."""
+        handler = type("Handler", (_Handler,), {"stand_in": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> TFCStandIn:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def client(self, **kwargs: Any) -> TFCClient:
+        """A client of the stand-in for its organization (kwargs go to TFCClient)."""
+        kwargs.setdefault("organization", self.org.name)
+        kwargs.setdefault("rate_limit", 0)
+        return TFCClient(
+            credentials=TerraformCredentials(host="127.0.0.1", token=STAND_IN_TOKEN),
+            api_origin=self.origin,
+            **kwargs,
+        )
+
+    def env(self) -> dict[str, str]:
+        """Environment under which `tfc` talks to the stand-in."""
+        return {
+            "TERRAPYNE_API_ORIGIN": self.origin,
+            "TFC_TOKEN": STAND_IN_TOKEN,
+            "TERRAPYNE_RATE_LIMIT": "0",
+        }
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.requests[path] += 1
+
+    def count_throttled(self) -> None:
+        with self._lock:
+            self.throttled += 1
+
+    def reset_counts(self) -> None:
+        """Forget the requests served so far."""
+        with self._lock:
+            self.requests.clear()
+            self.throttled = 0
+
+    def route(self, path: str, params: dict[str, str]) -> tuple[int, Any]:
+        """Answer an API GET: (status, JSON:API document)."""
+        org = self.org
+        segments = path.strip("/").split("/")
+        match segments:
+            case ["organizations", name, collection] if name == org.name:
+                return self._organization_listing(path, collection, params)
+            case ["organizations", name, "workspaces", workspace_name] if name == org.name:
+                return self._document(org.workspace_by_name(workspace_name), params)
+            case ["workspaces", workspace_id, "runs"]:
+                runs = org.children("runs", workspace_id)[::-1]
+                return self._listing(path, _filter_status(runs, params), params)
+            case ["workspaces", workspace_id, "current-state-version"]:
+                workspace = org.get("workspaces", workspace_id)
+                related = org.related(workspace, "current-state-version") if workspace else None
+                return self._document(related, params)
+            case ["team-projects"]:
+                project_id = params.get("filter[project][id]")
+                accesses = org.children("team-projects", project_id or "")
+                return self._listing(path, accesses, params)
+            case ["state-versions"]:
+                workspace = org.workspace_by_name(params.get("filter[workspace][name]", ""))
+                versions = (
+                    org.children("state-versions", workspace["id"])[::-1] if workspace else []
+                )
+                return self._listing(path, versions, params)
+            case [collection, resource_id]:
+                return self._document(org.get(collection, resource_id), params)
+        return 404, _errors(404, "not found")
+
+    def _organization_listing(
+        self, path: str, collection: str, params: dict[str, str]
+    ) -> tuple[int, Any]:
+        items = self.org.of_type(collection)
+        if collection == "workspaces":
+            items = _filter_workspaces(items, params)
+            if "sort" in params:
+                key = self._workspace_sort_key(params["sort"].removeprefix("-"))
+                if key is None:
+                    return 400, _errors(400, f"invalid sort parameter: {params['sort']}")
+                items = sorted(items, key=key, reverse=params["sort"].startswith("-"))
+        elif collection == "runs":
+            items = self._filter_org_runs(params)
+        elif collection in ("projects", "teams"):
+            items = _filter_named(items, params)
+        else:
+            return 404, _errors(404, "not found")
+        return self._listing(path, items, params)
+
+    def _workspace_sort_key(self, sort: str) -> Callable[[dict[str, Any]], str] | None:
+        """Sort key of a workspace listing ``sort`` value, or None if TFC does not support it."""
+        if sort == "current-run.created-at":
+            org = self.org
+            return lambda w: (
+                (org.related(w, "latest-run") or {}).get("attributes", {}).get("created-at", "")
+            )
+        if sort in ("name", "latest-change-at"):
+            return lambda w: w["attributes"][sort]
+        return None
+
+    def _filter_org_runs(self, params: dict[str, str]) -> list[dict[str, Any]]:
+        org = self.org
+        runs = _filter_status(org.runs_newest_first, params)
+        workspace_names = params.get("filter[workspace_names]")
+        project_names = params.get("filter[project_names]")
+        if not (workspace_names or project_names):
+            return runs
+        keep = set()
+        for workspace in org.of_type("workspaces"):
+            project = org.related(workspace, "project")
+            if workspace_names and workspace["attributes"]["name"] in workspace_names.split(","):
+                keep.add(workspace["id"])
+            if (
+                project_names
+                and project
+                and project["attributes"]["name"] in project_names.split(",")
+            ):
+                keep.add(workspace["id"])
+        return [r for r in runs if r["relationships"]["workspace"]["data"]["id"] in keep]
+
+    def _document(self, resource: dict[str, Any] | None, params: dict[str, str]) -> tuple[int, Any]:
+        if resource is None:
+            return 404, _errors(404, "not found")
+        document: dict[str, Any] = {"data": resource}
+        included = self._included([resource], params.get("include"))
+        if included:
+            document["included"] = included
+        return 200, document
+
+    def _listing(
+        self, path: str, items: list[dict[str, Any]], params: dict[str, str]
+    ) -> tuple[int, Any]:
+        size = min(int(params.get("page[size]", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        number = max(1, int(params.get("page[number]", 1)))
+        total_pages = max(1, -(-len(items) // size))
+        page = items[(number - 1) * size : number * size]
+        next_page = number + 1 if number < total_pages else None
+        prev_page = number - 1 if number > 1 else None
+        return 200, {
+            "data": page,
+            "included": self._included(page, params.get("include")),
+            "links": {
+                "first": self._page_link(path, params, 1),
+                "prev": self._page_link(path, params, prev_page),
+                "next": self._page_link(path, params, next_page),
+                "last": self._page_link(path, params, total_pages),
+            },
+            "meta": {
+                "pagination": {
+                    "current-page": number,
+                    "page-size": size,
+                    "prev-page": prev_page,
+                    "next-page": next_page,
+                    "total-pages": total_pages,
+                    "total-count": len(items),
+                }
+            },
+        }
+
+    def _page_link(self, path: str, params: dict[str, str], page: int | None) -> str | None:
+        if page is None:
+            return None
+        return f"{self.origin}/api/v2{path}?{urlencode({**params, 'page[number]': page})}"
+
+    def _included(self, items: list[dict[str, Any]], include: str | None) -> list[dict[str, Any]]:
+        if not include:
+            return []
+        seen: dict[tuple[str, str], dict[str, Any]] = {}
+        for relationship in include.split(","):
+            key = relationship.strip().replace("_", "-")
+            for item in items:
+                related = self.org.related(item, key)
+                if related is not None:
+                    seen.setdefault((related["type"], related["id"]), related)
+        return list(seen.values())
+
+    def _state_body(self, version: dict[str, Any]) -> bytes:
+        """A state version's file, generated on first download."""
+        with self._lock:
+            body = self._state_bodies.get(version["id"])
+        if body is None:
+            state = synthetic_state(
+                version["attributes"]["serial"],
+                self.org.state_resources,
+                lineage=version["relationships"]["workspace"]["data"]["id"],
+            )
+            body = json.dumps(state).encode()
+            with self._lock:
+                self._state_bodies[version["id"]] = body
+        return body
+
+    def archive(self, path: str) -> tuple[int, str, bytes]:
+        """Answer a signed archive URL: (status, content type, body)."""
+        match path.removeprefix(ARCHIVIST).strip("/").split("/"):
+            case ["state", state_version_id]:
+                version = self.org.get("state-versions", state_version_id)
+                if version is not None:
+                    return 200, "application/json", self._state_body(version)
+            case ["logs", log_id]:
+                if self.org.get("plans", log_id) or self.org.get("applies", log_id):
+                    return 200, "text/plain", _log(log_id, self.org.log_lines).encode()
+        return 404, "text/plain", b"not found"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler bound to one ``TFCStandIn`` (set on a subclass by ``start``)."""
+
+    stand_in: TFCStandIn
+    protocol_version = "HTTP/1.1"  # keep-alive, as the client pools connections
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        stand_in = self.stand_in
+        url = urlsplit(self.path)
+        stand_in.count(f"GET {url.path}")
+        if stand_in.latency:
+            time.sleep(stand_in.latency)
+
+        if url.path.startswith(ARCHIVIST):
+            status, content_type, body = stand_in.archive(url.path)
+            self._send(status, body, content_type)
+            return
+
+        allowed, wait = stand_in.throttle.take()
+        headers = {}
+        if stand_in.throttle.rate > 0:
+            headers = {
+                "X-RateLimit-Limit": str(int(stand_in.throttle.rate)),
+                "X-RateLimit-Remaining": str(int(stand_in.throttle.tokens)),
+                "X-RateLimit-Reset": f"{wait:.3f}",
+            }
+        if not allowed:
+            stand_in.count_throttled()
+            self._send_json(429, _errors(429, "Too many requests"), headers)
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send_json(401, _errors(401, "unauthorized"), headers)
+            return
+
+        path = url.path.removeprefix("/api/v2")
+        params = dict(parse_qsl(url.query))
+        match path.strip("/").split("/"):
+            case ["plans" | "applies", log_id, "logs"]:
+                # TFC redirects log reads to the archive host
+                location = f"{stand_in.blob_origin}{ARCHIVIST}/logs/{log_id}"
+                self._send(307, b"", headers={**headers, "Location": location})
+                return
+
+        status, document = stand_in.route(path, params)
+        self._send_json(status, document, headers)
+
+    def _send_json(self, status: int, document: Any, headers: dict[str, str]) -> None:
+        # Archive URLs are generated relative; they point at the archive host once served
+        body = json.dumps(document).replace(
+            f'"{ARCHIVIST}/', f'"{self.stand_in.blob_origin}{ARCHIVIST}/'
+        )
+        self._send(status, body.encode(), "application/vnd.api+json", headers)
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str = "text/plain",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _errors(status: int, title: str) -> dict[str, Any]:
+    return {"errors": [{"status": str(status), "title": title}]}
+
+
+def _filter_status(runs: list[dict[str, Any]], params: dict[str, str]) -> list[dict[str, Any]]:
+    statuses = params.get("filter[status]")
+    if not statuses:
+        return runs
+    wanted = set(statuses.split(","))
+    return [r for r in runs if r["attributes"]["status"] in wanted]
+
+
+def _filter_workspaces(
+    workspaces: list[dict[str, Any]], params: dict[str, str]
+) -> list[dict[str, Any]]:
+    project_id = params.get("filter[project][id]")
+    if project_id:
+        workspaces = [
+            w for w in workspaces if w["relationships"]["project"]["data"]["id"] == project_id
+        ]
+    if "search[wildcard-name]" in params:
+        pattern = params["search[wildcard-name]"].lower()
+        workspaces = [w for w in workspaces if fnmatch.fnmatch(w["attributes"]["name"], pattern)]
+    if "search[name]" in params:
+        needle = params["search[name]"].lower()
+        workspaces = [w for w in workspaces if needle in w["attributes"]["name"].lower()]
+    return workspaces
+
+
+def _filter_named(items: list[dict[str, Any]], params: dict[str, str]) -> list[dict[str, Any]]:
+    if "filter[names]" in params:
+        names = set(params["filter[names]"].split(","))
+        return [i for i in items if i["attributes"]["name"] in names]
+    if params.get("q"):
+        needle = params["q"].lower()
+        return [i for i in items if needle in i["attributes"]["name"].lower()]
+    return items
+
+
+def _log(log_id: str, lines: int) -> str:
+    """A plan or apply log of ``lines`` lines (an errored plan ends in an error box)."""
+    body = [f"aws_s3_bucket.r{i}: Refreshing state... [id=id-{i}]" for i in range(lines)]
+    body.append("")
+    body.append("Error: creating resource: AccessDenied")
+    return "\n".join([f"Terraform v1.7.0 ({log_id})", *body]) + "\n"
@@ -0,0 +1,312 @@
+"""Tests for AsyncTFCClient and the async API facades."""
+
+import asyncio
+import io
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from terrapyne.api.async_client import AsyncTFCClient
+from terrapyne.core.credentials import TerraformCredentials
+from terrapyne.core.exceptions import TFCConflictError, TFCNotFoundError, TFCServerError
+
+BASE = "https://app.terraform.io/api/v2"
+
+
+@pytest.fixture
+def creds():
+    return TerraformCredentials(host="app.terraform.io", token="test-token")
+
+
+def _workspace(ws_id: str, name: str, vcs: dict | None = None) -> dict:
+    attrs: dict = {"name": name}
+    if vcs:
+        attrs["vcs-repo"] = vcs
+    return {"id": ws_id, "type": "workspaces", "attributes": attrs}
+
+
+@pytest.mark.asyncio
+async def test_get_sends_auth_header_and_returns_json(httpx_mock, creds):
+    httpx_mock.add_response(
+        url=f"{BASE}/runs/run-1", json={"data": {"id": "run-1", "attributes": {}}}
+    )
+
+    async with AsyncTFCClient(organization="org", credentials=creds) as client:
+        data = await client.get("/runs/run-1")
+
+    assert data["data"]["id"] == "run-1"
+    request = httpx_mock.get_request()
+    assert request.headers["Authorization"] == "Bearer test-token"
+
+
+@pytest.mark.asyncio
+async def test_download_streams_body_to_destination(httpx_mock, creds):
+    url = "https://archivist.terraform.io/v1/object/state-1"
+    httpx_mock.add_response(url=url, content=b'{"version": 4}')
+    destination = io.BytesIO()
+
+    async with AsyncTFCClient(organization="org", credentials=creds) as client:
+        written = await client.download(url, destination)
+
+    assert written == len(b'{"version": 4}')
+    assert destination.getvalue() == b'{"version": 4}'
+
+
+@pytest.mark.asyncio
+async def test_error_mapping_matches_sync_client(httpx_mock, creds):
+    httpx_mock.add_response(url=f"{BASE}/workspaces/missing", status_code=404)
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        with pytest.raises(TFCNotFoundError):
+            await client._request("GET", "/workspaces/missing")
+
+
+@pytest.mark.asyncio
+async def test_post_409_does_not_retry(httpx_mock, creds):
+    httpx_mock.add_response(url=f"{BASE}/workspaces", method="POST", status_code=409)
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        with pytest.raises(TFCConflictError):
+            await client.post("/workspaces", json_data={"data": {}})
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_429_waits_for_retry_after(httpx_mock, creds):
+    httpx_mock.add_response(url=f"{BASE}/runs/run-1", status_code=429, headers={"Retry-After": "3"})
+    httpx_mock.add_response(url=f"{BASE}/runs/run-1", json={"data": {"id": "run-1"}})
+
+    with patch("terrapyne.api.ratelimit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        async with AsyncTFCClient(credentials=creds) as client:
+            data = await client.get("/runs/run-1")
+
+    assert data["data"]["id"] == "run-1"
+    assert mock_sleep.await_args.args[0] == pytest.approx(3, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_post_500_retries(httpx_mock, creds):
+    httpx_mock.add_response(url=f"{BASE}/runs", method="POST", status_code=500, is_reusable=True)
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        with patch("asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(TFCServerError):
+                await client.post("/runs", json_data={"data": {}})
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_with_meta_follows_pages(httpx_mock, creds):
+    path = f"{BASE}/organizations/org/workspaces"
+    httpx_mock.add_response(
+        url=re.compile(re.escape(path) + r"\?.*page%5Bnumber%5D=1.*"),
+        json={
+            "data": [_workspace("ws-1", "a")],
+            "included": [{"id": "prj-1", "type": "projects"}],
+            "links": {"next": "page2"},
+            "meta": {"pagination": {"total-count": 2}},
+        },
+    )
+    httpx_mock.add_response(
+        url=re.compile(re.escape(path) + r"\?.*page%5Bnumber%5D=2.*"),
+        json={"data": [_workspace("ws-2", "b")], "included": [], "links": {"next": None}},
+    )
+
+    async with AsyncTFCClient(organization="org", credentials=creds) as client:
+        workspaces, total = await client.workspaces.list()
+        names = [ws.name async for ws in workspaces]
+
+    assert total == 2
+    assert names == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_client(httpx_mock, creds):
+    for i in range(5):
+        httpx_mock.add_response(
+            url=f"{BASE}/runs/run-{i}",
+            json={"data": {"id": f"run-{i}", "attributes": {"status": "applied"}}},
+        )
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        runs = await asyncio.gather(*(client.runs.get(f"run-{i}") for i in range(5)))
+
+    assert [r.id for r in runs] == [f"run-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_runs_create_payload_matches_sync(httpx_mock, creds):
+    httpx_mock.add_response(
+        url=f"{BASE}/runs",
+        method="POST",
+        json={"data": {"id": "run-new", "attributes": {"status": "pending"}}},
+    )
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        run = await client.runs.create("ws-1", message="hi", target_addrs=["a.b"])
+
+    assert run.id == "run-new"
+    body = json.loads(httpx_mock.get_request().content)
+    attrs = body["data"]["attributes"]
+    assert attrs["message"] == "hi"
+    assert attrs["target-addrs"] == ["a.b"]
+    assert body["data"]["relationships"]["workspace"]["data"]["id"] == "ws-1"
+
+
+@pytest.mark.asyncio
+async def test_poll_until_complete_uses_asyncio_sleep(creds):
+    client = AsyncTFCClient(credentials=creds)
+    responses = [
+        {"data": {"id": "run-1", "attributes": {"status": "planning"}}},
+        {"data": {"id": "run-1", "attributes": {"status": "applied"}}},
+    ]
+    with (
+        patch.object(AsyncTFCClient, "get", new=AsyncMock(side_effect=responses)),
+        patch("terrapyne.api.runs.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        run = await client.runs.poll_until_complete("run-1")
+
+    assert run.status.value == "applied"
+    mock_sleep.assert_awaited_once_with(2)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_vcs_list_repositories_groups_by_repo(creds):
+    client = AsyncTFCClient(organization="org", credentials=creds)
+    github = {
+        "identifier": "acme/app",
+        "service-provider": "github",
+        "repository-http-url": "https://github.com/acme/app",
+    }
+
+    sparse = {"identifier": "acme/app"}  # no service provider: looked up individually
+
+    async def fake_get(path, params=None):
+        if path == "/organizations/org/workspaces":
+            return {
+                "data": [
+                    _workspace("ws-1", "one", github),
+                    _workspace("ws-2", "two", sparse),
+                    _workspace("ws-3", "three"),
+                ],
+                "meta": {"pagination": {"total-count": 3}},
+            }
+        return {"data": _workspace(path.rsplit("/", 1)[-1], "x", github)}
+
+    mock_get = AsyncMock(side_effect=fake_get)
+    with patch.object(AsyncTFCClient, "get", new=mock_get):
+        repos = await client.vcs.list_repositories("org")
+
+    assert [c.args[0] for c in mock_get.await_args_list] == [
+        "/organizations/org/workspaces",
+        "/workspaces/ws-2",
+    ]
+
+    assert repos == [
+        {
+            "identifier": "acme/app",
+            "url": "https://github.com/acme/app",
+            "workspaces": ["one", "two"],
+        }
+    ]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_vcs_list_repositories_bounds_concurrent_lookups(creds):
+    client = AsyncTFCClient(organization="org", credentials=creds)
+    sparse = {"identifier": "acme/app"}
+    in_flight = peak = 0
+
+    async def fake_get(path, params=None):
+        nonlocal in_flight, peak
+        if path == "/organizations/org/workspaces":
+            return {
+                "data": [_workspace(f"ws-{i}", f"ws{i}", sparse) for i in range(10)],
+                "meta": {"pagination": {"total-count": 10}},
+            }
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"data": _workspace(path.rsplit("/", 1)[-1], "x", sparse)}
+
+    with patch.object(AsyncTFCClient, "get", new=AsyncMock(side_effect=fake_get)):
+        await client.vcs.list_repositories("org", concurrency=3)
+
+    assert peak == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_teams_set_project_access_rejects_invalid_level(creds):
+    async with AsyncTFCClient(credentials=creds) as client:
+        with pytest.raises(ValueError, match="Invalid access level"):
+            await client.teams.set_project_access("prj-1", "team-1", "superuser")
+
+
+@pytest.mark.asyncio
+async def test_projects_list_team_access_resolves_names_in_batch(httpx_mock, creds):
+    def access(team_id: str) -> dict:
+        return {
+            "id": f"tpa-{team_id}",
+            "type": "team-projects",
+            "attributes": {"access": "read"},
+            "relationships": {"team": {"data": {"id": team_id, "type": "teams"}}},
+        }
+
+    httpx_mock.add_response(
+        url=re.compile(rf"{BASE}/team-projects\?.*include=team.*"),
+        json={
+            "data": [access("team-1"), access("team-2")],
+            "included": [{"id": "team-1", "type": "teams", "attributes": {"name": "platform"}}],
+            "links": {},
+        },
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/teams/team-2",
+        json={"data": {"id": "team-2", "type": "teams", "attributes": {"name": "security"}}},
+    )
+
+    async with AsyncTFCClient(credentials=creds) as client:
+        access_list = await client.projects.list_team_access("prj-1")
+
+    assert [a.team_name for a in access_list] == ["platform", "security"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_async_client_exported():
+    import terrapyne
+    from terrapyne.api import AsyncTFCClient as FromApi
+
+    assert terrapyne.AsyncTFCClient is AsyncTFCClient
+    assert FromApi is AsyncTFCClient
+
+
+@pytest.mark.asyncio
+async def test_paginate_with_meta_prefetches_in_order(creds):
+    client = AsyncTFCClient(credentials=creds, max_inflight=3)
+
+    async def fake_get(path, params=None):
+        page = params["page[number]"]
+        # Later pages complete first
+        await asyncio.sleep(0.01 * (5 - page))
+        return {
+            "data": [{"id": f"item-{page}"}],
+            "links": {"next": "more" if page < 5 else None},
+            "meta": {"pagination": {"total-count": 5, "total-pages": 5}},
+        }
+
+    with patch.object(AsyncTFCClient, "get", new=AsyncMock(side_effect=fake_get)) as mock_get:
+        items, total = await client.paginate_with_meta("/workspaces", page_size=1)
+        ids = [item["id"] async for item in items]
+
+    assert total == 5
+    assert ids == [f"item-{p}" for p in range(1, 6)]
+    assert mock_get.await_count == 5
+    await client.aclose()
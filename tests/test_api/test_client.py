@@ -3,12 +3,14 @@
 Tests the HTTP client, authentication, and pagination logic.
 """
 
+import importlib.util
 from unittest.mock import patch
 
 import httpx
 import pytest
 
-from terrapyne.api.client import TFCClient
+from terrapyne.api.client import API_LIMITS, API_TIMEOUT, TFCClient
+from terrapyne.api.ratelimit import RateLimitGovernor
 from terrapyne.core.credentials import TerraformCredentials
 from terrapyne.core.exceptions import (
     TFCAPIError,
@@ -18,6 +20,7 @@ from terrapyne.core.exceptions import (
     TFCRateLimitError,
     TFCServerError,
 )
+from terrapyne.models.utils import IncludedResources
 
 
 class TestTFCClientInitialization:
@@ -297,3 +300,270 @@ class TestRetryLogic:
                 client.post("/runs", json_data={"data": {}})
 
         assert call_count == 3, f"POST on 500 should retry 3 times, got {call_count}"
+
+    def test_get_404_does_not_retry(self):
+        """Client errors are not transient; only 5xx (and paced 429s) are retried."""
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        request = httpx.Request("GET", "https://app.terraform.io/api/v2/workspaces/ws-x")
+
+        with patch.object(
+            client.client, "request", return_value=httpx.Response(404, request=request)
+        ) as mock_request:
+            with pytest.raises(TFCNotFoundError):
+                client.get("/workspaces/ws-x")
+
+        assert mock_request.call_count == 1
+
+    def test_429_honours_retry_after(self):
+        """A 429 waits exactly Retry-After before retrying, even for POST."""
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        request = httpx.Request("POST", "https://app.terraform.io/api/v2/runs")
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}, request=request),
+            httpx.Response(201, json={"data": {"id": "run-1"}}, request=request),
+        ]
+
+        with (
+            patch.object(client.client, "request", side_effect=responses),
+            patch("terrapyne.api.ratelimit.time.sleep") as mock_sleep,
+        ):
+            assert client.post("/runs", json_data={"data": {}}) == {"data": {"id": "run-1"}}
+
+        [call] = mock_sleep.call_args_list
+        assert call.args[0] == pytest.approx(7, abs=0.1)
+
+    def test_429_raises_after_max_retries(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        request = httpx.Request("GET", "https://app.terraform.io/api/v2/runs/run-1")
+
+        with (
+            patch.object(
+                client.client,
+                "request",
+                return_value=httpx.Response(429, headers={"Retry-After": "1"}, request=request),
+            ) as mock_request,
+            patch("terrapyne.api.ratelimit.time.sleep"),
+        ):
+            with pytest.raises(TFCRateLimitError):
+                client.get("/runs/run-1")
+
+        assert mock_request.call_count == 6
+
+    def test_requests_are_paced_by_shared_governor(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        # A frozen clock so no tokens refill between requests
+        client.rate_limiter = RateLimitGovernor(rate=5, burst=2, clock=lambda: 100.0)
+        request = httpx.Request("GET", "https://app.terraform.io/api/v2/runs/run-1")
+        ok = httpx.Response(200, json={"data": {}}, request=request)
+
+        with (
+            patch.object(client.client, "request", return_value=ok),
+            patch("terrapyne.api.ratelimit.time.sleep") as mock_sleep,
+        ):
+            for _ in range(3):
+                client.get("/runs/run-1")
+
+        [call] = mock_sleep.call_args_list
+        assert call.args[0] == pytest.approx(0.2)
+
+
+class TestPaginationPrefetch:
+    """Test concurrent page prefetch in paginate_with_meta."""
+
+    @staticmethod
+    def _pages(total_pages: int, per_page: int = 2, advertised: int | None = None):
+        """Build a fake GET that serves numbered pages and records concurrency."""
+        import threading
+        import time
+
+        advertised = total_pages if advertised is None else advertised
+        state = {"inflight": 0, "peak": 0, "calls": []}
+        lock = threading.Lock()
+
+        def fake_get(path, params=None):
+            page = params["page[number]"]
+            with lock:
+                state["inflight"] += 1
+                state["peak"] = max(state["peak"], state["inflight"])
+                state["calls"].append(page)
+            if page > 1:
+                # Later pages finish first to prove ordering does not depend on timing
+                time.sleep(0.01 * (total_pages - page + 1))
+            with lock:
+                state["inflight"] -= 1
+            return {
+                "data": [{"id": f"item-{page}-{i}"} for i in range(per_page)],
+                "included": [{"id": f"inc-{page}"}],
+                "links": {"next": "more" if page < total_pages else None},
+                "meta": {
+                    "pagination": {"total-count": advertised * per_page, "total-pages": advertised}
+                },
+            }
+
+        return fake_get, state
+
+    def test_prefetch_yields_items_in_page_order(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds, max_inflight=4)
+        fake_get, state = self._pages(6)
+
+        with patch.object(TFCClient, "get", side_effect=fake_get):
+            items, total = client.paginate_with_meta("/workspaces", page_size=2)
+            seen = []
+            for item in items:
+                page = item["id"].split("-")[1]
+                assert items.included == [{"id": f"inc-{page}"}]
+                assert isinstance(items.included, IncludedResources)
+                seen.append(item["id"])
+
+        assert total == 12
+        assert seen == [f"item-{p}-{i}" for p in range(1, 7) for i in range(2)]
+        assert sorted(state["calls"]) == [1, 2, 3, 4, 5, 6]
+        assert 1 < state["peak"] <= 4
+
+    def test_default_is_sequential(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        fake_get, state = self._pages(4)
+
+        with patch.object(TFCClient, "get", side_effect=fake_get):
+            items, _ = client.paginate_with_meta("/workspaces", page_size=2)
+            assert len(list(items)) == 8
+
+        assert state["calls"] == [1, 2, 3, 4]
+        assert state["peak"] == 1
+
+    def test_prefetch_continues_when_pages_were_added(self):
+        """If the listing grew after page one, remaining pages are fetched sequentially."""
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+        fake_get, state = self._pages(5, advertised=3)
+
+        with patch.object(TFCClient, "get", side_effect=fake_get):
+            items, _ = client.paginate_with_meta("/workspaces", page_size=2, max_inflight=3)
+            assert len(list(items)) == 10
+
+        assert sorted(state["calls"]) == [1, 2, 3, 4, 5]
+
+
+class TestTransport:
+    """Pooled API and blob clients with per-operation timeouts."""
+
+    def test_api_client_options(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds)
+
+        options = client._http_options()
+
+        # HTTP/2 is on whenever the optional h2 package is installed
+        assert options["http2"] is (importlib.util.find_spec("h2") is not None)
+        assert options["limits"] is API_LIMITS
+        assert options["timeout"] is API_TIMEOUT
+        assert options["headers"]["Authorization"] == "Bearer test-token"
+
+    def test_signed_urls_use_blob_client_without_credentials(self, httpx_mock):
+        url = "https://archivist.terraform.io/v1/object/log-1"
+        httpx_mock.add_response(url=url, content=b"log")
+        httpx_mock.add_response(url="https://app.terraform.io/api/v2/runs/run-1", json={})
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+
+        with TFCClient(credentials=creds) as client:
+            client._request("GET", url)
+            client.get("/runs/run-1")
+            assert "blob_client" in client.__dict__
+
+        blob_request, api_request = httpx_mock.get_requests()
+        assert "Authorization" not in blob_request.headers
+        assert api_request.headers["Authorization"] == "Bearer test-token"
+
+    def test_blob_client_created_only_when_needed(self):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        with TFCClient(credentials=creds) as client:
+            assert client._http_for(f"{client.base_url}/runs") is client.client
+        assert "blob_client" not in client.__dict__
+
+    @pytest.mark.slow
+    def test_parallel_pagination_reuses_connections(self):
+        """Benchmark: prefetched pages share a few pooled keep-alive connections."""
+        import json
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        total_pages = 200
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                connections.append(self.client_address)
+                super().setup()
+
+            def do_GET(self):
+                page = int(httpx.URL(self.path).params.get("page[number]", "1"))
+                body = json.dumps(
+                    {
+                        "data": [{"id": f"ws-{page}", "type": "workspaces"}],
+                        "links": {"next": "more" if page < total_pages else None},
+                        "meta": {"pagination": {"total-pages": total_pages}},
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        try:
+            with TFCClient(credentials=creds, rate_limit=0, http2=False) as client:
+                client.api_origin = f"http://127.0.0.1:{server.server_port}"
+                client.base_url = f"{client.api_origin}/api/v2"
+                start = time.perf_counter()
+                items, _ = client.paginate_with_meta("/workspaces", page_size=1, max_inflight=8)
+                ids = [item["id"] for item in items]
+                elapsed = time.perf_counter() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        print(f"\n{total_pages} pages over {len(connections)} connections in {elapsed:.2f}s")
+        assert ids == [f"ws-{page}" for page in range(1, total_pages + 1)]
+        assert len(connections) <= 8
+
+
+class TestDownload:
+    """download() streams a response body to a file object without parsing or caching it."""
+
+    URL = "https://archivist.terraform.io/v1/object/state-1"
+
+    def test_streams_body_to_destination(self, httpx_mock, tmp_path):
+        body = b'{"version": 4, "resources": []}\n' * 1000
+        httpx_mock.add_response(url=self.URL, content=body)
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+
+        with TFCClient(credentials=creds) as client, open(tmp_path / "state.json", "wb") as f:
+            written = client.download(self.URL, f)
+
+        assert written == len(body)
+        assert (tmp_path / "state.json").read_bytes() == body
+
+    def test_error_raised_before_anything_is_written(self, httpx_mock, tmp_path):
+        httpx_mock.add_response(url=self.URL, status_code=404, content=b"not found")
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+
+        with TFCClient(credentials=creds) as client, open(tmp_path / "state.json", "wb") as f:
+            with pytest.raises(TFCNotFoundError):
+                client.download(self.URL, f)
+
+        assert (tmp_path / "state.json").read_bytes() == b""
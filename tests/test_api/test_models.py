@@ -5,6 +5,8 @@ Tests the from_api_response() factory methods on Pydantic models.
 
 from datetime import datetime
 
+import pytest
+
 from terrapyne.models.project import Project
 from terrapyne.models.run import Run
 from terrapyne.models.team_access import TeamProjectAccess
@@ -228,3 +230,168 @@ class TestDatetimeParsing:
 
         dt = parse_iso_datetime("")
         assert dt is None
+
+
+def _workspace_page(page: int, size: int = 100) -> dict:
+    """A workspace listing page with each workspace's project and latest run (and its plan) included."""
+    data, included = [], []
+    for i in range(size):
+        n = page * size + i
+        data.append(
+            {
+                "id": f"ws-{n}",
+                "type": "workspaces",
+                "attributes": {"name": f"app-{n}-prod", "updated-at": "2025-03-13T07:50:15Z"},
+                "relationships": {
+                    "project": {"data": {"id": f"prj-{n % 7}", "type": "projects"}},
+                    "latest-run": {"data": {"id": f"run-{n}", "type": "runs"}},
+                },
+            }
+        )
+        included.append(
+            {
+                "id": f"run-{n}",
+                "type": "runs",
+                "attributes": {"status": "applied"},
+                "relationships": {"plan": {"data": {"id": f"plan-{n}", "type": "plans"}}},
+            }
+        )
+        included.append(
+            {"id": f"plan-{n}", "type": "plans", "attributes": {"resource-additions": 2}}
+        )
+    included += [
+        {"id": f"prj-{p}", "type": "projects", "attributes": {"name": f"project-{p}"}}
+        for p in range(7)
+    ]
+    return {"data": data, "included": included}
+
+
+class TestIncludedResources:
+    """Test lookup of included resources by type and ID."""
+
+    def test_find(self):
+        from terrapyne.models.utils import IncludedResources
+
+        included = IncludedResources(_workspace_page(0, size=2)["included"])
+
+        assert included.find("runs", "run-1")["id"] == "run-1"
+        assert included.find("plans", "run-1") is None
+        assert included.find("runs", None) is None
+
+    def test_first_duplicate_wins(self):
+        from terrapyne.models.utils import IncludedResources
+
+        included = IncludedResources(
+            [
+                {"id": "prj-1", "type": "projects", "attributes": {"name": "first"}},
+                {"id": "prj-1", "type": "projects", "attributes": {"name": "second"}},
+            ]
+        )
+
+        assert included.find("projects", "prj-1")["attributes"]["name"] == "first"
+
+    def test_of_reuses_wrapped_list(self):
+        from terrapyne.models.utils import IncludedResources
+
+        included = IncludedResources([])
+
+        assert IncludedResources.of(included) is included
+        assert IncludedResources.of(None) == []
+
+    def test_workspace_page_shares_index(self):
+        from terrapyne.models.utils import IncludedResources
+
+        page = _workspace_page(0, size=3)
+        included = IncludedResources(page["included"])
+
+        workspaces = [Workspace.from_api_response(item, included) for item in page["data"]]
+
+        assert [w.project_name for w in workspaces] == ["project-0", "project-1", "project-2"]
+        assert workspaces[2].latest_run.id == "run-2"
+        assert workspaces[2].latest_run.additions == 2
+        assert included._index is not None
+
+
+class TestModelValidation:
+    """Test that models built from API payloads are validated."""
+
+    def test_bad_payload_is_rejected(self):
+        from pydantic import ValidationError
+
+        bad = {"id": "prj-1", "type": "projects", "attributes": {"resource-count": "many"}}
+
+        with pytest.raises(ValidationError):
+            Project.from_api_response(bad)
+
+    def test_null_attributes_fall_back_to_defaults(self):
+        """TFC sends null for unset attributes; they get the same defaults as absent ones."""
+        from terrapyne.models.plan import Plan
+        from terrapyne.models.state_version import StateVersion
+        from terrapyne.models.variable import WorkspaceVariable
+
+        state_version = StateVersion.from_api_response(
+            {"id": "sv-1", "attributes": {"resource-count": None, "providers-count": None}}
+        )
+        workspace = Workspace.from_api_response(
+            {"id": "ws-1", "attributes": {"name": None, "tag-names": None, "locked": None}}
+        )
+        project = Project.from_api_response(
+            {"id": "prj-1", "attributes": {"name": None, "resource-count": None}}
+        )
+        plan = Plan.from_api_response(
+            {"id": "plan-1", "attributes": {"status": None, "resource-additions": None}}
+        )
+        variable = WorkspaceVariable.from_api_response(
+            {"id": "var-1", "attributes": {"key": None, "category": None, "hcl": None}}
+        )
+
+        assert (state_version.resource_count, state_version.providers_count) == (0, 0)
+        assert (workspace.name, workspace.tag_names, workspace.locked) == ("", [], False)
+        assert (project.name, project.resource_count) == ("", 0)
+        assert (plan.status, plan.resource_additions) == ("unknown", 0)
+        assert (variable.key, variable.category, variable.hcl) == ("", "terraform", False)
+
+    def test_null_attributes_in_a_run(self):
+        run = Run.from_api_response(
+            {
+                "id": "run-1",
+                "attributes": {"status": "applied", "auto-apply": None, "is-destroy": None},
+            }
+        )
+
+        assert (run.auto_apply, run.is_destroy) == (False, False)
+
+
+@pytest.mark.slow
+def test_workspace_listing_model_benchmark():
+    """Building 9,000 workspaces with a shared page index beats indexing per item."""
+    import time
+
+    from terrapyne.models.utils import IncludedResources
+
+    pages = [_workspace_page(page) for page in range(90)]
+
+    def build(shared_index: bool) -> tuple[list[Workspace], float]:
+        start = time.perf_counter()
+        workspaces = []
+        for page in pages:
+            included = IncludedResources(page["included"]) if shared_index else None
+            for item in page["data"]:
+                workspaces.append(
+                    Workspace.from_api_response(item, included or list(page["included"]))
+                )
+        return workspaces, time.perf_counter() - start
+
+    shared = build(shared_index=True)[0]  # also warms up
+    unshared = build(shared_index=False)[0]
+    # Best of interleaved rounds, so that load on the machine hits both variants alike
+    rounds = [(build(True)[1], build(False)[1]) for _ in range(3)]
+    shared_seconds, unshared_seconds = (min(times) for times in zip(*rounds, strict=True))
+
+    print(
+        f"\n{len(shared)} workspaces: shared page index {shared_seconds:.2f}s, "
+        f"index per item {unshared_seconds:.2f}s"
+    )
+    assert [w.model_dump() for w in shared] == [w.model_dump() for w in unshared]
+    assert shared[-1].latest_run.additions == 2
+    assert shared_seconds < unshared_seconds
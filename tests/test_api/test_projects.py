@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from terrapyne.api.client import TFCClient
+from terrapyne.api.fieldsets import PROJECT_TABLE_FIELDS
 from terrapyne.api.projects import ProjectAPI
+from terrapyne.models.project import Project
+from terrapyne.models.team import Team
 
 
 @pytest.fixture
@@ -61,6 +64,18 @@ def test_list_projects_with_search_wildcard(project_api, mock_client):
     )
 
 
+def test_list_projects_with_sparse_fields(project_api, mock_client):
+    mock_client.get_organization.return_value = "test-org"
+    mock_client.paginate_with_meta.return_value = (iter([]), 0)
+
+    project_api.list(fields=PROJECT_TABLE_FIELDS)
+
+    params = mock_client.paginate_with_meta.call_args.kwargs["params"]
+    assert params == {
+        "fields[projects]": "name,description,created-at,resource-count,workspace-count"
+    }
+
+
 def test_get_project_by_name_found(project_api, mock_client):
     """Test get_by_name when project exists."""
     mock_client.get_organization.return_value = "test-org"
@@ -116,49 +131,104 @@ def test_get_workspace_counts(project_api, mock_client):
         assert counts == {"prj-1": 2, "prj-2": 1}
 
 
+def _projects(*ids, workspace_count=None):
+    return [Project.model_construct(id=i, name=i, workspace_count=workspace_count) for i in ids]
+
+
+def _count_response(path, params=None):
+    """A one-item workspace listing: 3 per project, 250 across the org."""
+    total = 3 if "filter[project][id]" in params else 250
+    return {"data": [], "meta": {"pagination": {"total-count": total}}}
+
+
+def test_count_workspaces_uses_reported_counts(project_api, mock_client):
+    counts = project_api.count_workspaces(_projects("prj-1", "prj-2", workspace_count=7), "org")
+
+    assert counts == {"prj-1": 7, "prj-2": 7}
+    mock_client.get.assert_not_called()
+
+
+def test_count_workspaces_queries_each_project_when_cheaper(project_api, mock_client):
+    mock_client.get_organization.return_value = "org"
+    mock_client.get.side_effect = _count_response
+
+    counts = project_api.count_workspaces(_projects("prj-1", "prj-2"), "org")
+
+    assert counts == {"prj-1": 3, "prj-2": 3}
+    # One probe for the org total (3 pages to walk > 2 projects), then one count per project
+    assert mock_client.get.call_count == 3
+    assert all(c.kwargs["params"]["page[size]"] == 1 for c in mock_client.get.call_args_list)
+
+
+def test_count_workspaces_walks_org_when_cheaper(project_api, mock_client):
+    mock_client.get_organization.return_value = "org"
+    mock_client.get.side_effect = _count_response
+    project_ids = [f"prj-{i}" for i in range(5)]
+
+    with patch.object(project_api, "get_workspace_counts", return_value={"prj-1": 4}) as walk:
+        counts = project_api.count_workspaces(_projects(*project_ids), "org")
+
+    walk.assert_called_once_with("org")
+    assert counts == {project_id: 4 if project_id == "prj-1" else 0 for project_id in project_ids}
+    assert mock_client.get.call_count == 1
+
+
+def _team_access_listing(team_ids, included=()):
+    items = MagicMock()
+    items.__iter__.return_value = iter(
+        [
+            {
+                "id": f"tpa-{team_id}",
+                "type": "team-projects",
+                "attributes": {"access": "admin"},
+                "relationships": {
+                    "team": {"data": {"id": team_id, "type": "teams"}},
+                    "project": {"data": {"id": "prj-1", "type": "projects"}},
+                },
+            }
+            for team_id in team_ids
+        ]
+    )
+    items.included = list(included)
+    return items, len(team_ids)
+
+
 def test_list_team_access(project_api, mock_client):
-    """Test listing team access for a project."""
-    # 1. Mock paginate for team-projects
-    access_data = [
-        {
-            "id": "tpa-1",
-            "type": "team-projects",
-            "attributes": {"access": "admin"},
-            "relationships": {
-                "team": {"data": {"id": "team-1", "type": "teams"}},
-                "project": {"data": {"id": "prj-1", "type": "projects"}},
-            },
-        }
-    ]
-    mock_client.paginate.return_value = iter(access_data)
-
-    # 2. Mock TeamsAPI.get for team name enrichment
+    """Team names come from include=team, with no per-team lookups."""
+    mock_client.paginate_with_meta.return_value = _team_access_listing(
+        ["team-1"],
+        included=[{"id": "team-1", "type": "teams", "attributes": {"name": "Platform Team"}}],
+    )
+
     with patch("terrapyne.api.teams.TeamsAPI.get") as mock_team_get:
-        team_mock = MagicMock()
-        team_mock.name = "Platform Team"
-        mock_team_get.return_value = team_mock
+        access_list = project_api.list_team_access("prj-1")
+
+    assert len(access_list) == 1
+    assert access_list[0].access == "admin"
+    assert access_list[0].team_name == "Platform Team"
+    mock_team_get.assert_not_called()
+    mock_client.paginate_with_meta.assert_called_once_with(
+        "/team-projects", params={"filter[project][id]": "prj-1", "include": "team"}
+    )
 
+
+def test_list_team_access_resolves_teams_missing_from_include(project_api, mock_client):
+    """Teams the include did not return are fetched once each."""
+    mock_client.paginate_with_meta.return_value = _team_access_listing(["team-1", "team-2"])
+
+    with patch("terrapyne.api.teams.TeamsAPI.get") as mock_team_get:
+        mock_team_get.side_effect = lambda team_id: Team.model_construct(
+            id=team_id, name=f"Team {team_id}"
+        )
         access_list = project_api.list_team_access("prj-1")
 
-        assert len(access_list) == 1
-        assert access_list[0].access == "admin"
-        assert access_list[0].team_name == "Platform Team"
-        mock_team_get.assert_called_once_with("team-1")
+    assert [a.team_name for a in access_list] == ["Team team-1", "Team team-2"]
+    assert sorted(c.args[0] for c in mock_team_get.call_args_list) == ["team-1", "team-2"]
 
 
 def test_list_team_access_enrichment_failure(project_api, mock_client):
     """Test team access listing when team name enrichment fails."""
-    access_data = [
-        {
-            "id": "tpa-1",
-            "type": "team-projects",
-            "attributes": {"access": "admin"},
-            "relationships": {
-                "team": {"data": {"id": "team-1", "type": "teams"}},
-            },
-        }
-    ]
-    mock_client.paginate.return_value = iter(access_data)
+    mock_client.paginate_with_meta.return_value = _team_access_listing(["team-1"])
 
     with patch("terrapyne.api.teams.TeamsAPI.get") as mock_team_get:
         mock_team_get.side_effect = Exception("API Error")
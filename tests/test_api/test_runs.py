@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from terrapyne.api.fieldsets import RUN_TABLE_FIELDS, RUN_TABLE_INCLUDE
 from terrapyne.api.runs import RunsAPI
 from terrapyne.models.run import Run, RunStatus
 
@@ -376,6 +377,65 @@ class TestRunRetrieval:
         assert len(runs) == 1
         assert runs[0].status == RunStatus.APPLIED
 
+    def test_list_runs_with_sparse_fields(self, api, mock_client):
+        """A sparse run page still yields runs with their plan's resource counts."""
+        mock_client.get.return_value = {
+            "data": [
+                {
+                    "id": "run-1",
+                    "type": "runs",
+                    "attributes": {"status": "planned", "message": "Queued manually"},
+                    "relationships": {"plan": {"data": {"id": "plan-1", "type": "plans"}}},
+                }
+            ],
+            "included": [
+                {
+                    "id": "plan-1",
+                    "type": "plans",
+                    "attributes": {"resource-additions": 2, "resource-changes": 1},
+                }
+            ],
+            "meta": {"pagination": {"total-count": 1}},
+        }
+
+        runs, _ = api.list("ws-abc123", include=RUN_TABLE_INCLUDE, fields=RUN_TABLE_FIELDS)
+
+        params = mock_client.get.call_args.kwargs["params"]
+        assert params["include"] == "plan"
+        assert params["fields[runs]"] == "status,message,created-at,plan"
+        assert params["fields[plans]"] == (
+            "resource-additions,resource-changes,resource-destructions"
+        )
+        assert runs[0].resource_additions == 2
+        assert runs[0].message == "Queued manually"
+
+    def test_list_for_organization(self, api, mock_client):
+        """Test the organization-wide run listing filters and workspace linkage."""
+        mock_client.get_organization.return_value = "test-org"
+        items = MagicMock()
+        items.__iter__.return_value = iter(
+            [
+                {
+                    "id": "run-1",
+                    "type": "runs",
+                    "attributes": {"status": "errored", "created-at": "2024-01-15T10:00:00Z"},
+                    "relationships": {"workspace": {"data": {"id": "ws-1", "type": "workspaces"}}},
+                }
+            ]
+        )
+        items.included = []
+        mock_client.paginate_with_meta.return_value = (items, 1)
+
+        runs_iter, total = api.list_for_organization(status="errored", project_names=["platform"])
+        runs = list(runs_iter)
+
+        mock_client.paginate_with_meta.assert_called_once_with(
+            "/organizations/test-org/runs",
+            params={"filter[status]": "errored", "filter[project_names]": "platform"},
+        )
+        assert total == 1
+        assert runs[0].workspace_id == "ws-1"
+
 
 class TestRunIntegration:
     """Test full run lifecycle workflows."""
@@ -1,11 +1,15 @@
 """Unit tests for State Versions API."""
 
+import io
+import json
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from terrapyne.api.state_store import StateStore
 from terrapyne.api.state_versions import StateVersionsAPI
+from terrapyne.core.exceptions import TFCServerError
 
 
 @pytest.fixture
@@ -136,3 +140,96 @@ def test_find_version_before(api, mock_client):
     assert sv is not None
     assert sv.id == "sv-target"
     assert sv.serial == 9
+
+
+STATE_BYTES = json.dumps(
+    {
+        "version": 4,
+        "serial": 12,
+        "lineage": "lin-abc",
+        "resources": [
+            {
+                "mode": "managed",
+                "type": "aws_instance",
+                "name": "web",
+                "instances": [{"attributes": {"id": "i-1"}}, {"attributes": {"id": "i-2"}}],
+            },
+            {"mode": "data", "type": "aws_ami", "name": "ubuntu", "instances": [{}]},
+        ],
+    }
+).encode()
+
+
+@pytest.fixture
+def downloadable(mock_client):
+    """A state version whose download streams STATE_BYTES."""
+    mock_client.get.return_value = {
+        "data": {
+            "id": "sv-abc",
+            "attributes": {"hosted-state-download-url": "https://archivist.example/sv-abc"},
+        }
+    }
+    mock_client.download.side_effect = lambda url, destination: destination.write(STATE_BYTES)
+    return mock_client
+
+
+def test_download_to_file_streams_to_private_temp_file(api, downloadable):
+    path = api.download_to_file("sv-abc")
+    try:
+        assert path.read_bytes() == STATE_BYTES
+        assert path.stat().st_mode & 0o077 == 0
+    finally:
+        path.unlink()
+    downloadable.download.assert_called_once()
+    assert downloadable.download.call_args.args[0] == "https://archivist.example/sv-abc"
+
+
+def test_download_to_file_removes_partial_file_on_error(api, downloadable, tmp_path):
+    downloadable.download.side_effect = TFCServerError("boom", status_code=500)
+
+    with pytest.raises(TFCServerError):
+        api.download_to_file("sv-abc", tmp_path / "state.json")
+
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_iter_resources_filters_and_removes_temp_file(api, downloadable):
+    downloaded = []
+    download_to_file = api.download_to_file
+
+    def tracking_download(state_version_id):
+        downloaded.append(download_to_file(state_version_id))
+        return downloaded[-1]
+
+    with patch.object(api, "download_to_file", side_effect=tracking_download):
+        instances = list(api.iter_resources("sv-abc", types={"aws_instance"}))
+
+    assert [i.get_field("id") for i in instances] == ["i-1", "i-2"]
+    assert not downloaded[0].exists()
+
+
+def test_state_store_downloads_each_version_once(api, downloadable, tmp_path):
+    downloadable.state_store = StateStore(tmp_path / "state")
+
+    assert api.download("sv-abc") == json.loads(STATE_BYTES)
+    streamed = io.BytesIO()
+    api.stream("sv-abc", streamed)
+    instances = list(api.iter_resources("sv-abc", types={"aws_instance"}))
+    path = api.download_to_file("sv-abc", tmp_path / "copy.tfstate")
+
+    assert streamed.getvalue() == STATE_BYTES
+    assert [i.get_field("id") for i in instances] == ["i-1", "i-2"]
+    assert path.read_bytes() == STATE_BYTES
+    downloadable.get.assert_called_once()
+    downloadable.download.assert_called_once()
+    assert (tmp_path / "state" / "objects" / "lin-abc-12.tfstate.gz").exists()
+
+
+def test_state_store_keeps_nothing_when_download_fails(api, downloadable, tmp_path):
+    downloadable.state_store = StateStore(tmp_path / "state")
+    downloadable.download.side_effect = TFCServerError("boom", status_code=500)
+
+    with pytest.raises(TFCServerError):
+        api.download("sv-abc")
+
+    assert "sv-abc" not in downloadable.state_store
@@ -0,0 +1,229 @@
+"""Clients against the local TFC API stand-in (tests/fixtures/tfc_server.py)."""
+
+import json
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from terrapyne.api.async_client import AsyncTFCClient
+from terrapyne.cli.main import app
+from terrapyne.core.credentials import TerraformCredentials
+from tests.fixtures.tfc_server import STAND_IN_TOKEN, SyntheticOrganization, TFCStandIn
+
+
+@pytest.fixture(scope="module")
+def server():
+    with TFCStandIn(SyntheticOrganization(workspaces=250, projects=5)) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def client(server):
+    server.reset_counts()
+    with server.client(max_inflight=4) as tfc:
+        yield tfc
+
+
+class TestListings:
+    def test_paginate_with_meta_fetches_every_page_once(self, server, client):
+        items, total = client.paginate_with_meta(
+            "/organizations/bench-org/workspaces", page_size=20
+        )
+
+        names = [item["attributes"]["name"] for item in items]
+
+        assert total == 250
+        assert names == [f"app-{w:06d}" for w in range(250)]
+        assert server.requests["GET /api/v2/organizations/bench-org/workspaces"] == 13
+
+    def test_workspace_listing_filters_by_project_and_includes_latest_run(self, client):
+        workspaces, total = client.workspaces.list(project_id="prj-000002", include="latest_run")
+        workspaces = list(workspaces)
+
+        assert total == len(workspaces) == 50
+        assert {w.project_id for w in workspaces} == {"prj-000002"}
+        assert all(w.latest_run is not None for w in workspaces)
+
+    @pytest.mark.parametrize(
+        ("search", "expected"),
+        [("app-00024", 10), ("app-00024*", 10), ("*-000249", 1), ("nothing", 0)],
+    )
+    def test_workspace_search(self, client, search, expected):
+        workspaces, _ = client.workspaces.list(search=search)
+
+        assert len(list(workspaces)) == expected
+
+    def test_organization_runs_newest_first_filtered_by_status_and_project(self, client):
+        runs, total = client.runs.list_for_organization(
+            status="errored", project_names=["project-001"]
+        )
+        runs = list(runs)
+
+        assert total == len(runs) > 0
+        assert {r.status for r in runs} == {"errored"}
+        created = [r.created_at for r in runs]
+        assert created == sorted(created, reverse=True)
+
+    def test_project_team_access_includes_team_names(self, client):
+        accesses = client.projects.list_team_access("prj-000001")
+
+        assert sorted(a.team_name for a in accesses) == ["team-001", "team-002", "team-003"]
+
+    def test_workspace_listing_sorts_by_latest_change(self, client):
+        items, _ = client.paginate_with_meta(
+            "/organizations/bench-org/workspaces", params={"sort": "-latest-change-at"}
+        )
+
+        changed = [item["attributes"]["latest-change-at"] for item in items]
+
+        assert len(changed) == 250
+        assert changed == sorted(changed, reverse=True)
+
+    @pytest.mark.parametrize("sort", ["-updated-at", "created-at"])
+    def test_workspace_listing_rejects_sorts_tfc_does_not_support(self, client, sort):
+        from terrapyne.core.exceptions import TFCAPIError
+
+        with pytest.raises(TFCAPIError) as error:
+            client.get("/organizations/bench-org/workspaces", params={"sort": sort})
+
+        assert error.value.status_code == 400
+
+    def test_incremental_inventory_sync_stops_early(self, client, tmp_path):
+        from terrapyne.api.inventory import INCREMENTAL_STOP_AFTER, Inventory
+
+        inventory = Inventory(tmp_path / "inventory.db")
+        try:
+            inventory.sync(client, "bench-org", ["workspaces"])
+            [stats] = inventory.sync(client, "bench-org", ["workspaces"])
+        finally:
+            inventory.close()
+
+        assert not stats.full
+        assert stats.fetched == INCREMENTAL_STOP_AFTER
+
+    def test_unknown_resource_is_not_found(self, client):
+        from terrapyne.core.exceptions import TFCNotFoundError
+
+        with pytest.raises(TFCNotFoundError):
+            client.workspaces.get("no-such-workspace")
+
+
+class TestArchives:
+    def test_state_download_follows_the_signed_url_on_the_archive_host(self, server, client):
+        version = client.state_versions.get_current("ws-00000007")
+        state = client.state_versions.download(version.id)
+
+        assert version.download_url.startswith(server.blob_origin)
+        assert state["serial"] == 2
+        assert len(state["resources"]) == server.org.state_resources
+
+    def test_plan_logs_redirect_to_the_archive_host(self, client):
+        logs = client.runs.get_plan_logs("plan-00000003001")
+
+        assert logs.startswith("Terraform v1.7.0 (plan-00000003001)")
+        assert "Error: creating resource" in logs
+
+
+class TestLoad:
+    def test_unpaced_client_retries_through_rate_limiting(self):
+        organization = SyntheticOrganization(workspaces=60, projects=1)
+        with TFCStandIn(organization, rate_limit=10) as server:
+            with server.client(max_inflight=4) as client:
+                server.throttle.burst, server.throttle.tokens = 3, 0  # refuse the first request
+                items, _ = client.paginate_with_meta(
+                    "/organizations/bench-org/workspaces", page_size=10
+                )
+                assert len(list(items)) == 60
+
+        assert server.throttled > 0
+
+    def test_latency_is_injected_into_every_response(self):
+        with TFCStandIn(SyntheticOrganization(workspaces=1), latency=0.05) as server:
+            with server.client() as client:
+                start = time.perf_counter()
+                client.projects.get_by_id("prj-000000")
+                assert time.perf_counter() - start >= 0.05
+
+    def test_requests_without_a_token_are_unauthorized(self, server):
+        import httpx
+
+        response = httpx.get(f"{server.origin}/api/v2/projects/prj-000000")
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, server):
+        credentials = TerraformCredentials(host="127.0.0.1", token=STAND_IN_TOKEN)
+        async with AsyncTFCClient(
+            organization="bench-org",
+            credentials=credentials,
+            api_origin=server.origin,
+            max_inflight=4,
+            rate_limit=0,
+        ) as client:
+            items, total = await client.paginate_with_meta(
+                "/organizations/bench-org/workspaces", page_size=50
+            )
+            names = [item["attributes"]["name"] async for item in items]
+
+        assert total == len(names) == 250
+
+
+class TestCLI:
+    def test_project_show(self, server, monkeypatch):
+        for name, value in server.env().items():
+            monkeypatch.setenv(name, value)
+
+        result = CliRunner().invoke(
+            app, ["project", "show", "project-003", "-o", "bench-org", "--format", "json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["workspace_count"] == 50
+
+    @pytest.mark.parametrize("strategy", ["workspace", "org"])
+    def test_run_errors(self, server, monkeypatch, strategy):
+        for name, value in server.env().items():
+            monkeypatch.setenv(name, value)
+
+        result = CliRunner().invoke(
+            app,
+            ["run", "errors", "project-000", "-o", "bench-org", "--strategy", strategy],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "✗ Workspace: app-000" in result.output
+
+    def test_state_diff_against_the_previous_version(self, server, monkeypatch):
+        for name, value in server.env().items():
+            monkeypatch.setenv(name, value)
+
+        result = CliRunner().invoke(app, ["state", "diff", "app-000007", "-o", "bench-org"])
+
+        assert result.exit_code == 0, result.output
+        assert "sv-00000007000 (serial 1) → sv-00000007001 (serial 2)" in result.output
+        assert '~ tags.Serial: "1" → "2"' in result.output
+
+    def test_state_diff_json(self, server, monkeypatch):
+        for name, value in server.env().items():
+            monkeypatch.setenv(name, value)
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "state",
+                "diff",
+                *("--from", "sv-00000007001", "--to", "sv-00000007000"),
+                *("--type", "aws_instance", "-o", "bench-org", "-f", "json"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["from"] == "sv-00000007001"
+        assert data["summary"]["changed"] == len(data["changed"]) > 0
+        assert {c["type"] for c in data["changed"]} == {"aws_instance"}
+        assert data["changed"][0]["attributes"] == [
+            {"path": "tags.Serial", "action": "changed", "before": "2", "after": "1"}
+        ]
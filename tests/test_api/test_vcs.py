@@ -7,6 +7,7 @@ import pytest
 from terrapyne.api.client import TFCClient
 from terrapyne.api.vcs import VCSAPI
 from terrapyne.models.vcs import VCSConnection
+from terrapyne.models.workspace import Workspace
 
 
 @pytest.fixture
@@ -78,43 +79,63 @@ def test_update_workspace_branch(vcs_api, mock_client):
         assert payload["data"]["attributes"]["vcs-repo"]["oauth-token-id"] == "ot-abc"
 
 
+def _listed_workspace(ws_id: str, name: str, vcs: dict | None) -> Workspace:
+    attrs: dict = {"name": name}
+    if vcs:
+        attrs["vcs-repo"] = vcs
+    return Workspace.from_api_response({"id": ws_id, "type": "workspaces", "attributes": attrs})
+
+
+GITHUB_REPO = {
+    "identifier": "org/repo",
+    "service-provider": "github",
+    "repository-http-url": "https://github.com/org/repo",
+}
+
+
 def test_list_repositories(vcs_api, mock_client):
-    """Test discovering repositories from workspaces."""
-    # 1. Mock workspaces list
-    ws1 = MagicMock()
-    ws1.id = "ws-1"
-    ws1.name = "prod"
-    ws2 = MagicMock()
-    ws2.id = "ws-2"
-    ws2.name = "dev"
+    """Repositories are discovered from the listing alone, without per-workspace GETs."""
+    workspaces = [
+        _listed_workspace("ws-1", "prod", GITHUB_REPO),
+        _listed_workspace("ws-2", "dev", GITHUB_REPO),
+        _listed_workspace("ws-3", "scratch", None),
+    ]
 
     with patch("terrapyne.api.workspaces.WorkspaceAPI.list") as mock_ws_list:
-        mock_ws_list.return_value = (iter([ws1, ws2]), 2)
-
-        # 2. Mock get_workspace_vcs for each workspace
-        vcs1 = VCSConnection.model_validate(
-            {
-                "identifier": "org/repo",
-                "service-provider": "github",
-                "repository-http-url": "https://github.com/org/repo",
-            }
-        )
-        vcs2 = VCSConnection.model_validate(
-            {
-                "identifier": "org/repo",
-                "service-provider": "github",
-                "repository-http-url": "https://github.com/org/repo",
-            }
-        )
-
-        # Track calls manually since we're patching the method on the same instance
-        with patch.object(VCSAPI, "get_workspace_vcs", side_effect=[vcs1, vcs2]):
-            repos = vcs_api.list_repositories("test-org")
+        mock_ws_list.return_value = (iter(workspaces), 3)
+        repos = vcs_api.list_repositories("test-org")
+
+    assert repos == [
+        {
+            "identifier": "org/repo",
+            "url": "https://github.com/org/repo",
+            "workspaces": ["prod", "dev"],
+        }
+    ]
+    mock_client.get.assert_not_called()
+
+
+def test_list_repositories_looks_up_sparse_listings(vcs_api, mock_client):
+    """Workspaces listed without a service provider fall back to a GET each."""
+    sparse = {"identifier": "org/repo"}
+    workspaces = [
+        _listed_workspace("ws-1", "prod", GITHUB_REPO),
+        _listed_workspace("ws-2", "dev", sparse),
+        _listed_workspace("ws-3", "qa", sparse),
+    ]
+    mock_client.get.side_effect = lambda path: {
+        "data": {"id": path.rsplit("/", 1)[1], "attributes": {"vcs-repo": GITHUB_REPO}}
+    }
 
-            assert len(repos) == 1
-            assert repos[0]["identifier"] == "org/repo"
-            assert "prod" in repos[0]["workspaces"]
-            assert "dev" in repos[0]["workspaces"]
+    with patch("terrapyne.api.workspaces.WorkspaceAPI.list") as mock_ws_list:
+        mock_ws_list.return_value = (iter(workspaces), 3)
+        repos = vcs_api.list_repositories("test-org")
+
+    assert repos[0]["workspaces"] == ["prod", "dev", "qa"]
+    assert sorted(c.args[0] for c in mock_client.get.call_args_list) == [
+        "/workspaces/ws-2",
+        "/workspaces/ws-3",
+    ]
 
 
 def test_list_connections(vcs_api, mock_client):
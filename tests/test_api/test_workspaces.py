@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from terrapyne.api.fieldsets import WORKSPACE_TABLE_FIELDS, fieldset_params
 from terrapyne.api.workspaces import WorkspaceAPI
 from terrapyne.models.variable import WorkspaceVariable
 
@@ -427,3 +428,39 @@ class TestWorkspaceVariableIntegration:
         assert len(variables) == 1
         assert variables[0].key == "environment"
         assert variables[0].id == "var-new123"
+
+
+class TestWorkspaceListFields:
+    """Sparse fieldsets on workspace listings."""
+
+    def test_fieldset_params(self):
+        assert fieldset_params(None) == {}
+        assert fieldset_params({"workspaces": ["name", "locked"], "projects": ["name"]}) == {
+            "fields[workspaces]": "name,locked",
+            "fields[projects]": "name",
+        }
+
+    def test_list_requests_sparse_fieldset(self):
+        client = MagicMock()
+        client.get_organization.return_value = "test-org"
+        items = MagicMock()
+        items.__iter__.return_value = iter(
+            [
+                {
+                    "id": "ws-1",
+                    "type": "workspaces",
+                    "attributes": {"name": "app-prod", "terraform-version": "1.9.0"},
+                }
+            ]
+        )
+        items.included = []
+        client.paginate_with_meta.return_value = (items, 1)
+
+        workspaces, _ = WorkspaceAPI(client).list(search="app-*", fields=WORKSPACE_TABLE_FIELDS)
+        [workspace] = list(workspaces)
+
+        params = client.paginate_with_meta.call_args.kwargs["params"]
+        assert params["fields[workspaces]"] == ("name,terraform-version,vcs-repo,locked,updated-at")
+        assert params["search[wildcard-name]"] == "app-*"
+        assert workspace.environment == "production"
+        assert workspace.locked is False
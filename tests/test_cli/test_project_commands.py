@@ -76,6 +76,7 @@ def list_all_projects(org_context, project_list_response):
         mock_client.projects.list.return_value = (iter(projects), len(projects))
         mock_client.workspaces.list.return_value = (iter([]), 0)
         mock_client.projects.get_workspace_counts.return_value = {}
+        mock_client.projects.count_workspaces.return_value = {p.id: 5 for p in projects}
 
         result = runner.invoke(app, ["project", "list", "--organization", "test-org"])
 
@@ -3,10 +3,13 @@
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from pytest_bdd import given, parsers, scenario, then, when
 from typer.testing import CliRunner
 
+from terrapyne.api.logs import RunLogStream
+from terrapyne.api.runs import RunsAPI
 from terrapyne.cli.main import app
 from terrapyne.models.run import Run, RunStatus
 from terrapyne.models.workspace import Workspace
@@ -149,6 +152,22 @@ def test_no_errored_runs_clean():
     pass
 
 
+@scenario(
+    "../features/run_diagnostics.feature",
+    "Scanning a project through the organization-wide runs listing",
+)
+def test_errored_runs_org_strategy():
+    pass
+
+
+@scenario(
+    "../features/run_diagnostics.feature",
+    "Falling back to per-workspace queries when the organization listing is unavailable",
+)
+def test_errored_runs_auto_strategy_fallback():
+    pass
+
+
 # ============================================================================
 # Background / Given Steps
 # ============================================================================
@@ -732,24 +751,49 @@ def check_continuous_updates(cli_result):
     target_fixture="mock_client",
 )
 def change_with_logs(run_id):
-    m = MagicMock()
-    # Initial status is planning
-    m.runs.get.return_value = Run.model_construct(
-        id=run_id, status=RunStatus.PLANNING, plan_id="plan-123", apply_id="apply-123"
-    )
-
-    # We will simulate polling logs. The first time we check plan logs it returns chunk 1, next time chunk 1+2
-    plan_log_chunks = ["Plan starting...", "Plan starting...\nPlan finished."]
-    apply_log_chunks = ["Apply starting...", "Apply starting...\nApply finished."]
-
-    m.runs.get_plan_logs.side_effect = plan_log_chunks
-    m.runs.get_apply_logs.side_effect = apply_log_chunks
+    # Each log grows between polls; the fake archive honours Range requests
+    logs = {"plan": b"", "apply": b""}
+    chunks = {
+        "plan": [b"Plan starting...\n", b"Plan finished.\n"],
+        "apply": [b"Apply starting...\n", b"Apply finished.\n"],
+    }
+    ranges: list[str] = []
+
+    def run_payload(status):
+        return {
+            "data": {
+                "id": run_id,
+                "type": "runs",
+                "attributes": {"status": status},
+                "relationships": {
+                    "plan": {"data": {"id": "plan-123"}},
+                    "apply": {"data": {"id": "apply-123"}},
+                },
+            }
+        }
+
+    def request(method, path, params=None, json_data=None, headers=None):
+        stage = "plan" if path.startswith("/plans/") else "apply"
+        if chunks[stage]:
+            logs[stage] += chunks[stage].pop(0)
+        ranges.append(headers["Range"])
+        start = int(headers["Range"].removeprefix("bytes=").rstrip("-"))
+        if start >= len(logs[stage]):
+            return httpx.Response(416)
+        return httpx.Response(206, content=logs[stage][start:])
+
+    low = MagicMock()
+    low.get.side_effect = [
+        run_payload(status) for status in ["planning", "planning", "applying", "applied"]
+    ]
+    low._request.side_effect = request
+    runs_api = RunsAPI(low)
 
-    # Mock the poll sequence
-    m.runs.poll_until_complete.return_value = Run.model_construct(
-        id=run_id, status=RunStatus.APPLIED, plan_id="plan-123", apply_id="apply-123"
+    m = MagicMock()
+    m.runs.stream_logs.side_effect = lambda rid, max_wait: RunLogStream(
+        runs_api, rid, max_wait=max_wait, sleep=lambda _: None
     )
-
+    m.log_ranges = ranges
     return m
 
 
@@ -761,29 +805,6 @@ def follow_logs(mock_client, run_id):
     ):
         v.return_value = ("test-org", None)
         c.return_value.__enter__.return_value = mock_client
-
-        # We need to simulate the stream_logs callback execution
-        def mock_poll(run_id, callback, max_wait):
-            # Simulate planning state
-            run_planning = Run.model_construct(
-                id=run_id, status=RunStatus.PLANNING, plan_id="plan-123"
-            )
-            callback(run_planning)
-            callback(run_planning)  # call again to get next chunk
-
-            # Simulate applying state
-            run_applying = Run.model_construct(
-                id=run_id, status=RunStatus.APPLYING, plan_id="plan-123", apply_id="apply-123"
-            )
-            callback(run_applying)
-            callback(run_applying)  # call again to get next chunk
-
-            return Run.model_construct(
-                id=run_id, status=RunStatus.APPLIED, plan_id="plan-123", apply_id="apply-123"
-            )
-
-        mock_client.runs.poll_until_complete.side_effect = mock_poll
-
         return runner.invoke(app, ["run", "follow", run_id, "-o", "test-org"])
 
 
@@ -806,6 +827,19 @@ def check_no_duplicate_logs(cli_result):
     assert cli_result.stdout.count("Apply starting...") == 1
 
 
+@then("each poll should only download new log output")
+def check_log_ranges(mock_client):
+    # Polls: planning, planning, applying (plan + apply), applied (plan + apply)
+    assert mock_client.log_ranges == [
+        "bytes=0-",
+        "bytes=17-",
+        "bytes=32-",
+        "bytes=0-",
+        "bytes=32-",
+        "bytes=18-",
+    ]
+
+
 @given(
     parsers.parse('the project "{project}" has recently encountered execution errors:'),
     target_fixture="project_errors_setup",
@@ -876,6 +910,73 @@ def analyze_project_failures_step(project_errors_setup):
         return result
 
 
+@given("the organization-wide runs listing is unavailable", target_fixture="org_listing_missing")
+def org_listing_missing_step():
+    return True
+
+
+@when(
+    parsers.parse(
+        'I analyze recent project-wide execution failures with the "{strategy}" strategy'
+    ),
+    target_fixture="analyze_project_failures",
+)
+def analyze_project_failures_strategy_step(project_errors_setup, strategy, request):
+    from terrapyne.core.exceptions import TFCNotFoundError
+    from terrapyne.models.project import Project
+
+    org_missing = "org_listing_missing" in request.fixturenames
+    project = project_errors_setup["project"]
+    with patch("terrapyne.api.client.TFCClient") as mock_client:
+        mock_instance = MagicMock()
+        mock_client.return_value.__enter__.return_value = mock_instance
+
+        proj = Project.model_construct(id="proj-123", name=project)
+        mock_instance.projects.list.return_value = ([proj], 1)
+
+        workspaces = []
+        runs = []
+        for r in project_errors_setup["runs"]:
+            ws_id = f"ws-{r['workspace']}"
+            if not any(w.id == ws_id for w in workspaces):
+                workspaces.append(Workspace.model_construct(id=ws_id, name=r["workspace"]))
+            runs.append(
+                Run.model_construct(
+                    id=r["run_id"],
+                    status=RunStatus.ERRORED,
+                    message=r["message"],
+                    workspace_id=ws_id,
+                    created_at=datetime.fromisoformat(r["created_at"]),
+                )
+            )
+        mock_instance.workspaces.list.return_value = (iter(workspaces), len(workspaces))
+
+        if org_missing:
+            mock_instance.runs.list_for_organization.side_effect = TFCNotFoundError(
+                "not found", status_code=404
+            )
+        else:
+            mock_instance.runs.list_for_organization.return_value = (iter(runs), len(runs))
+
+        mock_instance.runs.list.side_effect = lambda workspace_id, **_: (
+            [r for r in runs if r.workspace_id == workspace_id],
+            1,
+        )
+
+        result = runner.invoke(
+            app,
+            ["run", "errors", project, "--organization", "test-org", "--strategy", strategy],
+        )
+        result.mock_client = mock_instance
+        return result
+
+
+@then("no per-workspace run queries should have been made")
+def check_no_per_workspace_queries(analyze_project_failures):
+    analyze_project_failures.mock_client.runs.list.assert_not_called()
+    analyze_project_failures.mock_client.runs.list_for_organization.assert_called_once()
+
+
 @then("I should see a report of all failed executions")
 def check_failure_report(analyze_project_failures):
     assert analyze_project_failures.exit_code == 0
@@ -32,6 +32,11 @@ def test_run_pause_success():
     pass
 
 
+@scenario("../features/run_wait.feature", "Watching every active run during a rollout")
+def test_run_watch_all():
+    pass
+
+
 @given("a terraform cloud organization is accessible")
 def terraform_org_ready():
     pass
@@ -193,3 +198,49 @@ def check_discarded(mock_client):
 @then("the output should indicate it is paused for approval")
 def check_paused_output(cli_result):
     assert "Run paused for manual approval" in cli_result.stdout
+
+
+@given(parsers.parse('the organization has active runs "{run_a}" and "{run_b}"'))
+def org_has_active_runs(mock_client, run_a, run_b):
+    from terrapyne.api.run_watcher import RunEvent
+
+    active = [
+        Run.model_construct(id=run_a, status=RunStatus.PLANNING),
+        Run.model_construct(id=run_b, status=RunStatus.APPLYING),
+    ]
+    mock_client.runs.list_for_organization.return_value = (iter(active), 2)
+    mock_client.runs.poll_many.return_value = iter(
+        [
+            RunEvent(Run.model_construct(id=run_a, status=RunStatus.APPLIED), RunStatus.PLANNING),
+            RunEvent(Run.model_construct(id=run_b, status=RunStatus.ERRORED), RunStatus.APPLYING),
+        ]
+    )
+
+
+@when("I watch all active runs", target_fixture="cli_result")
+def watch_all_runs(mock_client):
+    with (
+        patch("terrapyne.cli.utils.validate_context") as v,
+        patch("terrapyne.api.client.TFCClient") as c,
+    ):
+        v.return_value = ("test-org", None)
+        c.return_value.__enter__.return_value = mock_client
+        return runner.invoke(app, ["run", "watch", "--all", "-o", "test-org"])
+
+
+@then("each run's status changes should be reported")
+def check_watch_all_output(mock_client, cli_result):
+    from unittest.mock import ANY
+
+    mock_client.runs.poll_many.assert_called_once_with(
+        ["run-a", "run-b"], max_wait=ANY, concurrency=ANY
+    )
+    assert "run-a" in cli_result.stdout
+    assert "applied" in cli_result.stdout
+    assert "errored" in cli_result.stdout
+    assert "1 succeeded, 1 did not succeed" in cli_result.stdout
+
+
+@then("the command should exit with code 1")
+def exit_one(cli_result):
+    assert cli_result.exit_code == 1
@@ -1,5 +1,6 @@
 """BDD tests for state version management CLI commands."""
 
+import io
 import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -8,6 +9,7 @@ from pytest_bdd import given, parsers, scenario, then, when
 from typer.testing import CliRunner
 
 from terrapyne.cli.main import app
+from terrapyne.core.state_diff import iter_state_resources
 from terrapyne.models.state_version import StateVersion
 from terrapyne.models.workspace import Workspace
 
@@ -19,6 +21,11 @@ def test_state_pull():
     pass
 
 
+@scenario("../features/state_management.feature", "List resources in the current state")
+def test_state_resources():
+    pass
+
+
 @scenario("../features/state_management.feature", "List state versions with relative time")
 def test_state_list():
     pass
@@ -56,9 +63,22 @@ def state_content(mock_client, resource_name):
         "terraform_version": "1.5.0",
         "serial": 1,
         "lineage": "abc",
-        "resources": [{"type": "aws_instance", "name": "web"}],
+        "resources": [
+            {
+                "mode": "managed",
+                "type": "aws_instance",
+                "name": "web",
+                "instances": [{"attributes": {"id": "i-123"}}],
+            }
+        ],
     }
-    mock_client.state_versions.download_from_url.return_value = state_data
+    state_text = json.dumps(state_data)
+    mock_client.state_versions.stream.side_effect = lambda sv_id, destination, **_: (
+        destination.write(state_text.encode())
+    )
+    mock_client.state_versions.iter_resources.side_effect = lambda sv_id, **filters: (
+        iter_state_resources(io.StringIO(state_text), **filters)
+    )
 
 
 @given("the workspace has state versions:")
@@ -94,6 +114,18 @@ def pull_state(mock_client):
         return runner.invoke(app, ["state", "pull", "-w", "my-infra", "-o", "test-org"])
 
 
+@when("I list the resources in the current state", target_fixture="cli_result")
+def list_state_resources(mock_client):
+    with (
+        patch("terrapyne.cli.utils.validate_context") as v,
+        patch("terrapyne.api.client.TFCClient") as c,
+    ):
+        v.return_value = ("test-org", "my-infra")
+        c.return_value.__enter__.return_value = mock_client
+        args = ["state", "resources", "-w", "my-infra", "-o", "test-org"]
+        return runner.invoke(app, [*args, "--fields", "address,id", "-f", "json"])
+
+
 @when("I list state versions", target_fixture="cli_result")
 def list_state_versions(mock_client):
     with (
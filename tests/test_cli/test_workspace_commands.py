@@ -10,6 +10,7 @@ import pytest
 from pytest_bdd import given, scenario, then, when
 from typer.testing import CliRunner
 
+from terrapyne.api.fieldsets import WORKSPACE_TABLE_FIELDS
 from terrapyne.cli.main import app
 from terrapyne.models.variable import WorkspaceVariable
 from terrapyne.models.workspace import Workspace
@@ -108,6 +109,13 @@ def check_workspace_count(list_all_workspaces):
     assert "2" in result.stdout or "workspace" in result.stdout.lower()
 
 
+@then("only the table fields should be requested")
+def check_sparse_fields(list_all_workspaces):
+    """Verify the table asks for a sparse fieldset rather than full resources."""
+    mock_instance = list_all_workspaces["mock_client"].return_value.__enter__.return_value
+    assert mock_instance.workspaces.list.call_args.kwargs["fields"] == WORKSPACE_TABLE_FIELDS
+
+
 # ============================================================================
 # Workspace Show Command Tests
 # ============================================================================
@@ -133,3 +133,149 @@ def test_cache_expiration(mock_creds, tmp_path):
 
             assert result == api_data
             mock_request.assert_called_once()
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "tiered"
+    monkeypatch.setenv("TERRAPYNE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def _response(data, status_code=200, etag=None):
+    import httpx
+
+    request = httpx.Request("GET", "https://app.terraform.io/api/v2/x")
+    headers = {"ETag": etag} if etag else {}
+    if status_code == 304:
+        return httpx.Response(304, headers=headers, request=request)
+    return httpx.Response(status_code, json=data, headers=headers, request=request)
+
+
+def test_cache_dir_env_override(mock_creds, cache_env):
+    """TERRAPYNE_CACHE_DIR selects the disk tier location."""
+    client = TFCClient(credentials=mock_creds, cache_ttl=60)
+    with patch.object(client.client, "request", return_value=_response({"data": []})):
+        client.get("/workspaces")
+
+    assert len(list(cache_env.glob("*.json"))) == 1
+
+
+def test_memory_tier_serves_without_disk(mock_creds, cache_env):
+    """A second GET is answered from memory even if the disk entry is gone."""
+    client = TFCClient(credentials=mock_creds, cache_ttl=60)
+    with patch.object(client.client, "request", return_value=_response({"data": [1]})) as req:
+        client.get("/workspaces")
+        for f in cache_env.glob("*.json"):
+            f.unlink()
+        assert client.get("/workspaces") == {"data": [1]}
+
+    assert req.call_count == 1
+    assert client.cache_stats.hits == 1
+    assert client.cache_stats.misses == 1
+
+
+def test_stale_entry_revalidates_with_etag(mock_creds, cache_env):
+    """Stale entries with an ETag are revalidated; a 304 reuses the cached body."""
+    client = TFCClient(credentials=mock_creds, cache_ttl=60)
+    with patch.object(
+        client.client,
+        "request",
+        side_effect=[_response({"data": "v1"}, etag='"abc"'), _response(None, 304)],
+    ) as req:
+        client.get("/workspaces")
+        # Age the entry past its TTL
+        assert client.cache is not None
+        for entry in client.cache._memory.values():
+            entry.stored_at -= 120
+        assert client.get("/workspaces") == {"data": "v1"}
+
+    assert req.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert client.cache_stats.revalidations == 1
+    assert (cache_env / f"{client.cache.key(client.base_url + '/workspaces', None)}.etag").exists()
+
+
+def test_ttl_policies(mock_creds, cache_env):
+    """Per-path TTLs: long for teams, short for runs, never for off-host URLs."""
+    client = TFCClient(credentials=mock_creds, cache_ttl=60)
+    assert client.cache is not None
+    policy = client.cache.policy
+
+    assert policy.ttl_for(f"{client.base_url}/teams/team-1") == 3600
+    assert policy.ttl_for(f"{client.base_url}/runs/run-1") == 2
+    assert policy.ttl_for(f"{client.base_url}/workspaces/ws-1") == 60
+    assert policy.ttl_for("https://archivist.terraform.io/v1/object/signed") == 0
+
+
+def test_off_host_urls_are_not_cached(mock_creds, cache_env):
+    client = TFCClient(credentials=mock_creds, cache_ttl=60)
+    url = "https://archivist.terraform.io/v1/object/signed"
+    with patch.object(client.blob_client, "request", return_value=_response({"v": 1})) as req:
+        client.get(url)
+        client.get(url)
+
+    assert req.call_count == 2
+    assert not cache_env.exists() or not list(cache_env.glob("*.json"))
+
+
+def test_memory_tier_evicts_by_bytes(tmp_path):
+    from terrapyne.api.cache import ResponseCache, TTLPolicy
+
+    base = "https://app.terraform.io/api/v2"
+    cache = ResponseCache(tmp_path, TTLPolicy(base, 60), memory_bytes=100)
+    for i in range(5):
+        cache.store(f"{base}/workspaces/ws-{i}", None, {"pad": "x" * 30})
+
+    assert cache._memory_used <= 100
+    assert cache.stats.evictions >= 3
+    # Evicted entries are still served from disk
+    assert cache.lookup(f"{base}/workspaces/ws-0", None) is not None
+
+
+def test_disk_tier_evicts_oldest(tmp_path):
+    from terrapyne.api.cache import ResponseCache, TTLPolicy
+
+    base = "https://app.terraform.io/api/v2"
+    cache = ResponseCache(tmp_path, TTLPolicy(base, 60), disk_bytes=200)
+    for i in range(10):
+        cache.store(f"{base}/workspaces/ws-{i}", None, {"pad": "x" * 30})
+        cache_file = tmp_path / f"{cache.key(f'{base}/workspaces/ws-{i}', None)}.json"
+        os.utime(cache_file, (1000 + i, 1000 + i))
+
+    remaining = list(tmp_path.glob("*.json"))
+    assert sum(p.stat().st_size for p in remaining) <= 200
+    newest = tmp_path / f"{cache.key(f'{base}/workspaces/ws-9', None)}.json"
+    assert newest in remaining
+    assert not list(tmp_path.glob(".tmp-*"))
+
+
+def test_stats_are_exact_across_threads(tmp_path):
+    import threading
+
+    from terrapyne.api.cache import CacheStats, ResponseCache, TTLPolicy
+
+    class SlowStats(CacheStats):
+        """Yields to other threads between reading a counter and writing it back."""
+
+        def __getattribute__(self, name):
+            value = super().__getattribute__(name)
+            if name in ("hits", "misses"):
+                time.sleep(0.0001)
+            return value
+
+    base = "https://app.terraform.io/api/v2"
+    cache = ResponseCache(tmp_path, TTLPolicy(base, 60))
+    cache.stats = SlowStats()
+    cache.store(f"{base}/workspaces/ws-hit", None, {"id": "ws-hit"})
+
+    def look_up():
+        for i in range(50):
+            cache.lookup(f"{base}/workspaces/ws-{'hit' if i % 2 else 'miss'}", None)
+
+    threads = [threading.Thread(target=look_up) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (cache.stats.hits, cache.stats.misses) == (200, 200)
@@ -0,0 +1,105 @@
+"""Tests for lazy command-group imports in `tfc` startup."""
+
+import json
+import os
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from terrapyne.cli.main import TfcGroup
+
+SRC = Path(__file__).parents[2] / "src"
+
+# Loaded by the command groups (and the SDK) but never needed to print `tfc --help`
+HEAVY_MODULES = ("httpx", "pydantic", "benedict", "asyncio", "terrapyne.core.plan_parser")
+
+
+def _run_cli(*args: str, prelude: str = "") -> subprocess.CompletedProcess[str]:
+    """Run `tfc <args>` in a fresh interpreter that prints its loaded modules as JSON to stderr."""
+    script = (
+        "import json, sys\n"
+        f"{prelude}\n"
+        f"sys.argv = ['tfc', *{list(args)!r}]\n"
+        "from terrapyne.cli.main import app\n"
+        "try:\n"
+        "    app()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(json.dumps(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC), os.getenv("PYTHONPATH", "")])}
+    return subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _loaded(result: subprocess.CompletedProcess[str]) -> set[str]:
+    return set(json.loads(result.stderr.strip().splitlines()[-1]))
+
+
+def test_help_imports_no_command_group():
+    result = _run_cli("--help")
+    loaded = _loaded(result)
+
+    assert "state" in result.stdout
+    assert not {module for module, _ in TfcGroup.lazy_groups.values()} & loaded
+    assert not {m for m in loaded if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES}
+
+
+def test_group_imports_only_its_own_module():
+    loaded = _loaded(_run_cli("state", "outputs", "--help"))
+
+    assert "terrapyne.cli.state_cmd" in loaded
+    others = {module for name, (module, _) in TfcGroup.lazy_groups.items() if name != "state"}
+    assert not others & loaded
+    assert "benedict" not in loaded
+    assert "terrapyne.core.plan_parser" not in loaded
+
+
+@pytest.mark.parametrize("name", list(TfcGroup.lazy_groups))
+def test_listed_help_matches_group(name):
+    module, short_help = TfcGroup.lazy_groups[name]
+
+    assert import_module(module).app.info.help == short_help
+
+
+def test_unknown_command_still_errors():
+    from typer.testing import CliRunner
+
+    from terrapyne.cli.main import app
+
+    result = CliRunner().invoke(app, ["nope"])
+
+    assert result.exit_code != 0
+
+
+def _import_seconds(module: str) -> float:
+    """Cumulative import time of ``module`` in a fresh interpreter, from -X importtime."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC), os.getenv("PYTHONPATH", "")])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    raise AssertionError(f"{module} not in importtime output")
+
+
+@pytest.mark.slow
+def test_startup_import_budget():
+    """`tfc --help` and `tfc state outputs --raw` stay within a fixed import-time budget."""
+    help_seconds = min(_import_seconds("terrapyne.cli.main") for _ in range(3))
+    state_seconds = min(_import_seconds("terrapyne.cli.state_cmd") for _ in range(3))
+
+    print(f"\ntfc --help {help_seconds * 1000:.0f}ms, tfc state {state_seconds * 1000:.0f}ms")
+    # Generous enough for a loaded CI runner; the eager imports took over 0.5s for --help alone
+    assert help_seconds < 0.5
+    assert state_seconds < 2.0
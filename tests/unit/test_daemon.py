@@ -0,0 +1,302 @@
+"""Tests for the `tfc serve` daemon and command forwarding."""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from terrapyne.api.client import TFCClient
+from terrapyne.cli import daemon, utils
+from terrapyne.cli.daemon import CommandServer, forward
+from terrapyne.core.credentials import TerraformCredentials
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def client():
+    creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+    client = TFCClient(credentials=creds, organization="acme", rate_limit=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="tfc-") as directory:
+        yield Path(directory) / "tfc.sock"
+
+
+@pytest.fixture
+def server(socket_path, client):
+    server = CommandServer(socket_path, client)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield server
+    daemon.stop(socket_path)
+    thread.join(5)
+
+
+def _forward(argv, socket_path, directory):
+    """Forward a command with real files as stdio (pytest's capture objects have no descriptor).
+
+    Returns:
+        (exit code, stdout, stderr)
+    """
+    with (
+        open(os.devnull) as stdin,
+        open(directory / "stdout", "w+") as stdout,
+        open(directory / "stderr", "w+") as stderr,
+        patch.multiple(sys, stdin=stdin, stdout=stdout, stderr=stderr),
+    ):
+        code = forward(argv, socket_path)
+    return code, (directory / "stdout").read_text(), (directory / "stderr").read_text()
+
+
+def _send(socket_path, argv, directory, cwd=None):
+    """Send a command as `forward` does, but with explicit stdio, so callers can run in threads.
+
+    Returns:
+        The daemon's response, with the command's stdout under ``"stdout"``
+    """
+    directory.mkdir(exist_ok=True)
+    with (
+        open(os.devnull) as stdin,
+        open(directory / "stdout", "w+") as stdout,
+        open(directory / "stderr", "w+") as stderr,
+        socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock,
+    ):
+        sock.connect(str(socket_path))
+        socket.send_fds(sock, [b"\0"], [stdin.fileno(), stdout.fileno(), stderr.fileno()])
+        request = {
+            "argv": argv,
+            "cwd": str(cwd or os.getcwd()),
+            "env": dict(os.environ),
+            "credentials": daemon.credentials_key(os.environ),
+        }
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        response = json.loads(sock.makefile("rb").readline())
+    response["stdout"] = (directory / "stdout").read_text()
+    return response
+
+
+@pytest.fixture
+def blocking_app(monkeypatch):
+    """Commands are replaced: ``block`` waits for ``release``; any other prints its name."""
+    started, release = threading.Event(), threading.Event()
+
+    def run(app, argv):
+        if argv == ["block"]:
+            started.set()
+            release.wait(5)
+        print(f"ran {argv[0]}")
+        return 0
+
+    monkeypatch.setattr(daemon, "_exit_code", run)
+    yield started, release
+    release.set()
+
+
+class TestForward:
+    def test_no_daemon_runs_in_process(self, socket_path):
+        assert forward(["workspace", "list"], socket_path) is None
+
+    def test_serve_and_opt_out_are_never_forwarded(self, server, socket_path, monkeypatch):
+        assert forward(["serve", "--stop"], socket_path) is None
+
+        monkeypatch.setenv(daemon.DAEMON_ENV, "0")
+        assert forward(["--version"], socket_path) is None
+
+    @pytest.mark.parametrize(
+        ("argv", "position"),
+        [
+            (["workspace", "list"], 0),
+            (["--debug", "-q", "run", "list"], 2),
+            (["--cache-ttl", "30", "serve"], 2),
+            (["--trace-file=out.json", "state", "diff"], 1),
+            (["--", "serve"], 1),
+            (["--version"], 1),
+        ],
+    )
+    def test_command_position(self, argv, position):
+        assert daemon._command_position(argv) == position
+
+    def test_global_value_options_match_the_cli(self):
+        import typer.main
+
+        from terrapyne.cli.main import app
+
+        options = {
+            name
+            for param in typer.main.get_command(app).params
+            if not getattr(param, "is_flag", True)
+            for name in param.opts
+        }
+
+        assert options == daemon._GLOBAL_VALUE_OPTIONS
+
+    def test_serve_as_an_argument_is_forwarded(self, server, socket_path, tmp_path):
+        code, _, stderr = _forward(["no-such-command", "serve"], socket_path, tmp_path)
+
+        assert code == 2
+        assert "No such command" in stderr
+        assert server.served == 1
+
+    @pytest.mark.parametrize("option", [["--cache-ttl", "0"], ["--state-store-mb=64"]])
+    def test_client_options_run_in_process(self, server, socket_path, tmp_path, option):
+        assert _forward([*option, "--version"], socket_path, tmp_path)[0] is None
+        assert server.served == 0
+
+    def test_command_runs_in_daemon_with_caller_stdio(self, server, socket_path, tmp_path):
+        code, stdout, _ = _forward(["--version"], socket_path, tmp_path)
+
+        assert code == 0
+        assert "terrapyne version 0.1.0" in stdout
+        assert server.served == 1
+
+    def test_exit_code_and_stderr_are_the_callers(self, server, socket_path, tmp_path):
+        code, _, stderr = _forward(["no-such-command"], socket_path, tmp_path)
+
+        assert code == 2
+        assert "No such command" in stderr
+
+    def test_different_credentials_fall_back(self, server, socket_path, tmp_path, monkeypatch):
+        monkeypatch.setenv("TFC_TOKEN", "someone-else")
+
+        assert _forward(["--version"], socket_path, tmp_path)[0] is None
+        assert server.served == 0
+
+    def test_caller_directory_and_environment_are_restored(self, server, socket_path, tmp_path):
+        cwd, env = os.getcwd(), dict(os.environ)
+        os.chdir(tmp_path)
+        try:
+            assert _forward(["--version"], socket_path, tmp_path)[0] == 0
+        finally:
+            os.chdir(cwd)
+
+        assert dict(os.environ) == env
+
+
+class TestCommandServer:
+    def test_stop(self, server, socket_path):
+        assert daemon.stop(socket_path)
+
+        deadline = time.monotonic() + 5
+        while socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not socket_path.exists()
+        assert not daemon.stop(socket_path)
+
+    def test_refuses_to_start_twice(self, server, socket_path, client):
+        with pytest.raises(RuntimeError, match="already listening"):
+            CommandServer(socket_path, client).serve_forever()
+
+    def test_replaces_stale_socket(self, socket_path, client):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+        server = CommandServer(socket_path, client, idle_timeout=0.05)
+
+        server.serve_forever()  # binds over the stale socket, then times out idle
+
+        assert not socket_path.exists()
+
+    def test_socket_is_owner_only(self, server, socket_path):
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+
+
+class TestConcurrentCommands:
+    def test_long_command_does_not_block_others(self, server, socket_path, tmp_path, blocking_app):
+        started, release = blocking_app
+        results = {}
+        blocked = threading.Thread(
+            target=lambda: results.update(a=_send(socket_path, ["block"], tmp_path / "a"))
+        )
+        blocked.start()
+        assert started.wait(5)
+
+        other = _send(socket_path, ["list"], tmp_path / "b")
+        assert "a" not in results
+
+        release.set()
+        blocked.join(5)
+        assert other == {"exit_code": 0, "stdout": "ran list\n"}
+        assert results["a"] == {"exit_code": 0, "stdout": "ran block\n"}
+        assert server.served == 2
+
+    def test_other_directory_falls_back_while_busy(
+        self, server, socket_path, tmp_path, blocking_app
+    ):
+        started, release = blocking_app
+        blocked = threading.Thread(target=_send, args=(socket_path, ["block"], tmp_path / "a"))
+        blocked.start()
+        assert started.wait(5)
+
+        busy = _send(socket_path, ["list"], tmp_path / "b", cwd=tmp_path)
+        release.set()
+        blocked.join(5)
+        idle = _send(socket_path, ["list"], tmp_path / "c", cwd=tmp_path)
+
+        assert "another directory" in busy["fallback"]
+        assert idle["exit_code"] == 0
+        assert os.getcwd() != str(tmp_path)
+
+    def test_stop_waits_for_running_commands(self, socket_path, client, tmp_path, blocking_app):
+        started, release = blocking_app
+        server = CommandServer(socket_path, client)
+        serving = threading.Thread(target=server.serve_forever)
+        serving.start()
+        deadline = time.monotonic() + 5
+        while not socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        blocked = threading.Thread(target=_send, args=(socket_path, ["block"], tmp_path / "a"))
+        blocked.start()
+        assert started.wait(5)
+
+        assert daemon.stop(socket_path)
+        serving.join(0.5)
+        assert serving.is_alive()
+
+        release.set()
+        serving.join(5)
+        blocked.join(5)
+        assert not serving.is_alive()
+        assert server.served == 1
+
+
+class TestWarmClient:
+    def test_get_client_borrows_warm_client(self, client):
+        previous = utils.set_warm_client(client)
+        try:
+            with utils.get_client(None, organization="other") as borrowed:
+                assert borrowed.client is client.client
+                assert borrowed.get_organization() == "other"
+                assert borrowed.workspaces.client is borrowed
+        finally:
+            utils.set_warm_client(previous)
+
+        assert not client.client.is_closed
+
+    def test_borrow_shares_pools_and_caches(self, client):
+        tracer = MagicMock()
+
+        borrowed = client.borrow("other", tracer=tracer)
+        borrowed.close()
+
+        assert borrowed.blob_client is client.blob_client
+        assert borrowed.rate_limiter is client.rate_limiter
+        assert borrowed.tracer is tracer
+        assert client.tracer is None
+        assert client.organization == "acme"
+        assert not client.client.is_closed
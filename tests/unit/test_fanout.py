@@ -0,0 +1,58 @@
+"""Tests for the bounded-concurrency fan-out engine."""
+
+import threading
+import time
+
+import pytest
+
+from terrapyne.api.fanout import fan_out
+from terrapyne.core.exceptions import TFCNotFoundError, TFCRateLimitError
+
+
+def test_results_keep_input_order():
+    def slow_square(n):
+        time.sleep(0.001 * (10 - n))
+        return n * n
+
+    assert fan_out(slow_square, range(10), concurrency=4) == [n * n for n in range(10)]
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    state = {"inflight": 0, "peak": 0}
+
+    def work(_):
+        with lock:
+            state["inflight"] += 1
+            state["peak"] = max(state["peak"], state["inflight"])
+        time.sleep(0.01)
+        with lock:
+            state["inflight"] -= 1
+
+    fan_out(work, range(20), concurrency=3)
+
+    assert 1 < state["peak"] <= 3
+
+
+def test_rate_limit_errors_are_not_retried():
+    """429s are retried by the client; a fan-out retry would multiply the attempts."""
+    calls = {"n": 0}
+
+    def always_limited(_):
+        calls["n"] += 1
+        raise TFCRateLimitError("429", status_code=429)
+
+    with pytest.raises(TFCRateLimitError):
+        fan_out(always_limited, [1], concurrency=2)
+
+    assert calls["n"] == 1
+
+
+def test_other_errors_propagate():
+    def missing(item):
+        if item == 2:
+            raise TFCNotFoundError("gone", status_code=404)
+        return item
+
+    with pytest.raises(TFCNotFoundError):
+        fan_out(missing, [1, 2, 3], concurrency=3)
@@ -0,0 +1,372 @@
+"""Tests for the local SQLite inventory."""
+
+import math
+import sqlite3
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from terrapyne.api.client import TFCClient
+from terrapyne.api.inventory import INCREMENTAL_STOP_AFTER, SCHEMA_VERSION, Inventory
+from terrapyne.cli.main import app
+from terrapyne.core.credentials import TerraformCredentials
+from terrapyne.core.exceptions import TFCNotFoundError
+
+
+def _timestamp(n: int) -> str:
+    """Current time, n microseconds on, so that successive timestamps increase."""
+    return (datetime.now(UTC) + timedelta(microseconds=n)).isoformat().replace("+00:00", "Z")
+
+
+# What TFC's workspace listing can sort by
+WORKSPACE_SORTS = ("name", "current-run.created-at", "latest-change-at")
+
+
+class FakeOrganization:
+    """In-memory organization answering the listings an inventory sync reads."""
+
+    def __init__(self, workspaces: int = 250, *, honour_sort: bool = True):
+        self.honour_sort = honour_sort
+        self.clock = 1000
+        self.requests: Counter[str] = Counter()
+        self.projects = {
+            f"prj-{i}": {"id": f"prj-{i}", "type": "projects", "attributes": {"name": f"team-{i}"}}
+            for i in range(3)
+        }
+        self.teams = {
+            "team-a": {"id": "team-a", "type": "teams", "attributes": {"name": "platform"}},
+            "team-b": {"id": "team-b", "type": "teams", "attributes": {"name": "viewers"}},
+        }
+        self.team_projects = {
+            f"tprj-{i}": _team_project(f"tprj-{i}", "team-a" if i else "team-b", f"prj-{i}")
+            for i in range(3)
+        }
+        self.runs: dict[str, dict] = {}
+        self.workspaces: dict[str, dict] = {}
+        for i in range(workspaces):
+            self.add_workspace(f"ws-{i}", f"app-{i:03d}", f"prj-{i % 3}")
+
+    def tick(self) -> str:
+        self.clock += 1
+        return _timestamp(self.clock)
+
+    def add_workspace(self, ws_id: str, name: str, project_id: str) -> None:
+        run = self.add_run(ws_id, "applied")
+        self.workspaces[ws_id] = {
+            "id": ws_id,
+            "type": "workspaces",
+            "attributes": {
+                "name": name,
+                "updated-at": self.tick(),
+                "latest-change-at": self.tick(),
+                "locked": False,
+            },
+            "relationships": {
+                "project": {"data": {"id": project_id, "type": "projects"}},
+                "latest-run": {"data": {"id": run["id"], "type": "runs"}},
+            },
+        }
+
+    def add_run(self, ws_id: str, status: str) -> dict:
+        run_id = f"run-{len(self.runs)}"
+        self.runs[run_id] = {
+            "id": run_id,
+            "type": "runs",
+            "attributes": {"status": status, "created-at": self.tick()},
+            "relationships": {"workspace": {"data": {"id": ws_id, "type": "workspaces"}}},
+        }
+        return self.runs[run_id]
+
+    def update_workspace(self, ws_id: str, **attributes) -> None:
+        """Change settings, which leaves latest-change-at alone."""
+        self.workspaces[ws_id]["attributes"].update(attributes, **{"updated-at": self.tick()})
+
+    def change_state(self, ws_id: str, **attributes) -> None:
+        """Create a state version (along with any attribute changes)."""
+        self.update_workspace(ws_id, **attributes)
+        self.workspaces[ws_id]["attributes"]["latest-change-at"] = self.tick()
+
+    def get(self, path: str, params: dict | None = None) -> dict:
+        params = params or {}
+        self.requests[path] += 1
+        collection = path.rsplit("/", 1)[-1]
+        included: list[dict] = []
+        if collection == "workspaces":
+            items = sorted(self.workspaces.values(), key=lambda w: w["attributes"]["name"])
+            sort = params.get("sort")
+            if sort is not None and sort.removeprefix("-") not in WORKSPACE_SORTS:
+                raise ValueError(f"TFC cannot sort workspaces by {sort}")
+            if sort == "-latest-change-at" and self.honour_sort:
+                items.sort(key=lambda w: w["attributes"]["latest-change-at"], reverse=True)
+        elif collection == "runs":
+            items = sorted(self.runs.values(), key=lambda r: r["id"][4:].zfill(6), reverse=True)
+        elif collection == "team-projects":
+            project_id = params["filter[project][id]"]
+            items = [t for t in self.team_projects.values() if _rel(t, "project") == project_id]
+        else:
+            items = list(getattr(self, collection).values())
+
+        size, number = params.get("page[size]", 20), params.get("page[number]", 1)
+        page = items[(number - 1) * size : number * size]
+        if collection == "workspaces" and params.get("include") == "latest_run":
+            included = [self.runs[_rel(w, "latest-run")] for w in page]
+        pages = max(1, math.ceil(len(items) / size))
+        return {
+            "data": page,
+            "included": included,
+            "links": {"next": f"{path}?page={number + 1}" if number < pages else None},
+            "meta": {"pagination": {"total-count": len(items), "total-pages": pages}},
+        }
+
+
+def _rel(item: dict, name: str) -> str:
+    return item["relationships"][name]["data"]["id"]
+
+
+def _team_project(tp_id: str, team_id: str, project_id: str) -> dict:
+    return {
+        "id": tp_id,
+        "type": "team-projects",
+        "attributes": {"access": "write"},
+        "relationships": {
+            "team": {"data": {"id": team_id, "type": "teams"}},
+            "project": {"data": {"id": project_id, "type": "projects"}},
+        },
+    }
+
+
+@pytest.fixture
+def org():
+    return FakeOrganization()
+
+
+@pytest.fixture
+def client(org):
+    creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+    client = TFCClient(credentials=creds, organization="acme", rate_limit=0, max_inflight=4)
+    with patch.object(client, "get", side_effect=org.get):
+        yield client
+    client.close()
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    inventory = Inventory(tmp_path / "inventory.db")
+    yield inventory
+    inventory.close()
+
+
+def _synced(inventory, client, org, **kwargs):
+    """Sync, then forget the requests it made."""
+    stats = {s.collection: s for s in inventory.sync(client, "acme", **kwargs)}
+    org.requests.clear()
+    return stats
+
+
+class TestSync:
+    def test_first_sync_is_full(self, inventory, client, org):
+        stats = _synced(inventory, client, org)
+
+        assert stats["workspaces"].full
+        assert stats["workspaces"].changed == 250 + 250  # workspaces and their latest runs
+        assert [s.collection for s in inventory.status("acme")] == [
+            "projects",
+            "teams",
+            "workspaces",
+            "team-projects",
+        ]
+        assert {s.collection: s.count for s in inventory.status("acme")}["workspaces"] == 250
+
+    def test_incremental_sync_stops_at_unchanged_workspaces(self, inventory, client, org):
+        _synced(inventory, client, org)
+        org.change_state("ws-7", locked=True)
+
+        stats = _synced(inventory, client, org)
+
+        assert not stats["workspaces"].full
+        assert stats["workspaces"].fetched == 1 + INCREMENTAL_STOP_AFTER
+        assert stats["workspaces"].changed == 1
+        [ws] = inventory.workspaces("acme", search="app-007")
+        assert ws.locked
+
+    def test_settings_changes_wait_for_a_full_walk(self, inventory, client, org):
+        _synced(inventory, client, org)
+        org.update_workspace("ws-7", locked=True)
+
+        incremental = _synced(inventory, client, org)
+        assert not inventory.workspaces("acme", search="app-007")[0].locked
+        full = _synced(inventory, client, org, full=True)
+
+        assert incremental["workspaces"].fetched == INCREMENTAL_STOP_AFTER
+        assert full["workspaces"].changed == 1
+        assert inventory.workspaces("acme", search="app-007")[0].locked
+
+    def test_new_run_is_linked_without_walking_workspaces(self, inventory, client, org):
+        _synced(inventory, client, org)
+        run = org.add_run("ws-3", "planning")
+        org.workspaces["ws-3"]["relationships"]["latest-run"]["data"]["id"] = run["id"]
+
+        _synced(inventory, client, org)
+
+        [ws] = inventory.workspaces("acme", search="app-003", include="latest_run")
+        assert ws.latest_run is not None
+        assert ws.latest_run.id == run["id"]
+        assert ws.latest_run.status == "planning"
+
+    def test_deleted_workspace_forces_a_full_walk(self, inventory, client, org):
+        _synced(inventory, client, org)
+        del org.workspaces["ws-100"]
+
+        stats = _synced(inventory, client, org)
+
+        assert stats["workspaces"].full
+        assert stats["workspaces"].deleted == 1
+        assert not inventory.workspaces("acme", search="app-100")
+
+    def test_unsorted_listing_is_walked_in_full(self, inventory, client):
+        org = FakeOrganization(honour_sort=False)
+        with patch.object(client, "get", side_effect=org.get):
+            _synced(inventory, client, org)
+            org.update_workspace("ws-249", locked=True)
+
+            stats = _synced(inventory, client, org)
+
+        assert stats["workspaces"].fetched == 250
+        assert inventory.workspaces("acme", search="app-249")[0].locked
+
+    def test_orgs_without_run_listing_fall_back_to_a_full_walk(self, inventory, client, org):
+        _synced(inventory, client, org)
+
+        def get(path, params=None):
+            if path.endswith("/runs"):
+                raise TFCNotFoundError("Not found", status_code=404)
+            return org.get(path, params)
+
+        with patch.object(client, "get", side_effect=get):
+            stats = _synced(inventory, client, org, collections=["workspaces"])
+
+        assert stats["workspaces"].full
+
+    def test_team_access_is_read_for_changed_projects_only(self, inventory, client, org):
+        _synced(inventory, client, org)
+        org.projects["prj-1"]["attributes"]["name"] = "renamed"
+        org.team_projects["tprj-1"]["attributes"]["access"] = "admin"
+
+        _synced(inventory, client, org)
+
+        [access] = inventory.team_access("acme", "prj-1")
+        assert access.access == "admin"
+        assert access.team_name == "platform"
+
+    def test_unknown_collection(self, inventory, client):
+        with pytest.raises(ValueError, match="Unknown inventory collections: runs"):
+            inventory.sync(client, "acme", ["runs"])
+
+    def test_other_schema_version_is_rebuilt(self, inventory, client, org):
+        _synced(inventory, client, org)
+        inventory.close()
+        with sqlite3.connect(inventory.path) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        assert inventory.age("acme", "workspaces") is None
+
+
+class TestQueries:
+    @pytest.fixture(autouse=True)
+    def synced(self, inventory, client, org):
+        _synced(inventory, client, org)
+
+    @pytest.mark.parametrize(
+        ("search", "expected"),
+        [("app-00", 10), ("APP-01*", 10), ("app-01*", 10), ("*-2?9", 0), ("*9", 25), ("_", 0)],
+    )
+    def test_workspace_search(self, inventory, search, expected):
+        assert len(inventory.workspaces("acme", search=search)) == expected
+
+    def test_workspaces_by_project_with_includes(self, inventory):
+        workspaces = inventory.workspaces("acme", project_id="prj-1", include="project,latest_run")
+
+        assert len(workspaces) == 83
+        assert workspaces == sorted(workspaces, key=lambda w: w.name)
+        assert {w.project_name for w in workspaces} == {"team-1"}
+        assert all(w.latest_run and w.latest_run.status == "applied" for w in workspaces)
+
+    def test_project_search_mirrors_the_api(self, inventory):
+        assert [p.name for p in inventory.projects("acme", "team-1")] == ["team-1"]
+        assert [p.name for p in inventory.projects("acme", "team")] == []
+        assert len(inventory.projects("acme", "*eam*")) == 3
+
+    def test_teams(self, inventory):
+        assert [t.name for t in inventory.teams("acme", search="PLAT")] == ["platform"]
+        assert [t.name for t in inventory.teams("acme", names=["viewers"])] == ["viewers"]
+
+
+class TestFacades:
+    def test_list_queries_read_the_inventory(self, client, org, tmp_path, monkeypatch):
+        monkeypatch.setenv("TERRAPYNE_INVENTORY", str(tmp_path / "inventory.db"))
+        client.inventory_max_age = math.inf
+
+        client.workspaces.list("acme", search="app-1*")
+        synced = sum(org.requests.values())
+        projects, _ = client.projects.list("acme")
+        _, total = client.workspaces.list("acme", search="app-1*")
+        teams, _ = client.teams.list_teams("acme", search="view")
+
+        assert total == 100
+        assert [t.name for t in teams] == ["viewers"]
+        assert len(list(projects)) == 3
+        assert sum(org.requests.values()) - synced == 2  # projects and teams, synced on first use
+
+    def test_stale_inventory_is_synced_first(self, client, org, tmp_path, monkeypatch):
+        monkeypatch.setenv("TERRAPYNE_INVENTORY", str(tmp_path / "inventory.db"))
+        client.inventory_max_age = 0
+        client.workspaces.list("acme")
+        org.change_state("ws-1", locked=True)
+
+        workspaces, _ = client.workspaces.list("acme", search="app-001")
+
+        assert next(workspaces).locked
+
+    def test_without_max_age_the_api_is_asked(self, client, org):
+        _, total = client.workspaces.list("acme")
+
+        assert total == 250
+        assert org.requests["/organizations/acme/workspaces"] == 1
+        assert "inventory" not in client.__dict__
+
+    def test_project_workspace_counts(self, client, org, tmp_path, monkeypatch):
+        monkeypatch.setenv("TERRAPYNE_INVENTORY", str(tmp_path / "inventory.db"))
+        client.inventory_max_age = math.inf
+        projects, _ = client.projects.list("acme")
+
+        counts = client.projects.count_workspaces(projects, "acme")
+
+        assert counts == {"prj-0": 84, "prj-1": 83, "prj-2": 83}
+
+
+class TestCLI:
+    def test_sync_then_list_from_inventory(self, org, tmp_path, monkeypatch):
+        monkeypatch.setenv("TERRAPYNE_INVENTORY", str(tmp_path / "inventory.db"))
+        monkeypatch.setenv("TFC_TOKEN", "test-token")
+        runner = CliRunner()
+
+        with patch.object(
+            TFCClient, "get", side_effect=lambda path, params=None: org.get(path, params)
+        ):
+            sync = runner.invoke(app, ["inventory", "sync", "-o", "acme", "--format", "json"])
+            org.requests.clear()
+            listing = runner.invoke(
+                app, ["--from-inventory", "workspace", "list", "-o", "acme", "-s", "app-24*"]
+            )
+            status = runner.invoke(app, ["inventory", "status", "-o", "acme"])
+
+        assert sync.exit_code == 0, sync.output
+        assert '"collection": "workspaces"' in sync.output
+        assert listing.exit_code == 0, listing.output
+        assert "app-249" in listing.output
+        assert not org.requests
+        assert status.exit_code == 0
+        assert "team-projects" in status.output
@@ -1,96 +1,215 @@
-"""Tests for run log streaming functionality."""
-
-from terrapyne.cli.run_cmd import _print_log_delta
-
-
-class TestPrintLogDelta:
-    """Test _print_log_delta helper function."""
-
-    def test_empty_log_returns_zero(self):
-        """When log is empty, position remains 0."""
-        result = _print_log_delta("", 0)
-        assert result == 0
-
-    def test_first_read_returns_full_length(self):
-        """First read from position 0 returns full log length."""
-        log = "Line 1\nLine 2\nLine 3\n"
-        result = _print_log_delta(log, 0)
-        assert result == len(log)
-
-    def test_delta_from_middle(self):
-        """Reading from middle position returns only new content length."""
-        log = "Line 1\nLine 2\nLine 3\n"
-        first_read = len("Line 1\n")
-        result = _print_log_delta(log, first_read)
-        assert result == len(log)
-
-    def test_no_new_content(self):
-        """When position equals log length, no new content."""
-        log = "Line 1\nLine 2\n"
-        result = _print_log_delta(log, len(log))
-        assert result == len(log)
-
-    def test_position_tracks_correctly(self, capsys):
-        """Position parameter correctly tracks where we left off."""
-        log = "ABC\nDEF\n"
-
-        # First read: position 0, returns position len(log)=8
-        pos = _print_log_delta(log, 0)
-        assert pos == 8
-        captured = capsys.readouterr()
-        assert captured.out == "ABC\nDEF\n"
-
-        # Second read: position 8 (at end), no new content
-        pos = _print_log_delta(log, pos)
-        assert pos == 8
-        captured = capsys.readouterr()
-        assert captured.out == ""
-
-    def test_incremental_reading(self, capsys):
-        """Simulate streaming incremental log updates."""
-        # Simulate log growing over time
-        log1 = "Planning...\n"
-        log2 = "Planning...\nFetching modules\n"
-        log3 = "Planning...\nFetching modules\nDone\n"
-
-        # First poll: read entire log1
-        pos = _print_log_delta(log1, 0)
-        captured = capsys.readouterr()
-        assert "Planning" in captured.out
-        # pos should be len(log1) = 12
-
-        # Second poll: log has grown, read from pos to new length
-        # log2 has new content "Fetching modules\n"
-        pos = _print_log_delta(log2, pos)
-        captured = capsys.readouterr()
-        assert "Fetching modules" in captured.out
-        assert "Planning" not in captured.out  # Don't repeat first line
-        # pos should be len(log2) = 28
-
-        # Third poll: log has grown more
-        pos = _print_log_delta(log3, pos)
-        captured = capsys.readouterr()
-        assert "Done" in captured.out
-
-    def test_position_at_log_boundary(self):
-        """Position exactly at log length returns same length."""
-        log = "Test line\n"
-        result = _print_log_delta(log, len(log))
-        assert result == len(log)
-
-    def test_multiline_delta_extraction(self, capsys):
-        """Delta extraction preserves multi-line content."""
-        log = "Header\nLine A\nLine B\nLine C\n"
-        header_len = len("Header\n")
-
-        _print_log_delta(log, header_len)
-        captured = capsys.readouterr()
-        assert captured.out == "Line A\nLine B\nLine C\n"
-
-    def test_empty_delta_no_output(self, capsys):
-        """When delta is empty, no output is printed."""
-        log = "No change\n"
-        _print_log_delta(log, len(log))
-        captured = capsys.readouterr()
-        # flush=True but no content written
-        assert captured.out == ""
+"""Tests for incremental run log tailing."""
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from terrapyne.api.client import TFCClient
+from terrapyne.api.logs import LogLine, LogTailer, RunLogStream
+from terrapyne.api.runs import RunsAPI
+from terrapyne.core.credentials import TerraformCredentials
+from terrapyne.core.exceptions import TFCNotFoundError
+
+BASE = "https://app.terraform.io/api/v2"
+
+
+class RangeServer:
+    """Serve a growing log, honouring Range headers like the TFC log archive."""
+
+    def __init__(self, *, honour_range: bool = True):
+        self.log = b""
+        self.honour_range = honour_range
+        self.ranges: list[str | None] = []
+
+    def _request(self, method, path, params=None, json_data=None, headers=None):
+        range_header = (headers or {}).get("Range")
+        self.ranges.append(range_header)
+        if not self.log:
+            raise TFCNotFoundError("not ready", status_code=404)
+        if not (self.honour_range and range_header):
+            return httpx.Response(200, content=self.log)
+        start = int(range_header.removeprefix("bytes=").rstrip("-"))
+        if start >= len(self.log):
+            return httpx.Response(416)
+        return httpx.Response(
+            206,
+            content=self.log[start:],
+            headers={"Content-Range": f"bytes {start}-{len(self.log) - 1}/{len(self.log)}"},
+        )
+
+
+class TestLogTailer:
+    def test_reads_only_new_bytes(self):
+        server = RangeServer()
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+
+        assert tailer.read() == []  # 404 before the log exists
+
+        server.log = b"Planning...\nFetching"
+        assert tailer.read() == ["Planning..."]
+        server.log += b" modules\nDone\n"
+        assert tailer.read() == ["Fetching modules", "Done"]
+        assert tailer.read() == []  # 416: nothing new
+
+        assert server.ranges == [
+            "bytes=0-",
+            "bytes=0-",
+            "bytes=20-",
+            "bytes=34-",
+        ]
+        assert tailer.offset == len(server.log)
+
+    def test_server_ignoring_range_is_sliced_locally(self):
+        server = RangeServer(honour_range=False)
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+
+        server.log = b"one\n"
+        assert tailer.read() == ["one"]
+        server.log += b"two\n"
+        assert tailer.read() == ["two"]
+        assert tailer.read() == []
+
+    def test_truncated_log_restarts_from_beginning(self):
+        server = RangeServer(honour_range=False)
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+
+        server.log = b"first attempt\nmore\n"
+        tailer.read()
+        server.log = b"retry\n"
+        assert tailer.read() == ["retry"]
+
+    def test_range_starting_past_offset_is_requested_again(self):
+        server = RangeServer()
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+        server.log = b"one\ntwo\nthree\n"
+        assert tailer.read() == ["one", "two", "three"]
+        server.log += b"four\nfive\n"
+
+        gap = httpx.Response(206, content=b"five\n", headers={"Content-Range": "bytes 19-23/24"})
+        server._request = MagicMock(return_value=gap)
+        assert tailer.read() == []
+        assert tailer.offset == 14
+
+        del server._request
+        assert tailer.read() == ["four", "five"]
+
+    def test_multibyte_character_split_across_reads(self):
+        server = RangeServer()
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+        encoded = "→ done\n".encode()
+
+        server.log = encoded[:1]
+        assert tailer.read() == []
+        server.log = encoded
+        assert tailer.read() == ["→ done"]
+
+    def test_flush_returns_unterminated_last_line(self):
+        server = RangeServer()
+        tailer = LogTailer(server, "/plans/plan-1/logs")
+
+        server.log = b"line\r\nno newline"
+        assert tailer.read() == ["line"]
+        assert tailer.flush() == ["no newline"]
+        assert tailer.flush() == []
+
+    def test_range_header_sent_over_http(self, httpx_mock):
+        httpx_mock.add_response(
+            url=f"{BASE}/plans/plan-1/logs",
+            status_code=206,
+            content=b"abc\n",
+            headers={"Content-Range": "bytes 0-3/4"},
+        )
+        httpx_mock.add_response(url=f"{BASE}/plans/plan-1/logs", status_code=416)
+
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        with TFCClient(credentials=creds) as client:
+            tailer = LogTailer(client, "/plans/plan-1/logs")
+            assert tailer.read() == ["abc"]
+            assert tailer.read() == []
+
+        requests = httpx_mock.get_requests()
+        assert [r.headers["Range"] for r in requests] == ["bytes=0-", "bytes=4-"]
+
+
+def _run(status: str, apply_id: str | None = None) -> dict:
+    relationships = {"plan": {"data": {"id": "plan-1", "type": "plans"}}}
+    if apply_id:
+        relationships["apply"] = {"data": {"id": apply_id, "type": "applies"}}
+    return {
+        "data": {
+            "id": "run-1",
+            "type": "runs",
+            "attributes": {"status": status},
+            "relationships": relationships,
+        }
+    }
+
+
+class TestRunLogStream:
+    def _api(self, statuses, plan_chunks, apply_chunks):
+        plan, apply = RangeServer(), RangeServer()
+        client = MagicMock()
+        client.get.side_effect = [_run(s, "apply-1") for s in statuses]
+
+        def request(method, path, params=None, json_data=None, headers=None):
+            server = plan if path.startswith("/plans/") else apply
+            chunks = plan_chunks if server is plan else apply_chunks
+            if chunks:
+                server.log += chunks.pop(0)
+            return server._request(method, path, headers=headers)
+
+        client._request.side_effect = request
+        return RunsAPI(client), plan, apply
+
+    def test_yields_plan_then_apply_lines_once(self):
+        api, plan, apply = self._api(
+            ["planning", "planning", "applying", "applied"],
+            [b"Plan: start\n", b"Plan: done\n"],
+            [b"Apply: start\n", b"Apply: done"],
+        )
+        sleeps: list[float] = []
+        stream = RunLogStream(api, "run-1", sleep=sleeps.append)
+
+        lines = list(stream)
+
+        assert lines == [
+            LogLine("plan", "Plan: start"),
+            LogLine("plan", "Plan: done"),
+            LogLine("apply", "Apply: start"),
+            LogLine("apply", "Apply: done"),
+        ]
+        assert stream.run is not None
+        assert stream.run.status.value == "applied"
+        # Every fetch after the first asks only for the unread tail
+        assert plan.ranges[-1] == f"bytes={len(plan.log)}-"
+        assert apply.ranges[-1] == f"bytes={len('Apply: start') + 1}-"
+
+    def test_backoff_resets_when_output_arrives(self):
+        api, _, _ = self._api(
+            ["planning"] * 5 + ["planned_and_finished"],
+            [b"a\n", b"", b"", b"", b"b\n"],
+            [],
+        )
+        sleeps: list[float] = []
+        list(RunLogStream(api, "run-1", sleep=sleeps.append))
+
+        assert sleeps == [2, 2, 2, 3, 2]
+
+    def test_timeout(self):
+        api, _, _ = self._api(["planning"] * 3, [], [])
+        clock = iter([0.0, 0.0, 5.0, 10.0])
+
+        with pytest.raises(TimeoutError, match="run-1"):
+            list(
+                RunLogStream(
+                    api, "run-1", max_wait=8, clock=lambda: next(clock), sleep=lambda _: None
+                )
+            )
+
+    def test_stream_logs_returns_stream(self):
+        api = RunsAPI(MagicMock())
+        stream = api.stream_logs("run-1", max_wait=60)
+
+        assert isinstance(stream, RunLogStream)
+        assert stream.max_wait == 60
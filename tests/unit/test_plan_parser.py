@@ -7,7 +7,7 @@ import pytest
 from typer.testing import CliRunner
 
 from terrapyne.cli.main import app
-from terrapyne.core.plan_parser import TerraformPlainTextPlanParser
+from terrapyne.core.plan_parser import PlanIR, PlanStreamParser, TerraformPlainTextPlanParser
 
 runner = CliRunner()
 
@@ -329,3 +329,251 @@ def test_fixture_json_output_is_valid(fixture_stem, plan_parser_fixtures):
     # Verify it's valid JSON-serializable
     json_str = json.dumps(parsed)  # raises on invalid JSON
     assert "resource_changes" in json.loads(json_str)
+
+
+@pytest.mark.parametrize("fixture_file", FIXTURE_FILES, ids=[f.stem for f in FIXTURE_FILES])
+def test_scanner_engine_matches_state_machine(fixture_file):
+    """The scanner engine must produce exactly the state machine's PlanIR."""
+    text = fixture_file.read_text()
+
+    expected = TerraformPlainTextPlanParser(text).parse_to_ir()
+    actual = TerraformPlainTextPlanParser(text, engine="scanner").parse_to_ir()
+
+    assert actual == expected
+
+
+EDGE_CASE_PLANS = [
+    # Summary on the same line as trailing content
+    "Terraform will perform the following actions:\n"
+    '  # a.b will be created\n  + resource "a" "b" {\n      + x = 1\n    }\n'
+    "  Plan: 1 to add, 0 to change, 0 to destroy.\n",
+    # Resource comment on the last line (no attributes follow)
+    "Terraform will perform the following actions:\n\n  # a.b will be destroyed",
+    # Attribute named like a declaration keyword ends the attribute scan
+    "Terraform will perform the following actions:\n"
+    '  # a.b will be updated in-place\n  ~ resource "a" "b" {\n'
+    '      ~ user_data = "x" -> "y"\n      ~ size = 1 -> 2\n    }\n',
+    # Errors after the plan
+    "Terraform will perform the following actions:\n"
+    '  # a.b will be created\n  + resource "a" "b" {\n    }\n'
+    "╷\n│ Error: boom\n│\n│ detail\n╵\nOperation failed: failed running terraform plan (exit 1)\n",
+    "",
+]
+
+
+@pytest.mark.parametrize("plan_text", EDGE_CASE_PLANS)
+def test_scanner_engine_matches_state_machine_edge_cases(plan_text):
+    expected = TerraformPlainTextPlanParser(plan_text).parse_to_ir()
+    actual = TerraformPlainTextPlanParser(plan_text, engine="scanner").parse_to_ir()
+
+    assert actual == expected
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError, match="Unknown plan parser engine"):
+        TerraformPlainTextPlanParser("", engine="regex")
+
+
+def test_parse_plan_cli_engine_option(tmp_path):
+    plan_file = tmp_path / "plan.txt"
+    plan_file.write_text(TestParsePlanCLIDoesNotRequireTerraformBinary.SIMPLE_PLAN)
+
+    result = runner.invoke(
+        app, ["run", "parse-plan", str(plan_file), "--engine", "scanner", "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert '"address": "aws_instance.web"' in result.output
+
+
+def _scaled_fixture_plan(copies: int) -> str:
+    """Concatenate the resource sections of every fixture into one large plan."""
+    sections = []
+    for fixture_file in FIXTURE_FILES:
+        text = TerraformPlainTextPlanParser.strip_ansi_codes(fixture_file.read_text())
+        start = text.find(TerraformPlainTextPlanParser.START_MARKER)
+        if start == -1:
+            continue
+        body = text[text.find("\n", start) + 1 :]
+        end = TerraformPlainTextPlanParser.PLAN_SUMMARY_PATTERN.search(body)
+        sections.append(body[: end.start()] if end else body)
+    body = "\n".join(sections)
+    return (
+        f"{TerraformPlainTextPlanParser.START_MARKER}\n\n"
+        + "\n".join([body] * copies)
+        + "\nPlan: 1 to add, 0 to change, 0 to destroy.\n"
+    )
+
+
+@pytest.mark.slow
+def test_scanner_engine_benchmark():
+    """The scanner must match the state machine on a large plan, and be faster."""
+    import time
+
+    plan_text = _scaled_fixture_plan(copies=400)
+    timings = {}
+    results = {}
+    for engine in TerraformPlainTextPlanParser.ENGINES:
+        start = time.perf_counter()
+        results[engine] = TerraformPlainTextPlanParser(plan_text, engine=engine).parse_to_ir()
+        timings[engine] = time.perf_counter() - start
+
+    print(
+        f"\n{len(results['scanner'].resource_changes)} resources: "
+        + ", ".join(f"{engine} {seconds:.2f}s" for engine, seconds in timings.items())
+    )
+    assert results["scanner"] == results["state_machine"]
+    assert timings["scanner"] < timings["state_machine"]
+
+
+@pytest.mark.parametrize("ansi", [False, True], ids=["plain", "ansi"])
+@pytest.mark.parametrize("engine", TerraformPlainTextPlanParser.ENGINES)
+def test_synthetic_plan_corpus_parses_to_its_counts(engine, ansi):
+    """Generated plans parse to the resource, summary and error counts they were built with."""
+    from tests.fixtures.plan_corpus import synthetic_plan
+
+    plan = synthetic_plan(60, ansi=ansi, errors=2)
+
+    plan_ir = TerraformPlainTextPlanParser(plan.text, engine=engine).parse_to_ir()
+
+    assert len(plan_ir.resource_changes) == plan.resources
+    assert plan_ir.plan_summary == {
+        "add": plan.to_add,
+        "change": plan.to_change,
+        "destroy": plan.to_destroy,
+        "import": 0,
+    }
+    assert len(plan_ir.diagnostics) == plan.errors
+
+
+def _stream_parse(plan_text: str, chunk_size: int) -> PlanIR:
+    """Feed plan_text to a PlanStreamParser in fixed-size chunks; return the combined IR."""
+    stream = PlanStreamParser()
+    resource_changes = []
+    for i in range(0, len(plan_text), chunk_size):
+        resource_changes += stream.feed(plan_text[i : i + chunk_size])
+    plan_ir = stream.finish()
+    plan_ir.resource_changes = resource_changes + plan_ir.resource_changes
+    return plan_ir
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+@pytest.mark.parametrize("fixture_file", FIXTURE_FILES, ids=[f.stem for f in FIXTURE_FILES])
+def test_stream_parser_matches_parser(fixture_file, chunk_size):
+    """Chunked input must parse to exactly the whole-text PlanIR."""
+    text = fixture_file.read_text()
+
+    assert _stream_parse(text, chunk_size) == TerraformPlainTextPlanParser(text).parse_to_ir()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 4096])
+def test_parse_plan_cli_output_does_not_depend_on_read_chunk_size(
+    tmp_path, monkeypatch, chunk_size
+):
+    import json
+
+    from terrapyne.cli import run_cmd
+    from tests.fixtures.plan_corpus import synthetic_plan
+
+    plan = synthetic_plan(120, ansi=True, errors=2)
+    plan_file = tmp_path / "plan.txt"
+    plan_file.write_text(plan.text)
+    monkeypatch.setattr(run_cmd, "PLAN_READ_CHUNK_SIZE", chunk_size)
+
+    result = runner.invoke(app, ["run", "parse-plan", str(plan_file), "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    expected = TerraformPlainTextPlanParser(plan.text).parse()
+    assert json.loads(result.output) == json.loads(json.dumps(expected))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096, 65536])
+@pytest.mark.parametrize("ansi", [False, True], ids=["plain", "ansi"])
+def test_stream_parser_is_chunk_size_invariant_on_the_corpus(ansi, chunk_size):
+    """Nested maps, jsonencode arrays and heredocs parse the same however the log is split."""
+    from tests.fixtures.plan_corpus import synthetic_plan
+
+    plan = synthetic_plan(120, ansi=ansi, errors=2)
+
+    assert _stream_parse(plan.text, chunk_size) == (
+        TerraformPlainTextPlanParser(plan.text).parse_to_ir()
+    )
+
+
+def test_stream_parser_keeps_a_value_left_open_across_a_header_buffered():
+    plan_text = (
+        "Terraform will perform the following actions:\n\n"
+        "  # a.b will be created\n"
+        '  + resource "a" "b" {\n'
+        "      + list = [\n"
+        '          + "x",\n'
+        "  # a.c will be created\n"
+        '  + resource "a" "c" {\n'
+        '      + id = "c"\n'
+        "    }\n\n"
+        "Plan: 2 to add, 0 to change, 0 to destroy.\n"
+    )
+
+    for chunk_size in (1, 16, 4096):
+        expected = TerraformPlainTextPlanParser(plan_text).parse_to_ir()
+        assert _stream_parse(plan_text, chunk_size) == expected
+
+
+@pytest.mark.parametrize(
+    "plan_text",
+    [
+        *EDGE_CASE_PLANS,
+        # CRLF line endings, with \r and \n split across chunks
+        EDGE_CASE_PLANS[0].replace("\n", "\r\n"),
+        # TFC version message before the plain text
+        '{"terraform_version": "1.5.7"}\n\n' + EDGE_CASE_PLANS[0],
+        # Structured JSON log
+        '{"@level": "info", "@message": "Plan: 2 to add, 0 to change, 0 to destroy.", '
+        '"type": "planned_change"}\n',
+        # Unterminated error box
+        "╷\n│ Error: boom\n│ detail\n",
+        "  \n\n",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+def test_stream_parser_matches_parser_edge_cases(plan_text, chunk_size):
+    expected = TerraformPlainTextPlanParser(plan_text).parse_to_ir()
+
+    assert _stream_parse(plan_text, chunk_size) == expected
+
+
+def test_stream_parser_returns_blocks_as_they_close():
+    stream = PlanStreamParser()
+
+    assert stream.feed(EDGE_CASE_PLANS[3].split("╷")[0]) == []  # block still open
+    resources = stream.feed('  # a.c will be destroyed\n  - resource "a" "c" {\n    }\n')
+    assert [rc.address for rc in resources] == ["a.b"]
+
+    plan_ir = stream.finish()
+    assert [rc.address for rc in plan_ir.resource_changes] == ["a.c"]
+    assert plan_ir.plan_status == "incomplete"
+
+
+def test_stream_parser_buffers_only_the_open_block():
+    plan_text = _scaled_fixture_plan(copies=20)
+    stream = PlanStreamParser()
+    resource_count = 0
+    most_buffered = 0
+    for line in plan_text.splitlines(keepends=True):
+        resource_count += len(stream.feed(line))
+        most_buffered = max(most_buffered, len(stream._section))
+    resource_count += len(stream.finish().resource_changes)
+
+    expected = TerraformPlainTextPlanParser(plan_text).parse_to_ir()
+    assert resource_count == len(expected.resource_changes)
+    assert most_buffered < 100 < plan_text.count("\n")
+
+
+def test_stream_parser_rejects_feed_after_finish():
+    stream = PlanStreamParser()
+    stream.finish()
+
+    with pytest.raises(ValueError, match="after finish"):
+        stream.feed("Plan: 1 to add, 0 to change, 0 to destroy.\n")
+    with pytest.raises(ValueError, match="already called"):
+        stream.finish()
@@ -0,0 +1,110 @@
+"""Tests for the client-side rate-limit governor."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from terrapyne.api.ratelimit import RateLimitGovernor, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestRateLimitGovernor:
+    def test_burst_then_paced(self, clock):
+        governor = RateLimitGovernor(rate=10, burst=3, clock=clock)
+
+        delays = [governor.reserve() for _ in range(5)]
+
+        assert delays == [0.0, 0.0, 0.0, pytest.approx(0.1), pytest.approx(0.2)]
+
+    def test_tokens_refill_over_time(self, clock):
+        governor = RateLimitGovernor(rate=10, burst=2, clock=clock)
+        governor.reserve()
+        governor.reserve()
+
+        clock.now += 0.15
+
+        assert governor.reserve() == 0.0
+        assert governor.reserve() == pytest.approx(0.05)
+
+    def test_pause_holds_every_request(self, clock):
+        governor = RateLimitGovernor(rate=10, burst=5, clock=clock)
+
+        governor.pause(2.5)
+
+        assert governor.reserve() == pytest.approx(2.5)
+        clock.now += 1
+        assert governor.reserve() == pytest.approx(1.5)
+
+    def test_zero_rate_only_honours_pauses(self, clock):
+        governor = RateLimitGovernor(rate=0, clock=clock)
+
+        assert [governor.reserve() for _ in range(50)] == [0.0] * 50
+        governor.pause(1)
+        assert governor.reserve() == pytest.approx(1)
+
+    def test_observe_lowers_rate_to_server_limit(self, clock):
+        governor = RateLimitGovernor(rate=25, clock=clock)
+
+        governor.observe({"X-RateLimit-Limit": "10"})
+        assert governor.rate == pytest.approx(9)
+
+        governor.observe({"X-RateLimit-Limit": "30"})
+        assert governor.rate == 25  # never above the configured rate
+
+    def test_observe_caps_tokens_at_server_remaining(self, clock):
+        governor = RateLimitGovernor(rate=10, burst=10, clock=clock)
+
+        governor.observe({"X-RateLimit-Remaining": "1"})
+
+        assert governor.reserve() == 0.0
+        assert governor.reserve() == pytest.approx(0.1)
+
+    def test_observe_exhausted_pauses_until_reset(self, clock):
+        governor = RateLimitGovernor(rate=10, clock=clock)
+
+        governor.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.5"})
+
+        assert governor.reserve() == pytest.approx(0.5)
+
+    def test_acquire_sleeps_for_reservation(self, clock, monkeypatch):
+        sleeps: list[float] = []
+        monkeypatch.setattr("terrapyne.api.ratelimit.time.sleep", sleeps.append)
+        governor = RateLimitGovernor(rate=4, burst=1, clock=clock)
+
+        governor.acquire()
+        governor.acquire()
+
+        assert sleeps == [pytest.approx(0.25)]
+
+
+class TestRetryAfterSeconds:
+    def test_delta_seconds(self):
+        assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(UTC) + timedelta(seconds=30)
+
+        delay = retry_after_seconds({"Retry-After": format_datetime(when, usegmt=True)})
+
+        assert delay is not None
+        assert 25 < delay <= 30
+
+    def test_falls_back_to_rate_limit_reset(self):
+        assert retry_after_seconds({"X-RateLimit-Reset": "0.25"}) == 0.25
+
+    def test_missing_or_invalid(self):
+        assert retry_after_seconds({}) is None
+        assert retry_after_seconds({"Retry-After": "soon"}) is None
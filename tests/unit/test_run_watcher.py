@@ -0,0 +1,123 @@
+"""Tests for the multiplexed run poller."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from terrapyne.api.run_watcher import AsyncRunWatcher, RunWatcher
+from terrapyne.api.runs import RunsAPI
+from terrapyne.models.run import Run, RunStatus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _runs_api(statuses: dict[str, list[RunStatus]]):
+    """RunsAPI double whose get() walks each run through a status sequence."""
+    api = MagicMock()
+    calls: dict[str, int] = {}
+
+    def get(run_id):
+        index = calls.get(run_id, 0)
+        calls[run_id] = index + 1
+        sequence = statuses[run_id]
+        return Run.model_construct(id=run_id, status=sequence[min(index, len(sequence) - 1)])
+
+    api.get.side_effect = get
+    return api, calls
+
+
+def test_yields_status_changes_until_all_terminal():
+    api, _ = _runs_api(
+        {
+            "run-1": [RunStatus.PLANNING, RunStatus.APPLIED],
+            "run-2": [RunStatus.PENDING, RunStatus.PENDING, RunStatus.ERRORED],
+        }
+    )
+    clock = FakeClock()
+    watcher = RunWatcher(
+        api, ["run-1", "run-2"], intervals=[1, 2, 4], clock=clock, sleep=clock.sleep
+    )
+
+    events = [(e.run.id, e.previous_status, e.run.status) for e in watcher]
+
+    assert events == [
+        ("run-1", None, RunStatus.PLANNING),
+        ("run-2", None, RunStatus.PENDING),
+        ("run-1", RunStatus.PLANNING, RunStatus.APPLIED),
+        ("run-2", RunStatus.PENDING, RunStatus.ERRORED),
+    ]
+
+
+def test_unchanged_runs_back_off_independently():
+    api, calls = _runs_api(
+        {
+            "fast": [RunStatus.PLANNING, RunStatus.APPLYING, RunStatus.APPLIED],
+            "slow": [RunStatus.PENDING] * 10 + [RunStatus.APPLIED],
+        }
+    )
+    clock = FakeClock()
+    watcher = RunWatcher(api, ["fast", "slow"], intervals=[1, 2, 4], clock=clock, sleep=clock.sleep)
+
+    list(watcher)
+
+    # One loop; no per-run sleeping threads. The unchanged run backs off to 4s.
+    assert calls["fast"] == 3
+    assert calls["slow"] == 11
+    assert max(clock.sleeps) == 4
+
+
+def test_awaiting_approval_uses_longest_interval():
+    api, _ = _runs_api({"run-1": [RunStatus.PLANNED, RunStatus.DISCARDED]})
+    clock = FakeClock()
+    watcher = RunWatcher(api, ["run-1"], intervals=[1, 2, 30], clock=clock, sleep=clock.sleep)
+
+    list(watcher)
+
+    assert clock.sleeps == [30]
+
+
+def test_timeout_names_pending_runs():
+    api, _ = _runs_api({"run-1": [RunStatus.PLANNING]})
+    clock = FakeClock()
+    watcher = RunWatcher(api, ["run-1"], max_wait=10, intervals=[3], clock=clock, sleep=clock.sleep)
+
+    with pytest.raises(TimeoutError, match=r"run-1 \(planning\)"):
+        list(watcher)
+
+
+def test_runs_api_poll_many_returns_watcher():
+    watcher = RunsAPI(MagicMock()).poll_many(["run-1", "run-1", "run-2"])
+
+    assert isinstance(watcher, RunWatcher)
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_yields_events(monkeypatch):
+    statuses = {"run-1": [RunStatus.PLANNING, RunStatus.APPLIED]}
+    calls: dict[str, int] = {}
+
+    async def get(run_id):
+        index = calls.get(run_id, 0)
+        calls[run_id] = index + 1
+        return Run.model_construct(id=run_id, status=statuses[run_id][index])
+
+    api = MagicMock()
+    api.get = AsyncMock(side_effect=get)
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+    events = [e async for e in AsyncRunWatcher(api, ["run-1"], intervals=[0.0])]
+
+    assert [e.run.status for e in events] == [RunStatus.PLANNING, RunStatus.APPLIED]
+    assert events[-1].is_terminal
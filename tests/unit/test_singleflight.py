@@ -0,0 +1,122 @@
+"""Tests for coalescing identical concurrent calls."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from terrapyne.api.client import TFCClient
+from terrapyne.api.singleflight import AsyncSingleFlight, SingleFlight
+from terrapyne.core.credentials import TerraformCredentials
+
+
+def _run_concurrently(flight, call, release, callers=5):
+    """Start ``callers`` threads, release the leader once all of them joined the flight."""
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(call) for _ in range(callers)]
+        while flight.shared < callers - 1:
+            threading.Event().wait(0.001)
+        release.set()
+    return futures
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"data": {"id": "ws-1"}}
+
+        futures = _run_concurrently(flight, lambda: flight.do("ws-1", fetch), release)
+        results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_error_is_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        futures = _run_concurrently(flight, lambda: flight.do("ws-1", fail), release, callers=3)
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result()
+
+    def test_finished_calls_are_not_remembered(self):
+        flight = SingleFlight()
+        calls = []
+
+        assert flight.do("k", lambda: calls.append(1) or 1) == 1
+        assert flight.do("k", lambda: calls.append(1) or 2) == 2
+        assert len(calls) == 2
+        assert flight.shared == 0
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+
+
+class TestAsyncSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "ws-1"}
+
+        results = await asyncio.gather(*(flight.do("ws-1", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert flight.shared == 4
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+def test_client_get_coalesces_identical_requests():
+    creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+    client = TFCClient(credentials=creds, rate_limit=0)
+    release = threading.Event()
+    request = httpx.Request("GET", f"{client.base_url}/workspaces/ws-1")
+
+    def slow_request(*args, **kwargs):
+        release.wait(5)
+        return httpx.Response(200, json={"data": {"id": "ws-1"}}, request=request)
+
+    with patch.object(client.client, "request", side_effect=slow_request) as mock_request:
+        futures = _run_concurrently(
+            client._inflight, lambda: client.get("/workspaces/ws-1"), release, callers=4
+        )
+
+    assert mock_request.call_count == 1
+    assert all(f.result() == {"data": {"id": "ws-1"}} for f in futures)
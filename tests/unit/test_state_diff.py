@@ -1,11 +1,18 @@
 """Tests for state diff and resource extraction."""
 
+import io
+import json
+
+import pytest
+
 from terrapyne.core.state_diff import (
     StateResourceInstance,
     diff_state_resources,
     extract_rows,
     format_diff_unified,
+    iter_state_resources,
     parse_state_resources,
+    read_state_lineage,
     resolve_field,
 )
 from terrapyne.models.state_version import StateVersion, StateVersionOutput
@@ -90,6 +97,86 @@ class TestParseStateResources:
         assert result[0].module is None
 
 
+class _Trickle:
+    """Text file that returns at most ``size`` characters per read."""
+
+    def __init__(self, text: str, size: int):
+        self._file = io.StringIO(text)
+        self._size = size
+
+    def read(self, n: int = -1) -> str:
+        return self._file.read(self._size if n < 0 else min(n, self._size))
+
+
+FILTERS = [
+    {},
+    {"mode": None},
+    {"mode": "data"},
+    {"types": {"aws_instance"}},
+    {"module_pattern": "module.vpc"},
+]
+
+
+class TestIterStateResources:
+    @pytest.mark.parametrize("filters", FILTERS)
+    @pytest.mark.parametrize("read_size", [1, 5, 4096])
+    def test_matches_parse_state_resources(self, filters, read_size):
+        text = json.dumps({"version": 4, **SAMPLE_STATE, "outputs": {}}, indent=2)
+
+        streamed = list(iter_state_resources(_Trickle(text, read_size), **filters))
+
+        assert streamed == parse_state_resources(SAMPLE_STATE, **filters)
+
+    def test_reads_state_file_path(self, tmp_path):
+        path = tmp_path / "terraform.tfstate"
+        path.write_text(json.dumps(SAMPLE_STATE))
+
+        assert list(iter_state_resources(path)) == parse_state_resources(SAMPLE_STATE)
+
+    def test_instances_before_resource_keys_are_buffered(self):
+        state = {
+            "resources": [
+                {"instances": [{"attributes": {"id": "a"}}], "name": "x", "type": "t"},
+                {"instances": [{"attributes": {"id": "b"}}], "mode": "managed", "type": "t"},
+            ]
+        }
+        text = json.dumps(state)
+
+        assert list(iter_state_resources(io.StringIO(text), mode=None)) == parse_state_resources(
+            state, mode=None
+        )
+
+    @pytest.mark.parametrize("module_pattern", [None, "app", "other"])
+    def test_module_after_instances_sets_address_and_module_filter(self, module_pattern):
+        resource = {"mode": "managed", "type": "t", "name": "x"}
+        instances = [{"index_key": 0, "attributes": {"id": "a"}}]
+        state = {"resources": [{**resource, "instances": instances, "module": "module.app"}]}
+        text = json.dumps(state)
+
+        streamed = list(iter_state_resources(io.StringIO(text), module_pattern=module_pattern))
+
+        assert streamed == parse_state_resources(state, module_pattern=module_pattern)
+        if module_pattern != "other":
+            assert [i.address for i in streamed] == ["module.app.t.x[0]"]
+
+    @pytest.mark.parametrize("text", ["", "[]", '{"resources": [{"mode": "managed",}]}'])
+    def test_invalid_json_raises_value_error(self, text):
+        with pytest.raises(ValueError):
+            list(iter_state_resources(io.StringIO(text)))
+
+
+class TestReadStateLineage:
+    def test_reads_head_of_state(self):
+        text = json.dumps({"version": 4, "serial": 7, "lineage": "abc-123", **SAMPLE_STATE})
+
+        assert read_state_lineage(_Trickle(text, 3)) == ("abc-123", 7)
+
+    def test_stops_at_resources(self):
+        text = '{"resources": [], "lineage": "abc-123", "serial": 7}'
+
+        assert read_state_lineage(io.StringIO(text)) == (None, None)
+
+
 class TestStateResourceInstance:
     def test_address_with_module_and_index(self):
         inst = StateResourceInstance(
@@ -172,6 +259,80 @@ class TestDiffStateResources:
         assert len(result.added) == 1
         assert result.added[0].resource_type == "aws_instance"
 
+    def test_identical_instances_are_counted_unchanged(self):
+        instances = parse_state_resources(SAMPLE_STATE)
+        result = diff_state_resources(instances, parse_state_resources(SAMPLE_STATE))
+        assert result.unchanged == 3
+        assert not result.changed
+        assert not result.has_changes
+
+    def test_reports_changed_attributes_by_path(self):
+        before = {
+            "id": "i-1",
+            "tags": {"Name": "web", "Legacy": "true"},
+            "sgs": ["sg-1", "sg-2"],
+        }
+        after = {
+            "id": "i-1",
+            "tags": {"Name": "api", "kubernetes.io/role": "node"},
+            "sgs": ["sg-1"],
+            "ami": "ami-2",
+        }
+        old = [StateResourceInstance("aws_instance", "web", "module.app", 0, before)]
+        new = [StateResourceInstance("aws_instance", "web", "module.app", 0, after)]
+
+        result = diff_state_resources(old, new)
+
+        assert result.unchanged == 0
+        [change] = result.changed
+        assert change.address == "module.app.aws_instance.web[0]"
+        assert [(a.path, a.action, a.before, a.after) for a in change.attributes] == [
+            ("tags.Name", "changed", "web", "api"),
+            ("tags.Legacy", "removed", "true", None),
+            ('tags["kubernetes.io/role"]', "added", None, "node"),
+            ("sgs[1]", "removed", "sg-2", None),
+            ("ami", "added", None, "ami-2"),
+        ]
+
+    def test_nested_blocks_and_type_changes(self):
+        before = {"ingress": [{"port": 80, "cidrs": ["10.0.0.0/8"]}], "count": "1"}
+        after = {"ingress": [{"port": 443, "cidrs": ["10.0.0.0/8", "0.0.0.0/0"]}], "count": 1}
+        old = [StateResourceInstance("aws_security_group", "sg", None, None, before)]
+        new = [StateResourceInstance("aws_security_group", "sg", None, None, after)]
+
+        [change] = diff_state_resources(old, new).changed
+
+        assert [(a.path, a.action) for a in change.attributes] == [
+            ("ingress[0].port", "changed"),
+            ("ingress[0].cidrs[1]", "added"),
+            ("count", "changed"),
+        ]
+
+    def test_accepts_streamed_instances(self):
+        old = parse_state_resources(SAMPLE_STATE)
+        state = json.loads(json.dumps(SAMPLE_STATE))
+        state["resources"][1]["instances"][0]["attributes"]["private_ip"] = "10.0.1.6"
+
+        result = diff_state_resources(old, iter_state_resources(io.StringIO(json.dumps(state))))
+
+        assert result.unchanged == 2
+        assert [c.address for c in result.changed] == ["aws_instance.web"]
+
+    def test_to_dict(self):
+        old = parse_state_resources(SAMPLE_STATE, types={"aws_subnet"})
+        new = [
+            StateResourceInstance(i.resource_type, i.resource_name, i.module, i.index_key, {})
+            for i in parse_state_resources(SAMPLE_STATE)
+        ]
+
+        data = diff_state_resources(old, new).to_dict()
+
+        assert data["summary"] == {"added": 1, "removed": 0, "changed": 2, "unchanged": 0}
+        assert data["added"] == [{"address": "aws_instance.web", "type": "aws_instance"}]
+        assert data["changed"][0]["address"] == "module.vpc.aws_subnet.private[0]"
+        assert data["changed"][0]["attributes"][0]["action"] == "removed"
+        json.dumps(data)
+
 
 class TestExtractRows:
     def test_extracts_requested_fields(self):
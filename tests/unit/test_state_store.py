@@ -0,0 +1,131 @@
+"""Tests for the local state version store."""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from terrapyne.api.client import TFCClient
+from terrapyne.api.state_store import StateStore
+
+
+def _state(serial: int, lineage: str = "lin-1", padding: str = "") -> bytes:
+    return json.dumps(
+        {"version": 4, "serial": serial, "lineage": lineage, "resources": [], "pad": padding}
+    ).encode()
+
+
+def _put(store: StateStore, state_version_id: str, content: bytes) -> None:
+    with store.writer(state_version_id) as f:
+        f.write(content)
+
+
+def _read(store: StateStore, state_version_id: str) -> bytes | None:
+    stored = store.open(state_version_id)
+    if stored is None:
+        return None
+    with stored:
+        return stored.read()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StateStore(tmp_path / "state")
+
+
+class TestStateStore:
+    def test_round_trip(self, store):
+        assert store.open("sv-1") is None
+
+        _put(store, "sv-1", _state(3))
+
+        assert "sv-1" in store
+        assert _read(store, "sv-1") == _state(3)
+
+    def test_objects_are_compressed_and_keyed_by_lineage_and_serial(self, store):
+        content = _state(3, padding="x" * 100_000)
+        _put(store, "sv-1", content)
+        _put(store, "sv-2", content)
+
+        objects = list(store.objects_dir.iterdir())
+        assert [p.name for p in objects] == ["lin-1-3.tfstate.gz"]
+        assert objects[0].stat().st_size < len(content) // 10
+        assert _read(store, "sv-2") == content
+
+    def test_state_without_lineage_is_keyed_by_content_hash(self, store):
+        _put(store, "sv-1", b'{"resources": []}')
+
+        [obj] = store.objects_dir.iterdir()
+        assert obj.name.startswith("sha256-")
+        assert _read(store, "sv-1") == b'{"resources": []}'
+
+    def test_failed_write_stores_nothing(self, store):
+        with pytest.raises(RuntimeError), store.writer("sv-1") as f:
+            f.write(b'{"serial": 1')
+            raise RuntimeError("download failed")
+
+        assert "sv-1" not in store
+        assert list(store.objects_dir.iterdir()) == []
+
+    def test_entries_are_private(self, store):
+        _put(store, "sv-1", _state(1))
+
+        for path in (store.root, store.objects_dir, store.refs_dir):
+            assert path.stat().st_mode & 0o077 == 0
+        for path in [*store.objects_dir.iterdir(), *store.refs_dir.iterdir()]:
+            assert path.stat().st_mode & 0o077 == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        padding = os.urandom(30_000).hex()  # ~32 KB once compressed
+        store = StateStore(tmp_path / "state", max_bytes=120_000)
+        for serial in range(3):
+            _put(store, f"sv-{serial}", _state(serial, padding=padding))
+            # Distinct mtimes without sleeping
+            for obj in store.objects_dir.iterdir():
+                os.utime(obj, (obj.stat().st_atime, obj.stat().st_mtime - 10))
+        assert _read(store, "sv-0") is not None  # refreshes sv-0
+
+        _put(store, "sv-3", _state(3, padding=padding))
+
+        assert "sv-1" not in store
+        assert all(sv in store for sv in ("sv-0", "sv-2", "sv-3"))
+
+    def test_evicted_entry_stays_readable_once_opened(self, store):
+        _put(store, "sv-1", _state(1))
+        stored = store.open("sv-1")
+
+        for obj in store.objects_dir.iterdir():
+            obj.unlink()
+
+        assert store.open("sv-1") is None
+        with stored:
+            assert stored.read() == _state(1)
+
+    def test_removes_stale_temp_files(self, store):
+        _put(store, "sv-1", _state(1))
+        stale = store.objects_dir / ".tmp-crashed"
+        stale.write_bytes(b"partial")
+        old = time.time() - 2 * 24 * 3600
+        os.utime(stale, (old, old))
+
+        _put(store, "sv-2", _state(2))
+
+        assert not stale.exists()
+
+    def test_rejects_path_like_ids(self, store):
+        with pytest.raises(ValueError), store.writer("../escape"):
+            pass
+
+
+def test_client_state_store_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setenv("TERRAPYNE_STATE_STORE_DIR", str(tmp_path / "state"))
+    monkeypatch.delenv("TERRAPYNE_STATE_STORE_MB", raising=False)
+
+    assert TFCClient(credentials=MagicMock()).state_store is None
+
+    store = TFCClient(credentials=MagicMock(), state_store_mb=64).state_store
+    assert store is not None
+    assert store.root == tmp_path / "state"
+    assert store.max_bytes == 64 * 1024 * 1024
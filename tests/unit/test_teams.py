@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
-from terrapyne.api.teams import TeamsAPI
+from terrapyne.api.fanout import DEFAULT_CONCURRENCY
+from terrapyne.api.teams import AsyncTeamsAPI, TeamNameCache, TeamsAPI, team_names
 from terrapyne.models.team_access import (
     TeamProjectAccess,
     TeamProjectAccessComparison,
@@ -73,6 +75,87 @@ def _make_client_mock() -> MagicMock:
     return client
 
 
+# ---------------------------------------------------------------------------
+# resolve_names — process-wide team name cache
+# ---------------------------------------------------------------------------
+
+
+class TestResolveNames:
+    def test_fetches_each_unknown_team_once(self):
+        client = _make_client_mock()
+        client.get.side_effect = lambda path: {
+            "data": _make_team_response(path.rsplit("/", 1)[1], f"name-{path[-1]}")
+        }
+        api = TeamsAPI(client)
+
+        assert api.resolve_names(["team-1", "team-2", "team-1"]) == {
+            "team-1": "name-1",
+            "team-2": "name-2",
+        }
+        assert api.resolve_names(["team-2"]) == {"team-2": "name-2"}
+        assert client.get.call_count == 2
+
+    def test_cache_is_shared_across_clients_of_one_host(self):
+        first, second = _make_client_mock(), _make_client_mock()
+        first.host = second.host = "app.terraform.io"
+        first.get.return_value = {"data": _make_team_response("team-1", "platform")}
+        TeamsAPI(first).get("team-1")
+
+        assert TeamsAPI(second).resolve_names(["team-1"]) == {"team-1": "platform"}
+        second.get.assert_not_called()
+
+        other_host = _make_client_mock()
+        other_host.host = "tfe.example.com"
+        other_host.get.side_effect = RuntimeError("forbidden")
+        assert TeamsAPI(other_host).resolve_names(["team-1"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_async_lookups_are_bounded(self):
+        in_flight = peak = 0
+
+        async def get(path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"data": _make_team_response(path.rsplit("/", 1)[1], "name")}
+
+        client = _make_client_mock()
+        client.get = get
+        team_ids = [f"team-{i}" for i in range(3 * DEFAULT_CONCURRENCY)]
+
+        names = await AsyncTeamsAPI(client).resolve_names(team_ids)
+
+        assert len(names) == len(team_ids)
+        assert peak == DEFAULT_CONCURRENCY
+
+    def test_list_teams_populates_cache(self):
+        client = _make_client_mock()
+        client.paginate_with_meta.return_value = (
+            iter([_make_team_response("team-1", "platform")]),
+            1,
+        )
+        teams, _ = TeamsAPI(client).list_teams()
+        list(teams)
+
+        assert team_names.get(client, "team-1") == "platform"
+
+    def test_cached_names_expire(self):
+        now = [0.0]
+        cache = TeamNameCache(ttl=60, clock=lambda: now[0])
+        client = _make_client_mock()
+        cache.update(client, {"team-1": "platform"})
+
+        now[0] = 59.0
+        assert cache.get(client, "team-1") == "platform"
+        now[0] = 60.0
+        assert cache.get(client, "team-1") is None
+
+        cache.update(client, {"team-1": "platform-renamed"})
+        assert cache.get(client, "team-1") == "platform-renamed"
+
+
 # ---------------------------------------------------------------------------
 # list_teams — server-side filtering
 # ---------------------------------------------------------------------------
@@ -0,0 +1,201 @@
+"""Tests for API call tracing and latency histograms."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from terrapyne.api.client import TFCClient
+from terrapyne.api.tracing import LatencyHistogram, Span, Tracer, endpoint_template
+from terrapyne.cli.main import app
+from terrapyne.core.credentials import TerraformCredentials
+
+BASE = "https://app.terraform.io/api/v2"
+
+
+@pytest.fixture
+def client():
+    creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+    tracer = Tracer()
+    return TFCClient(credentials=creds, rate_limit=0, tracer=tracer)
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/workspaces/ws-abc123", "/workspaces/{id}"),
+            ("/workspaces/ws-abc123/runs", "/workspaces/{id}/runs"),
+            (
+                "/organizations/acme/workspaces/my-app",
+                "/organizations/{organization}/workspaces/{workspace}",
+            ),
+            ("/organizations/acme/projects", "/organizations/{organization}/projects"),
+            ("/runs/run-XyZ9/plan", "/runs/{id}/plan"),
+        ],
+    )
+    def test_ids_and_names_are_templated(self, path, expected):
+        assert endpoint_template(f"{BASE}{path}?page[number]=2", BASE) == expected
+
+    def test_off_api_urls_collapse_to_host(self):
+        url = "https://archivist.terraform.io/v1/object/abc?sig=xyz"
+
+        assert endpoint_template(url, BASE) == "archivist.terraform.io/*"
+
+
+class TestLatencyHistogram:
+    def test_percentiles_report_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for seconds in [0.003] * 90 + [0.2] * 9 + [45.0]:
+            histogram.add(seconds)
+
+        assert histogram.count == 100
+        assert histogram.percentile(50) == 0.005
+        assert histogram.percentile(95) == 0.25
+        assert histogram.percentile(100) == 45.0  # unbounded bucket reports the max
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(99) == 0.0
+        assert LatencyHistogram().as_dict()["mean_ms"] == 0.0
+
+
+class TestTracer:
+    def _tracer(self):
+        tracer = Tracer()
+        tracer.record(Span("GET", "/workspaces/{id}", start=10.0, duration=0.02, status=200))
+        tracer.record(Span("GET", "/workspaces/{id}", start=11.0, duration=0.04, status=200))
+        tracer.record(Span("GET", "/runs/{id}", start=12.0, duration=0.5, status=200))
+        return tracer
+
+    def test_histograms_slowest_first(self):
+        histograms = self._tracer().histograms()
+
+        assert list(histograms) == ["GET /runs/{id}", "GET /workspaces/{id}"]
+        assert histograms["GET /workspaces/{id}"].count == 2
+
+    def test_max_spans_bounds_memory_not_histograms(self):
+        tracer = Tracer(max_spans=1)
+        for _ in range(3):
+            tracer.record(Span("GET", "/runs/{id}", start=0.0, duration=0.01))
+
+        assert len(tracer.spans) == 1
+        assert tracer.histograms()["GET /runs/{id}"].count == 3
+
+    def test_write_ndjson(self, tmp_path):
+        path = tmp_path / "trace.ndjson"
+
+        self._tracer().write(path)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["type"] for line in lines] == ["span"] * 3 + ["histogram"] * 2
+        assert lines[0]["name"] == "GET /workspaces/{id}"
+        assert lines[0]["status"] == 200
+        assert lines[3]["name"] == "GET /runs/{id}"
+        assert lines[3]["count"] == 1
+
+    def test_write_chrome(self, tmp_path):
+        path = tmp_path / "trace.json"
+
+        self._tracer().write(path, "chrome")
+
+        trace = json.loads(path.read_text())
+        event = trace["traceEvents"][0]
+        assert event["ph"] == "X"
+        assert event["ts"] == 10_000_000
+        assert event["dur"] == 20_000
+        assert "GET /runs/{id}" in trace["otherData"]["histograms"]
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown trace format"):
+            Tracer().write(tmp_path / "trace", "xml")
+
+
+class TestClientSpans:
+    def test_request_records_span(self, client, httpx_mock):
+        httpx_mock.add_response(
+            url=f"{BASE}/workspaces/ws-abc123", json={"data": {"id": "ws-abc123"}}
+        )
+
+        client.get("/workspaces/ws-abc123")
+
+        (span,) = client.tracer.spans
+        assert span.name == "GET /workspaces/{id}"
+        assert span.status == 200
+        assert span.bytes > 0
+        assert span.retries == 0
+        assert span.cache is None
+
+    def test_retries_are_counted(self, client, httpx_mock):
+        url = f"{BASE}/runs/run-1"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=url, json={"data": {}})
+
+        client.get("/runs/run-1")
+
+        assert [(s.status, s.retries) for s in client.tracer.spans] == [(429, 0), (200, 1)]
+
+    def test_cache_outcomes(self, tmp_path, monkeypatch, httpx_mock):
+        monkeypatch.setenv("TERRAPYNE_CACHE_DIR", str(tmp_path))
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds, rate_limit=0, cache_ttl=60, tracer=Tracer())
+        httpx_mock.add_response(url=f"{BASE}/workspaces/ws-1", json={"data": {}})
+
+        client.get("/workspaces/ws-1")
+        client.get("/workspaces/ws-1")
+
+        assert [(s.status, s.cache) for s in client.tracer.spans] == [(200, "miss"), (None, "hit")]
+
+    def test_download_records_bytes_written(self, client, httpx_mock, tmp_path):
+        url = "https://archivist.terraform.io/v1/object/abc"
+        httpx_mock.add_response(url=url, content=b"x" * 1000)
+
+        with open(tmp_path / "state", "wb") as f:
+            client.download(url, f)
+
+        (span,) = client.tracer.spans
+        assert span.endpoint == "archivist.terraform.io/*"
+        assert span.bytes == 1000
+
+    def test_no_tracer_records_nothing(self, httpx_mock):
+        creds = TerraformCredentials(host="app.terraform.io", token="test-token")
+        client = TFCClient(credentials=creds, rate_limit=0)
+        httpx_mock.add_response(url=f"{BASE}/workspaces/ws-1", json={"data": {}})
+
+        client.get("/workspaces/ws-1")
+
+        assert client.tracer is None
+
+
+class TestTraceFileOption:
+    def test_trace_file_written_on_exit(self, tmp_path):
+        path = tmp_path / "trace.json"
+        with patch("terrapyne.api.client.TFCClient") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.workspaces.list.return_value = (iter([]), 0)
+            mock_client.return_value.__enter__.return_value = mock_instance
+            result = CliRunner().invoke(
+                app,
+                [
+                    "--trace-file",
+                    str(path),
+                    "--trace-format",
+                    "chrome",
+                    "workspace",
+                    "list",
+                    "-o",
+                    "acme",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert isinstance(mock_client.call_args.kwargs["tracer"], Tracer)
+        assert json.loads(path.read_text())["traceEvents"] == []
+
+    def test_unknown_trace_format(self, tmp_path):
+        result = CliRunner().invoke(
+            app, ["--trace-file", str(tmp_path / "t"), "--trace-format", "xml", "version"]
+        )
+
+        assert result.exit_code != 0
+        assert not (tmp_path / "t").exists()